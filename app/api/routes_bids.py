@@ -15,6 +15,7 @@ from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 
+from app.config import settings
 from app.middleware.auth import get_current_user
 from app.models.bid_schemas import (
     BidAnnouncement,
@@ -28,7 +29,8 @@ from app.models.bid_schemas import (
     TeamBidProfileCreate,
 )
 from app.services.bid_fetcher import BidFetcher
-from app.services.bid_recommender import BidRecommender
+from app.services.bid_recommender import QUALIFICATION_ERROR_NOTE, BidRecommender
+from app.services.bid_search import InvalidCursorError, search_announcements
 from app.services.g2b_service import G2BService
 from app.utils.supabase_client import get_async_client
 
@@ -368,6 +370,31 @@ async def list_announcements(
     }
 
 
+@router.get("/api/teams/{team_id}/bids/announcements/search")
+async def search_bid_announcements(
+    team_id: str,
+    q: str = Query(min_length=1, max_length=100),
+    min_budget: Optional[int] = Query(default=None, ge=0),
+    min_days: Optional[int] = Query(default=None, ge=0),
+    bid_type: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    per_page: int = Query(default=20, ge=1, le=100),
+    current_user=Depends(get_current_user),
+):
+    """공고 전문 검색 (공고명/발주기관/상세내용, 관련도순 + 하이라이트, keyset 페이징)"""
+    client = await get_async_client()
+    await _require_team_member(client, team_id, current_user["id"])
+
+    try:
+        return await search_announcements(
+            client, q.strip(),
+            limit=per_page, cursor=cursor,
+            min_budget=min_budget, bid_type=bid_type, min_days=min_days,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/api/bids/{bid_no}")
 async def get_bid_detail(
     bid_no: str,
@@ -601,17 +628,52 @@ async def _run_fetch_and_analyze(
 
         async with G2BService() as g2b:
             fetcher = BidFetcher(g2b, client)
-            bids = await fetcher.fetch_bids_by_preset(preset)
+            bids = await fetcher.fetch_bids_by_preset(
+                preset,
+                incremental=settings.bid_incremental_sync,
+                prefer_local=settings.bid_ingestion_enabled,
+            )
 
         if not bids:
             logger.info(f"[팀 {team_id}] 수집된 공고 없음")
             return
 
         recommender = BidRecommender()
-        recommendations, qual_results = await recommender.analyze_bids(profile, bids)
-
-        await _save_recommendations(client, team_id, preset.id, recommendations, qual_results, bids)
-        logger.info(f"[팀 {team_id}] 분석 완료: 추천 {len(recommendations)}건")
+        profile_hash = recommender.profile_fingerprint(profile)
+        memo_quals, memo_recs = await _load_memoized_analysis(client, team_id, profile_hash, bids)
+        pending = [b for b in bids if b.bid_no not in memo_quals]
+
+        # 재공고(근접 중복)는 원 공고 분석 결과를 복사 — 원 공고가 이번 범위 밖이면 이전 분석 조회
+        linked = {b.bid_no: b.duplicate_of for b in pending if b.duplicate_of}
+        in_batch = {b.bid_no for b in bids}
+        outside = sorted({root for root in linked.values() if root not in in_batch})
+        root_quals, root_recs = await _load_canonical_analysis(client, team_id, profile_hash, outside)
+        linked = {no: root for no, root in linked.items() if root in in_batch or root in root_quals}
+        fresh = [b for b in pending if b.bid_no not in linked]
+
+        recommendations: list[BidRecommendation] = []
+        qual_results: list[QualificationResult] = []
+        if fresh:
+            recommendations, qual_results = await recommender.analyze_bids(profile, fresh)
+        recommendations += list(memo_recs.values())
+        qual_results += list(memo_quals.values())
+
+        known_quals = {**root_quals, **{q.bid_no: q for q in qual_results}}
+        known_recs = {**root_recs, **{r.bid_no: r for r in recommendations}}
+        for bid_no, root in linked.items():
+            if root in known_quals:
+                qual_results.append(known_quals[root].model_copy(update={"bid_no": bid_no}))
+            if root in known_recs:
+                recommendations.append(known_recs[root].model_copy(update={"bid_no": bid_no}))
+        recommendations.sort(key=lambda r: r.match_score, reverse=True)
+
+        await _save_recommendations(
+            client, team_id, preset.id, recommendations, qual_results, bids, profile_hash=profile_hash
+        )
+        logger.info(
+            f"[팀 {team_id}] 분석 완료: 추천 {len(recommendations)}건 "
+            f"(신규/변경 {len(fresh)}건 분석, 메모 재사용 {len(memo_quals)}건, 재공고 연결 {len(linked)}건)"
+        )
 
     except Exception as e:
         logger.error(f"[팀 {team_id}] 수집/분석 실패: {e}")
@@ -628,6 +690,120 @@ async def _run_fetch_and_analyze(
             logger.warning(f"[팀 {team_id}] Rate Limit 초기화 실패 (무시): {reset_err}")
 
 
+async def _load_memoized_analysis(
+    client,
+    team_id: str,
+    profile_hash: str,
+    bids: list[BidAnnouncement],
+) -> tuple[dict[str, QualificationResult], dict[str, BidRecommendation]]:
+    """
+    같은 프로필 + 같은 공고 내용으로 이미 분석한 결과 조회 (프리셋 무관)
+
+    Returns:
+        ({bid_no: 자격 판정}, {bid_no: 매칭 점수}) — 공고 내용 해시가 달라진 공고는 제외
+    """
+    if not bids:
+        return {}, {}
+    fingerprints = {b.bid_no: BidRecommender.bid_fingerprint(b) for b in bids}
+    try:
+        res = (
+            await client.table("bid_recommendations")
+            .select("*")
+            .eq("team_id", team_id)
+            .eq("profile_hash", profile_hash)
+            .in_("bid_no", list(fingerprints))
+            .order("analyzed_at", desc=True)
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"[팀 {team_id}] 분석 메모 조회 실패 (무시): {e}")
+        return {}, {}
+
+    rows = [
+        r for r in res.data or []
+        if r.get("content_hash") == fingerprints.get(r.get("bid_no")) and _is_final_row(r)
+    ]
+    return _restore_analysis(team_id, rows)
+
+
+async def _load_canonical_analysis(
+    client,
+    team_id: str,
+    profile_hash: str,
+    bid_nos: list[str],
+) -> tuple[dict[str, QualificationResult], dict[str, BidRecommendation]]:
+    """재공고의 원 공고(이번 수집 범위 밖)에 대해 같은 프로필로 분석한 최신 결과 (내용 해시 무관)"""
+    if not bid_nos:
+        return {}, {}
+    try:
+        res = (
+            await client.table("bid_recommendations")
+            .select("*")
+            .eq("team_id", team_id)
+            .eq("profile_hash", profile_hash)
+            .in_("bid_no", bid_nos)
+            .order("analyzed_at", desc=True)
+            .execute()
+        )
+    except Exception as e:
+        logger.warning(f"[팀 {team_id}] 원 공고 분석 조회 실패 (재공고 재분석): {e}")
+        return {}, {}
+    return _restore_analysis(team_id, [r for r in res.data or [] if _is_final_row(r)])
+
+
+def _is_final(qual: QualificationResult, rec: Optional[BidRecommendation]) -> bool:
+    """
+    재사용 가능한 분석인지 — 자격 판정 오류 임시 결과가 아니고,
+    fail이 아니면 매칭 점수까지 있음 (점수 배치 실패·top_n 밖 공고는 다음 수집에서 재분석)
+    """
+    if qual.qualification_notes == QUALIFICATION_ERROR_NOTE:
+        return False
+    return qual.qualification_status == "fail" or rec is not None
+
+
+def _is_final_row(row: dict) -> bool:
+    """bid_recommendations 행 기준 _is_final"""
+    if row.get("qualification_notes") == QUALIFICATION_ERROR_NOTE:
+        return False
+    return row.get("qualification_status") == "fail" or (
+        row.get("match_score") is not None and bool(row.get("recommendation_reasons"))
+    )
+
+
+def _restore_analysis(
+    team_id: str, rows: list[dict]
+) -> tuple[dict[str, QualificationResult], dict[str, BidRecommendation]]:
+    """bid_recommendations 행(analyzed_at 내림차순) → 공고별 최신 자격 판정/매칭 점수"""
+    quals: dict[str, QualificationResult] = {}
+    recs: dict[str, BidRecommendation] = {}
+    for row in rows:
+        bid_no = row.get("bid_no")
+        if bid_no in quals:
+            continue
+        try:
+            quals[bid_no] = QualificationResult(
+                bid_no=bid_no,
+                qualification_status=row["qualification_status"],
+                disqualification_reason=row.get("disqualification_reason"),
+                qualification_notes=row.get("qualification_notes"),
+            )
+            if row.get("match_score") is not None and row.get("recommendation_reasons"):
+                recs[bid_no] = BidRecommendation(
+                    bid_no=bid_no,
+                    match_score=row["match_score"],
+                    match_grade=row["match_grade"],
+                    recommendation_summary=row.get("recommendation_summary") or "",
+                    recommendation_reasons=row["recommendation_reasons"],
+                    risk_factors=row.get("risk_factors") or [],
+                    win_probability_hint=row.get("win_probability_hint") or "중",
+                    recommended_action=row.get("recommended_action") or "검토",
+                )
+        except Exception as e:
+            quals.pop(bid_no, None)
+            logger.warning(f"[팀 {team_id}] 분석 메모 복원 실패 {bid_no} (재분석): {e}")
+    return quals, recs
+
+
 async def _save_recommendations(
     client,
     team_id: str,
@@ -635,8 +811,9 @@ async def _save_recommendations(
     recommendations: list[BidRecommendation],
     qual_results: list[QualificationResult],
     bids: list[BidAnnouncement],
+    profile_hash: Optional[str] = None,
 ) -> None:
-    """bid_recommendations 테이블에 분석 결과 저장"""
+    """bid_recommendations 테이블에 분석 결과 저장 (profile_hash가 있으면 완료된 분석에 메모 키도 함께 저장)"""
     rec_map = {r.bid_no: r for r in recommendations}
     qual_map = {q.bid_no: q for q in qual_results}
     now = datetime.now(timezone.utc)
@@ -648,6 +825,7 @@ async def _save_recommendations(
         rec = rec_map.get(bid.bid_no)
 
         if not qual:
+            # 관련도 사전 필터 탈락 공고 — 분석하지 않았으므로 저장하지 않음 (다음 수집에서 다시 정렬)
             continue
 
         row = {
@@ -660,6 +838,11 @@ async def _save_recommendations(
             "analyzed_at": now.isoformat(),
             "expires_at": expires,
         }
+        if profile_hash:
+            # 미완료 분석은 메모 키를 비워 이전 키가 남지 않도록 함
+            final = _is_final(qual, rec)
+            row["profile_hash"] = profile_hash if final else None
+            row["content_hash"] = BidRecommender.bid_fingerprint(bid) if final else None
 
         if rec:
             row.update({
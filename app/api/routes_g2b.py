@@ -7,16 +7,19 @@
   GET /api/g2b/contract-results  계약결과 조회
   GET /api/g2b/company-history   업체 입찰이력
   GET /api/g2b/competitors       경쟁사 통합 분석 (4단계)
+  GET /api/g2b/award-stats       낙찰 이력 로컬 집계 (수요기관·업무구분·업체별)
 
 모두 JWT 인증 필요 (Depends(get_current_user))
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.middleware.auth import get_current_user
+from app.services.award_history import award_store
 from app.services.g2b_service import G2BService
 
 logger = logging.getLogger(__name__)
@@ -201,3 +204,23 @@ async def competitors(
     except Exception as e:
         logger.error(f"competitors 분석 오류: {e}")
         raise HTTPException(status_code=500, detail="경쟁사 분석 중 오류가 발생했습니다.")
+
+
+# ─────────────────────────────────────────────
+# 낙찰 이력 로컬 집계
+# ─────────────────────────────────────────────
+
+@router.get("/award-stats")
+async def award_stats(
+    agency: Optional[str] = Query(None, description="수요기관명"),
+    category: Optional[str] = Query(None, description="업무구분 (예: 용역)"),
+    company: Optional[str] = Query(None, description="업체명"),
+    current_user=Depends(get_current_user),
+):
+    """
+    낙찰 이력 로컬 저장소의 미리 계산된 집계 (G2B 호출 없음)
+
+    조건별 경쟁사 수, 낙찰 수·금액, 평균 투찰률·표준편차, 최근 개찰일.
+    공용 공고 수집 워커와 경쟁사 분석 요청이 적재한 범위만 반영됩니다.
+    """
+    return await asyncio.to_thread(award_store.stats, agency=agency, category=category, winner=company)
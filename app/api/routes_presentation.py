@@ -1,6 +1,7 @@
 """발표 자료 생성 API (v3.1) — 평가항목 기반 PPTX 자동 생성"""
 
 import asyncio
+import json
 import logging
 import tempfile
 from pathlib import Path
@@ -8,13 +9,22 @@ from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
 
 from app.exceptions import SessionNotFoundError
 from app.middleware.auth import get_current_user
 from app.models.phase_schemas import Phase2Artifact, Phase3Artifact, Phase4Artifact
 from app.models.schemas import RFPData
-from app.services.presentation_generator import generate_presentation_slides
-from app.services.presentation_pptx_builder import build_presentation_pptx
+from app.services.presentation_generator import (
+    generate_presentation_slides,
+    regenerate_slides,
+    slide_hashes,
+)
+from app.services.presentation_pptx_builder import (
+    build_presentation_pptx,
+    patch_presentation_pptx,
+)
+from app.services.progress_bus import progress_bus
 from app.services.session_manager import session_manager
 from app.utils.supabase_client import get_async_client
 
@@ -120,6 +130,67 @@ async def _upload_presentation(proposal_id: str, local_path: str) -> str:
         return ""
 
 
+# 진행 이벤트로 내보낼 발표 자료 세션 키 (슬라이드 JSON 등 대용량 값 제외)
+_PRESENTATION_EVENT_KEYS = (
+    "presentation_status",
+    "presentation_pptx_url",
+    "presentation_error",
+    "presentation_regenerated_slides",
+)
+
+
+def _set_presentation_state(proposal_id: str, updates: dict) -> None:
+    """발표 자료 세션 상태 갱신 + 진행 이벤트 발행"""
+    session_manager.update_session(proposal_id, updates)
+    data = {
+        k.removeprefix("presentation_"): updates[k]
+        for k in _PRESENTATION_EVENT_KEYS if k in updates
+    }
+    if data:
+        progress_bus.publish(proposal_id, "presentation", data)
+
+
+def _slides_json_path(proposal_id: str) -> Path:
+    """슬라이드 JSON 저장 경로 (PPTX와 같은 디렉토리)"""
+    return Path(tempfile.gettempdir()) / proposal_id / "presentation_slides.json"
+
+
+def _save_slides_json(proposal_id: str, slides_json: dict) -> dict[str, str]:
+    """슬라이드 JSON + 슬라이드별 콘텐츠 해시 저장. 해시 dict 반환"""
+    hashes = slide_hashes(slides_json)
+    path = _slides_json_path(proposal_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"slides_json": slides_json, "slide_hashes": hashes}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.warning(f"슬라이드 JSON 저장 실패 (무시): {e}")
+    return hashes
+
+
+def _load_slides_json(proposal_id: str, session: dict) -> Optional[dict]:
+    """세션 → 로컬 파일 순으로 슬라이드 JSON 조회"""
+    if session.get("presentation_slides"):
+        return session["presentation_slides"]
+    path = _slides_json_path(proposal_id)
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("slides_json")
+    except (OSError, ValueError):
+        return None
+
+
+def _load_artifacts(session: dict):
+    """세션 → (phase2, phase3, phase4, rfp_data)"""
+    phase2 = Phase2Artifact(**session["phase_artifact_2"])
+    phase3 = Phase3Artifact(**session["phase_artifact_3"])
+    phase4 = Phase4Artifact(**session["phase_artifact_4"])
+    rfp_raw = session.get("phase_artifact_1", {}).get("rfp_data")
+    rfp_data = RFPData(**rfp_raw) if rfp_raw else None
+    return phase2, phase3, phase4, rfp_data
+
+
 # ── 백그라운드 실행 함수 ──────────────────────────────────────────────────────
 
 async def _run_presentation(
@@ -133,11 +204,7 @@ async def _run_presentation(
         session = await session_manager.aget_session(proposal_id)
 
         # Artifact 로드
-        phase2 = Phase2Artifact(**session["phase_artifact_2"])
-        phase3 = Phase3Artifact(**session["phase_artifact_3"])
-        phase4 = Phase4Artifact(**session["phase_artifact_4"])
-        rfp_raw = session.get("phase_artifact_1", {}).get("rfp_data")
-        rfp_data = RFPData(**rfp_raw) if rfp_raw else None
+        phase2, phase3, phase4, rfp_data = _load_artifacts(session)
 
         # 슬라이드 JSON 생성 (Claude API)
         slides_json = await generate_presentation_slides(phase2, phase3, phase4, rfp_data)
@@ -150,27 +217,93 @@ async def _run_presentation(
 
         # PPTX 빌드
         output_path = Path(tempfile.gettempdir()) / proposal_id / "presentation.pptx"
-        project_name = rfp_data.project_name if rfp_data else ""
+        project_name = rfp_data.title if rfp_data else ""
         build_presentation_pptx(slides_json, output_path, project_name, template_path)
 
+        # 슬라이드별 JSON + 콘텐츠 해시 저장 (선택 슬라이드 재생성용)
+        hashes = _save_slides_json(proposal_id, slides_json)
+
         # Supabase Storage 업로드
         pptx_url = await _upload_presentation(proposal_id, str(output_path))
 
         # 세션 업데이트
-        session_manager.update_session(proposal_id, {
+        _set_presentation_state(proposal_id, {
             "presentation_status": "done",
             "presentation_pptx_path": str(output_path),
             "presentation_pptx_url": pptx_url,
             "presentation_eval_coverage": slides_json.get("eval_coverage", {}),
             "presentation_template_mode": template_mode,
             "presentation_template_id": template_id,
+            "presentation_sample_storage_path": sample_storage_path,
+            "presentation_slides": slides_json,
+            "presentation_slide_hashes": hashes,
         })
         logger.info(f"발표 자료 생성 완료: {proposal_id} ({slides_json.get('total_slides', '?')}장)")
 
     except Exception as e:
         logger.error(f"발표 자료 생성 실패: {proposal_id} — {e}")
         try:
-            session_manager.update_session(proposal_id, {
+            _set_presentation_state(proposal_id, {
+                "presentation_status": "error",
+                "presentation_error": str(e)[:500],
+            })
+        except Exception:
+            pass
+
+
+async def _run_slide_regeneration(
+    proposal_id: str,
+    slide_nums: list[int],
+    instructions: str = "",
+):
+    """선택 슬라이드 재생성 백그라운드 태스크 — Claude 호출과 PPTX 렌더링 모두 선택 슬라이드만"""
+    try:
+        session = await session_manager.aget_session(proposal_id)
+        phase2, phase3, phase4, rfp_data = _load_artifacts(session)
+        old_json = _load_slides_json(proposal_id, session) or {}
+        old_hashes = session.get("presentation_slide_hashes") or slide_hashes(old_json)
+
+        slides_json = await regenerate_slides(
+            old_json, slide_nums, phase2, phase3, phase4, rfp_data, instructions
+        )
+        hashes = _save_slides_json(proposal_id, slides_json)
+        changed = {int(n) for n, h in hashes.items() if old_hashes.get(n) != h}
+
+        template_mode = session.get("presentation_template_mode", "standard")
+        template_path = _resolve_template_path(
+            template_mode,
+            session.get("presentation_template_id", "government_blue"),
+            session.get("presentation_sample_storage_path"),
+        )
+        pptx_path = Path(
+            session.get("presentation_pptx_path")
+            or Path(tempfile.gettempdir()) / proposal_id / "presentation.pptx"
+        )
+        project_name = rfp_data.title if rfp_data else ""
+
+        pptx_url = session.get("presentation_pptx_url", "")
+        if changed:
+            await asyncio.to_thread(
+                patch_presentation_pptx,
+                pptx_path, slides_json, changed, pptx_path, project_name, template_path,
+            )
+            pptx_url = await _upload_presentation(proposal_id, str(pptx_path)) or pptx_url
+
+        _set_presentation_state(proposal_id, {
+            "presentation_status": "done",
+            "presentation_pptx_path": str(pptx_path),
+            "presentation_pptx_url": pptx_url,
+            "presentation_eval_coverage": slides_json.get("eval_coverage", {}),
+            "presentation_slides": slides_json,
+            "presentation_slide_hashes": hashes,
+            "presentation_regenerated_slides": sorted(changed),
+        })
+        logger.info(f"슬라이드 재생성 완료: {proposal_id} — 변경 {sorted(changed)}")
+
+    except Exception as e:
+        logger.error(f"슬라이드 재생성 실패: {proposal_id} — {e}")
+        try:
+            _set_presentation_state(proposal_id, {
                 "presentation_status": "error",
                 "presentation_error": str(e)[:500],
             })
@@ -180,6 +313,10 @@ async def _run_presentation(
 
 # ── 엔드포인트 ────────────────────────────────────────────────────────────────
 
+class SlideRegenerateRequest(BaseModel):
+    slide_nums: list[int] = Field(..., min_length=1)
+    instructions: str = ""
+
 @router.get("/presentation/templates")
 async def list_presentation_templates(
     current_user=Depends(get_current_user),
@@ -229,7 +366,7 @@ async def generate_presentation(
             detail="sample 모드에는 sample_storage_path가 필요합니다",
         )
 
-    session_manager.update_session(proposal_id, {"presentation_status": "processing"})
+    _set_presentation_state(proposal_id, {"presentation_status": "processing"})
 
     background_tasks.add_task(
         _run_presentation,
@@ -248,6 +385,43 @@ async def generate_presentation(
     }
 
 
+@router.post("/proposals/{proposal_id}/presentation/slides/regenerate")
+async def regenerate_presentation_slides(
+    proposal_id: str,
+    body: SlideRegenerateRequest,
+    background_tasks: BackgroundTasks,
+    current_user=Depends(get_current_user),
+):
+    """선택 슬라이드만 재생성 후 PPTX 부분 갱신 (백그라운드 실행)"""
+    try:
+        session = await session_manager.aget_session(proposal_id)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail="제안서를 찾을 수 없습니다")
+
+    if session.get("presentation_status") == "processing":
+        raise HTTPException(status_code=409, detail="발표 자료를 생성 중입니다")
+
+    slides_json = _load_slides_json(proposal_id, session)
+    if not slides_json:
+        raise HTTPException(status_code=404, detail="발표 자료가 아직 생성되지 않았습니다")
+
+    known = {s.get("slide_num") for s in slides_json.get("slides", [])}
+    unknown = sorted(set(body.slide_nums) - known)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"존재하지 않는 슬라이드 번호입니다: {unknown}")
+
+    slide_nums = sorted(set(body.slide_nums))
+    _set_presentation_state(proposal_id, {"presentation_status": "processing"})
+    background_tasks.add_task(_run_slide_regeneration, proposal_id, slide_nums, body.instructions)
+
+    return {
+        "proposal_id": proposal_id,
+        "status": "processing",
+        "slide_nums": slide_nums,
+        "message": f"슬라이드 {len(slide_nums)}장 재생성을 시작합니다",
+    }
+
+
 @router.get("/proposals/{proposal_id}/presentation/status")
 async def get_presentation_status(
     proposal_id: str,
@@ -267,6 +441,7 @@ async def get_presentation_status(
         "template_mode": session.get("presentation_template_mode", ""),
         "template_id": session.get("presentation_template_id", ""),
         "error": session.get("presentation_error", ""),
+        "regenerated_slides": session.get("presentation_regenerated_slides", []),
     }
 
 
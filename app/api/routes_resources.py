@@ -4,6 +4,7 @@
 모든 엔드포인트는 Bearer JWT 인증 필수.
 """
 
+import asyncio
 import logging
 import math
 import mimetypes
@@ -15,6 +16,10 @@ from pydantic import BaseModel
 
 from app.middleware.auth import get_current_user
 from app.services.asset_extractor import extract_sections_from_asset
+from app.services.asset_ingestion import BulkUploadError, ingest_assets, spool_uploads
+from app.services.asset_ingestion import cleanup as cleanup_spool
+from app.services.section_search import hybrid_search, index_section, remove_section
+from app.services.vector_store import library_vectors
 from app.utils.supabase_client import get_async_client
 
 logger = logging.getLogger(__name__)
@@ -52,10 +57,15 @@ class SectionUpdate(BaseModel):
 async def list_sections(
     user=Depends(get_current_user),
     category: Optional[str] = Query(None, description="카테고리 필터"),
-    q: Optional[str] = Query(None, description="제목/내용 검색"),
+    q: Optional[str] = Query(None, description="제목/내용 검색 (관련도순)"),
     scope: str = Query("all", description="all | team | personal"),
+    limit: int = Query(50, ge=1, le=200, description="검색 결과 최대 건수 (q 지정 시)"),
 ):
-    """섹션 라이브러리 목록 조회"""
+    """섹션 라이브러리 목록 조회
+
+    q를 지정하면 BM25 + 벡터 하이브리드 검색 결과를 관련도순으로 반환합니다
+    (각 섹션에 score, scores.bm25, scores.vector 포함).
+    """
     client = await get_async_client()
 
     query = client.table("sections").select(
@@ -63,9 +73,8 @@ async def list_sections(
         "owner_id, team_id, created_at, updated_at"
     )
 
-    if scope == "personal":
-        query = query.eq("owner_id", user.id)
-    elif scope == "team":
+    my_team_ids: list[str] = []
+    if scope != "personal":
         team_res = (
             await client.table("team_members")
             .select("team_id")
@@ -73,6 +82,10 @@ async def list_sections(
             .execute()
         )
         my_team_ids = [r["team_id"] for r in (team_res.data or [])]
+
+    if scope == "personal":
+        query = query.eq("owner_id", user.id)
+    elif scope == "team":
         if my_team_ids:
             team_ids_csv = ",".join(my_team_ids)
             query = query.or_(f"owner_id.eq.{user.id},team_id.in.({team_ids_csv})")
@@ -80,13 +93,6 @@ async def list_sections(
             query = query.eq("owner_id", user.id)
     else:
         # all: 본인 소유 + 팀 소속 + 공개
-        team_res = (
-            await client.table("team_members")
-            .select("team_id")
-            .eq("user_id", user.id)
-            .execute()
-        )
-        my_team_ids = [r["team_id"] for r in (team_res.data or [])]
         if my_team_ids:
             team_ids_csv = ",".join(my_team_ids)
             query = query.or_(
@@ -99,9 +105,32 @@ async def list_sections(
 
     if category:
         query = query.eq("category", category)
-    if q:
-        q_safe = q.replace("%", r"\%").replace("_", r"\_")
-        query = query.or_(f"title.ilike.%{q_safe}%,content.ilike.%{q_safe}%")
+
+    if q and q.strip():
+        team_set = set(my_team_ids)
+
+        def allow(meta: dict) -> bool:
+            if category and meta.get("category") != category:
+                return False
+            if meta.get("owner_id") == user.id:
+                return True
+            if scope == "personal":
+                return False
+            if meta.get("team_id") in team_set:
+                return True
+            return scope == "all" and meta.get("is_public", False)
+
+        matches = await hybrid_search(
+            client, q.strip(), owner_id=user.id, team_ids=my_team_ids, allow=allow, limit=limit,
+        )
+        if not matches:
+            return {"sections": []}
+        res = await query.in_("id", [m.section_id for m in matches]).execute()
+        rows = {r["id"]: r for r in (res.data or [])}
+        return {"sections": [
+            {**rows[m.section_id], "score": m.score, "scores": {"bm25": m.bm25, "vector": m.vector}}
+            for m in matches if m.section_id in rows
+        ]}
 
     query = query.order("created_at", desc=True)
     res = await query.execute()
@@ -145,6 +174,7 @@ async def create_section(body: SectionCreate, user=Depends(get_current_user)):
         insert_data["team_id"] = body.team_id
 
     await client.table("sections").insert(insert_data).execute()
+    await index_section(insert_data)
     return {"section_id": section_id, "title": body.title, "category": body.category}
 
 
@@ -176,13 +206,15 @@ async def update_section(
     if not update_data:
         raise HTTPException(status_code=400, detail="수정할 필드가 없습니다.")
 
-    await (
+    updated = await (
         client.table("sections")
         .update(update_data)
         .eq("id", section_id)
         .eq("owner_id", user.id)
         .execute()
     )
+    if updated.data:
+        await index_section(updated.data[0])
     return {"section_id": section_id, **update_data}
 
 
@@ -210,6 +242,7 @@ async def delete_section(section_id: str, user=Depends(get_current_user)):
         .eq("owner_id", user.id)
         .execute()
     )
+    await remove_section(section_id)
 
 
 # ── 회사 자료 ─────────────────────────────────────────────────────────
@@ -351,6 +384,64 @@ async def _run_extraction(
             )
 
 
+@router.post("/assets/bulk", status_code=201)
+async def upload_assets_bulk(
+    background_tasks: BackgroundTasks,
+    files: List[UploadFile] = File(...),
+    user=Depends(get_current_user),
+):
+    """회사 자료 일괄 업로드 (PDF / DOCX 여러 개 또는 ZIP)
+
+    파일은 임시 저장 후 백그라운드에서 Storage 업로드·섹션 추출을 병렬 실행합니다.
+    지원하지 않는 형식이나 크기 초과 파일은 skipped로 반환합니다.
+    """
+    try:
+        spooled = await asyncio.to_thread(
+            spool_uploads, [(f.file, f.filename or "") for f in files], user.id
+        )
+    except BulkUploadError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not spooled.assets:
+        raise HTTPException(status_code=400, detail="업로드 가능한 PDF 또는 DOCX 파일이 없습니다.")
+
+    client = await get_async_client()
+    team_res = (
+        await client.table("team_members")
+        .select("team_id")
+        .eq("user_id", user.id)
+        .limit(1)
+        .execute()
+    )
+    team_id = team_res.data[0]["team_id"] if team_res.data else None
+
+    try:
+        await client.table("company_assets").insert([
+            {
+                "id": a.asset_id,
+                "owner_id": user.id,
+                "team_id": team_id,
+                "filename": a.filename,
+                "storage_path": a.storage_path,
+                "file_type": a.file_type,
+                "status": "pending",
+            }
+            for a in spooled.assets
+        ]).execute()
+    except Exception:
+        cleanup_spool(spooled.assets)
+        raise
+
+    background_tasks.add_task(ingest_assets, spooled.assets, user.id, team_id)
+
+    return {
+        "assets": [
+            {"asset_id": a.asset_id, "filename": a.filename, "status": "pending"}
+            for a in spooled.assets
+        ],
+        "skipped": spooled.skipped,
+    }
+
+
 @router.get("/assets")
 async def list_assets(user=Depends(get_current_user)):
     """회사 자료 목록 조회 (내 자료 + 팀 자료)"""
@@ -408,6 +499,7 @@ async def delete_asset(asset_id: str, user=Depends(get_current_user)):
         .eq("owner_id", user.id)
         .execute()
     )
+    await library_vectors.remove_asset(asset_id)
 
 
 # ── 제안서 아카이브 ───────────────────────────────────────────────────
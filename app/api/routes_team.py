@@ -14,6 +14,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from app.middleware.auth import get_current_user
+from app.utils.model_router import model_for, route_usage
 from app.utils.supabase_client import get_async_client
 from app.utils.edge_functions import notify_comment_created
 
@@ -683,3 +684,16 @@ async def get_usage(
         "page": page,
         "page_size": page_size,
     }
+
+
+@router.get("/usage/routes")
+async def get_route_usage(user=Depends(get_current_user)):
+    """모델 라우팅 단계별 사용량 (현재 프로세스 기동 이후 누적)"""
+    usage = route_usage()
+    return {
+        "routes": {
+            step: {"model": model_for(step), **stats}
+            for step, stats in usage.items()
+        },
+        "total_tokens": sum(u["input_tokens"] + u["output_tokens"] for u in usage.values()),
+    }
@@ -1,24 +1,33 @@
 """v3.4 Phase 기반 API 엔드포인트"""
 
+import asyncio
 import logging
 import os
+import tempfile
 import uuid
 from typing import List, Optional
 
 import json as _json
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Header, HTTPException, UploadFile, File
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.services.session_manager import session_manager
+from app.services.progress_bus import ProgressEvent, progress_bus
 from app.models.phase_schemas import Phase1Artifact, Phase2Artifact, Phase3Artifact, Phase4Artifact
 from app.services.phase_executor import PhaseExecutor
 from app.services.bid_calculator import BidCalculator, PersonnelInput, ProcurementMethod, parse_budget_string
-from app.exceptions import SessionNotFoundError
+from app.services.award_history import award_store, ensure_fresh
+from app.services.bid_simulation import (
+    SIMULATED_METHODS, BidSimulator, RatioDistribution, fit_ratio_distribution, fit_ratios,
+)
+from app.services.g2b_service import G2BService
+from app.exceptions import FileProcessingError, SessionNotFoundError
 from app.services.template_service import get_available_templates, get_template_toc, clear_toc_cache
 from app.middleware.auth import get_current_user
+from app.utils.file_utils import aextract_text_from_file
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v3.1", tags=["v3.1"])
@@ -54,6 +63,48 @@ async def _run_phases_from(proposal_id: str, start_phase: int):
         logger.error(f"Phase {start_phase}부터 재실행 실패: {proposal_id} — {e}")
 
 
+async def _run_section_regeneration(proposal_id: str, section_names: list[str], instructions: str):
+    """백그라운드에서 선택 섹션 재작성 → 재평가 → 문서 패치"""
+    executor = PhaseExecutor(proposal_id, session_manager)
+    try:
+        final = await executor.regenerate_sections(section_names, instructions)
+        session_manager.update_session(proposal_id, {
+            "docx_path": final.docx_path,
+            "pptx_path": final.pptx_path,
+            "hwpx_path": final.hwpx_path,
+        })
+        logger.info(f"섹션 재생성 완료: {proposal_id} {section_names} (score={final.quality_score})")
+    except Exception as e:
+        logger.error(f"섹션 재생성 실패: {proposal_id} {section_names} — {e}")
+
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+async def _spool_upload(upload: UploadFile, suffix: str, max_bytes: int) -> str:
+    """업로드 파일을 청크 단위로 임시 파일에 기록하고 경로를 반환 (max_bytes 초과 시 413)
+
+    extract_text_from_file이 경로/확장자 기반으로 분기하므로 이름 있는 임시 파일을 사용합니다.
+    호출자가 사용 후 삭제해야 합니다.
+    """
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    written = 0
+    try:
+        with tmp:
+            while chunk := await upload.read(_UPLOAD_CHUNK_BYTES):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"파일 크기가 {settings.max_file_size_mb}MB를 초과합니다.",
+                    )
+                tmp.write(chunk)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    return tmp.name
+
+
 @router.post("/proposals/generate")
 async def generate_proposal_v31(
     rfp_title: str = Form(...),
@@ -64,6 +115,7 @@ async def generate_proposal_v31(
     team_id: Optional[str] = Form(None),
     section_ids: Optional[str] = Form(None),  # JSON 배열 문자열 ex) '["uuid1","uuid2"]'
     form_template_id: Optional[str] = Form(None),
+    warm_start: bool = Form(False),  # 사용자가 수락한 경우만 유사 이전 실행의 Phase 2/3 재사용 (기본은 후보 안내만)
     current_user=Depends(get_current_user),
 ):
     """v3.4 제안서 세션 초기화"""
@@ -72,19 +124,26 @@ async def generate_proposal_v31(
 
     rfp_text = ""
     if rfp_file:
-        # 파일 크기 검증
-        content = await rfp_file.read()
-        max_bytes = settings.max_file_size_mb * 1024 * 1024
-        if len(content) > max_bytes:
-            raise HTTPException(status_code=413, detail=f"파일 크기가 {settings.max_file_size_mb}MB를 초과합니다.")
-        # 확장자 검증
+        # 확장자 검증 (본문 수신 전)
         ext = os.path.splitext(rfp_file.filename or "")[1].lower()
         if ext not in settings.allowed_file_extensions:
             raise HTTPException(
                 status_code=415,
                 detail=f"지원하지 않는 파일 형식입니다. 허용: {', '.join(settings.allowed_file_extensions)}"
             )
-        rfp_text = content.decode("utf-8", errors="ignore")
+        # 청크 단위로 임시 파일에 기록 (크기 초과 시 즉시 413) → 확장자별 텍스트 추출 (off-loop)
+        tmp_path = await _spool_upload(rfp_file, ext, settings.max_file_size_mb * 1024 * 1024)
+        try:
+            rfp_text = await aextract_text_from_file(tmp_path)
+        except FileProcessingError as e:
+            raise HTTPException(status_code=422, detail=e.message)
+        finally:
+            os.unlink(tmp_path)
+        if not rfp_text.strip():
+            raise HTTPException(
+                status_code=422,
+                detail="파일에서 텍스트를 추출할 수 없습니다. (스캔 이미지 PDF 등은 지원되지 않습니다)",
+            )
     elif rfp_content:
         rfp_text = rfp_content
     else:
@@ -114,6 +173,7 @@ async def generate_proposal_v31(
                     "client_name": client_name,
                     "rfp_content": rfp_text,
                     "express_mode": express_mode,
+                    "warm_start": warm_start,
                 },
             },
             session_type="v3.1",
@@ -151,6 +211,59 @@ async def get_proposal_status_v31(proposal_id: str, current_user=Depends(get_cur
     }
 
 
+def _progress_snapshot(session: dict) -> dict:
+    """SSE 최초 연결 시 보내는 현재 상태 (status 엔드포인트와 동일 필드 + 발표 자료 상태)"""
+    return {
+        "status": session.get("status", "unknown"),
+        "current_phase": session.get("current_phase", "pending"),
+        "phases_completed": session.get("phases_completed", 0),
+        "error": session.get("error", ""),
+        "presentation_status": session.get("presentation_status", "idle"),
+    }
+
+
+@router.get("/proposals/{proposal_id}/events")
+async def stream_proposal_events(
+    proposal_id: str,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    since: Optional[int] = None,
+    current_user=Depends(get_current_user),
+):
+    """
+    제안서 진행 이벤트 SSE 스트림 (status 폴링 대체)
+
+    이벤트: snapshot(최초 상태) / phase / artifact / section / status / presentation / resync
+    재연결 시 Last-Event-ID 헤더(또는 ?since=)로 놓친 이벤트부터 재전송합니다.
+    """
+    try:
+        session = await session_manager.aget_session(proposal_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e.message))
+
+    try:
+        resume_from = int(last_event_id) if last_event_id else (since or 0)
+    except ValueError:
+        resume_from = 0
+
+    async def _events():
+        if not resume_from:
+            snapshot = ProgressEvent(
+                id=progress_bus.last_id(proposal_id), event="snapshot", data=_progress_snapshot(session)
+            )
+            yield snapshot.to_sse()
+            start = snapshot.id
+        else:
+            start = resume_from
+        async for ev in progress_bus.subscribe(proposal_id, start):
+            yield ev.to_sse() if ev is not None else ": keepalive\n\n"
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/proposals/{proposal_id}/result")
 async def get_proposal_result_v31(proposal_id: str, current_user=Depends(get_current_user)):
     """제안서 최종 결과 조회"""
@@ -221,6 +334,49 @@ async def execute_proposal_phase_v31(
     }
 
 
+class SectionRegenerateRequest(BaseModel):
+    sections: List[str]
+    instructions: str = ""
+
+
+@router.post("/proposals/{proposal_id}/sections/regenerate", status_code=202)
+async def regenerate_proposal_sections(
+    proposal_id: str,
+    req: SectionRegenerateRequest,
+    background_tasks: BackgroundTasks,
+    current_user=Depends(get_current_user),
+):
+    """Phase 4 섹션 일부만 재작성 (해당 섹션만 재평가, DOCX/HWPX 패치 — 즉시 202 반환)"""
+    try:
+        session = await session_manager.aget_session(proposal_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e.message))
+
+    if session.get("status") in ("processing", "running"):
+        raise HTTPException(status_code=409, detail="이미 실행 중입니다.")
+    if session.get("phases_completed", 0) < 5:
+        raise HTTPException(status_code=400, detail="Phase 5까지 완료된 제안서만 섹션을 재작성할 수 있습니다.")
+
+    existing = session.get("phase_artifact_4", {}).get("sections", {})
+    names = list(dict.fromkeys(req.sections))
+    unknown = [n for n in names if n not in existing]
+    if not names or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"존재하지 않는 섹션입니다: {unknown}. 사용 가능: {list(existing)}",
+        )
+
+    session_manager.update_session(proposal_id, {"status": "processing"})
+    background_tasks.add_task(_run_section_regeneration, proposal_id, names, req.instructions)
+
+    return {
+        "proposal_id": proposal_id,
+        "status": "processing",
+        "sections": names,
+        "message": f"섹션 {len(names)}개 재작성을 시작했습니다. /status로 진행 상태를 확인하세요.",
+    }
+
+
 @router.get("/proposals/{proposal_id}/download/{file_type}")
 async def download_document(proposal_id: str, file_type: str, current_user=Depends(get_current_user)):
     """
@@ -276,7 +432,12 @@ class BidCalculateRequest(BaseModel):
     procurement_method: str = "종합평가"
     budget: Optional[str] = None
     price_weight: int = 20
-    competitor_count: int = 5
+    # 시뮬레이션 행렬이 (시나리오 × 경쟁사 수)이므로 상한을 둠
+    competitor_count: int = Field(5, ge=0, le=100)
+    # 몬테카를로 낙찰 확률 곡선 (최저가/적격심사만) — 경쟁사 투찰률은 history_keyword 낙찰결과로 추정
+    simulate: bool = False
+    scenarios: Optional[int] = None
+    history_keyword: Optional[str] = None
 
 
 @router.post("/bid/calculate")
@@ -303,7 +464,41 @@ async def calculate_bid(req: BidCalculateRequest, current_user=Depends(get_curre
         price_weight=req.price_weight,
         competitor_count=req.competitor_count,
     )
-    return calc.to_dict(result)
+    body = calc.to_dict(result)
+    if req.simulate:
+        body["simulation"] = await _simulate_bid(req, calc, cost, method, budget_int)
+    return body
+
+
+async def _simulate_bid(req: BidCalculateRequest, calc: BidCalculator, cost, method, budget: Optional[int]):
+    """투찰률별 낙찰 확률 곡선 (가격 경쟁 방식이 아니면 None)"""
+    if method not in SIMULATED_METHODS:
+        return None
+    distribution = RatioDistribution()
+    if req.history_keyword:
+        try:
+            async with G2BService() as g2b:
+                if settings.award_history_enabled and await ensure_fresh(g2b, req.history_keyword):
+                    ratios = await asyncio.to_thread(
+                        award_store.ratios, req.history_keyword, settings.bid_sim_history_rows
+                    )
+                    distribution = fit_ratios(ratios)
+                else:
+                    rows = await g2b.get_bid_results(req.history_keyword, num_of_rows=settings.bid_sim_history_rows)
+                    distribution = fit_ratio_distribution(rows)
+        except Exception as e:
+            logger.warning(f"낙찰결과 이력 조회 실패 (기본 투찰률 분포 사용): {e}")
+    scenarios = max(1, min(req.scenarios or settings.bid_sim_scenarios, settings.bid_sim_max_scenarios))
+    sim = await asyncio.to_thread(
+        BidSimulator(calc).simulate, cost, method,
+        budget=budget,
+        competitor_count=req.competitor_count,
+        distribution=distribution,
+        scenarios=scenarios,
+        reserve_range=settings.bid_sim_reserve_range,
+    )
+    return BidSimulator.to_dict(sim)
+
 
 @router.get("/templates")
 async def list_templates(current_user=Depends(get_current_user)):
@@ -24,6 +24,68 @@ class Settings(BaseSettings):
     max_input_tokens: int = 100_000
     max_output_tokens: int = 16_000
     max_thinking_tokens: int = 10_000
+    # Phase 프롬프트 입력 예산 (시스템·사용자 템플릿 포함, max_input_tokens가 상한) — context_packer 사용
+    # 기존 고정 자르기([:3000] 등)의 실효 프롬프트 크기 이하 (한국어 본문 ≈ 0.8토큰/자, JSON ≈ 0.6토큰/자)
+    context_budget_tokens: dict[str, int] = {
+        "phase2": 10_000,
+        "phase3": 15_000,
+        "phase4": 20_000,
+        "phase5": 8_000,
+        "phase5_sections": 6_000,
+    }
+    # Phase 5 평가 입력의 섹션당 본문 상한 (토큰) — 전체 평가 / 재작성 섹션 재평가
+    phase5_section_preview_tokens: int = 800
+    phase5_rescore_preview_tokens: int = 2_400
+
+    # 장문 RFP 청크 분석 (임계값 초과 시 청크별 병렬 추출 → 병합 → 충돌 조정)
+    rfp_chunk_threshold_chars: int = 10_000
+    rfp_chunk_chars: int = 8_000
+    rfp_chunk_concurrency: int = 4
+
+    # 단계별 모델 라우팅 (model_router) — 미지정 단계는 claude_model 사용
+    # 정형 추출/채점 단계는 소형 모델, 응답 검증 실패 시 상위 모델로 1회 재시도
+    # (model_escalation에 없는 모델은 claude_model로 승격)
+    model_routes: dict[str, str] = {
+        "rfp_extract": "claude-sonnet-4-5-20250929",
+        "rfp_chunk": "claude-sonnet-4-5-20250929",
+        "toc_extract": "claude-haiku-4-5-20251001",
+        "asset_extract": "claude-sonnet-4-5-20250929",
+        "bid_qualification": "claude-sonnet-4-5-20250929",
+        "bid_scoring": "claude-sonnet-4-5-20250929",
+        "phase5_scoring": "claude-sonnet-4-5-20250929",
+        "phase5_sections": "claude-sonnet-4-5-20250929",
+    }
+    model_escalation: dict[str, str] = {
+        "claude-haiku-4-5-20251001": "claude-sonnet-4-5-20250929",
+    }
+
+    # Claude 호출 공용 제한 (프로세스 전역, rate_limiter) — 분당 요청 수 0이면 속도 제한 없음
+    claude_max_concurrency: int = 16
+    claude_requests_per_minute: int = 0
+
+    # 입찰 AI 분석 — 자격 판정/매칭 점수 배치 동시 실행 수,
+    # 로컬 관련도(BM25) 상위 후보 수 (0이면 전체 분석)
+    bid_analysis_concurrency: int = 4
+    bid_prefilter_max_candidates: int = 60
+
+    # 공고 증분 동기화 — 키워드별 마지막 공고일시 이후 + overlap(분)만 조회
+    bid_incremental_sync: bool = True
+    bid_sync_overlap_minutes: int = 120
+
+    # 공용 공고 수집 워커 — 활성 프리셋 키워드 합집합을 주기적으로 동기화,
+    # 팀별 수집은 동기화가 staleness(분) 이내면 로컬 테이블만 조회
+    bid_ingestion_enabled: bool = True
+    bid_ingestion_interval_minutes: int = 30
+    bid_ingestion_max_staleness_minutes: int = 90
+
+    # 발표 자료 스토리보드 (Step 3) — 슬라이드 그룹별 병렬 생성
+    presentation_storyboard_group_size: int = 4
+    presentation_storyboard_concurrency: int = 4
+    presentation_storyboard_max_tokens: int = 6000
+
+    # 진행 이벤트 스트림 (SSE) — 제안서별 재전송 버퍼 크기, keepalive 주기(초)
+    progress_buffer_size: int = 256
+    sse_keepalive_seconds: float = 15.0
 
     # HITL 설정
     enable_hitl: bool = True
@@ -39,6 +101,37 @@ class Settings(BaseSettings):
     supabase_service_role_key: str = ""  # 서버 사이드 작업용
     vector_db_path: str = "./data/vectors"
 
+    # 섹션 라이브러리 벡터 검색 (Phase 4 참고 자료) — 청크 크기(자), 목차 항목당 상위 k개, 임베딩 차원
+    vector_chunk_chars: int = 800
+    vector_top_k: int = 3
+    vector_embedding_dim: int = 512
+
+    # 섹션 라이브러리 하이브리드 검색 — 벡터 검색 결합 여부, BM25 역색인 재구축 주기(초)
+    section_search_vector: bool = True
+    section_index_ttl_seconds: int = 300
+
+    # 근접 중복 탐지 (MinHash + LSH) — 중복 판정 추정 Jaccard 유사도, 재공고 비교 대상 공고 기간(일)
+    near_duplicate_threshold: float = 0.8
+    bid_duplicate_window_days: int = 60
+
+    # 제안서 웜 스타트 — 이전 실행 Phase 2/3 재사용 여부, RFP 유사도 하한(추정 Jaccard), 비교할 최근 완료 제안서 수
+    warm_start_enabled: bool = True
+    warm_start_min_similarity: float = 0.7
+    warm_start_max_candidates: int = 300
+
+    # 입찰가 몬테카를로 시뮬레이션 (/bid/calculate) — 시나리오 수 기본값/상한, 복수예비가격 범위(±), 낙찰결과 이력 조회 건수
+    bid_sim_scenarios: int = 5000
+    bid_sim_max_scenarios: int = 20000
+    bid_sim_reserve_range: float = 0.02
+    bid_sim_history_rows: int = 100
+
+    # 낙찰 이력 로컬 저장소 (경쟁사 분석·투찰률 통계) — SQLite 파일 경로,
+    # 키워드별 동기화 유효 시간(시간, 이내면 G2B 호출 없이 로컬 조회), 증분 적재 최대 페이지 수(페이지당 100건)
+    award_history_enabled: bool = True
+    award_history_path: str = "data/award_history.sqlite3"
+    award_history_max_staleness_hours: int = 24
+    award_history_max_pages: int = 5
+
     # 프론트엔드 URL (이메일 링크 생성용)
     frontend_url: str = "http://localhost:3000"
 
@@ -47,11 +140,41 @@ class Settings(BaseSettings):
 
     # 나라장터 API 키
     g2b_api_key: str = ""
+
+    # 나라장터 API 공용 호출 제한 (프로세스 전역, rate_limiter) — 동시 실행 수, 분당 요청 수(공공 API 초당 10건),
+    # 경쟁사 분석 단계별 호출 1건 타임아웃(초, 재시도 포함 — 초과 시 해당 결과 없이 진행)
+    g2b_max_concurrency: int = 5
+    g2b_requests_per_minute: int = 600
+    g2b_call_timeout_seconds: float = 20.0
     
     # 파일 업로드 설정
     max_file_size_mb: int = 10
-    allowed_file_extensions: list[str] = [".pdf", ".docx", ".txt"]
-    
+    allowed_file_extensions: list[str] = [".pdf", ".docx", ".hwpx", ".hwp", ".txt"]
+
+    # PDF 텍스트 추출 — 백엔드: auto(설치된 가장 빠른 것) | pymupdf | pypdfium2 | pypdf2
+    pdf_extract_backend: str = "auto"
+    pdf_extract_workers: int = 4
+    pdf_pages_per_chunk: int = 20
+
+    # 회사 자료 섹션 추출 — 장문은 청크(자)별 병렬 Claude 호출, 최대 청크/섹션 수
+    asset_chunk_chars: int = 8000
+    asset_max_chunks: int = 8
+    asset_extract_concurrency: int = 4
+    asset_max_sections: int = 30
+
+    # 회사 자료 일괄 업로드 (파일 여러 개 또는 ZIP) — 최대 파일 수, 파일당 최대 크기(MB),
+    # 동시 처리 파일 수, 업로드 임시 저장 디렉토리
+    asset_bulk_max_files: int = 200
+    asset_bulk_max_file_mb: int = 50
+    asset_bulk_concurrency: int = 4
+    asset_spool_dir: str = "data/asset_spool"
+
+    # 추출 텍스트 캐시 (파일 SHA-256 키) — 환경변수: TEXT_CACHE_DIR=/app/data/text_cache,
+    # 최대 용량(MB, 초과 시 오래 사용되지 않은 파일부터 삭제, 0이면 제한 없음)
+    text_cache_enabled: bool = True
+    text_cache_dir: str = "data/text_cache"
+    text_cache_max_mb: int = 512
+
     # 출력 디렉토리 — 환경변수: OUTPUT_DIR=/app/output
     output_dir: str = "output"
 
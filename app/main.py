@@ -47,7 +47,14 @@ async def lifespan(app: FastAPI):
     from app.services.session_manager import session_manager
     loaded = await session_manager.startup_load()
     logger.info(f"세션 복원 완료: {loaded}개")
+    # 공용 공고 수집 워커 (활성 프리셋 키워드 합집합 주기 동기화)
+    from app.services.bid_ingestion import bid_ingestion_worker
+    if settings.bid_ingestion_enabled:
+        bid_ingestion_worker.start()
     yield
+    await bid_ingestion_worker.stop()
+    from app.utils.pdf_extractor import shutdown_pool
+    shutdown_pool()
     logger.info("시스템 종료")
 
 
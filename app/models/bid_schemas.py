@@ -19,6 +19,7 @@ class BidAnnouncement(BaseModel):
     days_remaining: Optional[int] = None
     content_text: Optional[str] = None
     qualification_available: bool = True
+    duplicate_of: Optional[str] = None  # 근접 중복(재공고)이면 원 공고 bid_no
 
 
 # ── 팀 입찰 프로필 ───────────────────────────────────────────
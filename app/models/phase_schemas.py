@@ -27,6 +27,10 @@ class Phase1Artifact(PhaseArtifact):
         default_factory=dict,
         description="나라장터 유사계약 및 경쟁사 사전 분석 데이터"
     )
+    warm_start: dict = Field(
+        default_factory=dict,
+        description="재사용한 이전 실행 (proposal_id, title, similarity, changed_fields, applied)"
+    )
 
 
 class Phase2Artifact(PhaseArtifact):
@@ -46,3 +46,47 @@ RFP_ANALYSIS_PROMPT = """다음 RFP(제안요청서) 문서 내용을 분석하
     "evaluation_criteria": ["평가 기준 목록 (배점 포함 시 함께 기재)"],
     "table_of_contents": ["RFP에 명시된 제안서 목차 항목 (없으면 빈 배열)"]
 }}"""
+
+RFP_CHUNK_ANALYSIS_PROMPT = """다음은 RFP(제안요청서) 문서의 일부입니다 (전체 {total}개 중 {index}번째 부분).
+이 부분에 실제로 나타난 정보만 추출하세요. 없는 항목은 빈 값으로 두고 추측하지 마세요.
+
+## RFP 원문 (부분)
+{rfp_text}
+
+## 추출 지침
+아래 JSON 형식으로만 응답하세요:
+{{
+    "title": "사업명 (이 부분에 없으면 빈 문자열)",
+    "client_name": "발주 기관명 (없으면 빈 문자열)",
+    "project_scope": "이 부분에 기술된 사업 범위 요약 (없으면 빈 문자열)",
+    "duration": "사업 기간 (없으면 빈 문자열)",
+    "budget": "예산 (없으면 null)",
+    "requirements": ["이 부분의 요구사항 (요구사항 고유번호가 있으면 함께 기재)"],
+    "evaluation_criteria": ["이 부분의 평가 기준 (배점 포함 시 함께 기재)"],
+    "table_of_contents": ["이 부분에 명시된 제안서 작성 목차 항목 (없으면 빈 배열)"]
+}}"""
+
+RFP_RECONCILE_PROMPT = """RFP 문서를 여러 부분으로 나누어 추출한 결과, 일부 항목에서 서로 다른 값이 나왔습니다.
+문서 앞부분과 후보값을 참고하여 각 항목의 최종 값을 하나로 확정해주세요.
+
+## 문서 앞부분
+{rfp_head}
+
+## 충돌 항목별 후보값
+{conflicts}
+
+## 병합된 요구사항 (참고)
+{requirements}
+
+## 지침
+- title, client_name, duration, budget: 후보 중 가장 공식적인 값을 선택 (표지/공고문 기준)
+- project_scope: 후보들을 종합하여 사업 범위를 3~5문장으로 요약
+
+아래 JSON 형식으로 충돌 항목만 응답하세요:
+{{
+    "title": "...",
+    "client_name": "...",
+    "project_scope": "...",
+    "duration": "...",
+    "budget": "... 또는 null"
+}}"""
@@ -2,15 +2,23 @@
 
 PDF/DOCX/TXT 파일에서 텍스트를 추출하고 Claude API를 통해
 재사용 가능한 섹션을 자동으로 식별하여 Supabase에 저장합니다.
+장문 문서는 구조 경계 기준 청크로 나눠 병렬 추출한 뒤 병합하고, 섹션은 한 번에 INSERT합니다.
 """
 
+import asyncio
 import json
 import logging
 from uuid import uuid4
 
 from app.config import settings
 from app.utils import create_anthropic_client
+from app.utils.model_router import routed_call
+from app.utils.pdf_extractor import iter_pdf_pages, run_in_pool
+from app.utils.text_cache import get_or_extract
 from app.utils.supabase_client import get_async_client
+from app.services.rfp_chunker import split_rfp_text
+from app.services.section_search import index_section, link_duplicate_sections
+from app.services.vector_store import library_vectors
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +61,7 @@ _VALID_CATEGORIES = frozenset([
 
 
 def _extract_text_from_bytes(file_content: bytes, file_type: str) -> str:
-    """파일 바이트에서 텍스트 추출
+    """파일 바이트에서 텍스트 추출 (PDF/DOCX는 콘텐츠 해시 텍스트 캐시 경유)
 
     Args:
         file_content: 파일 바이트 데이터
@@ -63,30 +71,23 @@ def _extract_text_from_bytes(file_content: bytes, file_type: str) -> str:
         추출된 텍스트 문자열
     """
     if file_type == "pdf":
-        return _extract_text_from_pdf_bytes(file_content)
+        return get_or_extract(file_content, lambda: _extract_text_from_pdf_bytes(file_content))
     elif file_type == "docx":
-        return _extract_text_from_docx_bytes(file_content)
+        return get_or_extract(
+            file_content, lambda: run_in_pool(_extract_text_from_docx_bytes, file_content)
+        )
     else:
         # txt 및 기타: UTF-8 디코딩
         return file_content.decode("utf-8", errors="ignore")
 
 
-def _extract_text_from_pdf_bytes(content: bytes) -> str:
-    """PDF 바이트에서 텍스트 추출 (PyPDF2 사용)"""
+def _extract_text_from_pdf_bytes(content: bytes) -> list[str]:
+    """PDF 바이트에서 페이지별 텍스트 추출 (pdf_extractor — 대용량은 페이지 범위 병렬)"""
     try:
-        import io
-        from PyPDF2 import PdfReader
-
-        reader = PdfReader(io.BytesIO(content))
-        pages_text = []
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                pages_text.append(page_text)
-        return "\n".join(pages_text)
+        return list(iter_pdf_pages(content))
     except Exception as exc:
         logger.warning("PDF 텍스트 추출 실패: %s", exc)
-        return ""
+        return []
 
 
 def _extract_text_from_docx_bytes(content: bytes) -> str:
@@ -113,46 +114,172 @@ def _parse_sections_from_response(response_text: str) -> list[dict]:
         섹션 딕셔너리 목록 (최대 10개)
     """
     try:
-        # JSON 코드 블록 추출
-        text = response_text.strip()
+        parsed = _load_sections_json(response_text)
+    except ValueError as exc:
+        logger.warning("섹션 JSON 파싱 실패: %s", exc)
+        return []
+    return _clean_sections(parsed)
+
+
+def _load_sections_json(response_text: str) -> list:
+    """응답 텍스트에서 섹션 JSON 배열 로드 — 배열이 아니면 ValueError (상위 모델 재시도 트리거)"""
+    # JSON 코드 블록 추출
+    text = response_text.strip()
+    try:
         if "```json" in text:
             text = text.split("```json")[1].split("```")[0]
         elif "```" in text:
             text = text.split("```")[1].split("```")[0]
+    except IndexError as exc:
+        raise ValueError(str(exc)) from exc
+
+    parsed = json.loads(text.strip())  # JSONDecodeError는 ValueError 하위 클래스
+    if not isinstance(parsed, list):
+        raise ValueError("Claude 응답이 리스트 형식이 아닙니다.")
+    return parsed
+
+
+def _clean_sections(parsed: list) -> list[dict]:
+    """섹션 항목 유효성 검사 (최대 10개)"""
+    # 최대 10개 제한 + 유효성 검사
+    sections = []
+    for item in parsed[:10]:
+        if not isinstance(item, dict):
+            continue
+        title = item.get("title", "").strip()
+        category = item.get("category", "other").strip()
+        content = item.get("content", "").strip()
+
+        if not title or not content:
+            continue
+
+        # 유효하지 않은 카테고리는 other로 대체
+        if category not in _VALID_CATEGORIES:
+            category = "other"
+
+        sections.append({
+            "title": title,
+            "category": category,
+            "content": content,
+        })
+
+    return sections
+
+
+_CHUNK_NOTE = "\n\n(문서 일부 {index}/{total} — 이 부분에서 재사용할 수 있는 섹션만 추출하세요.)"
+
+
+async def _extract_chunk_sections(
+    client, sem: asyncio.Semaphore, filename: str, chunk: str, index: int, total: int
+) -> list[dict]:
+    """청크 1개 섹션 추출 (실패 시 빈 리스트 — 다른 청크 결과로 진행)"""
+    user_prompt = _USER_PROMPT_TEMPLATE.format(filename=filename, text=chunk)
+    if total > 1:
+        user_prompt += _CHUNK_NOTE.format(index=index + 1, total=total)
+    async with sem:
+        try:
+            result = await routed_call(
+                client, "asset_extract",
+                validate=lambda text: _clean_sections(_load_sections_json(text)),
+                max_tokens=4096,
+                system=_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+            return result.value
+        except ValueError as exc:
+            logger.warning("섹션 JSON 파싱 실패 (청크 %d/%d): %s", index + 1, total, exc)
+        except Exception as exc:
+            logger.error("[asset_extractor] Claude API 호출 실패 (%s 청크 %d/%d): %s", filename, index + 1, total, exc)
+        return []
 
-        parsed = json.loads(text.strip())
 
-        if not isinstance(parsed, list):
-            logger.warning("Claude 응답이 리스트 형식이 아닙니다.")
-            return []
+def _merge_sections(results: list[list[dict]]) -> list[dict]:
+    """청크별 섹션 병합 — 같은 제목(공백 무시)은 내용이 긴 쪽 유지, 원문 순서, 최대 asset_max_sections개"""
+    merged: dict[str, dict] = {}
+    for sections in results:
+        for section in sections:
+            key = "".join(section["title"].split()).lower()
+            prev = merged.get(key)
+            if prev is None or len(section["content"]) > len(prev["content"]):
+                merged[key] = section  # 기존 키는 처음 나온 위치 유지
+    return list(merged.values())[:settings.asset_max_sections]
 
-        # 최대 10개 제한 + 유효성 검사
-        sections = []
-        for item in parsed[:10]:
-            if not isinstance(item, dict):
-                continue
-            title = item.get("title", "").strip()
-            category = item.get("category", "other").strip()
-            content = item.get("content", "").strip()
 
-            if not title or not content:
-                continue
+async def generate_sections(text: str, filename: str) -> list[dict]:
+    """문서 텍스트 → 재사용 섹션 목록 (장문은 청크별 병렬 Claude 호출 후 병합)"""
+    chunks = split_rfp_text(text, settings.asset_chunk_chars)[:settings.asset_max_chunks]
+    if not chunks:
+        return []
+    client = create_anthropic_client(async_client=True)
+    sem = asyncio.Semaphore(max(1, settings.asset_extract_concurrency))
+    results = await asyncio.gather(*[
+        _extract_chunk_sections(client, sem, filename, chunk, i, len(chunks))
+        for i, chunk in enumerate(chunks)
+    ])
+    return _merge_sections(results)
+
+
+def section_rows(sections: list[dict], asset_id: str, owner_id: str, team_id: str | None) -> list[dict]:
+    """추출 섹션 → sections 테이블 INSERT 행"""
+    rows = []
+    for section in sections:
+        row = {
+            "id": str(uuid4()),
+            "owner_id": owner_id,
+            "title": section["title"],
+            "category": section["category"],
+            "content": section["content"],
+            "tags": [],
+            "is_public": False,
+            "source_asset_id": asset_id,
+        }
+        if team_id:
+            row["team_id"] = team_id
+        rows.append(row)
+    return rows
+
+
+async def save_sections(rows: list[dict]) -> list[str]:
+    """근접 중복 연결 → 섹션 일괄 INSERT (1회 호출) + 검색 인덱스 갱신 → 저장된 섹션 UUID 목록 (실패 시 빈 리스트)"""
+    if not rows:
+        return []
+    try:
+        supabase = await get_async_client()
+        await link_duplicate_sections(supabase, rows)
+        await supabase.table("sections").insert(rows).execute()
+    except Exception as exc:
+        logger.error("[asset_extractor] 섹션 일괄 INSERT 실패 (%d건): %s", len(rows), exc)
+        return []
+    for row in rows:
+        await index_section(row)
+    return [row["id"] for row in rows]
 
-            # 유효하지 않은 카테고리는 other로 대체
-            if category not in _VALID_CATEGORIES:
-                category = "other"
 
-            sections.append({
-                "title": title,
-                "category": category,
-                "content": content,
-            })
+async def extract_asset_text(file_content: bytes, file_type: str) -> str:
+    """파일 텍스트 추출 (이벤트 루프 비차단 — PDF 페이지 범위/DOCX 파싱은 프로세스 풀)"""
+    return await asyncio.to_thread(_extract_text_from_bytes, file_content, file_type)
 
-        return sections
 
-    except (json.JSONDecodeError, IndexError) as exc:
-        logger.warning("섹션 JSON 파싱 실패: %s", exc)
+async def extract_section_rows(
+    asset_id: str,
+    owner_id: str,
+    team_id: str | None,
+    file_content: bytes,
+    file_type: str,
+    filename: str,
+) -> list[dict]:
+    """텍스트 추출 → 자료 원문 벡터 인덱싱 → 섹션 생성 → INSERT 행 (저장은 호출자가 일괄 수행)"""
+    text = await extract_asset_text(file_content, file_type)
+    if not text.strip():
+        logger.warning("[asset_extractor] %s: 텍스트 추출 결과가 비어있습니다.", asset_id)
         return []
+    await library_vectors.index_asset(asset_id, owner_id, team_id, filename, text)
+
+    sections = await generate_sections(text, filename)
+    if not sections:
+        logger.warning("[asset_extractor] %s: 추출된 섹션이 없습니다.", asset_id)
+        return []
+    return section_rows(sections, asset_id, owner_id, team_id)
 
 
 async def extract_sections_from_asset(
@@ -176,72 +303,8 @@ async def extract_sections_from_asset(
     Returns:
         생성된 섹션 UUID 목록 (실패 시 빈 리스트)
     """
-    # 1. 텍스트 추출
-    text = _extract_text_from_bytes(file_content, file_type)
-    if not text.strip():
-        logger.warning("[asset_extractor] %s: 텍스트 추출 결과가 비어있습니다.", asset_id)
-        return []
-
-    # 2. Claude API 호출
-    try:
-        client = create_anthropic_client(async_client=True)
-        user_prompt = _USER_PROMPT_TEMPLATE.format(
-            filename=filename,
-            text=text[:8000],
-        )
-        response = await client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            system=_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-        response_text = response.content[0].text
-    except Exception as exc:
-        logger.error("[asset_extractor] Claude API 호출 실패 (asset_id=%s): %s", asset_id, exc)
-        return []
-
-    # 3. 응답 파싱
-    sections = _parse_sections_from_response(response_text)
-    if not sections:
-        logger.warning("[asset_extractor] %s: 추출된 섹션이 없습니다.", asset_id)
-        return []
-
-    # 4. Supabase에 섹션 저장
-    section_ids = []
-    try:
-        supabase = await get_async_client()
-        for section in sections:
-            section_id = str(uuid4())
-            insert_data = {
-                "id": section_id,
-                "owner_id": owner_id,
-                "title": section["title"],
-                "category": section["category"],
-                "content": section["content"],
-                "tags": [],
-                "is_public": False,
-                "source_asset_id": asset_id,
-            }
-            if team_id:
-                insert_data["team_id"] = team_id
-
-            await supabase.table("sections").insert(insert_data).execute()
-            section_ids.append(section_id)
-
-        logger.info(
-            "[asset_extractor] %s: %d개 섹션 추출 완료",
-            asset_id,
-            len(section_ids),
-        )
-    except Exception as exc:
-        logger.error(
-            "[asset_extractor] Supabase INSERT 실패 (asset_id=%s): %s",
-            asset_id,
-            exc,
-        )
-        # 일부 저장에 성공한 경우 해당 UUID 반환
-        # 전체 실패 시 빈 리스트 반환
-        if not section_ids:
-            return []
-
+    rows = await extract_section_rows(asset_id, owner_id, team_id, file_content, file_type, filename)
+    section_ids = await save_sections(rows)
+    if section_ids:
+        logger.info("[asset_extractor] %s: %d개 섹션 추출 완료", asset_id, len(section_ids))
     return section_ids
@@ -0,0 +1,225 @@
+"""
+회사 자료 일괄 수집 (POST /assets/bulk)
+
+과거 제안서 아카이브처럼 파일이 많은 경우를 위한 파이프라인:
+  1. 업로드 스풀: 요청 파일(또는 ZIP 항목)을 메모리에 모으지 않고 임시 파일로 스트리밍 복사
+  2. 자료별 병렬 처리 (asset_bulk_concurrency): Storage 업로드(파일 경로) → 텍스트 추출
+     (PDF 페이지 범위·DOCX 파싱은 프로세스 풀) → 장문 청크별 병렬 섹션 생성
+  3. 모든 자료의 섹션을 sections 테이블에 1회 INSERT → 자료별 status/extracted_sections 갱신
+
+임시 파일은 자료 처리 후(성공/실패 무관) 삭제합니다.
+"""
+
+import asyncio
+import logging
+import mimetypes
+import shutil
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Iterable, Optional
+from uuid import uuid4
+
+from app.config import settings
+from app.services.asset_extractor import extract_section_rows, save_sections
+from app.utils.supabase_client import get_async_client
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_EXTENSIONS = {".pdf", ".docx"}
+_COPY_BUFFER = 1024 * 1024
+
+
+class BulkUploadError(ValueError):
+    """일괄 업로드 요청 오류 (파일 수 초과 등)"""
+
+
+@dataclass
+class SpooledAsset:
+    """임시 저장된 자료 1건"""
+    asset_id: str
+    filename: str
+    file_type: str
+    path: Path
+    storage_path: str
+
+
+@dataclass
+class SpoolResult:
+    assets: list[SpooledAsset] = field(default_factory=list)
+    skipped: list[dict] = field(default_factory=list)
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    """ZIP 항목 파일명 (UTF-8 플래그 없는 한국어 윈도우 압축은 cp949로 복원)"""
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode("cp437").decode("cp949")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return PurePosixPath(name).name
+
+
+def _copy_limited(src: BinaryIO, dst: Path, max_bytes: int) -> bool:
+    """src → dst 스트리밍 복사, max_bytes 초과 시 중단하고 False"""
+    written = 0
+    with open(dst, "wb") as out:
+        while True:
+            buf = src.read(_COPY_BUFFER)
+            if not buf:
+                return True
+            written += len(buf)
+            if written > max_bytes:
+                return False
+            out.write(buf)
+
+
+class _Spooler:
+    def __init__(self, owner_id: str, spool_dir: Path):
+        self.owner_id = owner_id
+        self.spool_dir = spool_dir
+        self.max_bytes = settings.asset_bulk_max_file_mb * 1024 * 1024
+        self.result = SpoolResult()
+
+    def add(self, src: BinaryIO, filename: str) -> None:
+        ext = Path(filename).suffix.lower()
+        if ext not in ALLOWED_EXTENSIONS:
+            self.result.skipped.append({"filename": filename, "reason": "PDF/DOCX가 아님"})
+            return
+        if len(self.result.assets) >= settings.asset_bulk_max_files:
+            raise BulkUploadError(f"한 번에 최대 {settings.asset_bulk_max_files}개 파일까지 업로드할 수 있습니다.")
+        asset_id = str(uuid4())
+        path = self.spool_dir / f"{asset_id}{ext}"
+        if not _copy_limited(src, path, self.max_bytes):
+            path.unlink(missing_ok=True)
+            self.result.skipped.append({
+                "filename": filename, "reason": f"파일 크기 {settings.asset_bulk_max_file_mb}MB 초과",
+            })
+            return
+        self.result.assets.append(SpooledAsset(
+            asset_id=asset_id,
+            filename=filename,
+            file_type=ext.lstrip("."),
+            path=path,
+            storage_path=f"assets/{self.owner_id}/{asset_id}{ext}",
+        ))
+
+    def add_zip(self, src: BinaryIO, filename: str) -> None:
+        try:
+            archive = zipfile.ZipFile(src)
+        except zipfile.BadZipFile:
+            self.result.skipped.append({"filename": filename, "reason": "손상된 ZIP"})
+            return
+        with archive:
+            for info in archive.infolist():
+                name = _zip_member_name(info)
+                if info.is_dir() or not name or name.startswith(".") or "__MACOSX" in info.filename:
+                    continue
+                if info.file_size > self.max_bytes:
+                    self.result.skipped.append({
+                        "filename": name, "reason": f"파일 크기 {settings.asset_bulk_max_file_mb}MB 초과",
+                    })
+                    continue
+                if Path(name).suffix.lower() not in ALLOWED_EXTENSIONS:
+                    self.result.skipped.append({"filename": name, "reason": "PDF/DOCX가 아님"})
+                    continue
+                with archive.open(info) as member:
+                    self.add(member, name)
+
+
+def spool_uploads(files: Iterable[tuple[BinaryIO, str]], owner_id: str) -> SpoolResult:
+    """업로드 파일/ZIP → 임시 파일 (동기 — asyncio.to_thread로 호출). 오류 시 이미 만든 임시 파일 삭제"""
+    spool_dir = Path(settings.asset_spool_dir)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    spooler = _Spooler(owner_id, spool_dir)
+    try:
+        for src, filename in files:
+            filename = PurePosixPath(filename or "").name
+            if Path(filename).suffix.lower() == ".zip":
+                spooler.add_zip(src, filename)
+            else:
+                spooler.add(src, filename)
+    except Exception:
+        cleanup(spooler.result.assets)
+        raise
+    return spooler.result
+
+
+def cleanup(assets: Iterable[SpooledAsset]) -> None:
+    for asset in assets:
+        asset.path.unlink(missing_ok=True)
+
+
+async def _process_asset(
+    client, sem: asyncio.Semaphore, asset: SpooledAsset, owner_id: str, team_id: Optional[str]
+) -> Optional[list[dict]]:
+    """자료 1건: Storage 업로드 → 섹션 행 생성 (실패 시 None)"""
+    async with sem:
+        try:
+            await (
+                client.table("company_assets")
+                .update({"status": "processing"})
+                .eq("id", asset.asset_id)
+                .execute()
+            )
+            mime_type = mimetypes.types_map.get(asset.path.suffix) or "application/octet-stream"
+            await client.storage.from_("proposal-files").upload(
+                asset.storage_path, asset.path, {"content-type": mime_type}
+            )
+            content = await asyncio.to_thread(asset.path.read_bytes)
+            return await extract_section_rows(
+                asset.asset_id, owner_id, team_id, content, asset.file_type, asset.filename
+            )
+        except Exception as exc:
+            logger.error("[asset_ingestion] asset_id=%s (%s) 처리 실패: %s", asset.asset_id, asset.filename, exc)
+            return None
+        finally:
+            await asyncio.to_thread(asset.path.unlink, True)
+
+
+async def _save_per_asset(results: list[Optional[list[dict]]]) -> set[str]:
+    """자료별 섹션 저장 (일괄 INSERT 실패 시) — 실패한 자료의 섹션만 누락
+
+    일괄 저장 때 같은 배치의 다른 자료 섹션으로 연결된 duplicate_of는 원본이 저장되지 않을 수 있으므로
+    해제하고 자료별로 다시 연결합니다.
+    """
+    batch_ids = {str(row["id"]) for res in results if res for row in res}
+    saved: set[str] = set()
+    for res in results:
+        if not res:
+            continue
+        for row in res:
+            if str(row.get("duplicate_of")) in batch_ids:
+                row.pop("duplicate_of")
+        saved.update(await save_sections(res))
+    return saved
+
+
+async def ingest_assets(assets: list[SpooledAsset], owner_id: str, team_id: Optional[str]) -> None:
+    """백그라운드 일괄 처리 — 자료별 병렬 추출 후 섹션 1회 INSERT (실패 시 자료별 재시도), 자료 status 갱신"""
+    client = await get_async_client()
+    sem = asyncio.Semaphore(max(1, settings.asset_bulk_concurrency))
+    try:
+        results = await asyncio.gather(*[
+            _process_asset(client, sem, asset, owner_id, team_id) for asset in assets
+        ])
+    finally:
+        cleanup(assets)
+
+    rows = [row for res in results if res for row in res]
+    saved = set(await save_sections(rows))
+    if rows and not saved and sum(1 for res in results if res) > 1:
+        logger.warning("[asset_ingestion] 섹션 일괄 INSERT 실패 — 자료별로 다시 저장")
+        saved = await _save_per_asset(results)
+    for asset, res in zip(assets, results):
+        section_ids = [row["id"] for row in res or [] if row["id"] in saved]
+        failed = res is None or (res and not section_ids)
+        update = {"status": "failed"} if failed else {"status": "done", "extracted_sections": section_ids}
+        try:
+            await client.table("company_assets").update(update).eq("id", asset.asset_id).execute()
+        except Exception as exc:
+            logger.error("[asset_ingestion] status 업데이트 실패 (asset_id=%s): %s", asset.asset_id, exc)
+    logger.info(
+        "[asset_ingestion] 일괄 처리 완료: 자료 %d건, 섹션 %d건 저장", len(assets), len(saved)
+    )
@@ -0,0 +1,338 @@
+"""
+나라장터 낙찰 이력 로컬 저장소 (경쟁사 투찰률 통계)
+
+경쟁사 분석(search_competitors)과 입찰가 시뮬레이션이 요청마다 G2B 낙찰결과·업체 이력 API를 여러 번 호출하지 않도록,
+낙찰결과를 로컬 SQLite 파일에 누적하고 경쟁사 집계를 적재 시점에 미리 계산해 둡니다.
+  - awards: 낙찰 1건 (공고번호, 낙찰업체, 투찰률, 낙찰금액, 수요기관, 업무구분, 개찰일)
+  - award_keywords: 검색 키워드 → 낙찰 (같은 낙찰이 여러 키워드에 걸릴 수 있음)
+  - competitor_stats: (업체, 수요기관, 업무구분)별 낙찰 수·금액 합·투찰률 합/제곱합 — 적재한 업체만 재계산
+  - award_sync_state: 키워드별 마지막 동기화 시각 — award_history_max_staleness_hours 이내면 로컬 조회만
+적재는 최신 페이지부터 읽다가 새 낙찰이 없는 페이지에서 멈추는 증분 방식입니다
+(공용 공고 수집 워커 주기 + 로컬 이력이 오래된 키워드의 경쟁사 분석 요청 시).
+
+SQLite는 표준 라이브러리이고 조회가 로컬 파일 인덱스 탐색이므로 밀리초 단위입니다.
+인스턴스마다 파일을 따로 두므로 다중 인스턴스에서는 인스턴스별로 적재됩니다.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.config import settings
+from app.services.bid_simulation import _to_float, history_ratio
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+
+_BID_NO_KEYS = ("bidNtceNo",)
+_WINNER_KEYS = ("sucsfBidderNm", "bidwinnrNm", "cmpnyNm")
+_AMOUNT_KEYS = ("sucsfBidAmt", "sucsfbidAmt", "bidAmt")
+_AGENCY_KEYS = ("dminsttNm", "ntceInsttNm")
+_CATEGORY_KEYS = ("bsnsDivNm", "bidClsfcNm")
+_DATE_KEYS = ("rlOpengDt", "opengDt", "fnlSucsfDate")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS awards (
+    bid_no      TEXT NOT NULL,
+    winner      TEXT NOT NULL,
+    title       TEXT NOT NULL DEFAULT '',
+    agency      TEXT NOT NULL DEFAULT '',
+    category    TEXT NOT NULL DEFAULT '',
+    amount      INTEGER NOT NULL DEFAULT 0,
+    ratio       REAL,
+    awarded_on  TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (bid_no, winner)
+);
+CREATE INDEX IF NOT EXISTS awards_winner_idx ON awards (winner);
+
+CREATE TABLE IF NOT EXISTS award_keywords (
+    keyword TEXT NOT NULL,
+    bid_no  TEXT NOT NULL,
+    winner  TEXT NOT NULL,
+    PRIMARY KEY (keyword, bid_no, winner)
+);
+
+CREATE TABLE IF NOT EXISTS competitor_stats (
+    winner     TEXT NOT NULL,
+    agency     TEXT NOT NULL,
+    category   TEXT NOT NULL,
+    wins       INTEGER NOT NULL,
+    amount     INTEGER NOT NULL,
+    ratio_n    INTEGER NOT NULL,
+    ratio_sum  REAL NOT NULL,
+    ratio_sq   REAL NOT NULL,
+    last_award TEXT NOT NULL,
+    PRIMARY KEY (winner, agency, category)
+);
+CREATE INDEX IF NOT EXISTS competitor_stats_agency_idx ON competitor_stats (agency, category);
+
+CREATE TABLE IF NOT EXISTS award_sync_state (
+    keyword   TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class AwardRecord:
+    """낙찰결과 1건 (ratio: 예정가격 대비 0~1, awarded_on: YYYY-MM-DD 또는 빈 문자열)"""
+    bid_no: str
+    winner: str
+    title: str = ""
+    agency: str = ""
+    category: str = ""
+    amount: int = 0
+    ratio: Optional[float] = None
+    awarded_on: str = ""
+
+
+def _first(row: dict, keys: tuple) -> str:
+    return next((str(row[k]).strip() for k in keys if row.get(k)), "")
+
+
+def _date(value: str) -> str:
+    digits = re.sub(r"\D", "", value)[:8]
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}" if len(digits) == 8 else ""
+
+
+def parse_award(row: dict) -> Optional[AwardRecord]:
+    """getBidResultListInfo 행 → AwardRecord (공고번호·낙찰업체가 없으면 None)"""
+    bid_no, winner = _first(row, _BID_NO_KEYS), _first(row, _WINNER_KEYS)
+    if not bid_no or not winner:
+        return None
+    return AwardRecord(
+        bid_no=bid_no,
+        winner=winner,
+        title=str(row.get("bidNtceNm") or ""),
+        agency=_first(row, _AGENCY_KEYS),
+        category=_first(row, _CATEGORY_KEYS),
+        amount=int(_to_float(_first(row, _AMOUNT_KEYS)) or 0),
+        ratio=history_ratio(row),
+        awarded_on=_date(_first(row, _DATE_KEYS)),
+    )
+
+
+class AwardHistoryStore:
+    """낙찰 이력 SQLite 저장소 (동기 API — 비동기 코드에서는 asyncio.to_thread로 호출)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self._path or settings.award_history_path
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            if path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add(self, keyword: str, records: Iterable[AwardRecord]) -> int:
+        """낙찰 적재 + 해당 업체 집계 갱신 → 키워드에 새로 연결된 낙찰 수"""
+        records = list(records)
+        if not records:
+            return 0
+        with self._lock:
+            db = self._db()
+            with db:
+                db.executemany(
+                    "INSERT OR IGNORE INTO awards VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(r.bid_no, r.winner, r.title, r.agency, r.category, r.amount, r.ratio, r.awarded_on)
+                     for r in records],
+                )
+                before = db.total_changes
+                db.executemany(
+                    "INSERT OR IGNORE INTO award_keywords VALUES (?, ?, ?)",
+                    [(keyword, r.bid_no, r.winner) for r in records],
+                )
+                linked = db.total_changes - before
+                self._refresh_stats(db, sorted({r.winner for r in records}))
+        return linked
+
+    @staticmethod
+    def _refresh_stats(db: sqlite3.Connection, winners: list[str]) -> None:
+        marks = ",".join("?" * len(winners))
+        db.execute(f"DELETE FROM competitor_stats WHERE winner IN ({marks})", winners)
+        db.execute(
+            f"""
+            INSERT INTO competitor_stats
+            SELECT winner, agency, category, COUNT(*), SUM(amount), COUNT(ratio),
+                   COALESCE(SUM(ratio), 0), COALESCE(SUM(ratio * ratio), 0), MAX(awarded_on)
+            FROM awards WHERE winner IN ({marks})
+            GROUP BY winner, agency, category
+            """,
+            winners,
+        )
+
+    def mark_synced(self, keyword: str, at: Optional[float] = None) -> None:
+        with self._lock:
+            db = self._db()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO award_sync_state VALUES (?, ?)", (keyword, at or time.time())
+                )
+
+    def is_fresh(self, keyword: str, max_age_hours: float) -> bool:
+        """키워드 동기화가 max_age_hours 이내인지"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT synced_at FROM award_sync_state WHERE keyword = ?", (keyword,)
+            ).fetchone()
+        return row is not None and time.time() - row["synced_at"] < max_age_hours * 3600
+
+    def competitors(self, keyword: str, since: str = "", limit: int = 10) -> tuple[list[dict], dict]:
+        """
+        키워드 낙찰 이력 기준 상위 낙찰업체
+
+        Args:
+            since: 개찰일 하한 (YYYY-MM-DD, 개찰일 미상 낙찰은 포함)
+
+        Returns:
+            (업체별 {winner, wins, amount, avg_ratio, total_wins, main_agency}, 전체 {awards, bids, amount})
+        """
+        scope = """
+            FROM award_keywords k JOIN awards a ON a.bid_no = k.bid_no AND a.winner = k.winner
+            WHERE k.keyword = ? AND (a.awarded_on >= ? OR a.awarded_on = '')
+        """
+        with self._lock:
+            db = self._db()
+            totals = db.execute(
+                f"SELECT COUNT(*) AS awards, COUNT(DISTINCT a.bid_no) AS bids, "
+                f"COALESCE(SUM(a.amount), 0) AS amount {scope}",
+                (keyword, since),
+            ).fetchone()
+            rows = db.execute(
+                f"SELECT a.winner, COUNT(*) AS wins, SUM(a.amount) AS amount, AVG(a.ratio) AS avg_ratio {scope} "
+                f"GROUP BY a.winner ORDER BY wins DESC, amount DESC, a.winner LIMIT ?",
+                (keyword, since, limit),
+            ).fetchall()
+            winners = [r["winner"] for r in rows]
+            marks = ",".join("?" * len(winners))
+            history = db.execute(
+                f"SELECT winner, agency, SUM(wins) AS wins FROM competitor_stats "
+                f"WHERE winner IN ({marks}) GROUP BY winner, agency ORDER BY wins DESC, agency",
+                winners,
+            ).fetchall() if winners else []
+
+        total_wins: dict[str, int] = {}
+        main_agency: dict[str, str] = {}
+        for h in history:
+            total_wins[h["winner"]] = total_wins.get(h["winner"], 0) + h["wins"]
+            main_agency.setdefault(h["winner"], h["agency"])
+        result = [
+            {
+                "winner": r["winner"],
+                "wins": r["wins"],
+                "amount": r["amount"] or 0,
+                "avg_ratio": r["avg_ratio"],
+                "total_wins": total_wins.get(r["winner"], r["wins"]),
+                "main_agency": main_agency.get(r["winner"], ""),
+            }
+            for r in rows
+        ]
+        return result, dict(totals)
+
+    def ratios(self, keyword: str, limit: int = 100) -> list[float]:
+        """키워드 낙찰의 투찰률 (최근 개찰일 순)"""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT a.ratio FROM award_keywords k "
+                "JOIN awards a ON a.bid_no = k.bid_no AND a.winner = k.winner "
+                "WHERE k.keyword = ? AND a.ratio IS NOT NULL ORDER BY a.awarded_on DESC LIMIT ?",
+                (keyword, limit),
+            ).fetchall()
+        return [r["ratio"] for r in rows]
+
+    def stats(
+        self, *, agency: Optional[str] = None, category: Optional[str] = None, winner: Optional[str] = None
+    ) -> dict:
+        """미리 계산된 집계 합산 — 수요기관·업무구분·업체 조건 (None이면 전체)"""
+        clauses, params = [], []
+        for column, value in (("agency", agency), ("category", category), ("winner", winner)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            row = self._db().execute(
+                f"SELECT COUNT(DISTINCT winner) AS competitors, COALESCE(SUM(wins), 0) AS wins, "
+                f"COALESCE(SUM(amount), 0) AS amount, COALESCE(SUM(ratio_n), 0) AS ratio_n, "
+                f"COALESCE(SUM(ratio_sum), 0) AS ratio_sum, COALESCE(SUM(ratio_sq), 0) AS ratio_sq, "
+                f"MAX(last_award) AS last_award FROM competitor_stats {where}",
+                params,
+            ).fetchone()
+        n = row["ratio_n"]
+        mean = row["ratio_sum"] / n if n else None
+        std = max(row["ratio_sq"] / n - mean * mean, 0.0) ** 0.5 if n else None
+        return {
+            "competitors": row["competitors"],
+            "wins": row["wins"],
+            "amount": row["amount"],
+            "avg_ratio": round(mean, 4) if mean is not None else None,
+            "ratio_std": round(std, 4) if std is not None else None,
+            "last_award": row["last_award"],
+        }
+
+
+award_store = AwardHistoryStore()
+
+
+async def sync_keyword(g2b, keyword: str, store: Optional[AwardHistoryStore] = None) -> int:
+    """
+    키워드 낙찰결과 증분 적재 (최신 페이지부터, 새 낙찰이 없는 페이지에서 중단)
+
+    Args:
+        g2b: 세션이 열린 G2BService
+
+    Returns:
+        새로 연결된 낙찰 수
+    """
+    store = store or award_store
+    added = 0
+    for page in range(1, settings.award_history_max_pages + 1):
+        rows = await g2b.get_bid_results(keyword, num_of_rows=PAGE_SIZE, page_no=page)
+        records = [r for r in (parse_award(row) for row in rows) if r]
+        new = await asyncio.to_thread(store.add, keyword, records)
+        added += new
+        if len(rows) < PAGE_SIZE or not new:
+            break
+    await asyncio.to_thread(store.mark_synced, keyword)
+    return added
+
+
+async def ensure_fresh(g2b, keyword: str, store: Optional[AwardHistoryStore] = None) -> bool:
+    """로컬 이력이 오래되었으면 동기화 → 로컬 조회 가능 여부 (동기화 실패 시 False)"""
+    store = store or award_store
+    try:
+        if await asyncio.to_thread(store.is_fresh, keyword, settings.award_history_max_staleness_hours):
+            return True
+        added = await sync_keyword(g2b, keyword, store)
+        logger.info(f"낙찰 이력 동기화: keyword={keyword}, 신규 {added}건")
+        return True
+    except Exception as e:
+        logger.warning(f"낙찰 이력 동기화 실패 (G2B 직접 조회): keyword={keyword}, {e}")
+        return False
+
+
+async def sync_keywords(g2b, keywords: list[str], store: Optional[AwardHistoryStore] = None) -> int:
+    """공용 수집 워커용 — 키워드별 증분 적재 (실패 키워드는 로그 후 다음 주기에 재시도)"""
+    added = 0
+    for keyword in keywords:
+        try:
+            added += await sync_keyword(g2b, keyword, store)
+        except Exception as e:
+            logger.warning(f"낙찰 이력 적재 실패 keyword={keyword} (무시): {e}")
+    return added
@@ -3,18 +3,109 @@
 
 G2BService 래퍼 + 후처리 필터 + Supabase upsert.
 새 API 연동 코드를 작성하지 않고 G2BService를 내부적으로 사용한다.
+
+증분 동기화(incremental=True):
+  키워드별 high-water mark(bid_sync_state: 마지막으로 본 공고일시 bidNtceDt)
+  이후 + overlap 구간만 G2B에 조회하고, 이미 저장된 공고는 bid_announcements에서 읽는다.
+  목록 필드 + 기존 상세내용의 해시가 저장된 content_hash와 같으면 상세 조회/upsert를 생략한다.
+  mark는 키워드 단위로 모든 팀이 공유하므로, 이 경로에서는 필터와 무관하게 조회한 공고를 모두 저장하고
+  프리셋 필터는 반환할 때만 적용한다 (조건이 더 느슨한 팀이 mark 이전 구간을 저장본에서 읽어도 누락 없음).
+
+로컬 조회(prefer_local=True):
+  공용 수집 워커(bid_ingestion)가 프리셋 키워드를 최근에 동기화했으면
+  G2B를 호출하지 않고 bid_announcements만 조회한다.
+
+재공고 연결:
+  upsert 시 공고명+상세내용 MinHash 서명(minhash)을 함께 저장하고, 최근 bid_duplicate_window_days일
+  같은 발주기관 공고 중 근접 중복이 있으면 duplicate_of에 원 공고 bid_no를 기록한다
+  (문구만 바뀐 재공고는 AI 분석 없이 원 공고 결과를 재사용).
 """
 
+import json
 import logging
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
+from app.config import settings
 from app.models.bid_schemas import BidAnnouncement, SearchPreset
 from app.services.g2b_service import G2BService
+from app.utils.minhash import LSHIndex, minhash
+from app.utils.text_cache import content_hash
 
 logger = logging.getLogger(__name__)
 
 _QUALIFICATION_UNAVAILABLE_PHRASES = ("첨부파일 참조", "붙임 참조", "별첨 참조", "입찰공고문 참조")
+_G2B_DATETIME_FORMATS = ("%Y/%m/%d %H:%M:%S", "%Y%m%d%H%M%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+# 나라장터 일시는 한국 표준시 (조회 파라미터도 KST로 전달)
+KST = timezone(timedelta(hours=9), "KST")
+# Supabase or_ 필터 구문과 충돌하는 문자
+_FILTER_UNSAFE = str.maketrans("", "", ",()%*")
+# PostgREST 응답 행 상한 — 저장 공고·재공고 비교 대상은 페이지 단위로 조회
+_LOAD_PAGE_SIZE = 1000
+
+
+def parse_g2b_datetime(value) -> Optional[datetime]:
+    """나라장터 일시 문자열(KST) → KST datetime (예: "2026/03/20 18:00:00", "20260320180000")"""
+    if not value:
+        return None
+    text = str(value).strip()
+    for fmt in _G2B_DATETIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=KST)
+        except ValueError:
+            continue
+    return None
+
+
+def format_g2b_datetime(value: datetime) -> str:
+    """datetime → 나라장터 조회 파라미터 (KST YYYYMMDDHHMMSS)"""
+    return value.astimezone(KST).strftime("%Y%m%d%H%M%S")
+
+
+def _parse_iso(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def announcement_hash(bid: BidAnnouncement) -> str:
+    """공고 목록 필드 + 상세내용 해시 (변경 감지용)"""
+    payload = json.dumps([
+        bid.bid_title, bid.agency, bid.bid_type, bid.budget_amount,
+        bid.deadline_date.isoformat() if bid.deadline_date else None,
+        bid.content_text or "",
+    ], ensure_ascii=False)
+    return content_hash(payload.encode("utf-8"))[:32]
+
+
+@dataclass(frozen=True)
+class BidFilter:
+    """후처리 필터 조건 (bid_types가 None이면 공고종류 제한 없음)"""
+
+    bid_types: Optional[frozenset[str]] = None
+    min_budget: int = 0
+    min_days_remaining: int = 0
+
+    @classmethod
+    def from_preset(cls, preset: SearchPreset) -> "BidFilter":
+        return cls(frozenset(preset.bid_types), preset.min_budget, preset.min_days_remaining)
+
+    @classmethod
+    def loosest(cls, presets: Iterable[SearchPreset]) -> "BidFilter":
+        """여러 프리셋 중 하나라도 통과하는 공고는 모두 통과시키는 조건"""
+        filters = [cls.from_preset(p) for p in presets]
+        if not filters:
+            return cls()
+        return cls(
+            frozenset().union(*(f.bid_types for f in filters)),
+            min(f.min_budget for f in filters),
+            min(f.min_days_remaining for f in filters),
+        )
 
 
 class BidFetcher:
@@ -29,7 +120,9 @@ class BidFetcher:
 
     # ── 공개 API ────────────────────────────────────────────
 
-    async def fetch_bids_by_preset(self, preset: SearchPreset) -> list[BidAnnouncement]:
+    async def fetch_bids_by_preset(
+        self, preset: SearchPreset, incremental: bool = False, prefer_local: bool = False
+    ) -> list[BidAnnouncement]:
         """
         프리셋 기반 공고 수집 통합 실행.
 
@@ -38,70 +131,143 @@ class BidFetcher:
         3. BidAnnouncement 스키마로 정규화
         4. bid_announcements 테이블에 upsert
         5. 각 공고별 fetch_bid_detail() 호출하여 content_text 확보
+
+        incremental=True면 키워드별 high-water mark 이후만 조회하고
+        저장된 공고와 합쳐 반환합니다 (변경된 공고만 상세 조회·upsert).
+        prefer_local=True면 공용 수집 워커가 최근 동기화한 경우 로컬 테이블만 조회합니다.
         """
-        raw_bids: dict[str, dict] = {}  # bid_no → raw dict (중복 제거)
+        range_days = getattr(preset, "announce_date_range_days", 14)
+        if prefer_local:
+            local = await self.load_local_bids(preset)
+            if local is not None:
+                return local
+        return await self.sync_keywords(
+            preset.keywords, range_days, BidFilter.from_preset(preset), incremental=incremental
+        )
 
+    async def sync_keywords(
+        self,
+        keywords: list[str],
+        range_days: int,
+        flt: BidFilter,
+        incremental: bool = False,
+    ) -> list[BidAnnouncement]:
+        """키워드 목록을 G2B에서 수집해 필터 통과 공고를 upsert하고 반환 (프리셋·공용 수집 공통)"""
         # 검색 기간 계산 (0 = 제한 없음)
-        date_from: Optional[str] = None
+        window_from: Optional[datetime] = None
         date_to: Optional[str] = None
-        range_days = getattr(preset, "announce_date_range_days", 14)
         if range_days and range_days > 0:
             now = datetime.now(timezone.utc)
-            date_to = now.strftime("%Y%m%d%H%M%S")
-            date_from = (now - timedelta(days=range_days)).strftime("%Y%m%d%H%M%S")
-            logger.info(f"검색 기간 적용: {date_from} ~ {date_to} ({range_days}일)")
+            date_to = format_g2b_datetime(now)
+            window_from = now - timedelta(days=range_days)
+            logger.info(f"검색 기간 적용: {format_g2b_datetime(window_from)} ~ {date_to} ({range_days}일)")
+        # 기간 제한이 없으면 저장본으로 범위를 보장할 수 없으므로 전체 조회
+        incremental = incremental and window_from is not None
 
-        for keyword in preset.keywords:
+        marks = await self._load_sync_marks(keywords) if incremental else {}
+        raw_bids: dict[str, dict] = {}  # bid_no → raw dict (중복 제거)
+        seen: dict[str, Optional[datetime]] = {}  # 조회 성공 키워드 → 최신 공고일시
+
+        for keyword in keywords:
+            since = self._incremental_since(marks.get(keyword), window_from)
+            date_from = since or window_from
             try:
                 results = await self.g2b.search_bid_announcements(
                     keyword, num_of_rows=self.NUM_OF_ROWS,
-                    date_from=date_from, date_to=date_to,
+                    date_from=format_g2b_datetime(date_from) if date_from else None,
+                    date_to=date_to,
                 )
+                latest = None
                 for item in results:
                     bid_no = item.get("bidNtceNo")
                     if bid_no and bid_no not in raw_bids:
                         raw_bids[bid_no] = item
+                    notice_at = parse_g2b_datetime(item.get("bidNtceDt"))
+                    if notice_at and (latest is None or notice_at > latest):
+                        latest = notice_at
+                if len(results) >= self.NUM_OF_ROWS:
+                    # 1페이지가 가득 차면 누락 공고가 있을 수 있으므로 mark를 올리지 않음
+                    logger.warning(f"키워드 '{keyword}' 조회 결과 {len(results)}건 — 동기화 mark 유지")
+                else:
+                    seen[keyword] = latest
             except Exception as e:
                 logger.warning(f"키워드 '{keyword}' 수집 실패 (계속 진행): {e}")
 
-        # 후처리 필터 적용
-        filtered: list[BidAnnouncement] = []
-        today = date.today()
-
-        for raw in raw_bids.values():
-            bid = self._normalize(raw)
-            if bid is None:
-                continue
-
-            # bid_types 필터
-            if bid.bid_type and bid.bid_type not in preset.bid_types:
-                continue
-
-            # min_budget 필터
-            if bid.budget_amount is not None and bid.budget_amount < preset.min_budget:
-                continue
-
-            # min_days_remaining 필터
-            if bid.deadline_date is not None:
-                days = (bid.deadline_date.date() - today).days
-                if days < preset.min_days_remaining:
+        normalized = [bid for bid in (self._normalize(raw) for raw in raw_bids.values()) if bid is not None]
+        filtered = [bid for bid in normalized if self._passes_filters(bid, flt)]
+
+        if not incremental:
+            if not filtered:
+                logger.info("수집 후 필터 통과 공고 없음")
+                return []
+
+            # 공고 상세(자격요건) 수집
+            for bid in filtered:
+                bid = await self._enrich_detail(bid)
+
+            # Supabase upsert
+            await self._upsert_announcements(filtered)
+
+            logger.info(f"공고 수집 완료: {len(filtered)}건 (키워드: {keywords})")
+            return filtered
+
+        # 공유 mark를 올리므로 필터 탈락 공고까지 저장 (다른 프리셋의 저장본 조회용)
+        stored = await self._load_stored_announcements(keywords, window_from)
+        changed: list[BidAnnouncement] = []
+        for bid in normalized:
+            prev = stored.get(bid.bid_no)
+            if prev is not None:
+                candidate = bid.model_copy(update={
+                    "content_text": prev[0].content_text,
+                    "qualification_available": prev[0].qualification_available,
+                })
+                if prev[1] and announcement_hash(candidate) == prev[1]:
+                    bid.content_text = candidate.content_text
+                    bid.qualification_available = candidate.qualification_available
                     continue
+            await self._enrich_detail(bid)
+            changed.append(bid)
+
+        if changed:
+            await self._upsert_announcements(changed)
+        await self._save_sync_marks(seen, marks, window_from)
+
+        fresh_nos = {b.bid_no for b in filtered}
+        result = filtered + [
+            bid for bid_no, (bid, _) in stored.items()
+            if bid_no not in fresh_nos and self._passes_filters(bid, flt)
+        ]
+        logger.info(
+            f"공고 증분 동기화 완료: {len(result)}건 (신규/변경 {len(changed)}건 upsert, "
+            f"G2B 응답 {len(raw_bids)}건, 키워드: {keywords})"
+        )
+        return result
 
-            filtered.append(bid)
-
-        if not filtered:
-            logger.info("수집 후 필터 통과 공고 없음")
-            return []
-
-        # 공고 상세(자격요건) 수집
-        for bid in filtered:
-            bid = await self._enrich_detail(bid)
+    async def load_local_bids(self, preset: SearchPreset) -> Optional[list[BidAnnouncement]]:
+        """
+        공용 수집 워커가 최근 동기화한 로컬 공고만으로 프리셋 결과 구성.
 
-        # Supabase upsert
-        await self._upsert_announcements(filtered)
+        모든 키워드가 bid_ingestion_max_staleness_minutes 이내에 동기화되었고
+        검색 기간 전체를 커버한 경우에만 결과를 반환하고, 아니면 None (G2B 조회 필요).
+        """
+        range_days = getattr(preset, "announce_date_range_days", 14)
+        if not range_days or range_days <= 0:
+            return None
+        now = datetime.now(timezone.utc)
+        window_from = now - timedelta(days=range_days)
+        fresh_after = now - timedelta(minutes=settings.bid_ingestion_max_staleness_minutes)
+        marks = await self._load_sync_marks(preset.keywords)
+        for keyword in preset.keywords:
+            mark = marks.get(keyword) or {}
+            synced, covered = mark.get("synced_at"), mark.get("covered_from")
+            if synced is None or synced < fresh_after or covered is None or covered > window_from:
+                return None
 
-        logger.info(f"공고 수집 완료: {len(filtered)}건 (키워드: {preset.keywords})")
-        return filtered
+        flt = BidFilter.from_preset(preset)
+        stored = await self._load_stored_announcements(preset.keywords, window_from)
+        result = [bid for bid, _ in stored.values() if self._passes_filters(bid, flt)]
+        logger.info(f"로컬 공고 조회: {len(result)}건 (키워드: {preset.keywords})")
+        return result
 
     async def fetch_bid_detail(self, bid_no: str) -> Optional[str]:
         """
@@ -119,6 +285,120 @@ class BidFetcher:
 
     # ── 내부 헬퍼 ────────────────────────────────────────────
 
+    def _passes_filters(self, bid: BidAnnouncement, flt: BidFilter) -> bool:
+        """후처리 필터: bid_types / min_budget / min_days_remaining"""
+        # bid_types 필터
+        if bid.bid_type and flt.bid_types is not None and bid.bid_type not in flt.bid_types:
+            return False
+
+        # min_budget 필터
+        if bid.budget_amount is not None and bid.budget_amount < flt.min_budget:
+            return False
+
+        # min_days_remaining 필터
+        if bid.deadline_date is not None:
+            days = (bid.deadline_date.date() - date.today()).days
+            if days < flt.min_days_remaining:
+                return False
+        return True
+
+    def _incremental_since(self, mark: Optional[dict], window_from: Optional[datetime]) -> Optional[datetime]:
+        """high-water mark 기준 조회 시작 시각 (검색 기간을 이미 커버한 경우만, 아니면 None)"""
+        if not mark or window_from is None:
+            return None
+        last = mark.get("last_notice_at")
+        covered = mark.get("covered_from")
+        if last is None or covered is None or covered > window_from:
+            return None
+        return max(window_from, last - timedelta(minutes=settings.bid_sync_overlap_minutes))
+
+    async def _load_sync_marks(self, keywords: list[str]) -> dict[str, dict]:
+        """bid_sync_state에서 키워드별 high-water mark 조회 (실패 시 빈 dict → 전체 조회)"""
+        try:
+            res = await (
+                self.db.table("bid_sync_state")
+                .select("keyword, last_notice_at, covered_from, synced_at")
+                .in_("keyword", keywords)
+                .execute()
+            )
+        except Exception as e:
+            logger.warning(f"동기화 상태 조회 실패 (전체 조회로 진행): {e}")
+            return {}
+        marks = {}
+        for row in res.data or []:
+            marks[row["keyword"]] = {
+                "last_notice_at": _parse_iso(row.get("last_notice_at")),
+                "covered_from": _parse_iso(row.get("covered_from")),
+                "synced_at": _parse_iso(row.get("synced_at")),
+            }
+        return marks
+
+    async def _save_sync_marks(
+        self,
+        seen: dict[str, Optional[datetime]],
+        marks: dict[str, dict],
+        window_from: datetime,
+    ) -> None:
+        """조회 성공 키워드의 high-water mark 갱신 (실패는 무시 — 다음 동기화가 더 넓게 조회)"""
+        now = datetime.now(timezone.utc)
+        rows = []
+        for keyword, latest in seen.items():
+            prev = marks.get(keyword) or {}
+            last = max((d for d in (prev.get("last_notice_at"), latest) if d), default=None)
+            covered = min((d for d in (prev.get("covered_from"), window_from) if d), default=window_from)
+            rows.append({
+                "keyword": keyword,
+                "last_notice_at": last.isoformat() if last else None,
+                "covered_from": covered.isoformat(),
+                "synced_at": now.isoformat(),
+            })
+        if not rows:
+            return
+        try:
+            await self.db.table("bid_sync_state").upsert(rows, on_conflict="keyword").execute()
+        except Exception as e:
+            logger.warning(f"동기화 상태 저장 실패 (무시): {e}")
+
+    async def _load_stored_announcements(
+        self, keywords: list[str], window_from: datetime
+    ) -> dict[str, tuple[BidAnnouncement, Optional[str]]]:
+        """검색 기간 내 저장 공고 중 키워드가 공고명에 포함된 것 → {bid_no: (공고, content_hash)}"""
+        terms = [kw.translate(_FILTER_UNSAFE).strip() for kw in keywords]
+        terms = [t for t in terms if t]
+        if not terms:
+            return {}
+        rows: list[dict] = []
+        try:
+            offset = 0
+            while True:
+                res = await (
+                    self.db.table("bid_announcements")
+                    .select("*")
+                    .or_(",".join(f"bid_title.ilike.%{t}%" for t in terms))
+                    .gte("announce_date", window_from.date().isoformat())
+                    .order("bid_no")
+                    .range(offset, offset + _LOAD_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = res.data or []
+                rows.extend(page)
+                if len(page) < _LOAD_PAGE_SIZE:
+                    break
+                offset += _LOAD_PAGE_SIZE
+        except Exception as e:
+            logger.warning(f"저장 공고 조회 실패 (G2B 응답만 사용): {e}")
+            return {}
+        stored = {}
+        for row in rows:
+            try:
+                bid = BidAnnouncement(**{k: row.get(k) for k in BidAnnouncement.model_fields if k in row})
+            except Exception:
+                continue
+            if bid.deadline_date:
+                bid.days_remaining = (bid.deadline_date.date() - date.today()).days
+            stored[bid.bid_no] = (bid, row.get("content_hash"))
+        return stored
+
     def _normalize(self, raw: dict) -> Optional[BidAnnouncement]:
         """나라장터 API 응답 dict → BidAnnouncement 스키마 변환"""
         try:
@@ -136,20 +416,8 @@ class BidFetcher:
                 except (ValueError, TypeError):
                     pass
 
-            deadline_date: Optional[datetime] = None
-            raw_deadline = raw.get("bfSpecRgstDt") or raw.get("bidNtceDt")
-            if raw_deadline:
-                try:
-                    # 포맷 예: "2026/03/20 18:00:00" 또는 "20260320180000"
-                    for fmt in ("%Y/%m/%d %H:%M:%S", "%Y%m%d%H%M%S", "%Y-%m-%dT%H:%M:%S"):
-                        try:
-                            deadline_date = datetime.strptime(str(raw_deadline).strip(), fmt)
-                            deadline_date = deadline_date.replace(tzinfo=timezone.utc)
-                            break
-                        except ValueError:
-                            continue
-                except Exception:
-                    pass
+            # 포맷 예: "2026/03/20 18:00:00" 또는 "20260320180000"
+            deadline_date = parse_g2b_datetime(raw.get("bfSpecRgstDt") or raw.get("bidNtceDt"))
 
             days_remaining: Optional[int] = None
             if deadline_date:
@@ -208,8 +476,75 @@ class BidFetcher:
                 return False
         return True
 
+    @staticmethod
+    def _signature(bid: BidAnnouncement) -> Optional[list[int]]:
+        """재공고 비교용 서명 (상세내용이 없으면 공고명만 같은 별개 공고가 많아 None)"""
+        if not bid.content_text:
+            return None
+        return minhash(f"{bid.bid_title}\n{bid.content_text}")
+
+    async def _link_duplicates(self, bids: list[BidAnnouncement]) -> dict[str, list[int]]:
+        """
+        최근 저장 공고 + 이번 배치에서 근접 중복(재공고)을 찾아 bid.duplicate_of 설정
+
+        Returns:
+            {bid_no: MinHash 서명} — 서명을 만들 수 없는 공고는 제외
+        """
+        signatures = {b.bid_no: sig for b in bids if (sig := self._signature(b))}
+        if not signatures:
+            return {}
+
+        since = date.today() - timedelta(days=settings.bid_duplicate_window_days)
+        # 연결은 같은 발주기관끼리만 → 이번 배치 기관의 공고만 조회 (기관 없는 공고가 있으면 전체)
+        batch_agencies = {b.agency for b in bids if b.bid_no in signatures}
+        stored: list[dict] = []
+        try:
+            offset = 0
+            while True:
+                query = (
+                    self.db.table("bid_announcements")
+                    .select("bid_no, agency, minhash, duplicate_of")
+                    .gte("announce_date", since.isoformat())
+                )
+                if all(batch_agencies):
+                    query = query.in_("agency", sorted(batch_agencies))
+                res = await query.order("bid_no").range(offset, offset + _LOAD_PAGE_SIZE - 1).execute()
+                page = res.data or []
+                stored.extend(page)
+                if len(page) < _LOAD_PAGE_SIZE:
+                    break
+                offset += _LOAD_PAGE_SIZE
+        except Exception as e:
+            logger.warning(f"재공고 비교 대상 조회 실패 (이번 배치 내에서만 비교): {e}")
+            stored = []
+
+        # 원 공고(duplicate_of 없음)만 색인 → 연결은 항상 최초 공고를 가리킴
+        index = LSHIndex()
+        agencies: dict[str, str] = {}
+        for row in stored:
+            if row.get("minhash") and not row.get("duplicate_of") and row["bid_no"] not in signatures:
+                index.add(row["bid_no"], row["minhash"])
+                agencies[row["bid_no"]] = row.get("agency")
+
+        threshold = settings.near_duplicate_threshold
+        for bid in sorted(bids, key=lambda b: (b.announce_date or date.max, b.bid_no)):
+            sig = signatures.get(bid.bid_no)
+            if sig is None:
+                continue
+            match = index.best_match(
+                sig, threshold, exclude=bid.bid_no, accept=lambda key: agencies.get(key) == bid.agency
+            )
+            bid.duplicate_of = match[0] if match else None
+            if match:
+                logger.info(f"재공고 연결: {bid.bid_no} → {match[0]} (유사도 {match[1]:.2f})")
+            else:
+                index.add(bid.bid_no, sig)
+                agencies[bid.bid_no] = bid.agency
+        return signatures
+
     async def _upsert_announcements(self, bids: list[BidAnnouncement]) -> None:
-        """bid_announcements 테이블에 upsert (bid_no 기준)"""
+        """bid_announcements 테이블에 upsert (bid_no 기준, 재공고 연결 포함)"""
+        signatures = await self._link_duplicates(bids)
         rows = []
         for bid in bids:
             row = {
@@ -222,6 +557,9 @@ class BidFetcher:
                 "days_remaining": bid.days_remaining,
                 "content_text": bid.content_text,
                 "qualification_available": bid.qualification_available,
+                "content_hash": announcement_hash(bid),
+                "minhash": signatures.get(bid.bid_no),
+                "duplicate_of": bid.duplicate_of,
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
             if bid.announce_date:
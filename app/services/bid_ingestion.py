@@ -0,0 +1,107 @@
+"""
+공용 입찰 공고 수집 워커
+
+팀별 trigger_fetch가 같은 키워드("AI", "플랫폼" 등)로 G2B를 중복 호출하지 않도록,
+활성 프리셋 전체의 키워드 합집합을 주기적으로 증분 동기화해 bid_announcements를 최신으로 유지합니다.
+  - 검색 기간: 활성 프리셋 중 최장 기간 (0 = 제한 없음은 팀별 수집이 직접 처리)
+  - 후처리 필터: 활성 프리셋 중 가장 느슨한 조건 (BidFilter.loosest)
+  - 팀별 수집은 BidFetcher.fetch_bids_by_preset(prefer_local=True)로 로컬 테이블만 조회
+
+같은 키워드의 낙찰결과도 낙찰 이력 로컬 저장소(award_history)에 증분 적재해
+경쟁사 분석·입찰가 시뮬레이션이 로컬 조회로 끝나도록 합니다.
+
+G2B 호출량은 팀 수가 아니라 고유 키워드 수에 비례합니다.
+단일 프로세스 기준 — 워커가 여러 개여도 키워드별 high-water mark(bid_sync_state)를 공유하므로
+중복 구간은 overlap 범위로 제한됩니다.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.config import settings
+from app.models.bid_schemas import SearchPreset
+from app.services import award_history
+from app.services.bid_fetcher import BidFetcher, BidFilter
+from app.services.g2b_service import G2BService
+from app.utils.supabase_client import get_async_client
+
+logger = logging.getLogger(__name__)
+
+# 앱 시작 직후 첫 수집까지 대기 (초) — lifespan 초기화와 겹치지 않도록
+_STARTUP_DELAY_SECONDS = 10
+
+
+async def load_active_presets(client) -> list[SearchPreset]:
+    """모든 팀의 활성 프리셋 (파싱 실패 행은 건너뜀)"""
+    res = await client.table("search_presets").select("*").eq("is_active", True).execute()
+    presets = []
+    for row in res.data or []:
+        try:
+            presets.append(SearchPreset(**row))
+        except Exception as e:
+            logger.warning(f"프리셋 파싱 실패 id={row.get('id')} (무시): {e}")
+    return presets
+
+
+def ingestion_plan(presets: list[SearchPreset]) -> tuple[list[str], int, BidFilter]:
+    """활성 프리셋 → (키워드 합집합, 최장 검색 기간, 가장 느슨한 필터)"""
+    keywords = list(dict.fromkeys(kw.strip() for p in presets for kw in p.keywords if kw.strip()))
+    range_days = max((p.announce_date_range_days for p in presets), default=0)
+    return keywords, range_days, BidFilter.loosest(presets)
+
+
+class BidIngestionWorker:
+    """활성 프리셋 키워드 합집합 주기 동기화 (lifespan에서 start/stop)"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def run_once(self) -> int:
+        """1회 동기화 → 동기화 범위 내 필터 통과 공고 수 (활성 프리셋이 없으면 0)"""
+        async with self._lock:
+            client = await get_async_client()
+            presets = await load_active_presets(client)
+            keywords, range_days, flt = ingestion_plan(presets)
+            if not keywords or range_days <= 0:
+                logger.info("공용 공고 수집: 동기화할 활성 프리셋 없음")
+                return 0
+            async with G2BService() as g2b:
+                bids = await BidFetcher(g2b, client).sync_keywords(
+                    keywords, range_days, flt, incremental=True
+                )
+                if settings.award_history_enabled:
+                    awards = await award_history.sync_keywords(g2b, keywords)
+                    logger.info(f"낙찰 이력 적재: 신규 {awards}건")
+            logger.info(f"공용 공고 수집 완료: 키워드 {len(keywords)}개, 공고 {len(bids)}건")
+            return len(bids)
+
+    async def _loop(self) -> None:
+        await asyncio.sleep(_STARTUP_DELAY_SECONDS)
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"공용 공고 수집 실패 (다음 주기에 재시도): {e}")
+            await asyncio.sleep(settings.bid_ingestion_interval_minutes * 60)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"공용 공고 수집 워커 시작 (주기 {settings.bid_ingestion_interval_minutes}분)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+bid_ingestion_worker = BidIngestionWorker()
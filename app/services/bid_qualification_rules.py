@@ -0,0 +1,218 @@
+"""
+입찰 참가자격 규칙 판정 (Claude 자격 판정 전 결정적 fast path)
+
+공고 내용에서 자주 나오는 자격 조항을 미리 컴파일한 정규식으로 추출하고,
+팀 프로필만으로 결론이 명확한 경우에만 pass/fail을 확정합니다.
+  - fail: 조항 1개라도 명확히 불충족 (인원 미달, 기업규모 제한, 필수 인증 미보유, 사업자 유형 제한)
+  - pass: 추출한 조항이 1개 이상이고 모두 충족하며, 규칙으로 판단할 수 없는 제한(지역·실적 등)이 없음
+  - 인원·인증 조항은 같은 문장에 가점/우대/제한/참여 불가 표현이 있으면 필수 요건으로 보지 않음
+    (예: "GS인증 보유 업체 가점", "300인 이상 기업은 참여를 제한") → 해당 조항이 있으면 pass도 확정하지 않음
+  - 기업규모·사업자 유형 제한도 같은 문장이 가점/우대이거나 부정("제한 없음", "무관")이면 같은 방식으로 처리
+    (예: "여성기업으로 확인받은 업체는 가점", "중소기업 참가자격 제한 없음")
+  - 그 외: None → Claude 판정 (_call_qualification)
+
+프로필 값이 비어 있으면(인원 미입력, 인증 목록 비어 있음 등) 해당 조항은 판단하지 않습니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.models.bid_schemas import BidAnnouncement, QualificationResult, TeamBidProfile
+
+# 규칙 판정에 쓰는 공고 내용 최대 길이 (자격 조항은 앞부분에 몰려 있음)
+CONTENT_MAX_CHARS = 8000
+
+# 인증/등록 카탈로그 — 표시명: 공고/프로필 표기 변형 정규식
+_CERT_PATTERNS = {
+    "GS인증": r"GS\s*인증",
+    "ISO 9001": r"ISO\s*[-/]?\s*9001",
+    "ISO 27001": r"ISO\s*[-/]?\s*27001",
+    "ISMS-P": r"ISMS\s*-?\s*P",
+    "ISMS": r"ISMS(?!\s*-?\s*P)",
+    "CMMI": r"CMMI",
+    "소프트웨어사업자": r"소프트웨어\s*사업자",
+    "정보통신공사업": r"정보통신\s*공사업",
+    "엔지니어링사업자": r"엔지니어링\s*사업자",
+    "벤처기업": r"벤처\s*기업\s*(?:확인|인증)",
+    "이노비즈": r"이노비즈|기술혁신형\s*중소기업",
+    "메인비즈": r"메인비즈|경영혁신형\s*중소기업",
+    "직접생산확인": r"직접\s*생산\s*확인",
+}
+_CERT_RES = {name: re.compile(p, re.IGNORECASE) for name, p in _CERT_PATTERNS.items()}
+# 인증명 뒤 60자 이내에 보유/등록 요구 표현이 있어야 자격 조항으로 인정
+_CERT_REQUIRED_TAIL = re.compile(r".{0,60}?(?:보유|소지|취득|등록(?:한|된|업체|자)|필수)", re.DOTALL)
+
+# 회사 인원 요건만 (과업 "투입 인력 N명 이상"은 자격 요건이 아니므로 제외)
+_EMPLOYEE_RE = re.compile(
+    r"(?:상시\s*)?(?:근로자|종업원|임직원)\s*(?:수\s*)?(?:가\s*)?(\d{1,5})\s*(?:명|인)\s*이상"
+)
+
+# 인원·인증 조항이 필수 요건이 아닐 수 있는 표현 (가점·우대 항목, 대기업 배제 등)
+_SOFT_CLAUSE_RE = re.compile(
+    r"가점|우대|감점|제한|제외|배제|(?:참여|참가|입찰)\s*(?:가\s*)?(?:불가|할\s*수\s*없)"
+)
+# 기업규모·사업자 유형 제한 조항이 필수 제한이 아닐 수 있는 표현 (조항 자체가 "제한"을 포함하므로 부정·가점만)
+_SOFT_RESTRICTION_RE = re.compile(
+    r"가점|우대|감점|배점|무관|제한\s*(?:이\s*|은\s*)?없|해당\s*(?:사항\s*)?없"
+)
+# 조항(문장) 경계
+_CLAUSE_BREAK_RE = re.compile(r"[.。;\n]|다\s")
+
+# 기업규모 제한 조항 → 참여 가능한 규모 집합
+_SMB = {"중소기업", "중기업", "소기업", "소상공인"}
+_SIZE_RULES = (
+    (re.compile(r"소기업\s*[·ㆍ,및/]?\s*소상공인\s*(?:간\s*)?(?:경쟁|제한|만)"), {"소기업", "소상공인"}),
+    (re.compile(r"중소기업(?:자)?\s*간\s*경쟁|중소기업(?:자)?(?:로|으로)?\s*(?:참가|입찰)?\s*(?:자격)?\s*제한|중소기업(?:자)?만"), _SMB),
+)
+_SIZE_ALIASES = {
+    "대기업": "대기업", "중견기업": "중견기업", "중견": "중견기업",
+    "중소기업": "중소기업", "중기업": "중기업", "소기업": "소기업",
+    "소상공인": "소상공인", "스타트업": "소기업",
+}
+
+# 사업자 유형 제한 조항
+_REG_TYPE_RULES = {
+    "사회적기업": re.compile(r"사회적\s*기업\s*(?:으로|만|간|제한)"),
+    "여성기업": re.compile(r"여성\s*기업\s*(?:으로|만|간|제한)"),
+    "장애인기업": re.compile(r"장애인\s*기업\s*(?:으로|만|간|제한)"),
+    "협동조합": re.compile(r"협동\s*조합\s*(?:으로|만|간|제한)"),
+}
+
+# 규칙으로 판단할 수 없는 제한 — 하나라도 있으면 pass를 확정하지 않음
+_UNRESOLVED_RE = re.compile(
+    r"지역\s*제한|소재\s*(?:업체|기업|자)|(?:주된\s*)?영업소\s*소재지"
+    r"|(?:수행|납품|용역)\s*실적|실적\s*(?:보유|제한|증명)"
+    r"|신용\s*(?:평가\s*)?등급|공동\s*수급|컨소시엄"
+)
+
+
+@dataclass
+class _Findings:
+    satisfied: list[str] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+    unclear: list[str] = field(default_factory=list)
+
+
+def _clause(text: str, start: int, end: int) -> str:
+    """text[start:end]를 포함하는 조항(문장)"""
+    begin = max((m.end() for m in _CLAUSE_BREAK_RE.finditer(text, 0, start)), default=0)
+    stop = _CLAUSE_BREAK_RE.search(text, end)
+    return text[begin:stop.start() if stop else len(text)]
+
+
+def _is_soft(text: str, start: int, end: int, rx: re.Pattern = _SOFT_CLAUSE_RE) -> bool:
+    """일치 구간이 가점·우대·제한 조항 안에 있어 필수 요건으로 단정할 수 없는지"""
+    return bool(rx.search(_clause(text, start, end)))
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text).lower()
+
+
+class QualificationRules:
+    """팀 프로필 1건 기준 규칙 판정기 (프로필 정규화를 1회만 수행)"""
+
+    def __init__(self, profile: TeamBidProfile):
+        held = " ".join(profile.certifications)
+        self.has_cert_profile = bool(profile.certifications)
+        self.held_certs = {name for name, rx in _CERT_RES.items() if rx.search(held)}
+        self.employee_count = profile.employee_count
+        self.size = self._size_of(profile)
+        self.reg_type = _normalize(profile.business_registration_type or "")
+
+    @staticmethod
+    def _size_of(profile: TeamBidProfile) -> Optional[str]:
+        for raw in (profile.company_size, profile.business_registration_type):
+            key = _normalize(raw or "")
+            for alias, size in _SIZE_ALIASES.items():
+                if alias in key:
+                    return size
+        return None
+
+    def _check_employees(self, text: str, f: _Findings) -> None:
+        if self.employee_count is None:
+            return
+        required = []
+        for m in _EMPLOYEE_RE.finditer(text):
+            if _is_soft(text, m.start(), m.end()):
+                f.unclear.append(m.group(0))
+            else:
+                required.append(int(m.group(1)))
+        if not required:
+            return
+        need = max(required)
+        if self.employee_count < need:
+            f.violations.append(f"인원 요건 미달 (요구 {need}명 이상, 보유 {self.employee_count}명)")
+        else:
+            f.satisfied.append(f"인원 {need}명 이상")
+
+    def _check_size(self, text: str, f: _Findings) -> None:
+        if self.size is None:
+            return
+        for rx, allowed in _SIZE_RULES:
+            for m in rx.finditer(text):
+                if _is_soft(text, m.start(), m.end(), _SOFT_RESTRICTION_RE):
+                    f.unclear.append(m.group(0))
+                    continue
+                if self.size in allowed:
+                    f.satisfied.append(f"기업규모 제한 충족 ({m.group(0)})")
+                else:
+                    f.violations.append(f"기업규모 제한 ({m.group(0)}) — 팀 규모: {self.size}")
+                return
+
+    def _check_certs(self, text: str, f: _Findings) -> None:
+        if not self.has_cert_profile:
+            return
+        for name, rx in _CERT_RES.items():
+            for m in rx.finditer(text):
+                tail = _CERT_REQUIRED_TAIL.match(text, m.end())
+                if not tail:
+                    continue
+                if _is_soft(text, m.start(), tail.end()):
+                    f.unclear.append(name)
+                    continue
+                if name in self.held_certs:
+                    f.satisfied.append(f"{name} 보유")
+                else:
+                    f.violations.append(f"필수 인증/등록 미보유: {name}")
+                break
+
+    def _check_reg_type(self, text: str, f: _Findings) -> None:
+        if not self.reg_type:
+            return
+        for name, rx in _REG_TYPE_RULES.items():
+            for m in rx.finditer(text):
+                if _is_soft(text, m.start(), m.end(), _SOFT_RESTRICTION_RE):
+                    f.unclear.append(name)
+                    continue
+                if _normalize(name) in self.reg_type:
+                    f.satisfied.append(f"{name} 제한 충족")
+                else:
+                    f.violations.append(f"{name}으로 참가 제한")
+                break
+
+    def evaluate(self, bid: BidAnnouncement) -> Optional[QualificationResult]:
+        """결론이 명확하면 QualificationResult, 아니면 None (Claude 판정 필요)"""
+        text = (bid.content_text or "")[:CONTENT_MAX_CHARS]
+        if not text.strip():
+            return None
+        f = _Findings()
+        self._check_employees(text, f)
+        self._check_size(text, f)
+        self._check_certs(text, f)
+        self._check_reg_type(text, f)
+
+        if f.violations:
+            return QualificationResult(
+                bid_no=bid.bid_no,
+                qualification_status="fail",
+                disqualification_reason="; ".join(f.violations),
+            )
+        if f.satisfied and not f.unclear and not _UNRESOLVED_RE.search(text):
+            return QualificationResult(
+                bid_no=bid.bid_no,
+                qualification_status="pass",
+                qualification_notes="규칙 판정: " + ", ".join(f.satisfied),
+            )
+        return None
@@ -4,8 +4,19 @@
 Claude API로 2단계 분석:
   1단계: 자격 판정 (pass / fail / ambiguous) — 배치 20건
   2단계: 매칭 점수 산출 (0~100) — 배치 20건
+
+Claude 호출 전 로컬 BM25 관련도(bid_relevance)로 공고를 정렬해
+상위 bid_prefilter_max_candidates건만 분석합니다.
+사전 필터에서 빠진 공고는 결과를 만들지 않으며 bid_recommendations에도 저장하지 않습니다 (의도된 동작).
+관련도 계산은 로컬 연산이라 수집 때마다 다시 정렬하고, 순위가 올라오면 그때 분석·저장됩니다.
+자격 판정은 규칙 판정(bid_qualification_rules)으로 명확한 공고를 먼저 확정하고 나머지만 Claude로 보냅니다.
+배치는 bid_analysis_concurrency개씩 동시 실행하고 결과는 입력 순서대로 병합합니다.
+
+모델은 model_router 단계(bid_qualification / bid_scoring)로 선택하며,
+응답이 JSON 배열이 아니면 상위 모델로 1회 재시도합니다.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
@@ -13,6 +24,10 @@ from datetime import datetime, timezone
 from anthropic import AsyncAnthropic
 
 from app.config import settings
+from app.services.bid_qualification_rules import QualificationRules
+from app.services.bid_relevance import rank_bids
+from app.utils.model_router import model_for, routed_call
+from app.utils.text_cache import content_hash
 from app.models.bid_schemas import (
     BidAnnouncement,
     BidRecommendation,
@@ -24,9 +39,25 @@ from app.models.bid_schemas import (
 
 logger = logging.getLogger(__name__)
 
+# 분석 로직(프롬프트·규칙 판정·사전 필터)이 바뀌면 올려서 기존 분석 메모를 무효화
+ANALYSIS_VERSION = 1
+
+# 자격 판정 배치 실패 시 임시 결과 표시 — 분석 메모로 재사용하지 않음
+QUALIFICATION_ERROR_NOTE = "AI 분석 일시 오류 — 직접 확인 필요"
+
 _MATCH_GRADE_TABLE = [(90, "S"), (80, "A"), (70, "B"), (60, "C"), (0, "D")]
 
 
+def _load_json_array(text: str) -> list:
+    """응답 텍스트의 첫 [ ~ 마지막 ] JSON 배열 로드 (배열이 아니면 예외)"""
+    start = text.find("[")
+    end = text.rfind("]") + 1
+    data = json.loads(text[start:end])
+    if not isinstance(data, list):
+        raise ValueError("JSON 배열이 아닙니다.")
+    return data
+
+
 def _score_to_grade(score: int) -> str:
     for threshold, grade in _MATCH_GRADE_TABLE:
         if score >= threshold:
@@ -42,7 +73,8 @@ class BidRecommender:
 
     def __init__(self):
         self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-        self.model = "claude-sonnet-4-5-20250929"
+        self.model = model_for("bid_qualification")
+        self.scoring_model = model_for("bid_scoring")
 
     # ── 공개 API ────────────────────────────────────────────
 
@@ -55,14 +87,23 @@ class BidRecommender:
         """
         1단계 + 2단계 통합 실행.
 
+        공고는 먼저 팀 프로필 대비 로컬 관련도 순으로 정렬하고, 상위 후보만 분석합니다.
+        2단계 top_n도 수집 순서가 아니라 관련도 순으로 선택됩니다.
+
         Returns:
             (recommendations, all_qual_results)
             - recommendations: match_score 내림차순, pass/ambiguous만 포함
-            - all_qual_results: fail 포함 전체 자격 판정 결과
+            - all_qual_results: fail 포함 전체 자격 판정 결과 (사전 필터 탈락 공고는 결과 없음 → 저장되지 않음)
         """
         if not bids:
             return [], []
 
+        bids = rank_bids(team_profile, bids)
+        limit = settings.bid_prefilter_max_candidates
+        if limit and len(bids) > limit:
+            logger.info(f"관련도 사전 필터: {len(bids)}건 중 상위 {limit}건만 분석")
+            bids = bids[:limit]
+
         # qualification_available=False인 공고는 자동 ambiguous 처리
         auto_ambiguous = [b for b in bids if not b.qualification_available]
         to_check = [b for b in bids if b.qualification_available]
@@ -102,44 +143,67 @@ class BidRecommender:
         team_profile: TeamBidProfile,
         bids: list[BidAnnouncement],
     ) -> list[QualificationResult]:
-        """1단계: 배치 자격 판정 (BATCH_SIZE건/호출)"""
-        results: list[QualificationResult] = []
-
-        for i in range(0, len(bids), self.BATCH_SIZE):
-            batch = bids[i : i + self.BATCH_SIZE]
-            try:
-                batch_results = await self._call_qualification(team_profile, batch)
-                results.extend(batch_results)
-            except Exception as e:
-                logger.error(f"자격 판정 배치 {i//self.BATCH_SIZE+1} 실패: {e}")
-                # 실패한 배치는 ambiguous로 처리
-                for b in batch:
-                    results.append(QualificationResult(
-                        bid_no=b.bid_no,
-                        qualification_status="ambiguous",
-                        qualification_notes="AI 분석 일시 오류 — 직접 확인 필요",
-                    ))
-
-        return results
+        """1단계: 규칙 판정 → 미확정 공고만 배치 자격 판정 (BATCH_SIZE건/호출, 배치 동시 실행)"""
+        rules = QualificationRules(team_profile)
+        decided = {}
+        pending: list[BidAnnouncement] = []
+        for b in bids:
+            result = rules.evaluate(b)
+            if result is None:
+                pending.append(b)
+            else:
+                decided[b.bid_no] = result
+        if decided:
+            logger.info(f"자격 규칙 판정: {len(decided)}건 확정, Claude 판정 {len(pending)}건")
+
+        sem = asyncio.Semaphore(max(1, settings.bid_analysis_concurrency))
+
+        async def run(index: int, batch: list[BidAnnouncement]) -> list[QualificationResult]:
+            async with sem:
+                try:
+                    return await self._call_qualification(team_profile, batch)
+                except Exception as e:
+                    logger.error(f"자격 판정 배치 {index + 1} 실패: {e}")
+                    # 실패한 배치는 ambiguous로 처리
+                    return [
+                        QualificationResult(
+                            bid_no=b.bid_no,
+                            qualification_status="ambiguous",
+                            qualification_notes=QUALIFICATION_ERROR_NOTE,
+                        )
+                        for b in batch
+                    ]
+
+        batches = await asyncio.gather(*(
+            run(i, batch) for i, batch in enumerate(self._batches(pending))
+        ))
+        results = {**decided, **{r.bid_no: r for batch in batches for r in batch}}
+        return [results[b.bid_no] for b in bids if b.bid_no in results]
 
     async def score_bids(
         self,
         team_profile: TeamBidProfile,
         bids: list[BidAnnouncement],
     ) -> list[BidRecommendation]:
-        """2단계: 배치 매칭 점수 산출 (BATCH_SIZE건/호출)"""
-        results: list[BidRecommendation] = []
-
-        for i in range(0, len(bids), self.BATCH_SIZE):
-            batch = bids[i : i + self.BATCH_SIZE]
-            try:
-                batch_results = await self._call_scoring(team_profile, batch)
-                results.extend(batch_results)
-            except Exception as e:
-                logger.error(f"매칭 점수 배치 {i//self.BATCH_SIZE+1} 실패: {e}")
-                # 실패한 배치 건너뜀
-
-        return results
+        """2단계: 배치 매칭 점수 산출 (BATCH_SIZE건/호출, 배치 동시 실행)"""
+        sem = asyncio.Semaphore(max(1, settings.bid_analysis_concurrency))
+
+        async def run(index: int, batch: list[BidAnnouncement]) -> list[BidRecommendation]:
+            async with sem:
+                try:
+                    return await self._call_scoring(team_profile, batch)
+                except Exception as e:
+                    logger.error(f"매칭 점수 배치 {index + 1} 실패: {e}")
+                    # 실패한 배치 건너뜀
+                    return []
+
+        batches = await asyncio.gather(*(
+            run(i, batch) for i, batch in enumerate(self._batches(bids))
+        ))
+        return [r for batch in batches for r in batch]
+
+    def _batches(self, bids: list[BidAnnouncement]) -> list[list[BidAnnouncement]]:
+        return [bids[i : i + self.BATCH_SIZE] for i in range(0, len(bids), self.BATCH_SIZE)]
 
     # ── Claude 호출 ──────────────────────────────────────────
 
@@ -175,7 +239,9 @@ class BidRecommender:
   }}
 ]"""
 
-        response = await self.client.messages.create(
+        response = await routed_call(
+            self.client, "bid_qualification",
+            validate=_load_json_array,
             model=self.model,
             max_tokens=2000,
             timeout=self.CLAUDE_TIMEOUT,
@@ -183,7 +249,7 @@ class BidRecommender:
             system=system,
         )
 
-        return self._parse_qualification_response(response.content[0].text, bids)
+        return self._parse_qualification_response(response.text, bids)
 
     async def _call_scoring(
         self, team_profile: TeamBidProfile, bids: list[BidAnnouncement]
@@ -224,15 +290,17 @@ strength는 "high"|"medium"|"low" 중 하나.
   }}
 ]"""
 
-        response = await self.client.messages.create(
-            model=self.model,
+        response = await routed_call(
+            self.client, "bid_scoring",
+            validate=_load_json_array,
+            model=self.scoring_model,
             max_tokens=4000,
             timeout=self.CLAUDE_TIMEOUT,
             messages=[{"role": "user", "content": user}],
             system=system,
         )
 
-        return self._parse_scoring_response(response.content[0].text, bids)
+        return self._parse_scoring_response(response.text, bids)
 
     # ── 파싱 헬퍼 ────────────────────────────────────────────
 
@@ -343,6 +411,22 @@ strength는 "high"|"medium"|"low" 중 하나.
             logger.error(f"매칭 점수 응답 파싱 실패: {e}\n응답: {text[:300]}")
             return []
 
+    # ── 메모이제이션 키 ──────────────────────────────────────
+
+    def profile_fingerprint(self, p: TeamBidProfile) -> str:
+        """분석에 쓰이는 프로필 필드(_format_profile) 해시 — 프로필이 같으면 같은 값"""
+        text = f"v{ANALYSIS_VERSION}\n{self._format_profile(p)}"
+        return content_hash(text.encode("utf-8"))[:32]
+
+    @staticmethod
+    def bid_fingerprint(b: BidAnnouncement) -> str:
+        """분석 입력이 되는 공고 필드 해시 — 공고 내용이 바뀌면 달라짐"""
+        payload = json.dumps(
+            [b.bid_title, b.agency, b.budget_amount, b.content_text or "", b.qualification_available],
+            ensure_ascii=False,
+        )
+        return content_hash(payload.encode("utf-8"))[:32]
+
     # ── 포맷 헬퍼 ────────────────────────────────────────────
 
     def _format_profile(self, p: TeamBidProfile) -> str:
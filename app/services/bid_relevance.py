@@ -0,0 +1,68 @@
+"""
+입찰 공고 로컬 관련도 점수 (Claude 호출 전 사전 순위화)
+
+팀 프로필의 전문분야/보유기술 키워드와 공고명 + 공고내용을
+한국어 문자 n-gram(2~3자) BM25로 비교합니다.
+  - 띄어쓰기·조사 변형에 강하도록 단어 단위가 아니라 어절 내부 문자 n-gram 사용
+  - 공고명은 TITLE_WEIGHT배 가중 (제목이 사업 성격을 가장 잘 드러냄)
+  - IDF는 이번 수집 공고 집합 기준 (모든 공고에 흔한 n-gram은 자동으로 가중치 낮음)
+"""
+
+import math
+from collections import Counter
+
+from app.models.bid_schemas import BidAnnouncement, TeamBidProfile
+from app.utils.ngrams import char_ngrams
+
+TITLE_WEIGHT = 3
+CONTENT_MAX_CHARS = 4000
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def profile_terms(profile: TeamBidProfile) -> list[str]:
+    """관련도 질의 n-gram (전문분야 + 보유기술, 중복 제거)"""
+    text = " ".join(profile.expertise_areas + profile.tech_keywords)
+    return list(dict.fromkeys(char_ngrams(text)))
+
+
+def _bid_terms(bid: BidAnnouncement) -> Counter:
+    terms = Counter(char_ngrams(bid.bid_title))
+    for gram in terms:
+        terms[gram] *= TITLE_WEIGHT
+    terms.update(char_ngrams((bid.content_text or "")[:CONTENT_MAX_CHARS]))
+    return terms
+
+
+def score_bids(profile: TeamBidProfile, bids: list[BidAnnouncement]) -> dict[str, float]:
+    """공고별 BM25 관련도 점수 {bid_no: score} (질의어가 없으면 모두 0)"""
+    query = profile_terms(profile)
+    if not query or not bids:
+        return {b.bid_no: 0.0 for b in bids}
+
+    docs = [_bid_terms(b) for b in bids]
+    lengths = [sum(d.values()) for d in docs]
+    avgdl = (sum(lengths) / len(lengths)) or 1.0
+    n_docs = len(docs)
+    df = Counter(gram for d in docs for gram in query if gram in d)
+    idf = {
+        gram: math.log(1 + (n_docs - df[gram] + 0.5) / (df[gram] + 0.5))
+        for gram in query
+    }
+
+    scores: dict[str, float] = {}
+    for bid, terms, dl in zip(bids, docs, lengths):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl)
+        score = 0.0
+        for gram in query:
+            tf = terms.get(gram, 0)
+            if tf:
+                score += idf[gram] * tf * (BM25_K1 + 1) / (tf + norm)
+        scores[bid.bid_no] = round(score, 4)
+    return scores
+
+
+def rank_bids(profile: TeamBidProfile, bids: list[BidAnnouncement]) -> list[BidAnnouncement]:
+    """관련도 내림차순 정렬 (동점은 수집 순서 유지)"""
+    scores = score_bids(profile, bids)
+    return sorted(bids, key=lambda b: scores[b.bid_no], reverse=True)
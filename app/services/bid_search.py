@@ -0,0 +1,97 @@
+"""
+입찰 공고 전문 검색
+
+search_bid_announcements RPC(tsvector + trigram 인덱스, database/migration_bid_search.sql)로
+공고명/발주기관/상세내용을 순위 검색하고, 결과에 검색어 하이라이트를 붙입니다.
+  - 정렬: rank DESC, bid_no ASC
+  - 페이지네이션: keyset — 마지막 행의 (rank, bid_no)를 불투명 커서로 전달 (OFFSET 스캔 없음)
+  - 하이라이트: HTML 이스케이프 후 검색어를 <mark>로 감쌈
+"""
+
+import base64
+import html
+import json
+import re
+from typing import Optional
+
+# 상세내용 스니펫 최대 길이 (RPC가 첫 검색어 주변 240자를 잘라 반환)
+SNIPPET_MAX_CHARS = 240
+
+
+class InvalidCursorError(ValueError):
+    """손상되었거나 위조된 페이지 커서"""
+
+
+def encode_cursor(rank, bid_no: str) -> str:
+    payload = json.dumps([rank, bid_no], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, bid_no = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(rank), str(bid_no)
+    except Exception as e:
+        raise InvalidCursorError("유효하지 않은 페이지 커서입니다.") from e
+
+
+def query_terms(query: str) -> list[str]:
+    """공백 기준 검색어 (중복 제거, 긴 검색어 우선 — 겹치는 하이라이트 방지)"""
+    terms = dict.fromkeys(t for t in query.split() if t)
+    return sorted(terms, key=len, reverse=True)
+
+
+def highlight(text: Optional[str], terms: list[str], max_chars: Optional[int] = None) -> str:
+    """HTML 이스케이프 + 검색어(대소문자 무시) <mark> 강조"""
+    if not text:
+        return ""
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars] + "…"
+    escaped = html.escape(text)
+    if not terms:
+        return escaped
+    pattern = re.compile("|".join(re.escape(html.escape(t)) for t in terms), re.IGNORECASE)
+    return pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", escaped)
+
+
+async def search_announcements(
+    client,
+    query: str,
+    *,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    min_budget: Optional[int] = None,
+    bid_type: Optional[str] = None,
+    min_days: Optional[int] = None,
+) -> dict:
+    """순위 검색 1페이지 → {"data": [...], "meta": {"next_cursor", "per_page"}}"""
+    after_rank, after_bid_no = decode_cursor(cursor) if cursor else (None, None)
+    res = await client.rpc("search_bid_announcements", {
+        "p_query": query,
+        "p_limit": limit + 1,  # 다음 페이지 존재 여부 확인용 1건 추가
+        "p_after_rank": after_rank,
+        "p_after_bid_no": after_bid_no,
+        "p_min_budget": min_budget,
+        "p_bid_type": bid_type,
+        "p_min_days": min_days,
+    }).execute()
+    rows = res.data or []
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    terms = query_terms(query)
+    data = []
+    for row in rows:
+        snippet = row.pop("snippet", None)
+        data.append({
+            **row,
+            "highlight": {
+                "bid_title": highlight(row.get("bid_title"), terms),
+                "agency": highlight(row.get("agency"), terms),
+                "content": highlight(snippet, terms, SNIPPET_MAX_CHARS),
+            },
+        })
+
+    next_cursor = encode_cursor(rows[-1]["rank"], rows[-1]["bid_no"]) if has_more else None
+    return {"data": data, "meta": {"next_cursor": next_cursor, "per_page": limit}}
@@ -0,0 +1,204 @@
+"""
+입찰가 몬테카를로 시뮬레이션 (BidCalculator 보완)
+
+BidCalculator.optimize_bid의 고정 비율(적격심사 하한 87.745% 바로 위 등) 대신,
+가격 경쟁 방식(최저가·적격심사)에서 투찰률 구간별 낙찰 확률 곡선을 한 번의 벡터 연산으로 계산합니다.
+
+시나리오 1건 = 예정가격 추첨 1회 + 경쟁사 투찰 1세트
+  1. 복수예비가격: 기초금액 ±reserve_range 범위 예비가격 15개 중 4개 무작위 추첨 → 평균 = 예정가격
+  2. 낙찰하한: 적격심사는 예정가격 × 낙찰하한율 미만 투찰 탈락 (최저가는 하한 없음)
+  3. 경쟁사 투찰률: 낙찰결과 이력(get_bid_results)의 낙찰률로 맞춘 정규분포 (예정가격 대비)
+  4. 하한 이상·예정가격 이하 투찰 중 최저가가 낙찰
+
+투찰률(grid)은 기초금액 대비 비율이며, 결과는 (시나리오 × 투찰률) 불리언 행렬의 열 평균입니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import numpy as np
+
+from app.services.bid_calculator import BidCalculator, ProcurementMethod, _fmt
+
+RESERVE_PRICE_COUNT = 15
+RESERVE_PRICE_DRAWS = 4
+# 이력이 부족할 때 쓰는 경쟁사 투찰률 분포 (예정가격 대비, 적격심사 하한 부근 밀집)
+DEFAULT_RATIO_MEAN = 0.885
+DEFAULT_RATIO_STD = 0.015
+MIN_HISTORY_SAMPLES = 5
+MIN_RATIO_STD = 0.003
+SIMULATED_METHODS = (ProcurementMethod.LOWEST_PRICE, ProcurementMethod.ADEQUATE_REVIEW)
+
+_RATE_KEYS = ("sucsfbidRate", "sucsfBidRate", "bidRate")
+_AMOUNT_KEYS = ("sucsfbidAmt", "sucsfBidAmt", "bidAmt")
+_BASE_KEYS = ("plnprc", "presmptPrce", "bssamt")
+
+
+@dataclass
+class RatioDistribution:
+    """경쟁사 투찰률 분포 (예정가격 대비)"""
+    mean: float = DEFAULT_RATIO_MEAN
+    std: float = DEFAULT_RATIO_STD
+    samples: int = 0
+
+
+@dataclass
+class SimulationResult:
+    ratios: list[float]
+    win_probability: list[float]
+    expected_margin: list[Optional[int]]
+    recommended_ratio: float
+    recommended_bid: int
+    recommended_win_probability: float
+    scenarios: int
+    competitor_count: int
+    distribution: RatioDistribution = field(default_factory=RatioDistribution)
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(str(value).replace(",", "").replace("%", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def history_ratio(row: dict) -> Optional[float]:
+    """낙찰결과 1건의 낙찰률 (예정가격 대비 0~1, 산출 불가 시 None)"""
+    for key in _RATE_KEYS:
+        rate = _to_float(row.get(key))
+        if rate:
+            return rate / 100 if rate > 1.5 else rate
+    amount = next((v for v in (_to_float(row.get(k)) for k in _AMOUNT_KEYS) if v), None)
+    base = next((v for v in (_to_float(row.get(k)) for k in _BASE_KEYS) if v), None)
+    if amount and base:
+        return amount / base
+    return None
+
+
+def fit_ratio_distribution(rows: Iterable[dict]) -> RatioDistribution:
+    """낙찰결과 이력 → 경쟁사 투찰률 정규분포 (이상치 제외, 표본 부족 시 기본값)"""
+    return fit_ratios(history_ratio(row) for row in rows)
+
+
+def fit_ratios(values: Iterable[Optional[float]]) -> RatioDistribution:
+    """낙찰률 목록 → 경쟁사 투찰률 정규분포 (낙찰 이력 저장소 조회 결과용)"""
+    ratios = np.array([r for r in values if r and 0.5 < r < 1.2])
+    if len(ratios) < MIN_HISTORY_SAMPLES:
+        return RatioDistribution(samples=len(ratios))
+    lo, hi = np.percentile(ratios, [5, 95])
+    trimmed = ratios[(ratios >= lo) & (ratios <= hi)]
+    return RatioDistribution(
+        mean=float(trimmed.mean()),
+        std=max(float(trimmed.std()), MIN_RATIO_STD),
+        samples=len(ratios),
+    )
+
+
+def win_probability_curve(
+    ratios: np.ndarray,
+    *,
+    competitor_count: int,
+    distribution: RatioDistribution,
+    floor_rate: float,
+    reserve_range: float,
+    scenarios: int,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """투찰률(기초금액 대비) 배열별 낙찰 확률 — 모든 시나리오를 한 번에 계산"""
+    rng = np.random.default_rng(seed)
+
+    # 1. 복수예비가격 15개 중 4개 추첨 → 예정가격 비율 (S,)
+    reserves = 1.0 + rng.uniform(-reserve_range, reserve_range, size=(scenarios, RESERVE_PRICE_COUNT))
+    picks = np.argsort(rng.random((scenarios, RESERVE_PRICE_COUNT)), axis=1)[:, :RESERVE_PRICE_DRAWS]
+    planned = np.take_along_axis(reserves, picks, axis=1).mean(axis=1)
+    floor = planned * floor_rate
+
+    # 2. 경쟁사 투찰 (S, C) — 하한 미만·예정가격 초과는 무효
+    competitors = rng.normal(distribution.mean, distribution.std, size=(scenarios, competitor_count))
+    competitors *= planned[:, None]
+    valid = (competitors >= floor[:, None]) & (competitors <= planned[:, None])
+    best_rival = np.where(valid, competitors, np.inf).min(axis=1, initial=np.inf)
+
+    # 3. 당사 투찰 (S, G)
+    ours = ratios[None, :]
+    wins = (ours >= floor[:, None]) & (ours <= planned[:, None]) & (ours < best_rival[:, None])
+    return wins.mean(axis=0)
+
+
+class BidSimulator:
+    """BidCalculator 원가·예정가격 가정 위에서 투찰률별 낙찰 확률/기대 이익 계산"""
+
+    def __init__(self, calculator: Optional[BidCalculator] = None):
+        self.calc = calculator or BidCalculator()
+
+    def simulate(
+        self,
+        cost,
+        method: ProcurementMethod,
+        *,
+        budget: Optional[int] = None,
+        competitor_count: int = 5,
+        distribution: Optional[RatioDistribution] = None,
+        scenarios: int = 5000,
+        reserve_range: float = 0.02,
+        grid_step: float = 0.001,
+        seed: Optional[int] = None,
+    ) -> SimulationResult:
+        """
+        Args:
+            cost: BidCalculator.calculate_cost 결과 (기대 이익·최저 투찰가 기준)
+            budget: 사업 예산 — 기초금액은 optimize_bid와 같은 가정(예산 × 0.96, 미정이면 원가 × 1.05)
+        """
+        if method not in SIMULATED_METHODS:
+            raise ValueError(f"가격 경쟁 방식(최저가/적격심사)만 시뮬레이션할 수 있습니다: {method.value}")
+        distribution = distribution or RatioDistribution()
+        base = int(budget * 0.96) if budget else int(cost.total_cost * 1.05)
+        floor_rate = self.calc.ADEQUATE_REVIEW_FLOOR if method == ProcurementMethod.ADEQUATE_REVIEW else 0.0
+
+        lo = max(floor_rate * (1 - reserve_range), 0.7)
+        grid = np.round(np.arange(lo, 1 + reserve_range + grid_step / 2, grid_step), 4)
+        probs = win_probability_curve(
+            grid,
+            competitor_count=max(competitor_count, 0),
+            distribution=distribution,
+            floor_rate=floor_rate,
+            reserve_range=reserve_range,
+            scenarios=scenarios,
+            seed=seed,
+        )
+
+        bids = (grid * base).astype(np.int64)
+        margins = bids - cost.total_cost
+        expected = np.where(margins >= 0, margins * probs, -np.inf)
+        best = int(expected.argmax()) if np.isfinite(expected).any() else int(probs.argmax())
+        return SimulationResult(
+            ratios=grid.tolist(),
+            win_probability=np.round(probs, 4).tolist(),
+            expected_margin=[int(e) if np.isfinite(e) else None for e in expected],
+            recommended_ratio=float(grid[best]),
+            recommended_bid=int(bids[best]),
+            recommended_win_probability=round(float(probs[best]), 4),
+            scenarios=scenarios,
+            competitor_count=competitor_count,
+            distribution=distribution,
+        )
+
+    @staticmethod
+    def to_dict(r: SimulationResult) -> dict:
+        return {
+            "curve": [
+                {"ratio": ratio, "win_probability": p, "expected_margin": m}
+                for ratio, p, m in zip(r.ratios, r.win_probability, r.expected_margin)
+            ],
+            "recommended_ratio": r.recommended_ratio,
+            "recommended_bid": r.recommended_bid,
+            "recommended_bid_fmt": _fmt(r.recommended_bid),
+            "recommended_win_probability": r.recommended_win_probability,
+            "scenarios": r.scenarios,
+            "competitor_count": r.competitor_count,
+            "competitor_ratio": {
+                "mean": round(r.distribution.mean, 4),
+                "std": round(r.distribution.std, 4),
+                "samples": r.distribution.samples,
+            },
+        }
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 from docx import Document
@@ -20,3 +21,49 @@ def build_docx(sections: dict, output_path: Path, project_name: str = "용역 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     doc.save(str(output_path))
     return output_path
+
+
+def patch_docx_sections(
+    sections: dict,
+    changed: set[str],
+    output_path: Path,
+    project_name: str = "용역 제안서",
+) -> Path:
+    """
+    기존 DOCX에서 changed 섹션 본문만 교체 (제목·나머지 섹션은 그대로)
+
+    build_docx가 만든 "N. 섹션명" Heading 1 구조가 sections와 일치하지 않으면 전체 재생성.
+    """
+    try:
+        doc = Document(str(output_path))
+    except Exception:
+        return build_docx(sections, output_path, project_name)
+
+    headings = [p for p in doc.paragraphs if p.style.name == "Heading 1"]
+    names = [re.sub(r"^\d+\.\s", "", h.text, count=1) for h in headings]
+    if names != list(sections):
+        return build_docx(sections, output_path, project_name)
+
+    for heading, name in zip(headings, names):
+        if name not in changed:
+            continue
+        # 다음 Heading 1 전까지의 본문 단락 제거
+        node = heading._p.getnext()
+        while node is not None and node.tag == heading._p.tag:
+            style = node.pPr.pStyle.val if node.pPr is not None and node.pPr.pStyle is not None else ""
+            if style == headings[0]._p.pPr.pStyle.val:
+                break
+            nxt = node.getnext()
+            node.getparent().remove(node)
+            node = nxt
+        # 새 본문을 제목 바로 뒤에 순서대로 삽입
+        anchor = heading._p
+        body = sections[name]
+        for line in (body.split("\n") if isinstance(body, str) else []):
+            if line.strip():
+                para = doc.add_paragraph(line.strip())
+                anchor.addnext(para._p)
+                anchor = para._p
+
+    doc.save(str(output_path))
+    return output_path
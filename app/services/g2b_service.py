@@ -6,8 +6,9 @@
 2. getBidResultListInfo       — 낙찰결과 조회 (낙찰업체명, 낙찰금액)
 3. getCmpnyBidInfoServc       — 업체별 수주이력
 4. CompetitorProfile 생성    — Phase 2 LLM 전달
+   (낙찰 이력 로컬 저장소가 최신이면 1~3단계 대신 로컬 집계 조회 — award_history)
 
-Rate Limit: 공공 API 초당 10건 → asyncio.sleep(0.1) + exponential backoff
+Rate Limit: 공공 API 초당 10건 → 공용 제한기(g2b_limiter) + exponential backoff
 캐싱: Supabase g2b_cache 테이블 (SHA256 해시 키, 24h TTL)
 """
 
@@ -25,6 +26,8 @@ from urllib.parse import quote
 import aiohttp
 
 from app.config import settings
+from app.services.award_history import award_store, ensure_fresh
+from app.utils.rate_limiter import g2b_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -146,9 +149,8 @@ class G2BService:
         url = f"{self.base_url}/{endpoint}?serviceKey={encoded_key}&_type=json"
 
         for attempt in range(3):
-            await asyncio.sleep(0.1)  # 기본 Rate Limit 간격
             try:
-                async with self.session.get(
+                async with g2b_limiter.slot(), self.session.get(
                     url,
                     params=params,
                     timeout=aiohttp.ClientTimeout(total=15),
@@ -316,8 +318,13 @@ class G2BService:
         3. 주요 업체 수주이력 조회
         4. CompetitorProfile 생성
 
+        낙찰 이력 로컬 저장소가 켜져 있으면 키워드를 증분 동기화한 뒤 로컬 집계로 응답하고,
+        동기화에 실패한 경우에만 1~3단계 API를 직접 호출합니다.
+        API 경로는 1·2단계를 동시에, 3단계 업체 이력을 업체별 동시에 조회합니다 (공용 제한기 공유).
+        호출마다 g2b_call_timeout_seconds를 넘기거나 실패하면 해당 결과 없이 진행합니다.
+
         Returns:
-            경쟁사 분석 결과 dict
+            경쟁사 분석 결과 dict (source: "local" | "api")
         """
         # 날짜 범위
         end_dt = datetime.now()
@@ -328,21 +335,17 @@ class G2BService:
         keyword = self._extract_main_keyword(rfp_title)
         logger.info(f"G2B 경쟁사 분석 시작: keyword={keyword}")
 
-        # Step 1: 유사 입찰공고 검색
-        try:
-            bid_list = await self.search_bid_announcements(
-                keyword, num_of_rows=20, date_from=date_from, date_to=date_to
-            )
-        except Exception as e:
-            logger.warning(f"입찰공고 검색 실패: {e}")
-            bid_list = []
+        if settings.award_history_enabled and await ensure_fresh(self, keyword):
+            return await self._local_competitors(keyword, rfp_title, start_dt, end_dt, max_competitors)
 
-        # Step 2: 낙찰결과에서 업체명 추출
-        try:
-            bid_results = await self.get_bid_results(keyword, num_of_rows=30)
-        except Exception as e:
-            logger.warning(f"낙찰결과 조회 실패: {e}")
-            bid_results = []
+        # Step 1 + 2: 유사 입찰공고 검색 / 낙찰결과 조회 (서로 독립 — 동시 실행)
+        bid_list, bid_results = await asyncio.gather(
+            self._partial(
+                self.search_bid_announcements(keyword, num_of_rows=20, date_from=date_from, date_to=date_to),
+                "입찰공고 검색",
+            ),
+            self._partial(self.get_bid_results(keyword, num_of_rows=30), "낙찰결과 조회"),
+        )
 
         # 낙찰업체 빈도 집계
         winner_counter: Counter = Counter()
@@ -361,15 +364,12 @@ class G2BService:
         # 상위 업체 선정
         top_companies = [c for c, _ in winner_counter.most_common(max_competitors)]
 
-        # Step 3: 주요 업체 수주이력 조회 (상위 5개만)
-        company_histories: Dict[str, List[Dict]] = {}
-        for company in top_companies[:5]:
-            try:
-                history = await self.get_company_bid_history(company, num_of_rows=10)
-                company_histories[company] = history
-            except Exception as e:
-                logger.warning(f"업체이력 조회 실패({company}): {e}")
-                company_histories[company] = []
+        # Step 3: 주요 업체 수주이력 조회 (상위 5개만, 업체별 동시 실행)
+        histories = await asyncio.gather(*(
+            self._partial(self.get_company_bid_history(company, num_of_rows=10), f"업체이력 조회({company})")
+            for company in top_companies[:5]
+        ))
+        company_histories: Dict[str, List[Dict]] = dict(zip(top_companies, histories))
 
         # Step 4: CompetitorProfile 생성
         profiles = []
@@ -378,21 +378,13 @@ class G2BService:
         ) or 1
 
         for company in top_companies:
-            amts = winner_amounts.get(company, [0])
-            avg_amt = int(sum(amts) / len(amts)) if amts else 0
-            market_share = round(sum(amts) / total_market, 4)
-            win_count = winner_counter[company]
-            strength = min(0.5 + win_count * 0.08 + min(avg_amt / 5e8 * 0.1, 0.1), 0.95)
-
-            profiles.append({
-                "company_name": company,
-                "win_count": win_count,
-                "avg_contract_amount": avg_amt,
-                "market_share": market_share,
-                "strength_score": round(strength, 3),
-                "weakness_score": round(1 - strength, 3),
-                "bid_history_count": len(company_histories.get(company, [])),
-            })
+            profiles.append(self._competitor_profile(
+                company,
+                win_count=winner_counter[company],
+                total_amount=sum(winner_amounts.get(company, [])),
+                total_market=total_market,
+                history_count=len(company_histories.get(company, [])),
+            ))
 
         return {
             "keyword": keyword,
@@ -402,10 +394,77 @@ class G2BService:
             "competitors": profiles,
             "total_competitors": len(profiles),
             "date_range": {"from": start_dt.date().isoformat(), "to": end_dt.date().isoformat()},
+            "source": "api",
+        }
+
+    async def _local_competitors(
+        self,
+        keyword: str,
+        rfp_title: str,
+        start_dt: datetime,
+        end_dt: datetime,
+        max_competitors: int,
+    ) -> Dict[str, Any]:
+        """낙찰 이력 로컬 저장소 기준 경쟁사 분석 (search_competitors와 같은 응답 형식)"""
+        rows, totals = await asyncio.to_thread(
+            award_store.competitors, keyword, start_dt.date().isoformat(), max_competitors
+        )
+        total_market = totals["amount"] or 1
+        profiles = []
+        for r in rows:
+            profile = self._competitor_profile(
+                r["winner"],
+                win_count=r["wins"],
+                total_amount=r["amount"],
+                total_market=total_market,
+                history_count=r["total_wins"],
+            )
+            profile["avg_bid_ratio"] = round(r["avg_ratio"], 4) if r["avg_ratio"] is not None else None
+            profile["main_agency"] = r["main_agency"]
+            profiles.append(profile)
+
+        return {
+            "keyword": keyword,
+            "rfp_title": rfp_title,
+            "bid_announcements_found": totals["bids"],
+            "bid_results_found": totals["awards"],
+            "competitors": profiles,
+            "total_competitors": len(profiles),
+            "date_range": {"from": start_dt.date().isoformat(), "to": end_dt.date().isoformat()},
+            "source": "local",
         }
 
     # ── 내부 헬퍼 ────────────────────────────────
 
+    @staticmethod
+    async def _partial(call, label: str) -> List[Dict]:
+        """경쟁사 분석 단계 호출 1건 — 시간 초과·실패 시 빈 목록 (부분 결과 허용)"""
+        timeout = settings.g2b_call_timeout_seconds
+        try:
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{label} 시간 초과 ({timeout}초)")
+        except Exception as e:
+            logger.warning(f"{label} 실패: {e}")
+        return []
+
+    @staticmethod
+    def _competitor_profile(
+        company: str, *, win_count: int, total_amount: int, total_market: int, history_count: int
+    ) -> Dict[str, Any]:
+        """낙찰 수·금액 → 경쟁사 프로필 dict"""
+        avg_amt = int(total_amount / win_count) if win_count else 0
+        strength = min(0.5 + win_count * 0.08 + min(avg_amt / 5e8 * 0.1, 0.1), 0.95)
+        return {
+            "company_name": company,
+            "win_count": win_count,
+            "avg_contract_amount": avg_amt,
+            "market_share": round(total_amount / total_market, 4),
+            "strength_score": round(strength, 3),
+            "weakness_score": round(1 - strength, 3),
+            "bid_history_count": history_count,
+        }
+
     def _extract_main_keyword(self, title: str) -> str:
         """제목에서 핵심 키워드 추출 (불용어 제거)"""
         stopwords = {'및', '등', '의', '을', '를', '이', '가', '은', '는', '에', '에서',
@@ -8,20 +8,31 @@ import anthropic
 from app.config import settings
 from app.models.phase_schemas import Phase1Artifact, Phase2Artifact, Phase3Artifact, Phase4Artifact, Phase5Artifact
 from app.services.rfp_parser import parse_rfp_text
-from app.services.docx_builder import build_docx
+from app.services.docx_builder import build_docx, patch_docx_sections
 from app.services.hwpx_builder import build_hwpx
 from app.services.pptx_builder import build_pptx
 from app.services.g2b_service import G2BService
 from app.services.bid_calculator import BidCalculator, PersonnelInput, ProcurementMethod, parse_budget_string
 from app.services.phase_prompts import PHASE2_SYSTEM, PHASE2_USER, PHASE3_SYSTEM, PHASE3_USER, PHASE4_SYSTEM, PHASE4_USER, PHASE5_SYSTEM, PHASE5_USER
+from app.services.phase_prompts import PHASE4_SECTION_USER, PHASE5_SECTION_USER, SEEDED_DELTA_USER
 from app.utils.claude_utils import extract_json_from_response
+from app.utils.context_packer import ContextField, estimate_tokens, fit_text, pack_fields, step_budget
+from app.utils.model_router import model_for, routed_call
 from app.services.template_service import get_template_toc
+from app.services.progress_bus import progress_bus
+from app.services.vector_store import library_vectors
+from app.services.warm_start import find_prior_run, save_rfp_signature
 from app.utils.edge_functions import notify_proposal_complete
 from app.utils.supabase_client import get_async_client
 
 logger = logging.getLogger(__name__)
 
 
+def _section_previews(sections: dict, max_tokens: int) -> dict:
+    """Phase 5 평가용 섹션 본문 — 섹션마다 max_tokens 이내로 자름 (문자열이 아닌 값은 그대로)"""
+    return {k: fit_text(v, max_tokens) if isinstance(v, str) else v for k, v in sections.items()}
+
+
 class PhaseExecutor:
     def __init__(self, proposal_id, session_manager):
         self.proposal_id = proposal_id
@@ -29,6 +40,9 @@ class PhaseExecutor:
         self.client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
         self.model = settings.claude_model
         self._bg_tasks: set = set()
+        # 웜 스타트: 재사용할 이전 실행(WarmStartMatch)과 누적 변경분 (RFP 변경 + 앞 단계 갱신 항목)
+        self._seed = None
+        self._seed_changes: dict = {}
 
     def _bg_task(self, coro):
         """백그라운드 Task 생성 + 참조 저장 (GC 방지)"""
@@ -37,12 +51,24 @@ class PhaseExecutor:
         task.add_done_callback(self._bg_tasks.discard)
         return task
 
+    def _publish(self, event: str, data: dict):
+        """진행 이벤트 발행 (SSE 구독자용, 실패는 무시)"""
+        try:
+            progress_bus.publish(self.proposal_id, event, data)
+        except Exception as e:
+            logger.debug(f"[{self.proposal_id}] 진행 이벤트 발행 실패 (무시): {e}")
+
     def _update_status(self, phase_name):
         """세션 메모리 상태 업데이트 + Supabase proposals 테이블 업데이트"""
         self.session_manager.update_session(self.proposal_id, {"current_phase": phase_name, "status": "running"})
         logger.info("[%s] %s" % (self.proposal_id, phase_name))
+        self._publish("phase", {"current_phase": phase_name, "status": "running"})
         self._bg_task(self._db_update_status(phase_name))
 
+    def _finish(self, status: str, **extra):
+        """파이프라인 종료 이벤트 (completed / failed)"""
+        self._publish("status", {"status": status, **extra})
+
     async def _db_update_status(self, phase_name: str):
         """Supabase proposals 테이블에 현재 phase 상태 업데이트"""
         try:
@@ -60,6 +86,7 @@ class PhaseExecutor:
         """세션 메모리 아티팩트 저장 + Supabase proposal_phases 테이블 upsert"""
         self.session_manager.update_session(self.proposal_id,
             {f"phase_artifact_{n}": artifact.model_dump(), "phases_completed": n})
+        self._publish("artifact", {"phase": n, "phases_completed": n, "summary": artifact.summary})
         self._bg_task(self._db_save_artifact(n, artifact))
 
     async def _db_save_artifact(self, n: int, artifact):
@@ -233,6 +260,11 @@ class PhaseExecutor:
 
         return result
 
+    async def _call(self, step: str, **kwargs):
+        """단계 라우팅 모델로 호출 + JSON 파싱 → (dict, 응답, 사용 모델)"""
+        routed = await routed_call(self.client, step, validate=self._parse, **kwargs)
+        return routed.value, routed.response, routed.model
+
     def _parse(self, text):
         try:
             return extract_json_from_response(text)
@@ -266,12 +298,12 @@ class PhaseExecutor:
     async def _enhance_with_feedback(self, context: str, task_description: str) -> str:
         prompt = (task_description + "를 수행해주세요.\n\n"
                   + context + "\n\n결과를 간결한 텍스트로 반환해주세요.")
-        r = await self.client.messages.create(
-            model=self.model,
+        routed = await routed_call(
+            self.client, "phase1_feedback",
             max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
         )
-        return r.content[0].text.strip()
+        return routed.value.strip()
 
     async def phase1_research(self, rfp_content, improvement_instructions=None):
         self._update_status("phase_1_research")
@@ -330,38 +362,107 @@ class PhaseExecutor:
             rfp_data=rfp_data,
             history_summary="이력 없음",
             g2b_competitor_data=g2b_data,
+            warm_start=await self._find_warm_start(rfp_data),
         )
         self._save_artifact(1, artifact)
         return artifact
 
+    async def _find_warm_start(self, rfp_data) -> dict:
+        """이번 RFP 서명 저장 + 가장 비슷한 이전 실행 검색 → Phase 1 아티팩트 warm_start (없으면 {})
+
+        세션 proposal_state.warm_start가 True(사용자 수락)일 때만 적용하고,
+        기본값(False)이면 후보만 기록·안내하고 Phase 2/3는 새로 실행합니다.
+        """
+        if not settings.warm_start_enabled:
+            return {}
+        rfp = rfp_data.model_dump(exclude={"raw_text"})
+        try:
+            session = self.session_manager.get_session(self.proposal_id)
+            client = await get_async_client()
+            self._bg_task(save_rfp_signature(client, self.proposal_id, rfp))
+            match = await find_prior_run(
+                client,
+                proposal_id=self.proposal_id,
+                owner_id=session.get("owner_id"),
+                team_id=session.get("team_id"),
+                rfp=rfp,
+            )
+        except Exception as e:
+            logger.warning(f"[{self.proposal_id}] 웜 스타트 조회 실패 (무시): {e}")
+            return {}
+        if match is None:
+            return {}
+
+        applied = bool(session.get("proposal_state", {}).get("warm_start", False))
+        if applied:
+            self._seed = match
+            self._seed_changes = dict(match.delta)
+        info = {**match.info(), "applied": applied}
+        self._publish("warm_start", info)
+        logger.info(
+            f"[{self.proposal_id}] 웜 스타트 후보: {match.proposal_id} "
+            f"(유사도 {match.similarity:.2f}, 변경 필드 {len(match.delta)}개, 적용={applied})"
+        )
+        return info
+
+    async def _seeded_call(self, n: int, system: str, label: str, max_tokens: int):
+        """웜 스타트: 이전 실행 Phase n 결과 + 변경분만 재분석 → (dict, 응답 | None, 모델 | None)
+
+        변경분이 없으면 Claude 호출 없이 이전 결과를 그대로 반환하고,
+        갱신된 항목은 다음 단계의 변경분에 추가합니다.
+        """
+        previous = self._seed.artifacts[n].get("structured_data") or {}
+        if not self._seed_changes:
+            return dict(previous), None, None
+        packed = pack_fields([
+            ContextField("changes", self._seed_changes, priority=1),
+            ContextField("previous", previous, priority=2),
+        ], step_budget(f"phase{n}", system + SEEDED_DELTA_USER))
+        d, r, model = await self._call(
+            f"phase{n}", max_tokens=max_tokens, system=system,
+            messages=[{"role": "user", "content": SEEDED_DELTA_USER.format(phase_label=label, **packed)}]
+        )
+        updated = d.get("updated") if isinstance(d.get("updated"), dict) else {}
+        merged = {**previous, **updated}
+        if d.get("summary"):
+            merged["summary"] = d["summary"]
+        if updated:
+            self._seed_changes[f"phase{n}_updated"] = updated
+        return merged, r, model
+
+    @staticmethod
+    def _usage_tokens(r) -> int:
+        return r.usage.input_tokens + r.usage.output_tokens if r is not None else 0
+
     async def phase2_analysis(self, a1, improvement_instructions=None):
         self._update_status("phase_2_analysis")
         improvement_prompt = self._build_improvement_prompt(improvement_instructions, 2)
-        # raw_text 제외: 토큰 절약 (full RFP 원문은 summary에 이미 반영됨)
-        structured_data_trimmed = {
-            k: v for k, v in a1.structured_data.items() if k != "raw_text"
-        }
-        g2b_summary = (
-            json.dumps(a1.g2b_competitor_data, ensure_ascii=False)[:8000]
-            if a1.g2b_competitor_data else "나라장터 데이터 없음"
-        )
-        user_prompt = PHASE2_USER.format(
-            rfp_summary=a1.summary[:3000],
-            structured_data=json.dumps(structured_data_trimmed, ensure_ascii=False),
-            g2b_data=g2b_summary
-        )
-        if improvement_prompt:
-            user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
+        if self._seed and not improvement_prompt:
+            d, r, model = await self._seeded_call(2, PHASE2_SYSTEM, "RFP 전략 분석(Phase 2)", 4096)
+        else:
+            # 개선 지침이 있으면 이후 단계도 새로 실행
+            self._seed = None
+            # raw_text 제외: 토큰 절약 (full RFP 원문은 summary에 이미 반영됨)
+            structured_data_trimmed = {
+                k: v for k, v in a1.structured_data.items() if k != "raw_text"
+            }
+            packed = pack_fields([
+                ContextField("rfp_summary", a1.summary, priority=1),
+                ContextField("structured_data", structured_data_trimmed, priority=1),
+                ContextField("g2b_data", a1.g2b_competitor_data or "나라장터 데이터 없음", priority=3),
+            ], step_budget("phase2", PHASE2_SYSTEM + PHASE2_USER + improvement_prompt))
+            user_prompt = PHASE2_USER.format(**packed)
+            if improvement_prompt:
+                user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
 
-        r = await self.client.messages.create(
-            model=self.model, max_tokens=4096, system=PHASE2_SYSTEM,
-            messages=[{"role": "user", "content": user_prompt}]
-        )
-        d = self._parse(r.content[0].text)
+            d, r, model = await self._call(
+                "phase2", max_tokens=4096, system=PHASE2_SYSTEM,
+                messages=[{"role": "user", "content": user_prompt}]
+            )
         artifact = Phase2Artifact(
             summary=d.get("summary", ""),
             structured_data=d,
-            token_count=r.usage.input_tokens + r.usage.output_tokens,
+            token_count=self._usage_tokens(r),
             key_requirements=d.get("key_requirements", []),
             evaluation_weights=d.get("evaluation_weights", {}),
             hidden_intent=d.get("hidden_intent", ""),
@@ -370,33 +471,37 @@ class PhaseExecutor:
             price_analysis=d.get("price_analysis", {})
         )
         self._save_artifact(2, artifact)
-        self._bg_task(self._log_usage(2, self.model, r.usage.input_tokens, r.usage.output_tokens))
+        if r is not None:
+            self._bg_task(self._log_usage(2, model, r.usage.input_tokens, r.usage.output_tokens))
         return artifact
 
     async def phase3_plan(self, a2, improvement_instructions=None):
         self._update_status("phase_3_plan")
         improvement_prompt = self._build_improvement_prompt(improvement_instructions, 3)
-        user_prompt = PHASE3_USER.format(
-            analysis_summary=a2.summary[:3000],
-            key_requirements=json.dumps(a2.key_requirements, ensure_ascii=False)[:4000],
-            evaluation_weights=json.dumps(a2.evaluation_weights, ensure_ascii=False)[:2000],
-            competitor_landscape=json.dumps(a2.competitor_landscape, ensure_ascii=False)[:4000],
-            evaluator_perspective=json.dumps(a2.structured_data.get("evaluator_perspective", {}), ensure_ascii=False)[:3000],
-            our_advantage_opportunities=json.dumps(a2.structured_data.get("our_advantage_opportunities", []), ensure_ascii=False)[:3000],
-            price_analysis=json.dumps(a2.price_analysis, ensure_ascii=False)[:2000]
-        )
-        if improvement_prompt:
-            user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
+        if self._seed and not improvement_prompt:
+            d, r, model = await self._seeded_call(3, PHASE3_SYSTEM, "제안 전략 수립(Phase 3)", 16000)
+        else:
+            packed = pack_fields([
+                ContextField("analysis_summary", a2.summary, priority=1),
+                ContextField("key_requirements", a2.key_requirements, priority=1),
+                ContextField("evaluation_weights", a2.evaluation_weights, priority=1),
+                ContextField("evaluator_perspective", a2.structured_data.get("evaluator_perspective", {}), priority=2),
+                ContextField("our_advantage_opportunities", a2.structured_data.get("our_advantage_opportunities", []), priority=2),
+                ContextField("competitor_landscape", a2.competitor_landscape, priority=3),
+                ContextField("price_analysis", a2.price_analysis, priority=3),
+            ], step_budget("phase3", PHASE3_SYSTEM + PHASE3_USER + improvement_prompt))
+            user_prompt = PHASE3_USER.format(**packed)
+            if improvement_prompt:
+                user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
 
-        r = await self.client.messages.create(
-            model=self.model, max_tokens=16000, system=PHASE3_SYSTEM,
-            messages=[{"role": "user", "content": user_prompt}]
-        )
-        d = self._parse(r.content[0].text)
+            d, r, model = await self._call(
+                "phase3", max_tokens=16000, system=PHASE3_SYSTEM,
+                messages=[{"role": "user", "content": user_prompt}]
+            )
         artifact = Phase3Artifact(
             summary=d.get("summary", ""),
             structured_data=d,
-            token_count=r.usage.input_tokens + r.usage.output_tokens,
+            token_count=self._usage_tokens(r),
             win_strategy=d.get("win_strategy", ""),
             section_plan=d.get("section_plan", []),
             page_allocation=d.get("page_allocation", {}),
@@ -449,41 +554,104 @@ class PhaseExecutor:
 
         artifact.bid_calculation = bid_calc_result
         self._save_artifact(3, artifact)
-        self._bg_task(self._log_usage(3, self.model, r.usage.input_tokens, r.usage.output_tokens))
+        if r is not None:
+            self._bg_task(self._log_usage(3, model, r.usage.input_tokens, r.usage.output_tokens))
         return artifact
 
-    async def _load_section_context(self) -> str:
-        """제안서에 연결된 섹션 라이브러리 내용을 로드"""
+    async def _load_section_context(self, toc: list[str], budget: int) -> str:
+        """섹션 라이브러리 참고 자료 — 목차 항목별 관련도 상위 청크 (budget 토큰 이내)
+
+        섹션을 선택했으면(section_ids) 그 안에서만 검색하고,
+        벡터 인덱스를 쓸 수 없으면 선택한 섹션 전문으로 대체합니다.
+        검색 결과가 하나도 없는 선택 섹션(미인덱싱·낮은 유사도)도 전문으로 보충합니다.
+        """
         try:
             client = await get_async_client()
             res = await (
                 client.table("proposals")
-                .select("section_ids")
+                .select("owner_id,team_id,section_ids")
                 .eq("id", self.proposal_id)
                 .maybe_single()
                 .execute()
             )
-            if not res.data or not res.data.get("section_ids"):
-                return ""
-            section_ids = res.data["section_ids"]
-            if not section_ids:
+            if not res.data:
                 return ""
-            sections_res = await (
-                client.table("sections")
-                .select("title,category,content")
-                .in_("id", section_ids)
-                .execute()
-            )
-            if not sections_res.data:
-                return ""
-            lines = ["\n\n## 우리 회사 참고 자료 (섹션 라이브러리)\n"]
-            for s in sections_res.data:
-                lines.append(f"### [{s['category']}] {s['title']}\n{s['content']}\n")
-            return "\n".join(lines)
+            section_ids = res.data.get("section_ids") or []
+            hits = None
+            if toc and res.data.get("owner_id"):
+                team_id = res.data.get("team_id")
+                results = await asyncio.gather(*(
+                    library_vectors.search(
+                        item, owner_id=res.data["owner_id"],
+                        team_ids=[team_id] if team_id else None, section_ids=section_ids,
+                    )
+                    for item in toc
+                ))
+                if all(r is not None for r in results):
+                    hits = dict(zip(toc, results))
+            if hits is None:
+                return await self._load_selected_sections(client, section_ids)
+            found = {h.section_id for item_hits in hits.values() for h in item_hits}
+            missing = [sid for sid in section_ids if sid not in found]
+            ctx = self._format_library_hits(hits, budget)
+            if missing:
+                ctx += await self._load_selected_sections(
+                    client, missing, heading="우리 회사 참고 자료 (선택 섹션 전문)"
+                )
+            return ctx
         except Exception as e:
             logger.warning(f"[{self.proposal_id}] 섹션 컨텍스트 로드 실패 (무시): {e}")
             return ""
 
+    @staticmethod
+    def _format_library_hits(hits: dict, budget: int) -> str:
+        """목차 항목별 검색 결과를 순위 라운드 로빈으로 budget까지 채움 (중복 청크 제외)"""
+        picked: dict[str, list] = {item: [] for item in hits}
+        seen: set[tuple] = set()
+        used = 0
+        depth = max((len(h) for h in hits.values()), default=0)
+        for rank in range(depth):
+            for item, item_hits in hits.items():
+                if rank >= len(item_hits):
+                    continue
+                hit = item_hits[rank]
+                key = (hit.section_id or hit.asset_id, hit.text)
+                cost = estimate_tokens(hit.text) + 20
+                if key in seen or used + cost > budget:
+                    continue
+                seen.add(key)
+                picked[item].append(hit)
+                used += cost
+        if not seen:
+            return ""
+        lines = ["\n\n## 우리 회사 참고 자료 (섹션 라이브러리 — 목차별 관련 내용)\n"]
+        for item, item_hits in picked.items():
+            if not item_hits:
+                continue
+            lines.append(f"### 목차: {item}")
+            for hit in item_hits:
+                lines.append(f"- [{hit.category}] {hit.title}\n{hit.text}\n")
+        return "\n".join(lines)
+
+    async def _load_selected_sections(
+        self, client, section_ids: list[str], heading: str = "우리 회사 참고 자료 (섹션 라이브러리)"
+    ) -> str:
+        """선택한 섹션 전문 로드 (벡터 검색 불가 시 대체 경로, 검색 결과 없는 선택 섹션 보충)"""
+        if not section_ids:
+            return ""
+        sections_res = await (
+            client.table("sections")
+            .select("title,category,content")
+            .in_("id", section_ids)
+            .execute()
+        )
+        if not sections_res.data:
+            return ""
+        lines = [f"\n\n## {heading}\n"]
+        for s in sections_res.data:
+            lines.append(f"### [{s['category']}] {s['title']}\n{s['content']}\n")
+        return "\n".join(lines)
+
     async def _load_form_template_context(self) -> str:
         """form_template_id 기반 서식 컨텍스트 로드"""
         try:
@@ -521,50 +689,69 @@ class PhaseExecutor:
             logger.warning("서식 컨텍스트 로드 실패 (무시): %s", e)
             return ""
 
-    async def phase4_implement(self, a3, a1, improvement_instructions=None):
-        self._update_status("phase_4_implement")
-        improvement_prompt = self._build_improvement_prompt(improvement_instructions, 4)
+    async def _phase4_toc(self, a1) -> list[str]:
+        """Phase 4 목차 (RFP 목차, 없으면 템플릿 TOC)"""
         rfp = a1.rfp_data
         toc = rfp.table_of_contents if rfp and rfp.table_of_contents else []
         if not toc:
             toc = await get_template_toc()
             logger.info(f"[{self.proposal_id}] RFP 목차 없음 — 템플릿 TOC 사용: {len(toc)}개 섹션")
-        toc_text = json.dumps(toc, ensure_ascii=False)
-        user_prompt = PHASE4_USER.format(
+        return toc
+
+    async def _phase4_base_prompt(self, a3, a1, reserved: str = "", toc=None) -> str:
+        """Phase 4 본문 작성 프롬프트 (RFP 정보 + Phase 3 전략 + 목차)
+
+        reserved: 프롬프트 뒤에 덧붙일 텍스트 (개선 지침, 섹션 라이브러리 등) — 예산에서 제외
+        """
+        rfp = a1.rfp_data
+        if toc is None:
+            toc = await self._phase4_toc(a1)
+        packed = pack_fields([
+            ContextField("table_of_contents", toc, priority=1),
+            ContextField("section_plan", a3.section_plan, priority=1),
+            ContextField("win_theme", a3.win_theme, priority=1),
+            ContextField("requirements", rfp.requirements if rfp else [], priority=1),
+            ContextField("project_scope", (rfp.project_scope if rfp else "") or "미정", priority=2),
+            ContextField("win_strategy", a3.win_strategy, priority=2),
+            ContextField("business_understanding_strategy", a3.structured_data.get("business_understanding_strategy", {}), priority=2),
+            ContextField("differentiation_strategy", a3.differentiation_strategy, priority=2),
+            ContextField("price_competitiveness_message", a3.bid_price_strategy.get("price_competitiveness_message", ""), priority=3, min_tokens=100),
+        ], step_budget("phase4", PHASE4_SYSTEM + PHASE4_USER + reserved))
+        return PHASE4_USER.format(
             project_name=rfp.title if rfp else "미정",
             client_name=rfp.client_name if rfp else "미정",
-            project_scope=(rfp.project_scope if rfp else "미정")[:1000],
             duration=rfp.duration if rfp else "미정",
-            budget=rfp.budget or "미정",
-            requirements=json.dumps(rfp.requirements if rfp else [], ensure_ascii=False)[:3000],
-            win_theme=json.dumps(a3.win_theme, ensure_ascii=False)[:2000],
-            win_strategy=a3.win_strategy[:2000],
-            section_plan=json.dumps(a3.section_plan, ensure_ascii=False)[:6000],
-            business_understanding_strategy=json.dumps(a3.structured_data.get("business_understanding_strategy", {}), ensure_ascii=False)[:3000],
-            differentiation_strategy=json.dumps(a3.differentiation_strategy, ensure_ascii=False)[:3000],
-            price_competitiveness_message=a3.bid_price_strategy.get("price_competitiveness_message", "")[:500],
-            table_of_contents=toc_text[:3000]
+            budget=(rfp.budget if rfp else None) or "미정",
+            **packed,
         )
-        if improvement_prompt:
-            user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
 
-        section_ctx = await self._load_section_context()
-        if section_ctx:
-            user_prompt += section_ctx
+    async def _phase4_reference_context(self, toc: list[str]) -> str:
+        """섹션 라이브러리 + 서식 컨텍스트 (Phase 4 예산의 1/4 이내)"""
+        budget = step_budget("phase4") // 4
+        ctx = await self._load_section_context(toc, budget) + await self._load_form_template_context()
+        return fit_text(ctx, budget)
 
-        template_ctx = await self._load_form_template_context()
-        if template_ctx:
-            user_prompt += template_ctx
+    async def phase4_implement(self, a3, a1, improvement_instructions=None):
+        self._update_status("phase_4_implement")
+        improvement_prompt = self._build_improvement_prompt(improvement_instructions, 4)
+        rfp = a1.rfp_data
+        if improvement_prompt:
+            improvement_prompt = "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
+        toc = await self._phase4_toc(a1)
+        reference_ctx = await self._phase4_reference_context(toc)
+        user_prompt = await self._phase4_base_prompt(a3, a1, improvement_prompt + reference_ctx, toc=toc)
+        user_prompt += improvement_prompt + reference_ctx
 
-        r = await self.client.messages.create(
-            model=self.model, max_tokens=16000, system=PHASE4_SYSTEM,
+        d, r, model = await self._call(
+            "phase4", max_tokens=16000, system=PHASE4_SYSTEM,
             messages=[{"role": "user", "content": user_prompt}]
         )
-        d = self._parse(r.content[0].text)
         # 동적 섹션 추출: Claude가 반환한 sections dict 사용, 없으면 최상위 키 폴백
         sections = d.get("sections")
         if not sections or not isinstance(sections, dict):
             sections = {k: v for k, v in d.items() if k not in ("summary", "sections") and isinstance(v, str)}
+        for name, body in sections.items():
+            self._publish("section", {"name": name, "chars": len(body) if isinstance(body, str) else 0})
         project_name = rfp.title if rfp else "용역 제안서"
         artifact = Phase4Artifact(
             summary=d.get("summary", "완료"),
@@ -573,29 +760,36 @@ class PhaseExecutor:
             sections=sections,
         )
         self._save_artifact(4, artifact)
-        self._bg_task(self._log_usage(4, self.model, r.usage.input_tokens, r.usage.output_tokens))
+        self._bg_task(self._log_usage(4, model, r.usage.input_tokens, r.usage.output_tokens))
         return artifact
 
+    def _hwpx_metadata(self, a2) -> dict:
+        """HWPX 표지/평가표 메타데이터 (세션 + Phase 2 아티팩트)"""
+        session = self.session_manager.get_session(self.proposal_id)
+        return {
+            "client_name": session.get("client_name", ""),
+            "proposer_name": settings.proposer_name if hasattr(settings, "proposer_name") else "",
+            "submit_date": "",
+            "bid_notice_number": "",
+            "evaluation_weights": a2.evaluation_weights if a2 else {},
+        }
+
     async def phase5_test(self, a4, a2, improvement_instructions=None):
         self._update_status("phase_5_test")
         improvement_prompt = self._build_improvement_prompt(improvement_instructions, 5)
-        preview = json.dumps(
-            {k: v[:1000] if isinstance(v, str) else v for k, v in a4.sections.items()},
-            ensure_ascii=False
-        )
-        user_prompt = PHASE5_USER.format(
-            key_requirements=json.dumps(a2.key_requirements, ensure_ascii=False),
-            evaluation_weights=json.dumps(a2.evaluation_weights, ensure_ascii=False),
-            sections_preview=preview
-        )
+        packed = pack_fields([
+            ContextField("key_requirements", a2.key_requirements, priority=1),
+            ContextField("evaluation_weights", a2.evaluation_weights, priority=1),
+            ContextField("sections_preview", _section_previews(a4.sections, settings.phase5_section_preview_tokens), priority=2, min_tokens=4000),
+        ], step_budget("phase5", PHASE5_SYSTEM + PHASE5_USER + improvement_prompt))
+        user_prompt = PHASE5_USER.format(**packed)
         if improvement_prompt:
             user_prompt += "\n\n개선 지침을 반영해주세요:\n" + improvement_prompt
 
-        r = await self.client.messages.create(
-            model=self.model, max_tokens=2048, system=PHASE5_SYSTEM,
+        d, r, model = await self._call(
+            "phase5_scoring", max_tokens=2048, system=PHASE5_SYSTEM,
             messages=[{"role": "user", "content": user_prompt}]
         )
-        d = self._parse(r.content[0].text)
         score = float(d.get("quality_score", 70))
         docx_path = pptx_path = hwpx_path = ""
         if a4.sections:
@@ -608,16 +802,8 @@ class PhaseExecutor:
             await asyncio.to_thread(build_pptx, a4.sections, Path(pptx_path), project_name)
             # HWPX 생성 — 메타데이터는 세션 + 아티팩트에서 수집
             try:
-                session = self.session_manager.get_session(self.proposal_id)
-                hwpx_metadata = {
-                    "client_name": session.get("client_name", ""),
-                    "proposer_name": settings.proposer_name if hasattr(settings, "proposer_name") else "",
-                    "submit_date": "",
-                    "bid_notice_number": "",
-                    "evaluation_weights": a2.evaluation_weights if a2 else {},
-                }
                 await asyncio.to_thread(
-                    build_hwpx, a4.sections, Path(hwpx_path), project_name, hwpx_metadata
+                    build_hwpx, a4.sections, Path(hwpx_path), project_name, self._hwpx_metadata(a2)
                 )
             except Exception as hwpx_err:
                 logger.warning(f"[{self.proposal_id}] HWPX 생성 실패 (무시): {hwpx_err}")
@@ -636,9 +822,144 @@ class PhaseExecutor:
             detailed_scores=d.get("detailed_scores", {})
         )
         self._save_artifact(5, artifact)
-        self._bg_task(self._log_usage(5, self.model, r.usage.input_tokens, r.usage.output_tokens))
+        self._bg_task(self._log_usage(5, model, r.usage.input_tokens, r.usage.output_tokens))
         return artifact
 
+    # ── 섹션 단위 재생성 ──────────────────────────────────────
+
+    async def _regenerate_section(self, system_blocks, a4, name: str, instructions: str):
+        """섹션 1개 재작성 → (섹션명, 본문, usage)"""
+        others = [k for k in a4.sections if k != name]
+        d, r, model = await self._call(
+            "phase4_section", max_tokens=8000, system=system_blocks,
+            messages=[{"role": "user", "content": PHASE4_SECTION_USER.format(
+                section_name=name,
+                current_text=fit_text(str(a4.sections.get(name, "")), 4000),
+                other_sections=json.dumps(others, ensure_ascii=False),
+                instructions=instructions or "없음 — 평가위원 관점에서 설득력과 정량 근거를 보강",
+            )}]
+        )
+        content = d.get("content")
+        if not isinstance(content, str) or not content.strip():
+            raise ValueError(f"섹션 재작성 결과가 비어 있습니다: {name}")
+        self._publish("section", {"name": name, "chars": len(content), "regenerated": True})
+        return name, content, r.usage
+
+    async def _rescore_sections(self, a5, a4, a2, names: list[str]):
+        """재작성 섹션만 Phase 5 재평가 — 나머지 섹션의 issues/점수는 유지"""
+        packed = pack_fields([
+            ContextField("key_requirements", a2.key_requirements, priority=1),
+            ContextField("evaluation_weights", a2.evaluation_weights, priority=1),
+            ContextField("sections_preview", _section_previews({k: a4.sections[k] for k in names}, settings.phase5_rescore_preview_tokens), priority=2, min_tokens=2000),
+        ], step_budget("phase5_sections", PHASE5_SYSTEM + PHASE5_SECTION_USER))
+        d, r, model = await self._call(
+            "phase5_sections", max_tokens=2048, system=PHASE5_SYSTEM,
+            messages=[{"role": "user", "content": PHASE5_SECTION_USER.format(**packed)}]
+        )
+        self._bg_task(self._log_usage(5, model, r.usage.input_tokens, r.usage.output_tokens))
+
+        # 전체 점수 = 기존 점수 + 재작성 섹션 점수 변화의 섹션 평균 (섹션 점수 이력이 없으면 기존 전체 점수 기준)
+        old_scores = dict(a5.structured_data.get("section_scores") or {})
+        new_scores = {k: float(v) for k, v in (d.get("section_scores") or {}).items() if k in names}
+        total = max(len(a4.sections), 1)
+        delta = sum(v - float(old_scores.get(k, a5.quality_score)) for k, v in new_scores.items())
+        a5.quality_score = round(min(100.0, max(0.0, a5.quality_score + delta / total)), 1)
+
+        changed = set(names)
+        a5.issues = [i for i in a5.issues if i.get("section") not in changed] + list(d.get("issues") or [])
+        a5.structured_data = {
+            **a5.structured_data,
+            "section_scores": {**old_scores, **new_scores},
+            "section_rescore_summary": d.get("summary", ""),
+        }
+        a5.token_count += r.usage.input_tokens + r.usage.output_tokens
+        return a5
+
+    async def _patch_documents(self, a5, a4, a2, names: list[str]):
+        """DOCX는 변경 섹션만 교체, HWPX/PPTX는 패치된 섹션으로 로컬 재빌드 (Claude 호출 없음)"""
+        project_name = a4.structured_data.get("_project_name", "용역 제안서")
+        if a5.docx_path:
+            await asyncio.to_thread(
+                patch_docx_sections, a4.sections, set(names), Path(a5.docx_path), project_name
+            )
+        if a5.pptx_path:
+            await asyncio.to_thread(build_pptx, a4.sections, Path(a5.pptx_path), project_name)
+        if a5.hwpx_path:
+            try:
+                await asyncio.to_thread(
+                    build_hwpx, a4.sections, Path(a5.hwpx_path), project_name, self._hwpx_metadata(a2)
+                )
+            except Exception as hwpx_err:
+                logger.warning(f"[{self.proposal_id}] HWPX 갱신 실패 (무시): {hwpx_err}")
+
+    async def regenerate_sections(self, section_names: list[str], instructions: str = ""):
+        """
+        Phase 4 섹션 일부만 재작성 → 해당 섹션만 Phase 5 재평가 → 산출 문서 패치
+
+        Phase 1~3 아티팩트는 세션에서 로드해 공통 컨텍스트(prompt caching 대상)로 사용하고,
+        섹션별 재작성 호출은 동시에 실행합니다.
+        """
+        session = self.session_manager.get_session(self.proposal_id) or {}
+
+        def _load(artifact_cls, key):
+            data = session.get(key, {})
+            return artifact_cls(**{k: v for k, v in data.items() if k in artifact_cls.model_fields})
+
+        try:
+            a1 = _load(Phase1Artifact, "phase_artifact_1")
+            a2 = _load(Phase2Artifact, "phase_artifact_2")
+            a3 = _load(Phase3Artifact, "phase_artifact_3")
+            a4 = _load(Phase4Artifact, "phase_artifact_4")
+            a5 = _load(Phase5Artifact, "phase_artifact_5")
+            names = [n for n in dict.fromkeys(section_names) if n in a4.sections]
+            if not names:
+                raise ValueError(f"재작성할 섹션이 없습니다: {section_names}")
+
+            self._update_status("phase_4_sections")
+            toc = await self._phase4_toc(a1)
+            reference_ctx = await self._phase4_reference_context(toc)
+            context = await self._phase4_base_prompt(a3, a1, reference_ctx, toc=toc) + reference_ctx
+            context_block = {"type": "text", "text": context}
+            if settings.enable_prompt_caching:
+                context_block["cache_control"] = {"type": "ephemeral"}
+            system_blocks = [{"type": "text", "text": PHASE4_SYSTEM}, context_block]
+
+            results = await asyncio.gather(*(
+                self._regenerate_section(system_blocks, a4, n, instructions) for n in names
+            ))
+            in_tok = out_tok = 0
+            for name, content, usage in results:
+                a4.sections[name] = content
+                in_tok += usage.input_tokens
+                out_tok += usage.output_tokens
+            a4.token_count += in_tok + out_tok
+            self._save_artifact(4, a4)
+            self._bg_task(self._log_usage(4, model_for("phase4_section"), in_tok, out_tok))
+
+            self._update_status("phase_5_sections")
+            a5 = await self._rescore_sections(a5, a4, a2, names)
+            await self._patch_documents(a5, a4, a2, names)
+            self._save_artifact(5, a5)
+
+            self.session_manager.update_session(self.proposal_id, {
+                "status": "completed",
+                "phases_completed": 5,
+                "regenerated_sections": names,
+            })
+            self._finish("completed", quality_score=a5.quality_score, regenerated_sections=names)
+            self._bg_task(self._upload_to_storage(
+                docx_path=a5.docx_path or "",
+                pptx_path=a5.pptx_path or "",
+                hwpx_path=a5.hwpx_path or "",
+            ))
+            return a5
+        except Exception as e:
+            self.session_manager.update_session(
+                self.proposal_id, {"status": "failed", "error": str(e)}
+            )
+            self._finish("failed", error=str(e)[:500])
+            raise
+
     async def execute_all(self, rfp_content, improvement_instructions=None):
         try:
             a1 = await self.phase1_research(rfp_content, improvement_instructions)
@@ -647,6 +968,7 @@ class PhaseExecutor:
             a4 = await self.phase4_implement(a3, a1, improvement_instructions)
             a5 = await self.phase5_test(a4, a2, improvement_instructions)
             self.session_manager.update_session(self.proposal_id, {"status": "completed", "phases_completed": 5})
+            self._finish("completed", quality_score=a5.quality_score)
             # DB 최종 상태 업데이트
             try:
                 client = await get_async_client()
@@ -672,6 +994,7 @@ class PhaseExecutor:
             return a5
         except Exception as e:
             self.session_manager.update_session(self.proposal_id, {"status": "failed", "error": str(e)})
+            self._finish("failed", error=str(e)[:500])
             self._bg_task(self._handle_failure(0, str(e)))
             raise
 
@@ -711,6 +1034,7 @@ class PhaseExecutor:
             self.session_manager.update_session(
                 self.proposal_id, {"status": "completed", "phases_completed": 5}
             )
+            self._finish("completed", quality_score=a5.quality_score)
             # Storage 업로드 (fire-and-forget)
             self._bg_task(self._upload_to_storage(
                 docx_path=a5.docx_path or "",
@@ -728,4 +1052,5 @@ class PhaseExecutor:
             self.session_manager.update_session(
                 self.proposal_id, {"status": "failed", "error": str(e)}
             )
+            self._finish("failed", error=str(e)[:500])
             raise
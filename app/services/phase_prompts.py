@@ -205,6 +205,27 @@ PHASE3_USER = """다음 분석 결과를 바탕으로 제안서 작성 전략을
 - risks_mitigations: probability(1-5) × impact(1-5) = risk_score를 계산하고, 20-25:critical / 12-19:high / 6-11:medium / 1-5:low로 priority를 기입하세요."""
 
 
+# ── 웜 스타트: 이전 실행 Phase 2/3 결과 + RFP 변경분만 재분석 ───────
+
+SEEDED_DELTA_USER = """같은 발주처의 유사 사업에 대해 이전에 작성한 {phase_label} 결과가 있습니다.
+이번 RFP에서 달라진 점만 반영해 결과를 갱신해주세요.
+
+## 이전 결과 (JSON)
+{previous}
+
+## 이번 변경 사항 (RFP 필드 변경, 앞 단계에서 갱신된 항목)
+{changes}
+
+변경 사항의 영향을 받는 최상위 항목만 이전 결과와 같은 형식으로 새로 작성하고,
+영향이 없는 항목은 응답에서 생략하세요.
+
+반드시 아래 JSON 형식으로 응답하세요:
+{{
+    "updated": {{"갱신한 최상위 키": "이전 결과와 같은 형식의 새 값"}},
+    "summary": "갱신된 결과 3줄 요약"
+}}"""
+
+
 # ── Phase 4: Implement ─────────────────────────────────────────────
 
 PHASE4_SYSTEM = """당신은 전문 용역 제안서 작성자입니다.
@@ -281,6 +302,29 @@ PHASE4_USER = """다음 정보를 바탕으로 제안서 본문을 작성해주
 }}"""
 
 
+# 섹션 단위 재작성 — 위 PHASE4_USER 전체(공통 컨텍스트) 뒤에 이어 보냄
+PHASE4_SECTION_USER = """위 정보를 바탕으로 작성된 제안서 중 아래 섹션 하나만 다시 작성해주세요.
+응답 형식은 위의 sections 형식 대신 아래 형식을 따르세요.
+
+## 재작성 대상 섹션
+{section_name}
+
+## 현재 본문 (검토에서 반려됨)
+{current_text}
+
+## 다른 섹션 목록 (내용 중복 없이 전체 흐름 유지)
+{other_sections}
+
+## 검토 의견
+{instructions}
+
+반드시 아래 JSON 형식으로 응답하세요:
+{{
+    "section_name": "{section_name}",
+    "content": "재작성한 섹션 본문 (충분히 상세하게, 정량 지표 2개 이상 포함)"
+}}"""
+
+
 # ── Phase 5: Test ──────────────────────────────────────────────────
 
 PHASE5_SYSTEM = """당신은 제안서 품질 심사관입니다.
@@ -323,3 +367,26 @@ PHASE5_USER = """다음 제안서 초안을 검토하고 품질을 평가해주
     "risks_coverage": "Risks/Mitigations의 완성도 평가 (1~2문장, 리스크 식별 범위와 대응 방안 실현 가능성 기준)",
     "checklist_specificity": "Implementation Checklist의 구체성 평가 (1~2문장, 단계별 산출물 명확성 기준)"
 }}"""
+
+# 재작성 섹션만 재평가 — 나머지 섹션의 기존 평가는 유지
+PHASE5_SECTION_USER = """다음은 제안서 중 재작성된 섹션입니다. 이 섹션들만 평가해주세요.
+
+## 핵심 요구사항
+{key_requirements}
+
+## 배점 구조 (항목별 배점 기준)
+{evaluation_weights}
+
+## 재작성 섹션
+{sections_preview}
+
+반드시 아래 JSON 형식으로 응답하세요:
+{{
+    "summary": "재평가 결과 요약",
+    "section_scores": {{
+        "섹션명": 85
+    }},
+    "issues": [
+        {{"section": "섹션명", "severity": "high/medium/low", "description": "문제 설명 및 개선 방향"}}
+    ]
+}}"""
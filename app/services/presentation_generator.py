@@ -4,6 +4,8 @@
 필요 시 구체적 사례(case_study) 또는 참고 슬라이드를 중간에 삽입 가능.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 from typing import Optional
@@ -11,9 +13,11 @@ from typing import Optional
 import anthropic
 
 from app.config import settings
+from app.exceptions import ClaudeAPIError
 from app.models.phase_schemas import Phase2Artifact, Phase3Artifact, Phase4Artifact
 from app.models.schemas import RFPData
 from app.utils.claude_utils import extract_json_from_response
+from app.utils.model_router import routed_call
 
 logger = logging.getLogger(__name__)
 
@@ -454,6 +458,30 @@ STORYBOARD_USER = """확정된 목차와 시각 설계를 기반으로 각 슬
 - speaker_notes: 4섹션 구조 ([발표 스크립트] / [예상 질문] / [답변 구조] / [전환 멘트])
 - eval_coverage: 각 평가항목명이 몇 번 슬라이드에서 다뤄지는지 매핑"""
 
+# 슬라이드 그룹별 병렬 작성 — 위 STORYBOARD_USER 전체가 공통 prefix(캐시 대상),
+# 이 지시문만 그룹마다 달라짐
+STORYBOARD_GROUP_USER = """이번 요청에서는 위 TOC 중 아래 슬라이드만 작성하세요.
+('TOC의 모든 슬라이드 포함' 규칙은 이번 요청에 한해 아래 slide_num 목록으로 한정합니다.
+나머지 슬라이드는 다른 요청에서 병렬로 작성되므로, 앞뒤 흐름과 [전환 멘트]는 전체 TOC 기준으로 유지하세요.)
+
+## 작성 대상 slide_num
+{slide_nums}
+
+## 작성 대상 TOC
+{group_toc}
+
+## 작성 대상 Visual Brief
+{group_brief}
+
+응답 형식은 위와 동일한 JSON ({{"slides": [...], "eval_coverage": {{...}}}})이며,
+slides에는 작성 대상 슬라이드만, eval_coverage에는 이 슬라이드들이 다루는 평가항목만 포함하세요."""
+
+# 선택 슬라이드 재생성 시 검토 의견 (그룹 지시문 뒤에 덧붙임)
+STORYBOARD_REVISION_NOTE = """
+
+## 검토 의견 (반드시 반영)
+{instructions}"""
+
 
 # ── 입력 조립 ────────────────────────────────────────────────────────────────
 
@@ -483,6 +511,179 @@ def _build_input(
     }
 
 
+# ── Step 3: 그룹 분할 / 병합 ─────────────────────────────────────────────────
+
+def _group_slides(toc: list[dict], group_size: int) -> list[list[dict]]:
+    """TOC를 slide_num 순서대로 group_size장씩 묶음"""
+    ordered = sorted(toc, key=lambda s: s.get("slide_num", 0))
+    size = max(1, group_size)
+    return [ordered[i:i + size] for i in range(0, len(ordered), size)]
+
+
+def _fallback_slide(entry: dict) -> dict:
+    """스토리보드 생성 실패/누락 슬라이드 — TOC 값만으로 최소 슬라이드 구성"""
+    return {
+        "slide_num": entry.get("slide_num", 0),
+        "layout": entry.get("layout", "eval_section"),
+        "title": entry.get("title", ""),
+        "eval_badge": entry.get("eval_badge", ""),
+        "bullets": [],
+        "speaker_notes": "",
+    }
+
+
+def _merge_coverage(coverages: list[dict]) -> dict:
+    """그룹별 eval_coverage 병합 — 같은 평가항목은 슬라이드 참조를 순서대로 이어붙임"""
+    merged: dict[str, list[str]] = {}
+    for cov in coverages:
+        for item, refs in (cov or {}).items():
+            parts = refs if isinstance(refs, list) else str(refs).split(",")
+            bucket = merged.setdefault(item, [])
+            for ref in (str(p).strip() for p in parts):
+                if ref and ref not in bucket:
+                    bucket.append(ref)
+    return {item: ", ".join(refs) for item, refs in merged.items()}
+
+
+def _assemble_storyboard(
+    groups: list[list[dict]],
+    group_results: list[Optional[dict]],
+) -> dict:
+    """
+    그룹별 결과 → 단일 스토리보드 ({slides, eval_coverage})
+
+    TOC에 있는 slide_num만 채택하고, 누락 슬라이드는 TOC 기반 최소 슬라이드로 채웁니다.
+    """
+    slides: list[dict] = []
+    coverages: list[dict] = []
+    for group, res in zip(groups, group_results):
+        by_num: dict = {}
+        for slide in (res or {}).get("slides", []) or []:
+            if isinstance(slide, dict):
+                by_num.setdefault(slide.get("slide_num"), slide)
+        missing = []
+        for entry in group:
+            slide = by_num.get(entry.get("slide_num"))
+            if slide is None:
+                missing.append(entry.get("slide_num"))
+                slide = _fallback_slide(entry)
+            slides.append(slide)
+        if missing:
+            logger.warning(f"[Step 3] 슬라이드 누락 — TOC 기반 최소 슬라이드로 대체: {missing}")
+        coverages.append((res or {}).get("eval_coverage") or {})
+    slides.sort(key=lambda s: s.get("slide_num", 0))
+    return {"slides": slides, "eval_coverage": _merge_coverage(coverages)}
+
+
+def _storyboard_system_blocks(inp: dict, toc: list[dict], visual_briefs: list[dict]) -> list[dict]:
+    """Step 3 공통 system 블록 (작성 규칙 + 전체 컨텍스트, prompt caching 대상)"""
+    shared_context = STORYBOARD_USER.format(
+        toc=json.dumps(toc, ensure_ascii=False),
+        visual_brief=json.dumps(visual_briefs, ensure_ascii=False),
+        win_theme=json.dumps(inp["win_theme"], ensure_ascii=False),
+        differentiation_strategy=json.dumps(
+            inp["differentiation_strategy"], ensure_ascii=False
+        ),
+        evaluator_perspective=json.dumps(
+            inp["evaluator_perspective"], ensure_ascii=False
+        ),
+        proposal_sections=json.dumps(inp["proposal_sections"], ensure_ascii=False),
+        implementation_checklist=json.dumps(
+            inp["implementation_checklist"], ensure_ascii=False
+        ),
+        team_plan=json.dumps(inp["team_plan"], ensure_ascii=False),
+    )
+    context_block: dict = {"type": "text", "text": shared_context}
+    if settings.enable_prompt_caching:
+        context_block["cache_control"] = {"type": "ephemeral"}
+    return [{"type": "text", "text": STORYBOARD_SYSTEM}, context_block]
+
+
+async def _storyboard_group(
+    client: anthropic.AsyncAnthropic,
+    sem: asyncio.Semaphore,
+    system_blocks: list[dict],
+    group: list[dict],
+    briefs_by_num: dict,
+    index: int,
+    total: int,
+    instructions: str = "",
+) -> Optional[dict]:
+    """슬라이드 그룹 1개 스토리보드 작성 (실패 시 None — 호출 측에서 fallback)"""
+    nums = [e.get("slide_num") for e in group]
+    content = STORYBOARD_GROUP_USER.format(
+        slide_nums=nums,
+        group_toc=json.dumps(group, ensure_ascii=False),
+        group_brief=json.dumps(
+            [briefs_by_num[n] for n in nums if n in briefs_by_num],
+            ensure_ascii=False,
+        ),
+    )
+    if instructions:
+        content += STORYBOARD_REVISION_NOTE.format(instructions=instructions)
+    async with sem:
+        try:
+            response = await routed_call(
+                client, "presentation_storyboard",
+                validate=extract_json_from_response,
+                max_tokens=settings.presentation_storyboard_max_tokens,
+                system=system_blocks,
+                messages=[{"role": "user", "content": content}],
+            )
+            result = response.value
+            logger.info(f"[Step 3] 그룹 {index + 1}/{total} 완료 — 슬라이드 {nums}")
+            return result
+        except Exception as e:
+            logger.warning(f"[Step 3] 그룹 {index + 1}/{total} 실패 (슬라이드 {nums}): {e}")
+            return None
+
+
+async def _generate_storyboard(
+    client: anthropic.AsyncAnthropic,
+    inp: dict,
+    toc: list[dict],
+    visual_briefs: list[dict],
+) -> dict:
+    """
+    Step 3 — 슬라이드 그룹별 병렬 스토리보드 작성 후 재조립
+
+    모든 요청이 동일한 system 블록(작성 규칙 + TOC/Visual Brief/Win Theme/본문)을
+    공유하므로 prompt caching으로 공통 prefix를 재사용합니다. 첫 그룹을 먼저 보내
+    캐시를 채운 뒤 나머지 그룹을 동시 실행합니다.
+    """
+    system_blocks = _storyboard_system_blocks(inp, toc, visual_briefs)
+
+    groups = _group_slides(toc, settings.presentation_storyboard_group_size)
+    briefs_by_num = {
+        b.get("slide_num"): b for b in visual_briefs if isinstance(b, dict)
+    }
+    sem = asyncio.Semaphore(max(1, settings.presentation_storyboard_concurrency))
+    logger.info(
+        f"[Step 3] 스토리보드 생성 요청 — {len(toc)}개 슬라이드 / {len(groups)}개 그룹 병렬"
+    )
+
+    def run(i: int):
+        return _storyboard_group(
+            client, sem, system_blocks, groups[i], briefs_by_num, i, len(groups)
+        )
+
+    if not groups:
+        return {"slides": [], "eval_coverage": {}}
+    if settings.enable_prompt_caching and len(groups) > 1:
+        first = await run(0)
+        rest = await asyncio.gather(*(run(i) for i in range(1, len(groups))))
+        group_results = [first, *rest]
+    else:
+        group_results = list(await asyncio.gather(*(run(i) for i in range(len(groups)))))
+
+    if all(r is None for r in group_results):
+        raise ClaudeAPIError(
+            "스토리보드 생성에 실패했습니다 (모든 슬라이드 그룹 실패)",
+            details={"groups": len(groups)},
+        )
+    return _assemble_storyboard(groups, group_results)
+
+
 # ── 공개 인터페이스 ───────────────────────────────────────────────────────────
 
 async def generate_presentation_slides(
@@ -496,17 +697,20 @@ async def generate_presentation_slides(
       Step 1 — TOC 생성: 평가항목 배점 기준 목차 설계 (25~35장)
       Step 2 — Visual Brief: 슬라이드별 시각 증명 전략 결정 (F-Pattern, 하이라이트 1개)
       Step 3 — 스토리보드: Visual Brief 기반 슬라이드별 본문/화자노트 작성
+               (슬라이드 그룹별 병렬 호출, 공통 prefix는 prompt caching)
 
     Returns:
-        {slides: [...], total_slides: N, eval_coverage: {...}}
+        {slides: [...], total_slides: N, eval_coverage: {...}, toc: [...], visual_briefs: [...]}
+        (toc/visual_briefs는 선택 슬라이드 재생성용)
     """
     client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
     inp = _build_input(phase2, phase3, phase4, rfp_data)
 
     # ── Step 1: TOC 생성 ──────────────────────────────────────────────────────
     logger.info(f"[Step 1] TOC 생성 요청 — 섹션 수: {len(inp['section_plan'])}")
-    toc_response = await client.messages.create(
-        model=settings.claude_model,
+    toc_response = await routed_call(
+        client, "presentation_toc",
+        validate=extract_json_from_response,
         max_tokens=4096,
         system=TOC_SYSTEM,
         messages=[{
@@ -518,14 +722,15 @@ async def generate_presentation_slides(
             ),
         }],
     )
-    toc_result = extract_json_from_response(toc_response.content[0].text)
+    toc_result = toc_response.value
     toc = toc_result.get("toc", [])
     logger.info(f"[Step 1] TOC 완료 — {len(toc)}개 슬라이드: {[s['title'] for s in toc]}")
 
     # ── Step 2: Visual Brief 생성 ──────────────────────────────────────────────
     logger.info(f"[Step 2] Visual Brief 생성 요청 — {len(toc)}개 슬라이드")
-    vb_response = await client.messages.create(
-        model=settings.claude_model,
+    vb_response = await routed_call(
+        client, "presentation_brief",
+        validate=extract_json_from_response,
         max_tokens=4096,
         system=VISUAL_BRIEF_SYSTEM,
         messages=[{
@@ -539,43 +744,101 @@ async def generate_presentation_slides(
             ),
         }],
     )
-    vb_result = extract_json_from_response(vb_response.content[0].text)
+    vb_result = vb_response.value
     visual_briefs = vb_result.get("visual_briefs", [])
     logger.info(f"[Step 2] Visual Brief 완료 — {len(visual_briefs)}개 슬라이드 시각 전략 확정")
 
-    # ── Step 3: 스토리보드 생성 ───────────────────────────────────────────────
-    logger.info(f"[Step 3] 스토리보드 생성 요청 — {len(toc)}개 슬라이드")
-    storyboard_response = await client.messages.create(
-        model=settings.claude_model,
-        max_tokens=16384,
-        system=STORYBOARD_SYSTEM,
-        messages=[{
-            "role": "user",
-            "content": STORYBOARD_USER.format(
-                toc=json.dumps(toc, ensure_ascii=False),
-                visual_brief=json.dumps(visual_briefs, ensure_ascii=False),
-                win_theme=json.dumps(inp["win_theme"], ensure_ascii=False),
-                differentiation_strategy=json.dumps(
-                    inp["differentiation_strategy"], ensure_ascii=False
-                ),
-                evaluator_perspective=json.dumps(
-                    inp["evaluator_perspective"], ensure_ascii=False
-                ),
-                proposal_sections=json.dumps(inp["proposal_sections"], ensure_ascii=False),
-                implementation_checklist=json.dumps(
-                    inp["implementation_checklist"], ensure_ascii=False
-                ),
-                team_plan=json.dumps(inp["team_plan"], ensure_ascii=False),
-            ),
-        }],
-    )
-    result = extract_json_from_response(storyboard_response.content[0].text)
+    # ── Step 3: 스토리보드 생성 (슬라이드 그룹별 병렬) ─────────────────────────
+    result = await _generate_storyboard(client, inp, toc, visual_briefs)
 
     # total_slides는 TOC 기준으로 보정
     result["total_slides"] = toc_result.get("total_slides", len(toc))
+    result["toc"] = toc
+    result["visual_briefs"] = visual_briefs
 
     logger.info(
         f"[Step 3] 스토리보드 완료 — {result.get('total_slides', '?')}장 "
         f"/ eval_coverage: {list(result.get('eval_coverage', {}).keys())}"
     )
     return result
+
+
+def slide_hash(slide: dict) -> str:
+    """슬라이드 JSON 콘텐츠 해시 (키 순서 무관)"""
+    raw = json.dumps(slide, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def slide_hashes(slides_json: dict) -> dict[str, str]:
+    """slide_num(str) → 콘텐츠 해시"""
+    return {
+        str(s.get("slide_num")): slide_hash(s)
+        for s in slides_json.get("slides", []) if isinstance(s, dict)
+    }
+
+
+async def regenerate_slides(
+    slides_json: dict,
+    slide_nums: list[int],
+    phase2: Phase2Artifact,
+    phase3: Phase3Artifact,
+    phase4: Phase4Artifact,
+    rfp_data: Optional[RFPData] = None,
+    instructions: str = "",
+) -> dict:
+    """
+    선택 슬라이드만 스토리보드 재작성 (TOC/Visual Brief는 기존 결과 재사용)
+
+    Args:
+        slides_json: generate_presentation_slides 결과 (toc/visual_briefs 포함)
+        slide_nums: 재작성할 slide_num 목록
+        instructions: 검토 의견 (선택)
+
+    Returns:
+        선택 슬라이드만 교체된 새 slides_json (나머지 슬라이드 dict는 그대로)
+
+    Raises:
+        ClaudeAPIError: 선택 슬라이드 재작성이 모두 실패한 경우
+    """
+    toc = slides_json.get("toc") or [
+        {k: s.get(k, "") for k in ("slide_num", "layout", "title", "eval_badge")}
+        for s in slides_json.get("slides", [])
+    ]
+    visual_briefs = slides_json.get("visual_briefs") or []
+    wanted = set(slide_nums)
+    targets = [e for e in toc if e.get("slide_num") in wanted]
+    if not targets:
+        return slides_json
+
+    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    inp = _build_input(phase2, phase3, phase4, rfp_data)
+    system_blocks = _storyboard_system_blocks(inp, toc, visual_briefs)
+    briefs_by_num = {b.get("slide_num"): b for b in visual_briefs if isinstance(b, dict)}
+    groups = _group_slides(targets, settings.presentation_storyboard_group_size)
+    sem = asyncio.Semaphore(max(1, settings.presentation_storyboard_concurrency))
+    logger.info(f"[재생성] 슬라이드 {sorted(wanted)} — {len(groups)}개 그룹")
+
+    group_results = await asyncio.gather(*(
+        _storyboard_group(
+            client, sem, system_blocks, group, briefs_by_num, i, len(groups), instructions
+        )
+        for i, group in enumerate(groups)
+    ))
+    if all(r is None for r in group_results):
+        raise ClaudeAPIError(
+            "슬라이드 재생성에 실패했습니다",
+            details={"slide_nums": sorted(wanted)},
+        )
+
+    # 실패 그룹은 기존 슬라이드 유지 (TOC fallback으로 덮어쓰지 않음)
+    fresh: dict = {}
+    coverages = [slides_json.get("eval_coverage") or {}]
+    for group, res in zip(groups, group_results):
+        if res is None:
+            continue
+        rebuilt = _assemble_storyboard([group], [res])
+        fresh.update({s.get("slide_num"): s for s in rebuilt["slides"]})
+        coverages.append(rebuilt["eval_coverage"])
+
+    slides = [fresh.get(s.get("slide_num"), s) for s in slides_json.get("slides", [])]
+    return {**slides_json, "slides": slides, "eval_coverage": _merge_coverage(coverages)}
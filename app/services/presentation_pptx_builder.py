@@ -1389,3 +1389,63 @@ def build_presentation_pptx(
     prs.save(str(output_path))
     logger.info(f"PPTX 저장 완료: {output_path} ({len(slides)}장)")
     return output_path
+
+
+def patch_presentation_pptx(
+    base_path: Path,
+    slides_json: dict,
+    changed_nums: set[int],
+    output_path: Path,
+    project_name: str = "",
+    template_path: Optional[Path] = None,
+) -> Path:
+    """
+    기존 PPTX에서 변경된 슬라이드만 다시 렌더링 (나머지 슬라이드 XML 파트는 그대로 재사용)
+
+    기존 파일이 없거나 슬라이드 수가 slides_json과 다르면 전체 빌드로 fallback.
+
+    Args:
+        base_path: 이전에 생성된 PPTX 경로
+        slides_json: 변경 슬라이드가 반영된 전체 슬라이드 JSON
+        changed_nums: 다시 렌더링할 slide_num 집합
+        output_path: 저장 경로 (base_path와 같아도 됨)
+        project_name / template_path: 전체 빌드 fallback 시 사용
+
+    Returns:
+        저장된 PPTX 파일 경로
+    """
+    slides = sorted(slides_json.get("slides", []), key=lambda s: s.get("slide_num", 99))
+    try:
+        prs = Presentation(str(base_path))
+    except Exception as e:
+        logger.info(f"기존 PPTX 로드 실패 — 전체 빌드: {e}")
+        return build_presentation_pptx(slides_json, output_path, project_name, template_path)
+    if len(prs.slides) != len(slides):
+        logger.info(f"슬라이드 수 불일치 ({len(prs.slides)} ≠ {len(slides)}) — 전체 빌드")
+        return build_presentation_pptx(slides_json, output_path, project_name, template_path)
+
+    sld_ids = prs.slides._sldIdLst
+    # 뒤에서부터 교체해야 앞쪽 위치가 밀리지 않음
+    for pos in reversed(range(len(slides))):
+        data = slides[pos]
+        if data.get("slide_num") not in changed_nums:
+            continue
+        before = len(sld_ids)
+        _render_slide(prs, data)
+        added = list(sld_ids)[before:]
+        if not added:
+            logger.warning(f"슬라이드 {data.get('slide_num')} 재렌더링 실패 — 기존 슬라이드 유지")
+            continue
+        old = sld_ids[pos]
+        for offset, sld_id in enumerate(added):
+            sld_ids.remove(sld_id)
+            sld_ids.insert(pos + offset, sld_id)
+        sld_ids.remove(old)
+        prs.part.drop_rel(old.rId)
+        # 새 슬라이드 파트명은 len(sldIdLst)+1로 정해지므로 교체 때마다 순서대로 재지정 (다음 교체와 충돌 방지)
+        prs.part.rename_slide_parts([sld_id.rId for sld_id in sld_ids])
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(str(output_path))
+    logger.info(f"PPTX 부분 갱신 완료: {output_path} (재렌더링 {sorted(changed_nums)})")
+    return output_path
@@ -0,0 +1,127 @@
+"""제안서 진행 이벤트 in-process pub/sub (SSE 스트림용)
+
+PhaseExecutor / 발표 자료 태스크가 publish → /events SSE 엔드포인트가 subscribe.
+제안서별 채널에 최근 이벤트를 링 버퍼로 보관하고, 이벤트 id는 채널 내 단조 증가 정수입니다.
+재연결 시 Last-Event-ID 이후 이벤트를 버퍼에서 재전송하고, 버퍼 밖으로 밀려난 경우
+"resync" 이벤트로 스냅샷 재조회를 요청합니다.
+
+단일 프로세스 기준 — 워커가 여러 개면 같은 워커에 붙은 구독자만 이벤트를 받습니다.
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 구독자 없는 채널을 오래된 순으로 정리하는 기준
+_MAX_CHANNELS = 1000
+
+
+@dataclass
+class ProgressEvent:
+    """진행 이벤트 1건"""
+    id: int
+    event: str
+    data: dict
+
+    def to_sse(self) -> str:
+        """SSE 와이어 포맷 (id/event/data)"""
+        payload = json.dumps(self.data, ensure_ascii=False, default=str)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+@dataclass
+class _Channel:
+    buffer: deque
+    seq: int = 0
+    subscribers: int = 0
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class ProgressBus:
+    """제안서 ID별 진행 이벤트 채널"""
+
+    def __init__(self, buffer_size: Optional[int] = None):
+        self._buffer_size = buffer_size or settings.progress_buffer_size
+        self._channels: "OrderedDict[str, _Channel]" = OrderedDict()
+
+    def _channel(self, proposal_id: str) -> _Channel:
+        ch = self._channels.get(proposal_id)
+        if ch is None:
+            ch = _Channel(buffer=deque(maxlen=self._buffer_size))
+            self._channels[proposal_id] = ch
+            self._evict()
+        else:
+            self._channels.move_to_end(proposal_id)
+        return ch
+
+    def _evict(self) -> None:
+        while len(self._channels) > _MAX_CHANNELS:
+            for pid, ch in self._channels.items():
+                if ch.subscribers == 0:
+                    del self._channels[pid]
+                    break
+            else:
+                return
+
+    def last_id(self, proposal_id: str) -> int:
+        """채널의 마지막 이벤트 id (이벤트 없으면 0)"""
+        ch = self._channels.get(proposal_id)
+        return ch.seq if ch else 0
+
+    def publish(self, proposal_id: str, event: str, data: dict) -> ProgressEvent:
+        """이벤트 발행 (이벤트 루프 스레드에서 호출)"""
+        ch = self._channel(proposal_id)
+        ch.seq += 1
+        ev = ProgressEvent(id=ch.seq, event=event, data=data)
+        ch.buffer.append(ev)
+        # 대기 중인 구독자 모두 깨우고 다음 대기용 Event로 교체
+        ch.changed.set()
+        ch.changed = asyncio.Event()
+        return ev
+
+    async def subscribe(
+        self,
+        proposal_id: str,
+        last_event_id: int = 0,
+        keepalive: Optional[float] = None,
+    ) -> AsyncIterator[Optional[ProgressEvent]]:
+        """
+        last_event_id 이후 이벤트를 순서대로 yield (버퍼 재전송 → 실시간)
+
+        keepalive초 동안 새 이벤트가 없으면 None을 yield합니다 (SSE 주석 전송용).
+        """
+        timeout = keepalive if keepalive is not None else settings.sse_keepalive_seconds
+        ch = self._channel(proposal_id)
+        ch.subscribers += 1
+        last = last_event_id
+        try:
+            # 서버 재시작 등으로 클라이언트 id가 현재 채널보다 앞서 있으면 처음부터
+            if last > ch.seq:
+                last = 0
+            while True:
+                if ch.buffer and last < ch.buffer[0].id - 1:
+                    yield ProgressEvent(id=last, event="resync", data={"missed_from": last + 1})
+                    last = ch.buffer[0].id - 1
+                pending = [ev for ev in ch.buffer if ev.id > last]
+                if pending:
+                    for ev in pending:
+                        yield ev
+                    last = pending[-1].id
+                    continue
+                waiter = ch.changed
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            ch.subscribers -= 1
+
+
+progress_bus = ProgressBus()
@@ -0,0 +1,156 @@
+"""장문 RFP 청크 분할 + 청크별 추출 결과 병합 (map-reduce의 split/reduce 단계)
+
+분할: 장/절 제목, 페이지 경계, 빈 줄 등 구조적 경계에서 자르고
+      max_chars 이하가 되도록 인접 세그먼트를 묶습니다.
+병합: 결정적(deterministic) 규칙
+  - 목록 필드(requirements, evaluation_criteria): 정규화 키로 중복 제거,
+    한쪽이 다른 쪽을 포함하면 더 긴 항목을 첫 등장 위치에 유지
+  - table_of_contents: 항목이 가장 많은 청크의 목차 사용 (목차는 한 곳에 몰려 있음)
+  - 단일 값 필드: 최빈값, 동률이면 앞 청크 우선 — 후보가 여럿이면 conflicts에 기록
+"""
+
+import re
+from collections import Counter
+
+# 단일 값 필드 / 목록 필드 (RFPData 기준)
+SCALAR_FIELDS = ("title", "client_name", "project_scope", "duration", "budget")
+LIST_FIELDS = ("requirements", "evaluation_criteria")
+
+# 줄 시작 구조 경계: 제N장/절, Ⅰ. 로마숫자, 1. / 1.1 / 1) 번호, □ ■ ○ 기호, 【 】 [ ] 제목
+_BOUNDARY_RE = re.compile(
+    r"^(?:"
+    r"제\s*\d+\s*[장절편]"
+    r"|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\s*[.．]"
+    r"|\d{1,2}(?:\.\d{1,2})*[.)]\s*\S"
+    r"|\d{1,2}(?:\.\d{1,2})+\s+\S"
+    r"|[□■◇◆【\[]"
+    r")",
+    re.MULTILINE,
+)
+
+_NORMALIZE_RE = re.compile(r"[\s\W_]+", re.UNICODE)
+
+# 포함 관계 중복 판단 최소 길이 (짧은 항목이 긴 항목에 우연히 포함되는 경우 방지)
+_CONTAINMENT_MIN_CHARS = 8
+
+
+def _segments(text: str) -> list[str]:
+    """구조적 경계(페이지 구분, 제목 줄) 기준 세그먼트 목록"""
+    cuts = {0, len(text)}
+    for m in re.finditer(r"\f", text):
+        cuts.add(m.end())
+    for m in _BOUNDARY_RE.finditer(text):
+        cuts.add(m.start())
+    points = sorted(cuts)
+    return [text[a:b] for a, b in zip(points, points[1:]) if text[a:b].strip()]
+
+
+def _hard_split(segment: str, max_chars: int) -> list[str]:
+    """max_chars 초과 세그먼트를 빈 줄 → 줄바꿈 → 고정 길이 순으로 분할"""
+    if len(segment) <= max_chars:
+        return [segment]
+    for sep in ("\n\n", "\n"):
+        parts = segment.split(sep)
+        if len(parts) > 1:
+            out: list[str] = []
+            buf = ""
+            for part in parts:
+                piece = part + sep
+                if buf and len(buf) + len(piece) > max_chars:
+                    out.append(buf)
+                    buf = ""
+                buf += piece
+            if buf:
+                out.append(buf)
+            if all(len(p) <= max_chars for p in out):
+                return out
+            return [q for p in out for q in _hard_split(p, max_chars)]
+    return [segment[i:i + max_chars] for i in range(0, len(segment), max_chars)]
+
+
+def split_rfp_text(text: str, max_chars: int) -> list[str]:
+    """
+    RFP 원문을 구조적 경계 기준으로 max_chars 이하 청크로 분할
+
+    Args:
+        text: RFP 원문
+        max_chars: 청크 최대 문자 수
+
+    Returns:
+        원문 순서를 유지한 청크 목록
+    """
+    chunks: list[str] = []
+    buf = ""
+    for seg in _segments(text):
+        for piece in _hard_split(seg, max_chars):
+            if buf and len(buf) + len(piece) > max_chars:
+                chunks.append(buf)
+                buf = ""
+            buf += piece
+    if buf.strip():
+        chunks.append(buf)
+    return chunks
+
+
+def _norm(item: str) -> str:
+    return _NORMALIZE_RE.sub("", item).lower()
+
+
+def dedup_items(items: list[str]) -> list[str]:
+    """정규화 키 기준 중복 제거 (포함 관계면 긴 항목을 먼저 나온 위치에 유지)"""
+    kept: list[str] = []
+    keys: list[str] = []
+    for raw in items:
+        item = str(raw).strip()
+        key = _norm(item)
+        if not key:
+            continue
+        for i, existing in enumerate(keys):
+            if key == existing:
+                break
+            shorter, longer = sorted((key, existing), key=len)
+            if len(shorter) >= _CONTAINMENT_MIN_CHARS and shorter in longer:
+                if longer is key:
+                    kept[i], keys[i] = item, key
+                break
+        else:
+            kept.append(item)
+            keys.append(key)
+    return kept
+
+
+def merge_chunk_results(results: list[dict]) -> tuple[dict, dict[str, list[str]]]:
+    """
+    청크별 추출 결과를 결정적으로 병합
+
+    Args:
+        results: 원문 순서의 청크별 추출 dict 목록
+
+    Returns:
+        (병합 결과 dict, 충돌 필드 → 후보값 목록)
+    """
+    merged: dict = {}
+    conflicts: dict[str, list[str]] = {}
+
+    for name in SCALAR_FIELDS:
+        candidates = [
+            str(r[name]).strip() for r in results
+            if r.get(name) not in (None, "") and str(r[name]).strip()
+        ]
+        if not candidates:
+            merged[name] = None if name == "budget" else ""
+            continue
+        counts = Counter(candidates)
+        top = max(counts.values())
+        merged[name] = next(c for c in candidates if counts[c] == top)
+        distinct = list(dict.fromkeys(candidates))
+        if len(distinct) > 1:
+            conflicts[name] = distinct
+
+    for name in LIST_FIELDS:
+        merged[name] = dedup_items([x for r in results for x in (r.get(name) or []) if x])
+
+    tocs = [r.get("table_of_contents") or [] for r in results]
+    merged["table_of_contents"] = dedup_items(max(tocs, key=len)) if tocs else []
+
+    return merged, conflicts
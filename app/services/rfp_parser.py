@@ -1,12 +1,40 @@
+import asyncio
 import json
+import logging
 from pathlib import Path
 
 import anthropic
 from PyPDF2 import PdfReader
 
 from app.config import settings
+from app.exceptions import RFPParsingError
 from app.models.schemas import RFPData
-from app.prompts.proposal import RFP_ANALYSIS_PROMPT, SYSTEM_PROMPT
+from app.prompts.proposal import (
+    RFP_ANALYSIS_PROMPT,
+    RFP_CHUNK_ANALYSIS_PROMPT,
+    RFP_RECONCILE_PROMPT,
+    SYSTEM_PROMPT,
+)
+from app.services.rfp_chunker import merge_chunk_results, split_rfp_text
+from app.utils.model_router import routed_call
+from app.utils.text_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# RFP 파싱 결과 캐시 (추출 텍스트 SHA-256 → 파싱 필드, 프로세스 생존 기간 동안 유지)
+# 텍스트 캐시 덕분에 같은 파일 재업로드 시 동일 텍스트가 나오므로 Claude 재호출 없이 재사용
+_PARSE_CACHE_MAX = 256
+_parse_cache: dict[str, dict] = {}
+
+
+def _get_parsed(text: str) -> dict | None:
+    return _parse_cache.get(content_hash(text.encode("utf-8")))
+
+
+def _set_parsed(text: str, data: dict) -> None:
+    if len(_parse_cache) >= _PARSE_CACHE_MAX:
+        _parse_cache.pop(next(iter(_parse_cache)))
+    _parse_cache[content_hash(text.encode("utf-8"))] = data
 
 
 def extract_text_from_pdf(file_path: Path) -> str:
@@ -27,40 +55,132 @@ def extract_text(file_path: Path) -> str:
     return extract_text_from_file(file_path)
 
 
-async def parse_rfp(file_path: Path) -> RFPData:
-    """RFP 파일 파싱 및 분석 (비동기)"""
-    from app.utils import create_anthropic_client, extract_json_from_response
+def _parse_fields(text: str) -> dict:
+    """추출 응답 검증 — JSON 객체가 아니면 예외 (상위 모델 재시도 트리거)"""
+    from app.utils import extract_json_from_response
 
-    raw_text = extract_text(file_path)
+    data = extract_json_from_response(text)
+    if not isinstance(data, dict):
+        raise RFPParsingError("RFP 분석 응답이 JSON 객체가 아닙니다.")
+    return data
 
-    client = create_anthropic_client(async_client=True)
-    response = await client.messages.create(
-        model=settings.claude_model,
-        max_tokens=4096,
-        system=SYSTEM_PROMPT,
-        messages=[
-            {
-                "role": "user",
-                "content": RFP_ANALYSIS_PROMPT.format(rfp_text=raw_text[:10000]),
-            }
-        ],
-    )
 
-    result_text = response.content[0].text
-    data = extract_json_from_response(result_text)
-    return RFPData(raw_text=raw_text, **data)
-
-async def parse_rfp_text(content: str) -> RFPData:
-    from app.utils import create_anthropic_client, extract_json_from_response
-    client = create_anthropic_client(async_client=True)
-    response = await client.messages.create(
-        model=settings.claude_model,
+async def _analyze_single(client, text: str) -> dict:
+    """단일 호출 분석 (짧은 RFP)"""
+    result = await routed_call(
+        client, "rfp_extract",
+        validate=_parse_fields,
         max_tokens=4096,
         system=SYSTEM_PROMPT,
         messages=[{
             "role": "user",
-            "content": RFP_ANALYSIS_PROMPT.format(rfp_text=content[:10000]),
+            "content": RFP_ANALYSIS_PROMPT.format(rfp_text=text),
         }],
     )
-    data = extract_json_from_response(response.content[0].text)
-    return RFPData(raw_text=content, **data)
+    return result.value
+
+
+async def _analyze_chunk(client, sem: asyncio.Semaphore, chunk: str, index: int, total: int) -> dict:
+    """청크 1개 필드 추출 (실패 시 빈 dict — 다른 청크 결과로 병합 진행)"""
+    async with sem:
+        try:
+            result = await routed_call(
+                client, "rfp_chunk",
+                validate=_parse_fields,
+                max_tokens=4096,
+                system=SYSTEM_PROMPT,
+                messages=[{
+                    "role": "user",
+                    "content": RFP_CHUNK_ANALYSIS_PROMPT.format(
+                        index=index + 1, total=total, rfp_text=chunk,
+                    ),
+                }],
+            )
+            return result.value
+        except Exception as e:
+            logger.warning(f"RFP 청크 {index + 1}/{total} 분석 실패 (건너뜀): {e}")
+            return {}
+
+
+async def _reconcile(client, raw_text: str, merged: dict, conflicts: dict[str, list[str]]) -> dict:
+    """충돌 필드 최종 조정 (1회 호출, 실패 시 병합 결과 유지)"""
+    try:
+        result = await routed_call(
+            client, "rfp_reconcile",
+            validate=_parse_fields,
+            max_tokens=2048,
+            system=SYSTEM_PROMPT,
+            messages=[{
+                "role": "user",
+                "content": RFP_RECONCILE_PROMPT.format(
+                    rfp_head=raw_text[:3000],
+                    conflicts=json.dumps(conflicts, ensure_ascii=False, indent=1),
+                    requirements=json.dumps(merged.get("requirements", [])[:30], ensure_ascii=False),
+                ),
+            }],
+        )
+        data = result.value
+    except Exception as e:
+        logger.warning(f"RFP 충돌 조정 실패 (병합 결과 사용): {e}")
+        return merged
+    for name in conflicts:
+        if name in data:
+            merged[name] = data[name]
+    return merged
+
+
+async def _analyze_chunked(client, raw_text: str) -> dict:
+    """장문 RFP map-reduce 분석: 구조 경계 분할 → 청크별 병렬 추출 → 결정적 병합 → 충돌 조정"""
+    chunks = split_rfp_text(raw_text, settings.rfp_chunk_chars)
+    sem = asyncio.Semaphore(max(1, settings.rfp_chunk_concurrency))
+    results = await asyncio.gather(*[
+        _analyze_chunk(client, sem, chunk, i, len(chunks)) for i, chunk in enumerate(chunks)
+    ])
+    if not any(results):
+        raise RFPParsingError(
+            "RFP 청크 분석이 모두 실패했습니다.",
+            details={"chunks": len(chunks), "chars": len(raw_text)},
+        )
+    merged, conflicts = merge_chunk_results(results)
+    logger.info(
+        f"RFP 청크 분석: {len(chunks)}개 청크, 요구사항 {len(merged['requirements'])}건, "
+        f"평가기준 {len(merged['evaluation_criteria'])}건, 충돌 {list(conflicts)}"
+    )
+    if conflicts:
+        merged = await _reconcile(client, raw_text, merged, conflicts)
+    return merged
+
+
+async def analyze_rfp_text(raw_text: str) -> RFPData:
+    """
+    RFP 원문 분석 (파싱 캐시 → 길이에 따라 단일 호출 / 청크 분석)
+
+    rfp_chunk_threshold_chars 이하는 단일 호출, 초과하면 잘라내지 않고 전체를 청크 분석합니다.
+    """
+    from app.utils import create_anthropic_client
+
+    cached = _get_parsed(raw_text)
+    if cached is not None:
+        return RFPData(raw_text=raw_text, **cached)
+
+    client = create_anthropic_client(async_client=True)
+    if len(raw_text) > settings.rfp_chunk_threshold_chars:
+        data = await _analyze_chunked(client, raw_text)
+    else:
+        data = await _analyze_single(client, raw_text)
+    rfp = RFPData(raw_text=raw_text, **data)
+    _set_parsed(raw_text, rfp.model_dump(exclude={"raw_text"}))
+    return rfp
+
+
+async def parse_rfp(file_path: Path) -> RFPData:
+    """RFP 파일 파싱 및 분석 (비동기)"""
+    from app.utils import aextract_text_from_file
+
+    raw_text = await aextract_text_from_file(file_path)
+    return await analyze_rfp_text(raw_text)
+
+
+async def parse_rfp_text(content: str) -> RFPData:
+    """RFP 텍스트 파싱 및 분석 (비동기)"""
+    return await analyze_rfp_text(content)
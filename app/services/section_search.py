@@ -0,0 +1,288 @@
+"""
+섹션 라이브러리 하이브리드 검색 (/resources/sections?q=)
+
+  - 어휘 검색: 인메모리 역색인 + BM25 (한국어 문자 n-gram, 제목 TITLE_WEIGHT배 가중)
+  - 의미 검색: 섹션 벡터 인덱스(vector_store.library_vectors) — settings.section_search_vector로 선택
+  - 결과 융합: Reciprocal Rank Fusion (점수 척도가 다른 두 순위를 순위만으로 결합)
+
+역색인은 첫 검색 때 sections 테이블 전체로 만들고, 섹션 생성/수정/삭제 시
+index_section / remove_section으로 증분 갱신합니다. 다른 워커 프로세스의 변경은
+section_index_ttl_seconds가 지나 재구축될 때 반영됩니다.
+프로세스의 첫 구축 때 벡터 인덱스에 없는 원본 섹션(인덱스 도입 전 섹션)을 백그라운드로 백필합니다.
+
+근접 중복: 같은 역색인에 원본 섹션(duplicate_of 없음)의 MinHash 서명 LSH 색인을 함께 두고,
+자료 추출 섹션 저장 전 link_duplicate_sections로 같은 소유자/팀 라이브러리의 근접 중복을
+duplicate_of로 연결합니다. 연결된 섹션은 검색 결과와 벡터 인덱스(Phase 4 참고 자료)에서 제외됩니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.config import settings
+from app.services.vector_store import library_vectors
+from app.utils.minhash import LSHIndex, minhash
+from app.utils.ngrams import char_ngrams
+
+logger = logging.getLogger(__name__)
+
+TITLE_WEIGHT = 3
+CONTENT_MAX_CHARS = 20000
+# MinHash 서명 대상 본문 길이 (역색인 재구축 비용 제한)
+SIGNATURE_MAX_CHARS = 8000
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60
+_LOAD_PAGE_SIZE = 1000
+_SECTION_COLUMNS = "id, title, category, content, owner_id, team_id, is_public, duplicate_of"
+
+
+@dataclass
+class _Doc:
+    terms: Counter
+    length: int
+    meta: dict
+
+
+@dataclass
+class SectionMatch:
+    """하이브리드 검색 결과 1건 (score: RRF 융합 점수)"""
+    section_id: str
+    score: float
+    bm25: Optional[float] = None
+    vector: Optional[float] = None
+
+
+def _section_terms(section: dict) -> Counter:
+    terms = Counter(char_ngrams(section.get("title") or ""))
+    for gram in terms:
+        terms[gram] *= TITLE_WEIGHT
+    terms.update(char_ngrams((section.get("content") or "")[:CONTENT_MAX_CHARS]))
+    return terms
+
+
+def section_signature(section: dict) -> Optional[list[int]]:
+    return minhash((section.get("content") or "")[:SIGNATURE_MAX_CHARS])
+
+
+def _same_library(meta: dict, owner_id: Optional[str], team_id: Optional[str]) -> bool:
+    return meta.get("owner_id") == owner_id or bool(team_id and meta.get("team_id") == team_id)
+
+
+class SectionSearchIndex:
+    """섹션 BM25 역색인 (프로세스 전역 1개)"""
+
+    def __init__(self):
+        self._docs: dict[str, _Doc] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._total_len = 0
+        self._originals = LSHIndex()
+        self._loaded_at: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+        self._backfill_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def meta(self, section_id: str) -> Optional[dict]:
+        doc = self._docs.get(section_id)
+        return doc.meta if doc else None
+
+    def add(self, section: dict) -> None:
+        """섹션 1건 추가/교체"""
+        sid = str(section["id"])
+        self.remove(sid)
+        terms = _section_terms(section)
+        length = sum(terms.values())
+        self._docs[sid] = _Doc(terms=terms, length=length, meta={
+            "owner_id": section.get("owner_id"),
+            "team_id": section.get("team_id"),
+            "is_public": bool(section.get("is_public", False)),
+            "category": section.get("category"),
+            "duplicate_of": section.get("duplicate_of"),
+        })
+        for gram in terms:
+            self._postings.setdefault(gram, set()).add(sid)
+        self._total_len += length
+        if not section.get("duplicate_of") and (sig := section_signature(section)):
+            self._originals.add(sid, sig)
+
+    def remove(self, section_id: str) -> None:
+        self._originals.remove(section_id)
+        doc = self._docs.pop(section_id, None)
+        if doc is None:
+            return
+        for gram in doc.terms:
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(section_id)
+                if not ids:
+                    del self._postings[gram]
+        self._total_len -= doc.length
+
+    def search(self, query: str, allow: Callable[[dict], bool], limit: int) -> list[tuple[str, float]]:
+        """BM25 상위 limit건 [(section_id, score)] — allow(meta)가 False인 섹션 제외"""
+        grams = list(dict.fromkeys(char_ngrams(query)))
+        if not grams or not self._docs:
+            return []
+        n_docs = len(self._docs)
+        avgdl = (self._total_len / n_docs) or 1.0
+        scores: dict[str, float] = {}
+        for gram in grams:
+            ids = self._postings.get(gram)
+            if not ids:
+                continue
+            idf = math.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            for sid in ids:
+                doc = self._docs[sid]
+                if sid not in scores and not allow(doc.meta):
+                    continue
+                tf = doc.terms[gram]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * doc.length / avgdl)
+                scores[sid] = scores.get(sid, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return [(sid, round(score, 4)) for sid, score in ranked]
+
+    def find_duplicate(
+        self, signature: list[int], owner_id: Optional[str], team_id: Optional[str]
+    ) -> Optional[str]:
+        """같은 소유자/팀 라이브러리의 원본 섹션 중 근접 중복 section_id"""
+        match = self._originals.best_match(
+            signature,
+            settings.near_duplicate_threshold,
+            accept=lambda sid: sid in self._docs and _same_library(self._docs[sid].meta, owner_id, team_id),
+        )
+        return match[0] if match else None
+
+    async def ensure_loaded(self, client) -> None:
+        """역색인이 비었거나 TTL이 지났으면 sections 테이블 전체로 재구축"""
+        ttl = settings.section_index_ttl_seconds
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+            return
+        async with self._load_lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+                return
+            rows: list[dict] = []
+            offset = 0
+            while True:
+                res = await (
+                    client.table("sections")
+                    .select(_SECTION_COLUMNS)
+                    .order("id")
+                    .range(offset, offset + _LOAD_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = res.data or []
+                rows.extend(page)
+                if len(page) < _LOAD_PAGE_SIZE:
+                    break
+                offset += _LOAD_PAGE_SIZE
+            self._docs.clear()
+            self._postings.clear()
+            self._total_len = 0
+            self._originals = LSHIndex()
+            for row in rows:
+                self.add(row)
+            self._loaded_at = time.monotonic()
+            logger.info(f"섹션 검색 역색인 구축: {len(rows)}건")
+            if self._backfill_task is None:
+                originals = [r for r in rows if not r.get("duplicate_of")]
+                self._backfill_task = asyncio.create_task(library_vectors.backfill_sections(originals))
+
+
+section_index = SectionSearchIndex()
+
+
+async def index_section(section: dict) -> None:
+    """섹션 생성/수정 시 역색인 + 벡터 인덱스 갱신 (section: id, title, category, content, owner_id, ...)"""
+    section_index.add(section)
+    if section.get("duplicate_of"):
+        await library_vectors.remove_section(str(section["id"]))
+    else:
+        await library_vectors.index_section(section)
+
+
+async def remove_section(section_id: str) -> None:
+    section_index.remove(section_id)
+    await library_vectors.remove_section(section_id)
+
+
+async def link_duplicate_sections(client, rows: list[dict]) -> int:
+    """
+    저장 전 섹션 행의 근접 중복 원본을 찾아 row["duplicate_of"] 설정 (기존 라이브러리 + 같은 배치)
+
+    Returns:
+        연결된 섹션 수 (역색인 로드 실패 시 같은 배치 안에서만 비교)
+    """
+    try:
+        await section_index.ensure_loaded(client)
+    except Exception as e:
+        logger.warning(f"섹션 역색인 로드 실패 (배치 내 중복만 확인): {e}")
+    threshold = settings.near_duplicate_threshold
+    batch = LSHIndex()
+    batch_meta: dict[str, dict] = {}
+    linked = 0
+    for row in rows:
+        sig = section_signature(row)
+        if sig is None:
+            continue
+        owner_id, team_id = row.get("owner_id"), row.get("team_id")
+        root = section_index.find_duplicate(sig, owner_id, team_id)
+        if root is None:
+            match = batch.best_match(
+                sig, threshold, accept=lambda sid: _same_library(batch_meta[sid], owner_id, team_id)
+            )
+            root = match[0] if match else None
+        if root is None:
+            batch.add(str(row["id"]), sig)
+            batch_meta[str(row["id"])] = {"owner_id": owner_id, "team_id": team_id}
+            continue
+        row["duplicate_of"] = root
+        linked += 1
+    if linked:
+        logger.info(f"근접 중복 섹션 연결: {linked}/{len(rows)}건")
+    return linked
+
+
+async def hybrid_search(
+    client,
+    query: str,
+    *,
+    owner_id: str,
+    team_ids: list[str],
+    allow: Callable[[dict], bool],
+    limit: int = 50,
+) -> list[SectionMatch]:
+    """BM25 + 벡터 검색 결과를 RRF로 융합 (allow: 접근 범위/카테고리 필터)"""
+    await section_index.ensure_loaded(client)
+
+    def visible(meta: dict) -> bool:
+        return not meta.get("duplicate_of") and allow(meta)
+
+    lexical = section_index.search(query, visible, limit * 2)
+
+    semantic: list[tuple[str, float]] = []
+    if settings.section_search_vector:
+        hits = await library_vectors.search(query, owner_id=owner_id, team_ids=team_ids, k=limit * 2)
+        best: dict[str, float] = {}
+        for hit in hits or []:
+            meta = section_index.meta(hit.section_id) if hit.section_id else None
+            if meta is None or not visible(meta):
+                continue
+            best[hit.section_id] = max(best.get(hit.section_id, -1.0), hit.score)
+        semantic = sorted(best.items(), key=lambda kv: kv[1], reverse=True)
+
+    matches: dict[str, SectionMatch] = {}
+    for field, ranked in (("bm25", lexical), ("vector", semantic)):
+        for rank, (sid, score) in enumerate(ranked, start=1):
+            m = matches.setdefault(sid, SectionMatch(section_id=sid, score=0.0))
+            m.score += 1.0 / (RRF_K + rank)
+            setattr(m, field, score)
+    ordered = sorted(matches.values(), key=lambda m: m.score, reverse=True)[:limit]
+    for m in ordered:
+        m.score = round(m.score, 6)
+    return ordered
@@ -1,16 +1,19 @@
 """제안서 템플릿 서비스 — output/output template/ 폴더에서 목차를 추출합니다."""
 
+import asyncio
 import json
 import logging
 import os
-import zipfile
 from pathlib import Path
 from typing import Optional
-import xml.etree.ElementTree as ET
 
 import anthropic
 
 from app.config import settings
+from app.utils.file_utils import extract_text_from_hwpx
+from app.utils.model_router import routed_call
+from app.utils.pdf_extractor import iter_pdf_pages
+from app.utils.text_cache import get_or_extract
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +36,13 @@ _toc_cache: dict[str, list[str]] = {}
 def _read_pdf_text(path: Path) -> str:
     """PDF에서 텍스트를 추출합니다."""
     try:
-        import PyPDF2
-        with open(path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            pages = []
-            for i, page in enumerate(reader.pages):
-                if i >= 10:  # 목차는 앞부분에 있으므로 10페이지까지만
-                    break
-                text = page.extract_text() or ""
-                pages.append(text)
-        return "\n".join(pages)
+        # 목차는 앞부분에 있으므로 10페이지까지만
+        return get_or_extract(
+            path.read_bytes(),
+            lambda: list(iter_pdf_pages(path, max_pages=10)),
+            max_pages=10,
+            variant="p10",
+        )
     except Exception as e:
         logger.warning(f"PDF 읽기 실패 {path.name}: {e}")
         return ""
@@ -51,28 +51,17 @@ def _read_pdf_text(path: Path) -> str:
 def _read_hwpx_text(path: Path) -> str:
     """HWPX(ZIP+XML)에서 텍스트를 추출합니다."""
     try:
-        with zipfile.ZipFile(path, "r") as z:
-            # HWPX 구조: Contents/section0.xml, Contents/section1.xml, ...
-            section_names = sorted([n for n in z.namelist() if "section" in n.lower() and n.endswith(".xml")])
-            texts = []
-            for name in section_names[:3]:  # 앞부분 3개 섹션만
-                with z.open(name) as xmlf:
-                    raw = xmlf.read().decode("utf-8", errors="ignore")
-                    # XML 태그 제거하고 텍스트만 추출
-                    try:
-                        root = ET.fromstring(raw)
-                        text = " ".join(root.itertext())
-                    except ET.ParseError:
-                        # 파싱 실패 시 단순 태그 제거
-                        import re
-                        text = re.sub(r"<[^>]+>", " ", raw)
-                    texts.append(text[:5000])
-        return "\n".join(texts)
+        return get_or_extract(path.read_bytes(), lambda: _extract_hwpx_head(path), variant="toc")
     except Exception as e:
         logger.warning(f"HWPX 읽기 실패 {path.name}: {e}")
         return ""
 
 
+def _extract_hwpx_head(path: Path) -> str:
+    """HWPX 앞부분 3개 섹션 텍스트 (목차 추출용)"""
+    return extract_text_from_hwpx(path, max_sections=3, max_chars_per_section=5000)
+
+
 def _get_template_files() -> list[Path]:
     """템플릿 디렉토리에서 지원 파일 목록을 반환합니다."""
     template_dir = Path(settings.template_dir)
@@ -84,6 +73,18 @@ def _get_template_files() -> list[Path]:
     return sorted(files)
 
 
+def _parse_toc(raw: str) -> list[str]:
+    """목차 추출 응답 검증 — {"toc": [...]} 형식이 아니면 예외 (상위 모델 재시도 트리거)"""
+    import re
+    m = re.search(r"\{.*\}", raw, re.DOTALL)
+    if not m:
+        raise ValueError("목차 응답에 JSON이 없습니다.")
+    toc = json.loads(m.group()).get("toc", [])
+    if not isinstance(toc, list):
+        raise ValueError("목차 응답의 toc가 목록이 아닙니다.")
+    return [str(item).strip() for item in toc if item]
+
+
 async def _extract_toc_with_claude(text: str, filename: str) -> list[str]:
     """Claude를 사용해 문서 텍스트에서 목차를 추출합니다."""
     client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
@@ -105,20 +106,13 @@ async def _extract_toc_with_claude(text: str, filename: str) -> list[str]:
 - 목차를 찾을 수 없으면 빈 배열 반환
 """
     try:
-        r = await client.messages.create(
-            model=settings.claude_model,
+        r = await routed_call(
+            client, "toc_extract",
+            validate=_parse_toc,
             max_tokens=1024,
             messages=[{"role": "user", "content": prompt}],
         )
-        raw = r.content[0].text
-        # JSON 추출
-        import re
-        m = re.search(r"\{.*\}", raw, re.DOTALL)
-        if m:
-            d = json.loads(m.group())
-            toc = d.get("toc", [])
-            if isinstance(toc, list) and toc:
-                return [str(item).strip() for item in toc if item]
+        return r.value
     except Exception as e:
         logger.warning(f"Claude TOC 추출 실패: {e}")
     return []
@@ -160,11 +154,11 @@ async def get_template_toc(prefer_filename: Optional[str] = None) -> list[str]:
 
     logger.info(f"템플릿 파일 선택: {selected.name}")
 
-    # 텍스트 추출
+    # 텍스트 추출 (이벤트 루프 비차단)
     if selected.suffix == ".pdf":
-        text = _read_pdf_text(selected)
+        text = await asyncio.to_thread(_read_pdf_text, selected)
     else:
-        text = _read_hwpx_text(selected)
+        text = await asyncio.to_thread(_read_hwpx_text, selected)
 
     if not text.strip():
         logger.warning(f"텍스트 추출 실패 — 기본 목차 사용")
@@ -0,0 +1,224 @@
+"""
+섹션 라이브러리 벡터 인덱스 (chromadb, settings.vector_db_path)
+
+sections 테이블 섹션과 회사 자료(company_assets) 원문을 청크 단위로 임베딩해 저장하고,
+Phase 4에서 목차 항목별로 관련도 상위 청크를 검색합니다.
+  - 임베딩: 한국어 문자 n-gram 특징 해싱 (로컬·결정적, 외부 임베딩 API 불필요)
+  - 청크: 문단 경계 기준 vector_chunk_chars 이내
+  - 메타데이터: section_id/asset_id, owner_id, team_id, is_public → 검색 시 접근 범위 필터
+
+chromadb 호출은 동기 API이므로 asyncio.to_thread로 실행하고,
+인덱스 오류는 원본 데이터 저장을 막지 않도록 로그만 남깁니다 (무시).
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.utils.ngrams import char_ngrams
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "section_library"
+# 이 유사도 미만 청크는 무관한 것으로 보고 제외
+MIN_SCORE = 0.1
+_PARAGRAPH_RE = re.compile(r"\n\s*\n|\n(?=#)")
+
+
+def chunk_text(text: str, max_chars: Optional[int] = None) -> list[str]:
+    """문단 경계 기준 청크 분할 (max_chars 초과 문단은 글자 수로 분할)"""
+    max_chars = max_chars or settings.vector_chunk_chars
+    chunks: list[str] = []
+    current = ""
+    for para in (p.strip() for p in _PARAGRAPH_RE.split(text or "")):
+        if not para:
+            continue
+        while len(para) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(para[:max_chars])
+            para = para[max_chars:]
+        if current and len(current) + len(para) + 2 > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n\n{para}" if current else para
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def embed_text(text: str, dim: Optional[int] = None) -> list[float]:
+    """문자 n-gram 특징 해싱 임베딩 (L2 정규화, 프로세스 간 안정적인 crc32 사용)"""
+    dim = dim or settings.vector_embedding_dim
+    vec = np.zeros(dim, dtype=np.float32)
+    for gram in char_ngrams(text):
+        h = zlib.crc32(gram.encode("utf-8"))
+        vec[h % dim] += 1.0 if (h >> 31) & 1 else -1.0
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec /= norm
+    return vec.tolist()
+
+
+@dataclass
+class VectorHit:
+    """검색 결과 청크 1건 (score: 코사인 유사도)"""
+    text: str
+    score: float
+    title: str
+    category: str
+    section_id: str = ""
+    asset_id: str = ""
+
+
+class LibraryVectorStore:
+    """섹션/회사 자료 청크 벡터 인덱스 (지연 초기화, 프로세스 전역 1개)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._collection = None
+        self._init_lock = threading.Lock()
+
+    def _get_collection(self):
+        if self._collection is None:
+            with self._init_lock:
+                if self._collection is None:
+                    import chromadb
+                    client = chromadb.PersistentClient(path=self._path or settings.vector_db_path)
+                    self._collection = client.get_or_create_collection(
+                        COLLECTION_NAME, metadata={"hnsw:space": "cosine"}
+                    )
+        return self._collection
+
+    # ── 동기 구현 (to_thread 대상) ─────────────────────────
+
+    def _upsert(self, key: str, value: str, meta: dict, text: str) -> int:
+        col = self._get_collection()
+        col.delete(where={key: value})
+        chunks = chunk_text(text)
+        if not chunks:
+            return 0
+        col.upsert(
+            ids=[f"{key}:{value}:{i}" for i in range(len(chunks))],
+            documents=chunks,
+            embeddings=[embed_text(f"{meta['title']}\n{c}") for c in chunks],
+            metadatas=[{**meta, key: value, "chunk": i} for i in range(len(chunks))],
+        )
+        return len(chunks)
+
+    def _indexed_ids(self, key: str) -> set[str]:
+        res = self._get_collection().get(where={"chunk": 0}, include=["metadatas"])
+        return {str(m[key]) for m in res["metadatas"] or [] if m.get(key)}
+
+    def _delete(self, key: str, value: str) -> None:
+        self._get_collection().delete(where={key: value})
+
+    def _query(self, text: str, k: int, where: dict) -> list[VectorHit]:
+        col = self._get_collection()
+        res = col.query(query_embeddings=[embed_text(text)], n_results=k, where=where)
+        hits = []
+        for doc, meta, dist in zip(res["documents"][0], res["metadatas"][0], res["distances"][0]):
+            hits.append(VectorHit(
+                text=doc,
+                score=round(1.0 - float(dist), 4),
+                title=meta.get("title", ""),
+                category=meta.get("category", ""),
+                section_id=meta.get("section_id", ""),
+                asset_id=meta.get("asset_id", ""),
+            ))
+        return hits
+
+    # ── 공개 API ────────────────────────────────────────────
+
+    @staticmethod
+    def _meta(row: dict, title: str, category: str) -> dict:
+        return {
+            "title": title or "",
+            "category": category or "other",
+            "owner_id": row.get("owner_id") or "",
+            "team_id": row.get("team_id") or "",
+            "is_public": bool(row.get("is_public", False)),
+        }
+
+    async def index_section(self, section: dict) -> int:
+        """섹션 1건 (재)인덱싱 → 청크 수 (실패 시 0)"""
+        try:
+            meta = self._meta(section, section.get("title", ""), section.get("category", ""))
+            return await asyncio.to_thread(
+                self._upsert, "section_id", str(section["id"]), meta, section.get("content") or ""
+            )
+        except Exception as e:
+            logger.warning(f"섹션 벡터 인덱싱 실패 id={section.get('id')} (무시): {e}")
+            return 0
+
+    async def index_asset(
+        self, asset_id: str, owner_id: str, team_id: Optional[str], filename: str, text: str
+    ) -> int:
+        """회사 자료 원문 인덱싱 → 청크 수 (실패 시 0)"""
+        try:
+            meta = self._meta({"owner_id": owner_id, "team_id": team_id}, filename, "other")
+            return await asyncio.to_thread(self._upsert, "asset_id", asset_id, meta, text)
+        except Exception as e:
+            logger.warning(f"자료 벡터 인덱싱 실패 id={asset_id} (무시): {e}")
+            return 0
+
+    async def backfill_sections(self, sections: list[dict]) -> int:
+        """인덱스에 없는 섹션만 인덱싱 (인덱스 도입 전에 생성된 섹션 등) → 인덱싱한 섹션 수"""
+        try:
+            indexed = await asyncio.to_thread(self._indexed_ids, "section_id")
+        except Exception as e:
+            logger.warning(f"섹션 벡터 백필 대상 조회 실패 (무시): {e}")
+            return 0
+        missing = [s for s in sections if str(s["id"]) not in indexed and (s.get("content") or "").strip()]
+        for section in missing:
+            await self.index_section(section)
+        if missing:
+            logger.info(f"섹션 벡터 인덱스 백필: {len(missing)}건")
+        return len(missing)
+
+    async def remove_section(self, section_id: str) -> None:
+        try:
+            await asyncio.to_thread(self._delete, "section_id", section_id)
+        except Exception as e:
+            logger.warning(f"섹션 벡터 삭제 실패 id={section_id} (무시): {e}")
+
+    async def remove_asset(self, asset_id: str) -> None:
+        try:
+            await asyncio.to_thread(self._delete, "asset_id", asset_id)
+        except Exception as e:
+            logger.warning(f"자료 벡터 삭제 실패 id={asset_id} (무시): {e}")
+
+    async def search(
+        self,
+        query: str,
+        *,
+        owner_id: str,
+        team_ids: Optional[list[str]] = None,
+        section_ids: Optional[list[str]] = None,
+        k: Optional[int] = None,
+        min_score: float = MIN_SCORE,
+    ) -> Optional[list[VectorHit]]:
+        """접근 가능한 청크 중 유사도 상위 k개 (인덱스 사용 불가 시 None)"""
+        scope = [{"owner_id": owner_id}, {"is_public": True}]
+        if team_ids:
+            scope.append({"team_id": {"$in": list(team_ids)}})
+        where: dict = {"$or": scope}
+        if section_ids:
+            where = {"$and": [where, {"section_id": {"$in": list(section_ids)}}]}
+        try:
+            hits = await asyncio.to_thread(self._query, query, k or settings.vector_top_k, where)
+        except Exception as e:
+            logger.warning(f"벡터 검색 실패 (무시): {e}")
+            return None
+        return [h for h in hits if h.score >= min_score]
+
+
+library_vectors = LibraryVectorStore()
@@ -0,0 +1,138 @@
+"""
+제안서 웜 스타트 — 반복 발주 RFP의 이전 실행 재사용
+
+같은 발주처가 요구사항이 거의 같은 RFP를 연이어 내는 경우, 새 제안서의 Phase 1 결과(RFPData)로
+가장 비슷한 이전 실행(완료된 제안서)을 찾아 Phase 2/3 산출물을 초안으로 재사용합니다.
+  - 색인: Phase 1 완료 시 RFPData 주요 필드의 MinHash 서명을 proposals.rfp_minhash에 저장
+  - 검색: 같은 소유자/팀의 최근 완료 제안서 서명과 일괄 비교 (numpy) → 유사도 상위 1건
+  - 재사용: 이전 실행의 proposal_phases 아티팩트(1~3) + RFP 변경분(rfp_delta)
+    → 변경이 없으면 Phase 2/3를 그대로 사용, 있으면 변경분만 재분석 (phase_executor)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.utils.minhash import NUM_PERM, minhash
+
+logger = logging.getLogger(__name__)
+
+# 서명·변경 비교 대상 RFPData 필드 (raw_text 제외)
+SCALAR_FIELDS = ("title", "client_name", "project_scope", "duration", "budget")
+LIST_FIELDS = ("requirements", "evaluation_criteria", "table_of_contents")
+SEEDED_PHASES = (1, 2, 3)
+
+
+@dataclass
+class WarmStartMatch:
+    """가장 비슷한 이전 실행 (artifacts: {phase_num: artifact_json})"""
+    proposal_id: str
+    title: str
+    similarity: float
+    artifacts: dict[int, dict] = field(default_factory=dict)
+    delta: dict = field(default_factory=dict)
+
+    def info(self) -> dict:
+        """Phase 1 아티팩트·진행 이벤트용 요약"""
+        return {
+            "proposal_id": self.proposal_id,
+            "title": self.title,
+            "similarity": round(self.similarity, 3),
+            "changed_fields": sorted(self.delta),
+        }
+
+
+def rfp_signature(rfp: dict) -> Optional[list[int]]:
+    """RFPData 주요 필드 MinHash 서명"""
+    parts = [str(rfp.get(f) or "") for f in SCALAR_FIELDS]
+    for f in LIST_FIELDS:
+        parts.extend(str(item) for item in rfp.get(f) or [])
+    return minhash("\n".join(parts))
+
+
+def rfp_delta(previous: dict, current: dict) -> dict:
+    """
+    이전 RFP → 이번 RFP 변경분
+
+    Returns:
+        {필드: {"before", "after"}} (단일 값) / {필드: {"added", "removed"}} (목록) — 변경 없으면 {}
+    """
+    delta: dict = {}
+    for f in SCALAR_FIELDS:
+        before, after = previous.get(f) or "", current.get(f) or ""
+        if before.strip() != after.strip():
+            delta[f] = {"before": before, "after": after}
+    for f in LIST_FIELDS:
+        before, after = previous.get(f) or [], current.get(f) or []
+        added = [item for item in after if item not in before]
+        removed = [item for item in before if item not in after]
+        if added or removed:
+            delta[f] = {"added": added, "removed": removed}
+    return delta
+
+
+async def save_rfp_signature(client, proposal_id: str, rfp: dict) -> None:
+    """Phase 1 결과 서명 저장 (실패 시 로그만 — 다음 제안서의 웜 스타트 후보에서 빠질 뿐)"""
+    signature = rfp_signature(rfp)
+    if signature is None:
+        return
+    try:
+        await client.table("proposals").update({"rfp_minhash": signature}).eq("id", proposal_id).execute()
+    except Exception as e:
+        logger.warning(f"[{proposal_id}] RFP 서명 저장 실패 (무시): {e}")
+
+
+async def find_prior_run(
+    client,
+    *,
+    proposal_id: str,
+    owner_id: Optional[str],
+    team_id: Optional[str],
+    rfp: dict,
+) -> Optional[WarmStartMatch]:
+    """같은 소유자/팀의 완료 제안서 중 RFP가 가장 비슷한 실행 (유사도 하한 미만이면 None)"""
+    signature = rfp_signature(rfp)
+    if signature is None or not owner_id:
+        return None
+
+    query = (
+        client.table("proposals")
+        .select("id, title, rfp_minhash")
+        .eq("status", "completed")
+        .neq("id", proposal_id)
+    )
+    query = query.or_(f"owner_id.eq.{owner_id},team_id.eq.{team_id}") if team_id else query.eq("owner_id", owner_id)
+    res = await query.order("created_at", desc=True).limit(settings.warm_start_max_candidates).execute()
+    rows = [r for r in res.data or [] if r.get("rfp_minhash") and len(r["rfp_minhash"]) == NUM_PERM]
+    if not rows:
+        return None
+
+    similarities = (np.array([r["rfp_minhash"] for r in rows]) == np.array(signature)).mean(axis=1)
+    best = int(similarities.argmax())
+    if similarities[best] < settings.warm_start_min_similarity:
+        return None
+    row = rows[best]
+
+    phases = await (
+        client.table("proposal_phases")
+        .select("phase_num, artifact_json")
+        .eq("proposal_id", row["id"])
+        .in_("phase_num", list(SEEDED_PHASES))
+        .execute()
+    )
+    artifacts = {p["phase_num"]: p["artifact_json"] for p in phases.data or [] if p.get("artifact_json")}
+    if any(n not in artifacts for n in SEEDED_PHASES):
+        logger.info(f"[{proposal_id}] 웜 스타트 후보 {row['id']}의 Phase 1~3 아티팩트 없음 (미사용)")
+        return None
+
+    previous = artifacts[1].get("rfp_data") or artifacts[1].get("structured_data") or {}
+    return WarmStartMatch(
+        proposal_id=row["id"],
+        title=row.get("title") or "",
+        similarity=float(similarities[best]),
+        artifacts=artifacts,
+        delta=rfp_delta(previous, rfp),
+    )
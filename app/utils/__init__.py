@@ -1,11 +1,12 @@
 """유틸리티 모듈"""
 
 from .claude_utils import extract_json_from_response, create_anthropic_client
-from .file_utils import validate_file_type, extract_text_from_file
+from .file_utils import validate_file_type, extract_text_from_file, aextract_text_from_file
 
 __all__ = [
     "extract_json_from_response",
     "create_anthropic_client",
     "validate_file_type",
     "extract_text_from_file",
+    "aextract_text_from_file",
 ]
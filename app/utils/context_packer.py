@@ -0,0 +1,147 @@
+"""프롬프트 컨텍스트 토큰 예산 패킹
+
+Phase 프롬프트 입력을 고정 문자 수([:3000] 등)로 자르는 대신
+  1. 한국어 인지 휴리스틱으로 토큰 수를 추정하고
+  2. 필드 우선순위에 따라 단계별 예산(settings.context_budget_tokens)을 배분한 뒤
+  3. JSON은 구조를 깨지 않고 긴 문자열/목록만 줄여서(compact) 예산에 맞춥니다.
+
+토큰 추정: 한글·CJK 문자 ≈ 1토큰, 그 외 문자 ≈ 3.5자당 1토큰 (Claude 토크나이저 대비 약간 보수적)
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.config import settings
+
+_WIDE_RE = re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3040-\u30ff\u4e00-\u9fff]")
+_ASCII_CHARS_PER_TOKEN = 3.5
+
+# compact_json 축소 단계 — (문자열 최대 길이, 목록 최대 항목 수, dict 최대 키 수)
+_SHRINK_LEVELS = (
+    (4000, 200, 200),
+    (2000, 50, 100),
+    (1000, 20, 60),
+    (500, 10, 40),
+    (250, 5, 20),
+    (120, 3, 10),
+    (60, 2, 6),
+    (30, 1, 3),
+)
+
+_ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """한국어 인지 토큰 수 추정 (빠른 휴리스틱)"""
+    if not text:
+        return 0
+    wide = len(_WIDE_RE.findall(text))
+    return wide + math.ceil((len(text) - wide) / _ASCII_CHARS_PER_TOKEN)
+
+
+def fit_text(text: str, max_tokens: int) -> str:
+    """텍스트를 max_tokens 이내로 자름 (가능하면 줄 경계에서)"""
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    cut = text[:lo]
+    nl = cut.rfind("\n")
+    if nl > lo * 0.8:
+        cut = cut[:nl]
+    return cut.rstrip() + _ELLIPSIS
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _shrink(value: Any, str_cap: int, list_cap: int, dict_cap: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= str_cap else value[:str_cap] + _ELLIPSIS
+    if isinstance(value, list):
+        items = [_shrink(v, str_cap, list_cap, dict_cap) for v in value[:list_cap]]
+        if len(value) > list_cap:
+            items.append(f"{_ELLIPSIS}(+{len(value) - list_cap})")
+        return items
+    if isinstance(value, dict):
+        keys = list(value)[:dict_cap]
+        out = {k: _shrink(value[k], str_cap, list_cap, dict_cap) for k in keys}
+        if len(value) > dict_cap:
+            out[_ELLIPSIS] = f"+{len(value) - dict_cap}"
+        return out
+    return value
+
+
+def compact_json(value: Any, max_tokens: Optional[int] = None) -> str:
+    """
+    항상 유효한 JSON 문자열을 반환하는 예산 맞춤 직렬화
+
+    예산을 넘으면 긴 문자열 → 긴 목록 → 많은 키 순으로 단계적으로 줄이며,
+    줄인 위치에는 "…" / "…(+N)" 표시를 남깁니다.
+    """
+    raw = _dumps(value)
+    if max_tokens is None or estimate_tokens(raw) <= max_tokens:
+        return raw
+    for caps in _SHRINK_LEVELS:
+        raw = _dumps(_shrink(value, *caps))
+        if estimate_tokens(raw) <= max_tokens:
+            return raw
+    return raw
+
+
+@dataclass
+class ContextField:
+    """프롬프트 입력 필드 1개
+
+    priority: 작을수록 먼저 예산 배분 (1 = 필수 핵심)
+    min_tokens: 예산이 부족해도 보장하는 최소 토큰
+    """
+    name: str
+    value: Any
+    priority: int = 2
+    min_tokens: int = 200
+
+    def render(self, max_tokens: Optional[int] = None) -> str:
+        if isinstance(self.value, str):
+            return self.value if max_tokens is None else fit_text(self.value, max_tokens)
+        return compact_json(self.value, max_tokens)
+
+
+def pack_fields(fields: list[ContextField], budget: int) -> dict[str, str]:
+    """
+    우선순위 순으로 예산을 배분해 필드별 렌더링 문자열 반환
+
+    전체가 예산 안에 들어가면 원본 그대로(JSON은 compact 직렬화),
+    아니면 높은 우선순위부터 필요한 만큼 가져가되 남은 필드의 min_tokens는 남겨 둡니다.
+    """
+    full = {f.name: f.render() for f in fields}
+    costs = {name: estimate_tokens(text) for name, text in full.items()}
+    if sum(costs.values()) <= budget:
+        return full
+
+    out: dict[str, str] = {}
+    remaining = max(budget, 0)
+    ordered = sorted(fields, key=lambda f: f.priority)
+    for i, f in enumerate(ordered):
+        reserve = sum(min(g.min_tokens, costs[g.name]) for g in ordered[i + 1:])
+        allot = max(min(costs[f.name], remaining - reserve), min(f.min_tokens, costs[f.name]))
+        out[f.name] = full[f.name] if allot >= costs[f.name] else f.render(allot)
+        remaining -= estimate_tokens(out[f.name])
+    return out
+
+
+def step_budget(step: str, overhead: str = "") -> int:
+    """단계별 입력 예산 (settings.max_input_tokens 상한, 템플릿/부가 텍스트 토큰 제외)"""
+    cap = settings.context_budget_tokens.get(step, settings.max_input_tokens)
+    return max(min(cap, settings.max_input_tokens) - estimate_tokens(overhead), 0)
@@ -1,13 +1,17 @@
 """파일 처리 관련 유틸리티"""
 
+import asyncio
 import logging
+import re
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Union
-
-from PyPDF2 import PdfReader
+from typing import Optional, Union
 
 from app.config import settings
 from app.exceptions import FileProcessingError
+from app.utils.pdf_extractor import extract_pdf_text, iter_pdf_pages
+from app.utils.text_cache import get_or_extract
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +44,19 @@ def extract_text_from_pdf(file_path: Union[str, Path]) -> str:
         FileProcessingError: PDF 읽기 실패 시
     """
     try:
-        reader = PdfReader(str(file_path))
-        text_parts = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-        return "\n".join(text_parts)
+        return extract_pdf_text(file_path)
+    except Exception as e:
+        logger.error(f"PDF 텍스트 추출 실패: {e}")
+        raise FileProcessingError(
+            f"PDF 파일을 읽을 수 없습니다: {file_path}",
+            details={"path": str(file_path), "error": str(e)}
+        )
+
+
+def _extract_pdf_pages(file_path: Path) -> list[str]:
+    """PDF 페이지별 텍스트 추출 (텍스트 캐시의 페이지 오프셋 기록용)"""
+    try:
+        return list(iter_pdf_pages(file_path))
     except Exception as e:
         logger.error(f"PDF 텍스트 추출 실패: {e}")
         raise FileProcessingError(
@@ -81,10 +91,88 @@ def extract_text_from_docx(file_path: Union[str, Path]) -> str:
         )
 
 
+def _section_sort_key(name: str) -> tuple[int, str]:
+    """Contents/section10.xml이 section2.xml 뒤에 오도록 숫자 기준 정렬"""
+    m = re.search(r"section(\d+)", name, re.IGNORECASE)
+    return (int(m.group(1)) if m else 0, name)
+
+
+def _hwpx_section_text(raw: str) -> str:
+    """HWPX 섹션 XML → 문단 단위 텍스트"""
+    try:
+        root = ET.fromstring(raw)
+    except ET.ParseError:
+        # 파싱 실패 시 단순 태그 제거
+        return re.sub(r"<[^>]+>", " ", raw)
+
+    paragraphs = []
+    for elem in root.iter():
+        if not elem.tag.endswith("}p"):
+            continue
+        # 문단 직속 run/t 만 수집 (표 안 문단은 root.iter()가 별도로 방문)
+        line = "".join(
+            t.text or ""
+            for run in elem if run.tag.endswith("}run")
+            for t in run if t.tag.endswith("}t")
+        )
+        if line.strip():
+            paragraphs.append(line)
+    if not paragraphs:
+        return " ".join(root.itertext())
+    return "\n".join(paragraphs)
+
+
+def extract_text_from_hwpx(
+    file_path: Union[str, Path],
+    max_sections: Optional[int] = None,
+    max_chars_per_section: Optional[int] = None,
+) -> str:
+    """
+    HWPX(ZIP+XML) 파일에서 텍스트 추출
+
+    Args:
+        file_path: HWPX 파일 경로
+        max_sections: 앞에서부터 읽을 최대 섹션 수 (None이면 전체)
+        max_chars_per_section: 섹션별 최대 문자 수 (None이면 제한 없음)
+
+    Returns:
+        추출된 텍스트
+
+    Raises:
+        FileProcessingError: ZIP 형식이 아니거나 읽기 실패 시
+    """
+    try:
+        with zipfile.ZipFile(file_path, "r") as z:
+            # HWPX 구조: Contents/section0.xml, Contents/section1.xml, ...
+            section_names = sorted(
+                (n for n in z.namelist() if "section" in n.lower() and n.endswith(".xml")),
+                key=_section_sort_key,
+            )
+            texts = []
+            for name in section_names[:max_sections]:
+                with z.open(name) as xmlf:
+                    text = _hwpx_section_text(xmlf.read().decode("utf-8", errors="ignore"))
+                texts.append(text[:max_chars_per_section])
+        return "\n".join(texts)
+    except zipfile.BadZipFile as e:
+        raise FileProcessingError(
+            "HWP 5.0 바이너리 형식은 지원되지 않습니다. 한글에서 HWPX로 저장 후 업로드해주세요.",
+            details={"path": str(file_path), "error": str(e)}
+        )
+    except Exception as e:
+        logger.error(f"HWPX 텍스트 추출 실패: {e}")
+        raise FileProcessingError(
+            f"HWPX 파일을 읽을 수 없습니다: {file_path}",
+            details={"path": str(file_path), "error": str(e)}
+        )
+
+
 def extract_text_from_file(file_path: Union[str, Path]) -> str:
     """
     파일에서 텍스트 추출 (통합 함수)
 
+    PDF/DOCX/HWPX는 파일 바이트 SHA-256 기준 텍스트 캐시를 거칩니다.
+
     Args:
         file_path: 파일 경로
 
@@ -106,16 +194,14 @@ def extract_text_from_file(file_path: Union[str, Path]) -> str:
 
     try:
         if suffix == ".pdf":
-            return extract_text_from_pdf(file_path)
+            return get_or_extract(file_path.read_bytes(), lambda: _extract_pdf_pages(file_path))
         elif suffix == ".docx":
-            return extract_text_from_docx(file_path)
-        elif suffix == ".hwp":
-            raise FileProcessingError(
-                "HWP 파일 형식은 아직 지원되지 않습니다.",
-                details={"path": str(file_path)}
-            )
+            return get_or_extract(file_path.read_bytes(), lambda: extract_text_from_docx(file_path))
+        elif suffix in (".hwpx", ".hwp"):
+            # .hwp는 HWPX(ZIP) 형식으로 저장된 경우만 지원 — HWP 5.0 바이너리는 FileProcessingError
+            return get_or_extract(file_path.read_bytes(), lambda: extract_text_from_hwpx(file_path))
         elif suffix == ".txt":
-            return file_path.read_text(encoding="utf-8")
+            return file_path.read_text(encoding="utf-8", errors="ignore")
         else:
             raise FileProcessingError(
                 f"지원하지 않는 파일 형식입니다: {suffix}",
@@ -129,3 +215,8 @@ def extract_text_from_file(file_path: Union[str, Path]) -> str:
             f"파일을 읽는 중 오류가 발생했습니다: {file_path}",
             details={"path": str(file_path), "error": str(e)}
         )
+
+
+async def aextract_text_from_file(file_path: Union[str, Path]) -> str:
+    """extract_text_from_file의 비동기 래퍼 (asyncio.to_thread 사용)"""
+    return await asyncio.to_thread(extract_text_from_file, file_path)
@@ -0,0 +1,118 @@
+"""
+MinHash 서명 + LSH 밴드 색인 (근접 중복 문서 탐지)
+
+재업로드된 회사 소개서 섹션, 문구만 조금 바뀐 재공고처럼 "거의 같은" 문서를 찾습니다.
+  - 슁글: 공백·기호를 제거한 본문의 문자 SHINGLE_SIZE-gram 집합
+  - 서명: NUM_PERM개 해시 순열의 최솟값 — 두 서명의 일치 비율 ≈ 슁글 집합 Jaccard 유사도
+  - LSH: 서명을 LSH_BANDS개 밴드로 나눠 밴드가 하나라도 같은 문서만 후보로 비교
+    (밴드 32 × 행 4 → Jaccard 0.45 부근부터 후보가 되고, 0.8 이상은 거의 놓치지 않음)
+
+crc32 + 고정 시드 순열이므로 프로세스·재시작과 무관하게 같은 텍스트는 같은 서명을 갖습니다
+(DB INTEGER[]에 저장 가능한 31비트 값).
+"""
+
+import re
+import zlib
+from typing import Hashable, Optional
+
+import numpy as np
+
+NUM_PERM = 128
+LSH_BANDS = 32
+SHINGLE_SIZE = 4
+
+_PRIME = (1 << 31) - 1
+_WORD_RE = re.compile(r"[0-9a-z가-힣]+")
+_rng = np.random.default_rng(20260301)
+_PERM_A = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """띄어쓰기·문장부호 차이를 무시한 문자 size-gram 집합 (짧은 본문은 전체 1개)"""
+    compact = "".join(_WORD_RE.findall((text or "").lower()))
+    if len(compact) <= size:
+        return {compact} if compact else set()
+    return {compact[i:i + size] for i in range(len(compact) - size + 1)}
+
+
+def minhash(text: str) -> Optional[list[int]]:
+    """MinHash 서명 (NUM_PERM개 정수, 슁글이 없으면 None)"""
+    grams = shingles(text)
+    if not grams:
+        return None
+    hashes = np.fromiter(
+        (zlib.crc32(g.encode("utf-8")) & _PRIME for g in grams), dtype=np.uint64, count=len(grams)
+    )
+    # (a·h + b) mod p — a, h < 2^31 이므로 uint64에서 넘치지 않음
+    values = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _PRIME
+    return values.min(axis=1).astype(np.int64).tolist()
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """두 서명의 추정 Jaccard 유사도 (0~1)"""
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+class LSHIndex:
+    """MinHash 서명 LSH 색인 (key → 서명, 밴드 버킷 → key 집합)"""
+
+    def __init__(self, bands: int = LSH_BANDS):
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._signatures: dict[Hashable, list[int]] = {}
+        self._buckets: dict[tuple, set] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: list[int]) -> list[tuple]:
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: Hashable, signature: list[int]) -> None:
+        self.remove(key)
+        self._signatures[key] = signature
+        for bk in self._band_keys(signature):
+            self._buckets.setdefault(bk, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for bk in self._band_keys(signature):
+            keys = self._buckets.get(bk)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[bk]
+
+    def candidates(self, signature: list[int]) -> set:
+        """밴드가 하나 이상 일치하는 key 집합"""
+        found: set = set()
+        for bk in self._band_keys(signature):
+            found |= self._buckets.get(bk, set())
+        return found
+
+    def best_match(
+        self, signature: list[int], threshold: float, exclude: Optional[Hashable] = None, accept=None
+    ) -> Optional[tuple[Hashable, float]]:
+        """추정 유사도 threshold 이상 후보 중 가장 비슷한 (key, 유사도) — accept(key)가 False인 후보 제외"""
+        best: Optional[tuple[Hashable, float]] = None
+        for key in self.candidates(signature):
+            if key == exclude or (accept is not None and not accept(key)):
+                continue
+            score = similarity(signature, self._signatures[key])
+            if score < threshold:
+                continue
+            # 동점이면 key가 작은 쪽 (결과 결정적)
+            if best is None or score > best[1] or (score == best[1] and str(key) < str(best[0])):
+                best = (key, score)
+        return best
@@ -0,0 +1,121 @@
+"""파이프라인 단계별 Claude 모델 라우팅
+
+추출/분류/채점처럼 정형 JSON을 내는 단계는 소형 모델(settings.model_routes),
+본문 작성 단계는 기본 모델(settings.claude_model)로 보냅니다.
+
+소형 모델 응답이 검증(validate)을 통과하지 못하면 settings.model_escalation에 정의된
+상위 모델(없으면 claude_model)로 1회 재시도합니다.
+단계별 호출 수 / 승격 수 / 토큰 사용량은 프로세스 내에 집계됩니다 (route_usage()).
+모든 호출은 공용 제한기(rate_limiter.claude_limiter)를 거칩니다.
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional
+
+from app.config import settings
+from app.utils.rate_limiter import claude_limiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouteUsage:
+    """단계별 누적 사용량"""
+    calls: int = 0
+    escalations: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    models: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class RoutedResponse:
+    """라우팅 호출 결과 — value는 validate 반환값 (validate 없으면 응답 텍스트)"""
+    value: Any
+    response: Any
+    model: str
+    escalated: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.response.content[0].text
+
+
+_usage: dict[str, RouteUsage] = {}
+
+
+def model_for(step: str) -> str:
+    """단계에 지정된 모델 (미지정 단계는 claude_model)"""
+    return settings.model_routes.get(step) or settings.claude_model
+
+
+def escalation_for(model: str) -> Optional[str]:
+    """검증 실패 시 재시도할 상위 모델 (이미 최상위면 None)"""
+    target = settings.model_escalation.get(model) or settings.claude_model
+    return target if target != model else None
+
+
+def _record(step: str, model: str, response: Any) -> None:
+    u = _usage.setdefault(step, RouteUsage())
+    u.calls += 1
+    u.models[model] = u.models.get(model, 0) + 1
+    usage = getattr(response, "usage", None)
+    in_tok = getattr(usage, "input_tokens", 0)
+    out_tok = getattr(usage, "output_tokens", 0)
+    if isinstance(in_tok, int) and isinstance(out_tok, int):
+        u.input_tokens += in_tok
+        u.output_tokens += out_tok
+        if settings.log_token_usage:
+            logger.info(f"[route:{step}] {model} 입력 {in_tok} / 출력 {out_tok} 토큰")
+
+
+async def routed_call(
+    client,
+    step: str,
+    *,
+    validate: Optional[Callable[[str], Any]] = None,
+    model: Optional[str] = None,
+    **kwargs,
+) -> RoutedResponse:
+    """
+    단계 모델로 messages.create 호출 → validate 실패 시 상위 모델로 1회 재시도
+
+    Args:
+        client: AsyncAnthropic 클라이언트
+        step: 라우팅 단계명 (settings.model_routes 키)
+        validate: 응답 텍스트 검증/파싱 함수 (예외 발생 = 검증 실패)
+        model: 단계 모델 대신 사용할 모델 (인스턴스별 재정의용)
+        **kwargs: messages.create 인자 (model 제외)
+
+    Raises:
+        API 호출 예외는 그대로, 상위 모델도 검증 실패하면 마지막 검증 예외
+    """
+    current = model or model_for(step)
+    escalated = False
+    while True:
+        async with claude_limiter.slot():
+            response = await client.messages.create(model=current, **kwargs)
+        _record(step, current, response)
+        text = response.content[0].text
+        try:
+            value = validate(text) if validate else text
+            return RoutedResponse(value=value, response=response, model=current, escalated=escalated)
+        except Exception as e:
+            target = None if escalated else escalation_for(current)
+            if target is None:
+                _usage[step].failures += 1
+                raise
+            logger.warning(f"[route:{step}] {current} 응답 검증 실패 → {target} 재시도: {e}")
+            _usage[step].escalations += 1
+            current, escalated = target, True
+
+
+def route_usage() -> dict[str, dict]:
+    """단계별 누적 사용량 스냅샷"""
+    return {step: asdict(u) for step, u in sorted(_usage.items())}
+
+
+def reset_route_usage() -> None:
+    _usage.clear()
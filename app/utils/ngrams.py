@@ -0,0 +1,23 @@
+"""
+한국어 문자 n-gram 토큰화 (로컬 관련도·검색·임베딩 공용)
+
+띄어쓰기·조사 변형에 강하도록 단어 단위가 아니라 어절 내부 문자 n-gram(2~3자)을 사용합니다.
+"""
+
+import re
+
+NGRAM_SIZES = (2, 3)
+
+_WORD_RE = re.compile(r"[0-9a-z가-힣]+")
+
+
+def char_ngrams(text: str) -> list[str]:
+    """어절 내부 문자 n-gram 목록 (2자 미만 어절은 그대로 1개 토큰)"""
+    grams: list[str] = []
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) < min(NGRAM_SIZES):
+            grams.append(word)
+            continue
+        for n in NGRAM_SIZES:
+            grams.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return grams
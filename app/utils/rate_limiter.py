@@ -0,0 +1,63 @@
+"""외부 API 공용 호출 제한기 (프로세스 전역)
+
+동시 실행 수와 분당 요청 수를 함께 제한합니다.
+각 서비스의 배치 동시 실행 semaphore는 작업별 상한이고, 이 제한기는 모든 작업이 공유하는 상한입니다.
+  - claude_limiter: claude_max_concurrency / claude_requests_per_minute
+    — model_router.routed_call이 호출마다 통과하므로 서비스 코드에서 직접 사용할 일은 드뭅니다.
+  - g2b_limiter: g2b_max_concurrency / g2b_requests_per_minute — G2BService._call_api가 HTTP 요청마다 통과
+"""
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.config import settings
+
+
+class AsyncRateLimiter:
+    """동시 실행 수 + 분당 요청 수 제한 (이벤트 루프별 상태)
+
+    rate_per_minute가 0이면 속도 제한 없이 동시 실행 수만 제한합니다.
+    """
+
+    def __init__(self, max_concurrency: int, rate_per_minute: int = 0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_per_minute = max(0, rate_per_minute)
+        self._loops: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def _state(self) -> dict:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = {"sem": asyncio.Semaphore(self.max_concurrency), "lock": asyncio.Lock(), "next_at": 0.0}
+            self._loops[loop] = state
+        return state
+
+    async def _wait_turn(self, state: dict) -> None:
+        if not self.rate_per_minute:
+            return
+        interval = 60.0 / self.rate_per_minute
+        async with state["lock"]:
+            now = time.monotonic()
+            wait = state["next_at"] - now
+            state["next_at"] = max(now, state["next_at"]) + interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """호출 1건 슬롯 확보 (동시 실행 슬롯 → 속도 간격 순)"""
+        state = self._state()
+        async with state["sem"]:
+            await self._wait_turn(state)
+            yield
+
+
+claude_limiter = AsyncRateLimiter(
+    settings.claude_max_concurrency, settings.claude_requests_per_minute
+)
+g2b_limiter = AsyncRateLimiter(
+    settings.g2b_max_concurrency, settings.g2b_requests_per_minute
+)
@@ -0,0 +1,187 @@
+"""추출 텍스트 캐시 — 파일 바이트 SHA-256 키, 로컬 디스크 저장
+
+같은 RFP/회사 자료가 여러 팀원에게서 반복 업로드되므로
+PyPDF2/python-docx 추출 결과를 콘텐츠 해시로 캐싱합니다.
+
+저장 형식: {text_cache_dir}/{hash[:2]}/{hash}[-{variant}].json.z
+  zlib 압축된 JSON {"v": 1, "page_offsets": [...], "text": "..."}
+  page_offsets[i] = i번째 페이지가 text에서 시작하는 문자 위치
+
+용량 관리: 저장 후 전체 크기가 text_cache_max_mb를 넘으면 오래 사용되지 않은 파일부터 삭제
+  (캐시 HIT 시 파일 mtime 갱신 → LRU)
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class CachedText:
+    """캐시된 추출 결과"""
+    text: str
+    page_offsets: list[int] = field(default_factory=lambda: [0])
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_offsets)
+
+    def head(self, max_pages: Optional[int]) -> str:
+        """앞 max_pages 페이지까지의 텍스트"""
+        if max_pages is None or max_pages >= self.page_count:
+            return self.text
+        return self.text[:self.page_offsets[max_pages]].rstrip("\n")
+
+
+def content_hash(data: bytes) -> str:
+    """파일 바이트의 SHA-256 hex digest"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def join_pages(pages: list[str]) -> CachedText:
+    """페이지 텍스트 목록 → 결합 텍스트 + 페이지 오프셋 (빈 페이지는 본문에서 제외)"""
+    parts: list[str] = []
+    offsets: list[int] = []
+    pos = 0
+    for page in pages:
+        offsets.append(pos)
+        if page:
+            if parts:
+                pos += 1  # 구분자 "\n"
+                offsets[-1] = pos
+            parts.append(page)
+            pos += len(page)
+    return CachedText(text="\n".join(parts), page_offsets=offsets or [0])
+
+
+def _cache_path(digest: str, variant: str = "") -> Path:
+    name = f"{digest}-{variant}" if variant else digest
+    return Path(settings.text_cache_dir) / digest[:2] / f"{name}.json.z"
+
+
+def load_cached_text(digest: str, variant: str = "") -> Optional[CachedText]:
+    """캐시 조회 (없거나 손상되었으면 None)"""
+    if not settings.text_cache_enabled:
+        return None
+    path = _cache_path(digest, variant)
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"텍스트 캐시 읽기 실패 (무시): {e}")
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)  # LRU 정리 기준
+    try:
+        payload = json.loads(zlib.decompress(raw))
+        if payload.get("v") != _FORMAT_VERSION:
+            return None
+        return CachedText(text=payload["text"], page_offsets=payload.get("page_offsets") or [0])
+    except (zlib.error, ValueError, KeyError) as e:
+        logger.warning(f"텍스트 캐시 손상 — 무시: {path.name} ({e})")
+        return None
+
+
+def store_cached_text(digest: str, cached: CachedText, variant: str = "") -> None:
+    """캐시 저장 (원자적 rename, 실패는 무시)"""
+    if not settings.text_cache_enabled or not cached.text.strip():
+        return
+    path = _cache_path(digest, variant)
+    payload = {"v": _FORMAT_VERSION, "page_offsets": cached.page_offsets, "text": cached.text}
+    body = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), 6)
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+        tmp = None
+    except OSError as e:
+        logger.warning(f"텍스트 캐시 저장 실패 (무시): {e}")
+        return
+    finally:
+        if tmp is not None:
+            Path(tmp).unlink(missing_ok=True)
+    _evict()
+
+
+def _evict() -> None:
+    """캐시 전체 크기가 상한을 넘으면 mtime이 오래된 파일부터 삭제 (실패는 무시)"""
+    limit = settings.text_cache_max_mb * 1024 * 1024
+    if limit <= 0:
+        return
+    entries = []
+    for path in Path(settings.text_cache_dir).glob("*/*.json.z"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    if total <= limit:
+        return
+    entries.sort(key=lambda e: e[0])
+    removed = 0
+    for _, size, path in entries:
+        if total <= limit:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    logger.info(f"텍스트 캐시 정리: {removed}개 파일 삭제")
+
+
+def get_or_extract(
+    data: bytes,
+    extract: Callable[[], Union[str, list[str]]],
+    max_pages: Optional[int] = None,
+    variant: str = "",
+) -> str:
+    """
+    캐시 우선 텍스트 추출
+
+    Args:
+        data: 원본 파일 바이트 (캐시 키)
+        extract: 캐시 미스 시 호출할 추출 함수 (전체 텍스트 또는 페이지 목록 반환)
+        max_pages: 앞 N페이지만 필요한 경우 — 전체 캐시가 있으면 오프셋으로 잘라 사용
+        variant: 부분 추출 결과를 전체 결과와 구분하는 키 접미사
+            (max_pages 없는 variant는 전체 결과로 대신할 수 없으므로 자체 캐시만 사용)
+
+    Returns:
+        추출된 텍스트
+    """
+    digest = content_hash(data)
+
+    if variant:
+        partial = load_cached_text(digest, variant)
+        if partial is not None:
+            logger.debug(f"텍스트 캐시 HIT: {digest[:12]}-{variant}")
+            return partial.text
+    if not variant or max_pages is not None:
+        full = load_cached_text(digest)
+        if full is not None:
+            logger.debug(f"텍스트 캐시 HIT: {digest[:12]}")
+            return full.head(max_pages)
+
+    result = extract()
+    cached = join_pages(result) if isinstance(result, list) else CachedText(text=result)
+    store_cached_text(digest, cached, variant)
+    return cached.text
@@ -0,0 +1,12 @@
+-- ============================================================
+-- 마이그레이션: 입찰 분석 메모이제이션 키
+-- 같은 팀 프로필(profile_hash) + 같은 공고 내용(content_hash)이면
+-- 프리셋/재수집과 무관하게 이전 자격 판정·매칭 점수를 재사용합니다.
+-- 실행 위치: Supabase Dashboard > SQL Editor
+-- ============================================================
+
+ALTER TABLE bid_recommendations ADD COLUMN IF NOT EXISTS profile_hash TEXT;
+ALTER TABLE bid_recommendations ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS bid_recommendations_memo_idx
+    ON bid_recommendations(team_id, profile_hash, bid_no);
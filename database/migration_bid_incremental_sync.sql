@@ -0,0 +1,16 @@
+-- ============================================================
+-- 마이그레이션: 입찰 공고 증분 동기화
+-- 키워드별 high-water mark(마지막 공고일시) + 공고 내용 해시(변경 감지)
+-- 실행 위치: Supabase Dashboard > SQL Editor
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS bid_sync_state (
+    keyword         TEXT PRIMARY KEY,
+    last_notice_at  TIMESTAMPTZ,                 -- 마지막으로 본 공고일시 (bidNtceDt)
+    covered_from    TIMESTAMPTZ,                 -- 저장본이 보장하는 가장 이른 공고일시
+    synced_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE bid_announcements ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS bid_announcements_announce_date_idx ON bid_announcements(announce_date);
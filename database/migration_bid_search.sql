@@ -0,0 +1,82 @@
+-- ============================================================
+-- 마이그레이션: 입찰 공고 전문 검색 (tsvector + trigram)
+-- 공고명/발주기관/상세내용 검색 인덱스 + 순위 검색 RPC (keyset 페이지네이션)
+-- 실행 위치: Supabase Dashboard > SQL Editor
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 어절 단위 일치 (simple 사전 — 한국어 형태소 분석 없이 공백 기준 토큰)
+ALTER TABLE bid_announcements ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(bid_title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(agency, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(content_text, '')), 'C')
+    ) STORED;
+
+-- 어절 내부 부분 일치 ("챗봇" → "챗봇구축") — trigram 대상 텍스트 (상세내용은 앞 4000자)
+ALTER TABLE bid_announcements ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (
+        lower(bid_title || ' ' || agency || ' ' || coalesce(left(content_text, 4000), ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS bid_announcements_search_tsv_idx  ON bid_announcements USING GIN (search_tsv);
+CREATE INDEX IF NOT EXISTS bid_announcements_search_trgm_idx ON bid_announcements USING GIN (search_text gin_trgm_ops);
+-- list_announcements의 ilike 필터도 인덱스 사용
+CREATE INDEX IF NOT EXISTS bid_announcements_title_trgm_idx  ON bid_announcements USING GIN (bid_title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS bid_announcements_agency_trgm_idx ON bid_announcements USING GIN (agency gin_trgm_ops);
+
+-- 순위 검색: rank DESC, bid_no ASC 정렬 / (p_after_rank, p_after_bid_no) 이후 행부터 반환
+CREATE OR REPLACE FUNCTION search_bid_announcements(
+    p_query         TEXT,
+    p_limit         INT     DEFAULT 20,
+    p_after_rank    NUMERIC DEFAULT NULL,
+    p_after_bid_no  TEXT    DEFAULT NULL,
+    p_min_budget    BIGINT  DEFAULT NULL,
+    p_bid_type      TEXT    DEFAULT NULL,
+    p_min_days      INT     DEFAULT NULL
+)
+RETURNS TABLE (
+    bid_no          TEXT,
+    bid_title       TEXT,
+    agency          TEXT,
+    bid_type        TEXT,
+    budget_amount   BIGINT,
+    announce_date   DATE,
+    deadline_date   TIMESTAMPTZ,
+    days_remaining  INTEGER,
+    rank            NUMERIC,
+    snippet         TEXT
+)
+LANGUAGE sql STABLE
+SET pg_trgm.word_similarity_threshold = 0.5
+AS $$
+    WITH q AS (
+        SELECT plainto_tsquery('simple', p_query) AS tsq,
+               lower(trim(p_query)) AS text,
+               lower(split_part(trim(p_query), ' ', 1)) AS head
+    ),
+    hits AS (
+        SELECT a.*,
+               round((
+                   ts_rank_cd(a.search_tsv, q.tsq)
+                   + 2 * word_similarity(q.text, lower(a.bid_title))
+                   + word_similarity(q.text, a.search_text)
+               )::numeric, 6) AS rank,
+               q.head
+        FROM bid_announcements a, q
+        WHERE (a.search_tsv @@ q.tsq OR q.text <% a.search_text)
+          AND (p_min_budget IS NULL OR a.budget_amount >= p_min_budget)
+          AND (p_bid_type   IS NULL OR a.bid_type = p_bid_type)
+          AND (p_min_days   IS NULL OR a.days_remaining >= p_min_days)
+    )
+    SELECT h.bid_no, h.bid_title, h.agency, h.bid_type, h.budget_amount,
+           h.announce_date, h.deadline_date, h.days_remaining, h.rank,
+           substr(h.content_text, greatest(strpos(lower(h.content_text), h.head) - 60, 1), 240) AS snippet
+    FROM hits h
+    WHERE p_after_rank IS NULL
+       OR h.rank < p_after_rank
+       OR (h.rank = p_after_rank AND h.bid_no > p_after_bid_no)
+    ORDER BY h.rank DESC, h.bid_no ASC
+    LIMIT p_limit;
+$$;
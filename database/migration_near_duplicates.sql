@@ -0,0 +1,17 @@
+-- ============================================================
+-- 마이그레이션: 근접 중복 연결 (MinHash + LSH)
+-- 문구만 바뀐 재공고 → 원 공고 bid_no, 재업로드 자료에서 추출된 거의 같은 섹션 → 원본 섹션 id
+-- 연결된 공고는 AI 분석을 생략하고 원 공고 결과를 재사용하며, 연결된 섹션은 검색에서 제외됩니다.
+-- 실행 위치: Supabase Dashboard > SQL Editor
+-- ============================================================
+
+-- 공고명 + 상세내용 MinHash 서명 (app/utils/minhash.py, 31비트 정수 128개)
+ALTER TABLE bid_announcements ADD COLUMN IF NOT EXISTS minhash INTEGER[];
+ALTER TABLE bid_announcements ADD COLUMN IF NOT EXISTS duplicate_of TEXT;
+
+CREATE INDEX IF NOT EXISTS bid_announcements_duplicate_of_idx ON bid_announcements(duplicate_of);
+
+-- 원본 섹션이 삭제되면 연결 해제 (남은 섹션이 다시 원본이 됨)
+ALTER TABLE sections ADD COLUMN IF NOT EXISTS duplicate_of UUID REFERENCES sections(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS sections_duplicate_of_idx ON sections(duplicate_of);
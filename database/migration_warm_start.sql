@@ -0,0 +1,10 @@
+-- ============================================================
+-- 마이그레이션: 제안서 웜 스타트 (반복 발주 RFP의 이전 실행 재사용)
+-- Phase 1 완료 시 RFPData MinHash 서명을 저장하고, 새 제안서는 같은 소유자/팀의
+-- 최근 완료 제안서 중 가장 비슷한 실행의 Phase 2/3 산출물을 초안으로 재사용합니다.
+-- 실행 위치: Supabase Dashboard > SQL Editor
+-- ============================================================
+
+ALTER TABLE proposals ADD COLUMN IF NOT EXISTS rfp_minhash INTEGER[];
+
+CREATE INDEX IF NOT EXISTS proposals_warm_start_idx ON proposals (owner_id, status, created_at DESC);
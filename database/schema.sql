@@ -61,11 +61,13 @@ CREATE TABLE proposals (
     win_result              TEXT CHECK (win_result IN ('won', 'lost', 'pending')),  -- 설계 명세 CHECK 추가
     bid_amount              BIGINT,
     notes                   TEXT,
+    rfp_minhash             INTEGER[],  -- RFPData MinHash 서명 (웜 스타트 유사 실행 검색)
     created_at              TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at              TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
 CREATE INDEX proposals_title_trgm ON proposals USING GIN (title gin_trgm_ops);
+CREATE INDEX proposals_warm_start_idx ON proposals (owner_id, status, created_at DESC);
 ALTER TABLE proposals REPLICA IDENTITY FULL;
 
 -- proposal_phases
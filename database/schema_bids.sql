@@ -4,6 +4,8 @@
 -- 의존성: teams 테이블 (schema.sql 또는 supabase_schema.sql)
 -- 적용 순서: schema.sql → schema_bids.sql
 
+CREATE EXTENSION IF NOT EXISTS pg_trgm;  -- 공고 부분 일치 검색 (trigram)
+
 -- ── 1. 입찰 공고 원문 (전역 캐시, 팀 구분 없음) ──────────────
 
 CREATE TABLE IF NOT EXISTS bid_announcements (
@@ -19,6 +21,17 @@ CREATE TABLE IF NOT EXISTS bid_announcements (
     content_text            TEXT,                          -- 공고 상세내용 (규격서, 자격요건)
     qualification_available BOOLEAN NOT NULL DEFAULT true, -- 자격요건 텍스트 확보 여부
     raw_data                JSONB,                         -- API 원본 응답
+    content_hash            TEXT,                          -- 목록 필드 + 상세내용 해시 (증분 동기화 변경 감지)
+    search_tsv              tsvector GENERATED ALWAYS AS ( -- 어절 단위 전문 검색 (simple 사전)
+                                setweight(to_tsvector('simple', coalesce(bid_title, '')), 'A') ||
+                                setweight(to_tsvector('simple', coalesce(agency, '')), 'B') ||
+                                setweight(to_tsvector('simple', coalesce(content_text, '')), 'C')
+                            ) STORED,
+    search_text             TEXT GENERATED ALWAYS AS (     -- 어절 내부 부분 일치용 trigram 대상
+                                lower(bid_title || ' ' || agency || ' ' || coalesce(left(content_text, 4000), ''))
+                            ) STORED,
+    minhash                 INTEGER[],                     -- 공고명 + 상세내용 MinHash 서명 (재공고 탐지)
+    duplicate_of            TEXT,                          -- 근접 중복(재공고)이면 원 공고 bid_no
     fetched_at              TIMESTAMPTZ NOT NULL DEFAULT now(),
     created_at              TIMESTAMPTZ NOT NULL DEFAULT now()
 );
@@ -27,6 +40,75 @@ CREATE INDEX IF NOT EXISTS bid_announcements_deadline_idx  ON bid_announcements(
 CREATE INDEX IF NOT EXISTS bid_announcements_bid_type_idx  ON bid_announcements(bid_type);
 CREATE INDEX IF NOT EXISTS bid_announcements_agency_idx    ON bid_announcements(agency);
 CREATE INDEX IF NOT EXISTS bid_announcements_fetched_at_idx ON bid_announcements(fetched_at);
+CREATE INDEX IF NOT EXISTS bid_announcements_announce_date_idx ON bid_announcements(announce_date);
+CREATE INDEX IF NOT EXISTS bid_announcements_search_tsv_idx  ON bid_announcements USING GIN (search_tsv);
+CREATE INDEX IF NOT EXISTS bid_announcements_search_trgm_idx ON bid_announcements USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS bid_announcements_title_trgm_idx  ON bid_announcements USING GIN (bid_title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS bid_announcements_agency_trgm_idx ON bid_announcements USING GIN (agency gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS bid_announcements_duplicate_of_idx ON bid_announcements(duplicate_of);
+
+-- 순위 검색: rank DESC, bid_no ASC 정렬 / (p_after_rank, p_after_bid_no) 이후 행부터 반환
+CREATE OR REPLACE FUNCTION search_bid_announcements(
+    p_query         TEXT,
+    p_limit         INT     DEFAULT 20,
+    p_after_rank    NUMERIC DEFAULT NULL,
+    p_after_bid_no  TEXT    DEFAULT NULL,
+    p_min_budget    BIGINT  DEFAULT NULL,
+    p_bid_type      TEXT    DEFAULT NULL,
+    p_min_days      INT     DEFAULT NULL
+)
+RETURNS TABLE (
+    bid_no          TEXT,
+    bid_title       TEXT,
+    agency          TEXT,
+    bid_type        TEXT,
+    budget_amount   BIGINT,
+    announce_date   DATE,
+    deadline_date   TIMESTAMPTZ,
+    days_remaining  INTEGER,
+    rank            NUMERIC,
+    snippet         TEXT
+)
+LANGUAGE sql STABLE
+SET pg_trgm.word_similarity_threshold = 0.5
+AS $$
+    WITH q AS (
+        SELECT plainto_tsquery('simple', p_query) AS tsq,
+               lower(trim(p_query)) AS text,
+               lower(split_part(trim(p_query), ' ', 1)) AS head
+    ),
+    hits AS (
+        SELECT a.*,
+               round((
+                   ts_rank_cd(a.search_tsv, q.tsq)
+                   + 2 * word_similarity(q.text, lower(a.bid_title))
+                   + word_similarity(q.text, a.search_text)
+               )::numeric, 6) AS rank,
+               q.head
+        FROM bid_announcements a, q
+        WHERE (a.search_tsv @@ q.tsq OR q.text <% a.search_text)
+          AND (p_min_budget IS NULL OR a.budget_amount >= p_min_budget)
+          AND (p_bid_type   IS NULL OR a.bid_type = p_bid_type)
+          AND (p_min_days   IS NULL OR a.days_remaining >= p_min_days)
+    )
+    SELECT h.bid_no, h.bid_title, h.agency, h.bid_type, h.budget_amount,
+           h.announce_date, h.deadline_date, h.days_remaining, h.rank,
+           substr(h.content_text, greatest(strpos(lower(h.content_text), h.head) - 60, 1), 240) AS snippet
+    FROM hits h
+    WHERE p_after_rank IS NULL
+       OR h.rank < p_after_rank
+       OR (h.rank = p_after_rank AND h.bid_no > p_after_bid_no)
+    ORDER BY h.rank DESC, h.bid_no ASC
+    LIMIT p_limit;
+$$;
+
+-- 키워드별 증분 동기화 상태 (high-water mark)
+CREATE TABLE IF NOT EXISTS bid_sync_state (
+    keyword         TEXT PRIMARY KEY,
+    last_notice_at  TIMESTAMPTZ,                 -- 마지막으로 본 공고일시 (bidNtceDt)
+    covered_from    TIMESTAMPTZ,                 -- 저장본이 보장하는 가장 이른 공고일시
+    synced_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
 
 -- 만료 공고 정리: deadline_date < now() - interval '7 days' 건 앱 레벨에서 주기적 삭제
 
@@ -100,6 +182,10 @@ CREATE TABLE IF NOT EXISTS bid_recommendations (
     win_probability_hint    TEXT,              -- 상/중상/중/중하/하
     recommended_action      TEXT,              -- 적극 검토/검토/보류
 
+    -- 분석 메모이제이션 키 (프로필 필드 해시 + 공고 내용 해시)
+    profile_hash TEXT,
+    content_hash TEXT,
+
     analyzed_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
     expires_at   TIMESTAMPTZ,                  -- 24h TTL
     UNIQUE(team_id, bid_no, preset_id)
@@ -110,3 +196,4 @@ CREATE INDEX IF NOT EXISTS bid_recommendations_preset_idx   ON bid_recommendatio
 CREATE INDEX IF NOT EXISTS bid_recommendations_score_idx    ON bid_recommendations(match_score DESC);
 CREATE INDEX IF NOT EXISTS bid_recommendations_expires_idx  ON bid_recommendations(expires_at);
 CREATE INDEX IF NOT EXISTS bid_recommendations_status_idx   ON bid_recommendations(qualification_status);
+CREATE INDEX IF NOT EXISTS bid_recommendations_memo_idx     ON bid_recommendations(team_id, profile_hash, bid_no);
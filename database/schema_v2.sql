@@ -16,11 +16,13 @@ CREATE TABLE IF NOT EXISTS sections (
     tags        TEXT[] DEFAULT '{}',
     is_public   BOOLEAN NOT NULL DEFAULT false,
     use_count   INT NOT NULL DEFAULT 0,
+    duplicate_of UUID REFERENCES sections(id) ON DELETE SET NULL,  -- 근접 중복이면 원본 섹션
     created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
 CREATE INDEX IF NOT EXISTS sections_category_idx ON sections(category);
+CREATE INDEX IF NOT EXISTS sections_duplicate_of_idx ON sections(duplicate_of);
 CREATE INDEX IF NOT EXISTS sections_team_idx ON sections(team_id);
 CREATE INDEX IF NOT EXISTS sections_owner_idx ON sections(owner_id);
 
@@ -2,9 +2,8 @@
 
 /**
  * F4: 새 제안서 생성 페이지
- * - 드래그앤드롭 파일 업로드 (PDF / DOCX / TXT)
+ * - 드래그앤드롭 파일 업로드 (PDF / DOCX / HWPX / HWP / TXT)
  * - 형식/크기 즉시 검증 (서버 요청 전)
- * - .hwp 업로드 시 즉시 오류 메시지
  */
 
 import { useCallback, useEffect, useRef, useState } from "react";
@@ -12,7 +11,7 @@ import { useRouter } from "next/navigation";
 import Link from "next/link";
 import { api, FormTemplate, Section } from "@/lib/api";
 
-const ALLOWED = [".pdf", ".docx", ".txt"];
+const ALLOWED = [".pdf", ".docx", ".hwpx", ".hwp", ".txt"];
 const ALLOWED_MIME = [
   "application/pdf",
   "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -22,11 +21,8 @@ const MAX_MB = 10;
 
 function validateFile(file: File): string | null {
   const ext = "." + file.name.split(".").pop()?.toLowerCase();
-  if (ext === ".hwp" || ext === ".hwpx") {
-    return "HWP 파일은 지원하지 않습니다. PDF 또는 DOCX로 변환 후 업로드해 주세요.";
-  }
   if (!ALLOWED.includes(ext) && !ALLOWED_MIME.includes(file.type)) {
-    return `지원하지 않는 파일 형식입니다. (PDF, DOCX, TXT만 가능)`;
+    return `지원하지 않는 파일 형식입니다. (PDF, DOCX, HWPX, TXT만 가능)`;
   }
   if (file.size > MAX_MB * 1024 * 1024) {
     return `파일 크기가 ${MAX_MB}MB를 초과합니다. (현재: ${(file.size / 1024 / 1024).toFixed(1)}MB)`;
@@ -182,7 +178,7 @@ export default function NewProposalPage() {
               <input
                 ref={inputRef}
                 type="file"
-                accept=".pdf,.docx,.txt"
+                accept=".pdf,.docx,.hwpx,.hwp,.txt"
                 className="hidden"
                 onChange={(e) => { const f = e.target.files?.[0]; if (f) handleFile(f); }}
               />
@@ -203,7 +199,7 @@ export default function NewProposalPage() {
                 <div>
                   <p className="text-3xl mb-2">⬆</p>
                   <p className="font-medium text-[#ededed] text-sm">파일을 드래그하거나 클릭하여 업로드</p>
-                  <p className="text-xs text-[#8c8c8c] mt-1">PDF, DOCX, TXT · 최대 10MB</p>
+                  <p className="text-xs text-[#8c8c8c] mt-1">PDF, DOCX, HWPX, TXT · 최대 10MB</p>
                 </div>
               )}
             </div>
@@ -352,6 +352,18 @@ class TestBidAnnouncements:
         assert "data" in body
         assert "meta" in body
 
+    def test_공고_검색_잘못된_커서_400(self, client_with_auth):
+        mock_client = make_supabase_mock()
+
+        with patch("app.api.routes_bids.get_async_client", AsyncMock(return_value=mock_client)):
+            res = client_with_auth.get(
+                f"/api/teams/{TEAM_ID}/bids/announcements/search",
+                params={"q": "AI", "cursor": "손상된커서"},
+                headers=AUTH_HEADERS,
+            )
+
+        assert res.status_code == 400
+
     def test_공고_상세_정상_200(self, client_with_auth):
         bid = {"bid_no": "20260001-00", "bid_title": "AI 행정 시스템", "agency": "행정안전부"}
         mock_client = make_supabase_mock(bid_data=[bid])
@@ -0,0 +1,151 @@
+"""회사 자료 일괄 수집 유닛 테스트 — ZIP 스풀, 청크 병렬 섹션 추출, 섹션 일괄 INSERT"""
+
+import io
+import json
+import zipfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.services import asset_extractor, asset_ingestion
+
+
+@pytest.fixture(autouse=True)
+def _spool_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "asset_spool_dir", str(tmp_path / "spool"))
+
+
+def _zip(entries: dict[str, bytes]) -> io.BytesIO:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+def test_ZIP_항목을_임시_파일로_풀고_지원하지_않는_형식은_건너뜀():
+    archive = _zip({"제안서/a.pdf": b"%PDF-a", "b.docx": b"docx", "readme.txt": b"x", "__MACOSX/._a.pdf": b""})
+    result = asset_ingestion.spool_uploads([(archive, "archive.zip"), (io.BytesIO(b"%PDF-c"), "c.pdf")], "u1")
+
+    assert [a.filename for a in result.assets] == ["a.pdf", "b.docx", "c.pdf"]
+    assert result.assets[0].path.read_bytes() == b"%PDF-a"
+    assert result.assets[2].storage_path == f"assets/u1/{result.assets[2].asset_id}.pdf"
+    assert result.skipped == [{"filename": "readme.txt", "reason": "PDF/DOCX가 아님"}]
+
+
+def test_크기_초과는_건너뛰고_파일_수_초과는_오류(monkeypatch):
+    monkeypatch.setattr(settings, "asset_bulk_max_file_mb", 1)
+    big = io.BytesIO(b"0" * (1024 * 1024 + 1))
+    result = asset_ingestion.spool_uploads([(big, "big.pdf")], "u1")
+    assert result.assets == [] and "초과" in result.skipped[0]["reason"]
+
+    monkeypatch.setattr(settings, "asset_bulk_max_files", 1)
+    with pytest.raises(asset_ingestion.BulkUploadError):
+        asset_ingestion.spool_uploads([(io.BytesIO(b"a"), "a.pdf"), (io.BytesIO(b"b"), "b.pdf")], "u1")
+    assert list(Path(settings.asset_spool_dir).iterdir()) == []
+
+
+async def test_장문은_청크별로_병렬_추출하고_같은_제목은_병합(monkeypatch):
+    monkeypatch.setattr(settings, "asset_chunk_chars", 50)
+    text = "\n\n".join(["가" * 40, "나" * 40, "다" * 40])
+    replies = iter([
+        [{"title": "회사 소개", "category": "company_intro", "content": "짧음"}],
+        [{"title": "회사  소개", "category": "company_intro", "content": "더 긴 회사 소개"},
+         {"title": "방법론", "category": "methodology", "content": "절차"}],
+        [],
+    ])
+    prompts = []
+
+    async def create(**kwargs):
+        prompts.append(kwargs["messages"][0]["content"])
+        resp = MagicMock()
+        resp.content = [MagicMock(text=json.dumps(next(replies), ensure_ascii=False))]
+        resp.usage = MagicMock(input_tokens=1, output_tokens=1)
+        return resp
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    with patch("app.services.asset_extractor.create_anthropic_client", return_value=client):
+        sections = await asset_extractor.generate_sections(text, "a.pdf")
+
+    assert len(prompts) == 3 and "문서 일부 1/3" in prompts[0]
+    assert [(s["title"], s["content"]) for s in sections] == [("회사  소개", "더 긴 회사 소개"), ("방법론", "절차")]
+
+
+async def test_일괄_처리는_섹션을_한_번에_INSERT하고_자료별_상태_갱신():
+    spooled = asset_ingestion.spool_uploads(
+        [(io.BytesIO(b"%PDF-a"), "a.pdf"), (io.BytesIO(b"%PDF-b"), "b.pdf")], "u1"
+    )
+    ok, broken = spooled.assets
+
+    async def rows(asset_id, owner_id, team_id, content, file_type, filename):
+        if asset_id == broken.asset_id:
+            raise RuntimeError("추출 실패")
+        return asset_extractor.section_rows(
+            [{"title": "소개", "category": "company_intro", "content": "본문"}], asset_id, owner_id, team_id
+        )
+
+    sections_table, assets_table = MagicMock(), MagicMock()
+    sections_table.insert.return_value.execute = AsyncMock()
+    assets_table.update.return_value.eq.return_value.execute = AsyncMock()
+    db = MagicMock()
+    db.table = MagicMock(side_effect=lambda name: sections_table if name == "sections" else assets_table)
+    db.storage.from_.return_value.upload = AsyncMock()
+
+    with patch("app.services.asset_ingestion.get_async_client", AsyncMock(return_value=db)), \
+         patch("app.services.asset_extractor.get_async_client", AsyncMock(return_value=db)), \
+         patch("app.services.asset_ingestion.extract_section_rows", side_effect=rows), \
+         patch("app.services.asset_extractor.index_section", AsyncMock()):
+        await asset_ingestion.ingest_assets(spooled.assets, "u1", "t1")
+
+    assert sections_table.insert.call_count == 1
+    inserted = sections_table.insert.call_args.args[0]
+    assert [r["source_asset_id"] for r in inserted] == [ok.asset_id]
+    updates = [c.args[0] for c in assets_table.update.call_args_list]
+    assert {"status": "done", "extracted_sections": [inserted[0]["id"]]} in updates
+    assert {"status": "failed"} in updates
+    assert not ok.path.exists() and not broken.path.exists()
+
+
+async def test_일괄_INSERT_실패_시_자료별로_다시_저장해_실패_자료만_failed():
+    spooled = asset_ingestion.spool_uploads(
+        [(io.BytesIO(b"%PDF-a"), "a.pdf"), (io.BytesIO(b"%PDF-b"), "b.pdf"), (io.BytesIO(b"%PDF-c"), "c.pdf")], "u1"
+    )
+    first, bad, last = spooled.assets
+
+    async def rows(asset_id, owner_id, team_id, content, file_type, filename):
+        body = "잘못된 행" if asset_id == bad.asset_id else f"본문 {filename}"
+        return asset_extractor.section_rows(
+            [{"title": "소개", "category": "company_intro", "content": body}], asset_id, owner_id, team_id
+        )
+
+    inserts: list[list[dict]] = []
+
+    async def insert_execute(batch):
+        inserts.append(batch)
+        if any(r["content"] == "잘못된 행" for r in batch):
+            raise RuntimeError("violates check constraint")
+
+    sections_table, assets_table = MagicMock(), MagicMock()
+    sections_table.insert.side_effect = lambda batch: MagicMock(execute=lambda: insert_execute(batch))
+    assets_table.update.return_value.eq.return_value.execute = AsyncMock()
+    db = MagicMock()
+    db.table = MagicMock(side_effect=lambda name: sections_table if name == "sections" else assets_table)
+    db.storage.from_.return_value.upload = AsyncMock()
+
+    with patch("app.services.asset_ingestion.get_async_client", AsyncMock(return_value=db)), \
+         patch("app.services.asset_extractor.get_async_client", AsyncMock(return_value=db)), \
+         patch("app.services.asset_ingestion.extract_section_rows", side_effect=rows), \
+         patch("app.services.asset_extractor.index_section", AsyncMock()):
+        await asset_ingestion.ingest_assets(spooled.assets, "u1", "t1")
+
+    assert [len(batch) for batch in inserts] == [3, 1, 1, 1]
+    ids = [c.args[1] for c in assets_table.update.return_value.eq.call_args_list]
+    final = {
+        asset_id: c.args[0]["status"]
+        for asset_id, c in zip(ids, assets_table.update.call_args_list) if c.args[0]["status"] != "processing"
+    }
+    assert final == {first.asset_id: "done", bad.asset_id: "failed", last.asset_id: "done"}
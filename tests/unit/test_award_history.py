@@ -0,0 +1,98 @@
+"""낙찰 이력 로컬 저장소 유닛 테스트 — 파싱, 집계, 증분 적재, 경쟁사 분석 로컬 조회 (G2B 호출 Mock)"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import award_history, g2b_service
+from app.services.award_history import AwardHistoryStore, AwardRecord, parse_award, sync_keyword
+from app.services.g2b_service import G2BService
+
+
+def _award(bid_no: str, winner: str, ratio: float = 0.88, amount: int = 100_000_000, **kwargs) -> AwardRecord:
+    return AwardRecord(bid_no=bid_no, winner=winner, ratio=ratio, amount=amount,
+                       agency=kwargs.pop("agency", "행정안전부"), category="용역",
+                       awarded_on=kwargs.pop("awarded_on", "2026-05-01"), **kwargs)
+
+
+def _row(n: int, winner: str = "가나소프트") -> dict:
+    return {"bidNtceNo": f"2026{n:05d}", "sucsfBidderNm": winner, "sucsfBidAmt": "88,000,000",
+            "sucsfbidRate": "88.1", "dminsttNm": "행정안전부", "rlOpengDt": "2026-05-01 10:00:00"}
+
+
+def test_낙찰결과_행을_정규화하고_업체명_없는_행은_제외():
+    record = parse_award({**_row(1), "bidNtceNm": "챗봇 구축", "bsnsDivNm": "용역"})
+
+    assert record == AwardRecord(
+        bid_no="202600001", winner="가나소프트", title="챗봇 구축", agency="행정안전부", category="용역",
+        amount=88_000_000, ratio=pytest.approx(0.881), awarded_on="2026-05-01",
+    )
+    assert parse_award({"bidNtceNo": "X", "sucsfBidderNm": ""}) is None
+
+
+def test_적재_시_업체별_집계를_갱신하고_키워드별로_조회():
+    store = AwardHistoryStore(":memory:")
+    assert store.add("챗봇", [_award("1", "A", 0.87), _award("2", "A", 0.89), _award("3", "B")]) == 3
+    assert store.add("챗봇", [_award("1", "A", 0.87)]) == 0
+    store.add("플랫폼", [_award("9", "B", agency="조달청"), _award("8", "B", agency="조달청", awarded_on="2020-01-01")])
+
+    rows, totals = store.competitors("챗봇", since="2025-01-01")
+    assert [(r["winner"], r["wins"], r["total_wins"]) for r in rows] == [("A", 2, 2), ("B", 1, 3)]
+    assert round(rows[0]["avg_ratio"], 4) == 0.88 and rows[1]["main_agency"] == "조달청"
+    assert totals == {"awards": 3, "bids": 3, "amount": 300_000_000}
+
+    stats = store.stats(agency="행정안전부")
+    assert stats["competitors"] == 2 and stats["wins"] == 3 and stats["avg_ratio"] == 0.88
+    assert store.stats(winner="B")["last_award"] == "2026-05-01"
+    assert sorted(store.ratios("챗봇")) == [0.87, 0.88, 0.89]
+
+
+async def test_증분_적재는_새_낙찰이_없는_페이지에서_중단():
+    store = AwardHistoryStore(":memory:")
+    pages = {1: [_row(i) for i in range(100)], 2: [_row(i) for i in range(100, 130)]}
+    g2b = MagicMock()
+    g2b.get_bid_results = AsyncMock(side_effect=lambda kw, num_of_rows, page_no: pages.get(page_no, []))
+
+    assert await sync_keyword(g2b, "챗봇", store) == 130
+    assert g2b.get_bid_results.await_count == 2
+    assert store.is_fresh("챗봇", max_age_hours=1)
+
+    g2b.get_bid_results.reset_mock()
+    assert await sync_keyword(g2b, "챗봇", store) == 0
+    assert g2b.get_bid_results.await_count == 1
+
+
+async def test_경쟁사_분석은_로컬_이력으로_응답하고_업체_이력_API를_호출하지_않음():
+    store = AwardHistoryStore(":memory:")
+    g2b = G2BService()
+    g2b.get_bid_results = AsyncMock(return_value=[_row(1, "가나소프트"), _row(2, "가나소프트"), _row(3, "다라")])
+    g2b.search_bid_announcements = AsyncMock()
+    g2b.get_company_bid_history = AsyncMock()
+
+    with patch.object(award_history, "award_store", store), patch.object(g2b_service, "award_store", store):
+        result = await g2b.search_competitors("AI 챗봇 구축", max_competitors=5)
+        again = await g2b.search_competitors("AI 챗봇 구축", max_competitors=5)
+
+    assert result["source"] == "local" and again == result
+    assert g2b.get_bid_results.await_count == 1
+    g2b.search_bid_announcements.assert_not_awaited()
+    g2b.get_company_bid_history.assert_not_awaited()
+    top = result["competitors"][0]
+    assert (top["company_name"], top["win_count"], top["market_share"], top["avg_bid_ratio"]) == (
+        "가나소프트", 2, 0.6667, 0.881
+    )
+
+
+async def test_동기화_실패_시_G2B_직접_조회로_대체():
+    store = AwardHistoryStore(":memory:")
+    g2b = G2BService()
+    g2b.get_bid_results = AsyncMock(side_effect=[RuntimeError("G2B_API_KEY"), [_row(1)]])
+    g2b.search_bid_announcements = AsyncMock(return_value=[])
+    g2b.get_company_bid_history = AsyncMock(return_value=[{}, {}])
+
+    with patch.object(award_history, "award_store", store), patch.object(g2b_service, "award_store", store):
+        result = await g2b.search_competitors("AI 챗봇 구축")
+
+    assert result["source"] == "api"
+    assert result["competitors"][0]["bid_history_count"] == 2
+    assert not store.is_fresh("AI", max_age_hours=1)
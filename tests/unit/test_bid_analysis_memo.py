@@ -0,0 +1,197 @@
+"""입찰 분석 메모이제이션 유닛 테스트 — 프로필/공고 해시가 같으면 Claude 재분석 생략"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.api import routes_bids
+from app.models.bid_schemas import (
+    BidAnnouncement,
+    BidRecommendation,
+    QualificationResult,
+    SearchPreset,
+    TeamBidProfile,
+)
+from app.services.bid_recommender import QUALIFICATION_ERROR_NOTE, BidRecommender
+
+PROFILE = TeamBidProfile(team_id="team-1", expertise_areas=["AI"], tech_keywords=["LLM"])
+PRESET = SearchPreset(id="preset-2", team_id="team-1", name="AI", keywords=["AI"])
+
+
+def _bid(bid_no: str, content: str = "자격요건") -> BidAnnouncement:
+    return BidAnnouncement(bid_no=bid_no, bid_title=f"공고 {bid_no}", agency="기관", content_text=content)
+
+
+class _Query:
+    """Supabase 쿼리 체인 Mock — 메서드 호출을 기록하고 execute()에서 data 반환"""
+
+    def __init__(self, data=None):
+        self.data = data or []
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    async def execute(self):
+        return MagicMock(data=self.data)
+
+
+def _memo_row(bid: BidAnnouncement, profile_hash: str, content_hash: str | None = None) -> dict:
+    return {
+        "bid_no": bid.bid_no,
+        "profile_hash": profile_hash,
+        "content_hash": content_hash or BidRecommender.bid_fingerprint(bid),
+        "qualification_status": "pass",
+        "match_score": 88,
+        "match_grade": "A",
+        "recommendation_summary": "이전 분석",
+        "recommendation_reasons": [{"category": "기술", "reason": "부합", "strength": "high"}],
+        "risk_factors": [],
+        "win_probability_hint": "중상",
+        "recommended_action": "적극 검토",
+    }
+
+
+def test_프로필_해시는_분석_필드만_반영():
+    rec = BidRecommender.__new__(BidRecommender)
+    same = PROFILE.model_copy(update={"team_id": "다른 팀"})
+    changed = PROFILE.model_copy(update={"tech_keywords": ["LLM", "RAG"]})
+    assert rec.profile_fingerprint(PROFILE) == rec.profile_fingerprint(same)
+    assert rec.profile_fingerprint(PROFILE) != rec.profile_fingerprint(changed)
+    assert BidRecommender.bid_fingerprint(_bid("1")) != BidRecommender.bid_fingerprint(_bid("1", "변경"))
+
+
+async def test_변경_없는_공고는_메모_재사용_신규만_분석():
+    unchanged, edited, new = _bid("001"), _bid("002", "정정 공고"), _bid("003")
+    with patch("app.services.bid_recommender.AsyncAnthropic"):
+        profile_hash = BidRecommender().profile_fingerprint(PROFILE)
+    memo = _Query([
+        _memo_row(unchanged, profile_hash),
+        _memo_row(edited, profile_hash, content_hash="이전-내용-해시"),
+    ])
+    upsert = _Query()
+    client = MagicMock()
+    client.table = MagicMock(side_effect=lambda name: memo if not memo.calls else upsert)
+
+    analyzed = []
+
+    async def analyze(profile, bids, top_n=20):
+        analyzed.extend(b.bid_no for b in bids)
+        quals = [QualificationResult(bid_no=b.bid_no, qualification_status="ambiguous") for b in bids]
+        return [], quals
+
+    fetcher = MagicMock()
+    fetcher.fetch_bids_by_preset = AsyncMock(return_value=[unchanged, edited, new])
+    g2b = MagicMock()
+    g2b.__aenter__ = AsyncMock(return_value=g2b)
+    g2b.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.api.routes_bids.get_async_client", AsyncMock(return_value=client)),
+        patch("app.api.routes_bids.G2BService", return_value=g2b),
+        patch("app.api.routes_bids.BidFetcher", return_value=fetcher),
+        patch("app.services.bid_recommender.AsyncAnthropic"),
+        patch.object(BidRecommender, "analyze_bids", side_effect=analyze),
+    ):
+        await routes_bids._run_fetch_and_analyze("team-1", PRESET, PROFILE)
+
+    assert analyzed == ["002", "003"]
+    assert ("eq", ("profile_hash", profile_hash)) in memo.calls
+    rows = next(args[0] for name, args in upsert.calls if name == "upsert")
+    by_no = {r["bid_no"]: r for r in rows}
+    assert by_no["001"]["match_score"] == 88 and by_no["001"]["preset_id"] == "preset-2"
+    assert by_no["002"]["qualification_status"] == "ambiguous"
+    assert by_no["001"]["profile_hash"] == profile_hash
+    assert by_no["001"]["content_hash"] == BidRecommender.bid_fingerprint(unchanged)
+    # 점수 없이 끝난 ambiguous 공고는 메모 키를 남기지 않음 (다음 수집에서 재분석)
+    assert by_no["002"]["profile_hash"] is None and by_no["002"]["content_hash"] is None
+
+
+async def test_오류_임시_결과와_점수_없는_통과_공고는_재사용하지_않음():
+    errored, unscored, failed = _bid("001"), _bid("002"), _bid("003")
+    with patch("app.services.bid_recommender.AsyncAnthropic"):
+        profile_hash = BidRecommender().profile_fingerprint(PROFILE)
+    memo = _Query([
+        {**_memo_row(errored, profile_hash), "qualification_status": "ambiguous",
+         "qualification_notes": QUALIFICATION_ERROR_NOTE, "match_score": None},
+        {**_memo_row(unscored, profile_hash), "match_score": None, "recommendation_reasons": None},
+        {**_memo_row(failed, profile_hash), "qualification_status": "fail", "match_score": None},
+    ])
+    upsert = _Query()
+    client = MagicMock()
+    client.table = MagicMock(side_effect=lambda name: memo if not memo.calls else upsert)
+
+    analyzed = []
+
+    async def analyze(profile, bids, top_n=20):
+        analyzed.extend(b.bid_no for b in bids)
+        quals = [
+            QualificationResult(
+                bid_no="001", qualification_status="ambiguous", qualification_notes=QUALIFICATION_ERROR_NOTE
+            ),
+            QualificationResult(bid_no="002", qualification_status="pass"),
+        ]
+        recs = [BidRecommendation(
+            bid_no="002", match_score=75, match_grade="B", recommendation_summary="재분석",
+            recommendation_reasons=[{"category": "기술", "reason": "부합", "strength": "high"}],
+            win_probability_hint="중", recommended_action="검토",
+        )]
+        return recs, quals
+
+    fetcher = MagicMock()
+    fetcher.fetch_bids_by_preset = AsyncMock(return_value=[errored, unscored, failed])
+    g2b = MagicMock()
+    g2b.__aenter__ = AsyncMock(return_value=g2b)
+    g2b.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.api.routes_bids.get_async_client", AsyncMock(return_value=client)),
+        patch("app.api.routes_bids.G2BService", return_value=g2b),
+        patch("app.api.routes_bids.BidFetcher", return_value=fetcher),
+        patch("app.services.bid_recommender.AsyncAnthropic"),
+        patch.object(BidRecommender, "analyze_bids", side_effect=analyze),
+    ):
+        await routes_bids._run_fetch_and_analyze("team-1", PRESET, PROFILE)
+
+    assert analyzed == ["001", "002"]
+    rows = {r["bid_no"]: r for r in next(args[0] for name, args in upsert.calls if name == "upsert")}
+    assert rows["001"]["profile_hash"] is None
+    assert rows["002"]["profile_hash"] == profile_hash and rows["002"]["match_score"] == 75
+    assert rows["003"]["profile_hash"] == profile_hash
+
+
+async def test_관련도_사전_필터_탈락_공고는_분석도_저장도_하지_않음(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "bid_prefilter_max_candidates", 1)
+    relevant = BidAnnouncement(bid_no="001", bid_title="AI LLM 플랫폼 구축", agency="기관", content_text="LLM")
+    unrelated = BidAnnouncement(bid_no="002", bid_title="청사 청소 용역", agency="기관", content_text="청소")
+    memo, upsert = _Query(), _Query()
+    client = MagicMock()
+    client.table = MagicMock(side_effect=lambda name: memo if not memo.calls else upsert)
+
+    checked = []
+
+    async def check(profile, bids):
+        checked.extend(b.bid_no for b in bids)
+        return [QualificationResult(bid_no=b.bid_no, qualification_status="fail") for b in bids]
+
+    fetcher = MagicMock()
+    fetcher.fetch_bids_by_preset = AsyncMock(return_value=[unrelated, relevant])
+    g2b = MagicMock()
+    g2b.__aenter__ = AsyncMock(return_value=g2b)
+    g2b.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.api.routes_bids.get_async_client", AsyncMock(return_value=client)),
+        patch("app.api.routes_bids.G2BService", return_value=g2b),
+        patch("app.api.routes_bids.BidFetcher", return_value=fetcher),
+        patch("app.services.bid_recommender.AsyncAnthropic"),
+        patch.object(BidRecommender, "check_qualifications", side_effect=check),
+    ):
+        await routes_bids._run_fetch_and_analyze("team-1", PRESET, PROFILE)
+
+    assert checked == ["001"]
+    rows = next(args[0] for name, args in upsert.calls if name == "upsert")
+    assert [r["bid_no"] for r in rows] == ["001"]
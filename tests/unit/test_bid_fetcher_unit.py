@@ -9,7 +9,7 @@ from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch, call
 
 from app.models.bid_schemas import BidAnnouncement, SearchPreset
-from app.services.bid_fetcher import BidFetcher
+from app.services.bid_fetcher import KST, BidFetcher, parse_g2b_datetime
 
 
 # ─────────────────────────────────────────────────────────────
@@ -351,3 +351,129 @@ class TestExtractContentText:
         fetcher = make_fetcher()
         detail = {"specDocCn": "스펙 문서 내용"}
         assert fetcher._extract_content_text(detail) == "스펙 문서 내용"
+
+
+# ─────────────────────────────────────────────────────────────
+# 증분 동기화 — high-water mark + 변경 감지
+# ─────────────────────────────────────────────────────────────
+
+class _Query:
+    """Supabase 쿼리 체인 Mock — 호출 기록 + execute()에서 data 반환"""
+
+    def __init__(self, data=None):
+        self.data = data or []
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    async def execute(self):
+        return MagicMock(data=self.data)
+
+
+class TestIncrementalSync:
+
+    def _db(self, marks=None, stored=None):
+        tables = {
+            "bid_sync_state": _Query(marks),
+            "bid_announcements": _Query(stored),
+        }
+        db = MagicMock()
+        db.table = MagicMock(side_effect=lambda name: tables[name])
+        return db, tables
+
+    def _stored_row(self, raw, content="자격요건 명세 텍스트입니다.", **override):
+        from app.services.bid_fetcher import announcement_hash
+        bid = make_fetcher()._normalize(raw).model_copy(update={"content_text": content, **override})
+        return {**bid.model_dump(mode="json"), "content_hash": announcement_hash(bid)}
+
+    def _upserts(self, query):
+        return [args[0] for name, args in query.calls if name == "upsert"]
+
+    @pytest.mark.asyncio
+    async def test_mark_이후_overlap_구간만_조회(self):
+        last = datetime.now(timezone.utc) - timedelta(hours=5)
+        covered = datetime.now(timezone.utc) - timedelta(days=30)
+        db, tables = self._db(marks=[{
+            "keyword": "AI", "last_notice_at": last.isoformat(), "covered_from": covered.isoformat(),
+        }])
+        g2b = MagicMock()
+        g2b.search_bid_announcements = AsyncMock(return_value=[])
+
+        await make_fetcher(g2b=g2b, db=db).fetch_bids_by_preset(make_preset(keywords=["AI"]), incremental=True)
+
+        date_from = g2b.search_bid_announcements.call_args.kwargs["date_from"]
+        expected = last - timedelta(minutes=120)
+        assert date_from == expected.astimezone(KST).strftime("%Y%m%d%H%M%S")
+
+    @pytest.mark.asyncio
+    async def test_검색_기간을_커버하지_못한_mark는_전체_기간_조회(self):
+        last = datetime.now(timezone.utc) - timedelta(hours=5)
+        covered = datetime.now(timezone.utc) - timedelta(days=3)  # 14일 기간보다 짧음
+        db, _ = self._db(marks=[{
+            "keyword": "AI", "last_notice_at": last.isoformat(), "covered_from": covered.isoformat(),
+        }])
+        g2b = MagicMock()
+        g2b.search_bid_announcements = AsyncMock(return_value=[])
+
+        await make_fetcher(g2b=g2b, db=db).fetch_bids_by_preset(make_preset(keywords=["AI"]), incremental=True)
+
+        date_from = datetime.strptime(
+            g2b.search_bid_announcements.call_args.kwargs["date_from"], "%Y%m%d%H%M%S"
+        ).replace(tzinfo=KST)
+        assert datetime.now(timezone.utc) - date_from > timedelta(days=13)
+
+    @pytest.mark.asyncio
+    async def test_변경_없는_공고는_상세조회_upsert_생략_저장본과_합쳐_반환(self):
+        unchanged, edited, new = make_raw("001"), make_raw("002"), make_raw("003")
+        old_only = make_raw("004", bid_title="AI 예전 공고")
+        db, tables = self._db(stored=[
+            self._stored_row(unchanged),
+            self._stored_row(edited, bid_title="AI 행정 시스템 (정정 전)"),
+            self._stored_row(old_only),
+        ])
+        g2b = MagicMock()
+        g2b.search_bid_announcements = AsyncMock(return_value=[unchanged, edited, new])
+        g2b.get_bid_detail = AsyncMock(return_value={"ntceSpecCn": "새 자격요건 명세 텍스트입니다."})
+
+        result = await make_fetcher(g2b=g2b, db=db).fetch_bids_by_preset(
+            make_preset(keywords=["AI"]), incremental=True
+        )
+
+        assert sorted(b.bid_no for b in result) == ["001", "002", "003", "004"]
+        detail_nos = [c.args[0] for c in g2b.get_bid_detail.call_args_list]
+        assert detail_nos == ["002", "003"]
+        upserted = self._upserts(tables["bid_announcements"])
+        assert [r["bid_no"] for r in upserted[0]] == ["002", "003"]
+        assert next(b for b in result if b.bid_no == "001").content_text == "자격요건 명세 텍스트입니다."
+
+        marks = self._upserts(tables["bid_sync_state"])[0]
+        assert marks[0]["keyword"] == "AI" and marks[0]["last_notice_at"]
+
+    @pytest.mark.asyncio
+    async def test_증분_동기화는_필터_탈락_공고도_저장하고_반환에서만_제외(self):
+        """공유 mark를 올리므로 조건이 더 느슨한 팀이 저장본에서 읽을 수 있어야 함"""
+        small = make_raw("001", budget="50000000")  # min_budget 1억 미만
+        goods = make_raw("002", bid_type="물품")
+        ok = make_raw("003")
+        db, tables = self._db()
+        g2b = MagicMock()
+        g2b.search_bid_announcements = AsyncMock(return_value=[small, goods, ok])
+        g2b.get_bid_detail = AsyncMock(return_value={"ntceSpecCn": "자격요건 명세 텍스트입니다."})
+
+        result = await make_fetcher(g2b=g2b, db=db).fetch_bids_by_preset(
+            make_preset(keywords=["AI"]), incremental=True
+        )
+
+        assert [b.bid_no for b in result] == ["003"]
+        upserted = self._upserts(tables["bid_announcements"])
+        assert sorted(r["bid_no"] for r in upserted[0]) == ["001", "002", "003"]
+
+
+def test_나라장터_일시는_KST로_해석():
+    parsed = parse_g2b_datetime("2026/03/20 18:00:00")
+    assert parsed.utcoffset() == timedelta(hours=9)
+    assert parsed.astimezone(timezone.utc).hour == 9
@@ -0,0 +1,135 @@
+"""공용 공고 수집 워커 유닛 테스트 — 키워드 합집합 동기화, 팀별 로컬 조회"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.bid_schemas import BidAnnouncement, SearchPreset
+from app.services import bid_ingestion
+from app.services.bid_fetcher import BidFetcher, BidFilter
+
+
+def _preset(pid: str, keywords: list[str], **kwargs) -> SearchPreset:
+    return SearchPreset(id=pid, team_id=f"team-{pid}", name=pid, keywords=keywords, is_active=True, **kwargs)
+
+
+class _Query:
+    """Supabase 쿼리 체인 Mock — 메서드 호출을 기록하고 execute()에서 data 반환"""
+
+    def __init__(self, data=None):
+        self.data = data or []
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    async def execute(self):
+        return MagicMock(data=self.data)
+
+
+def _db(marks=None, stored=None):
+    tables = {"bid_sync_state": _Query(marks), "bid_announcements": _Query(stored)}
+    db = MagicMock()
+    db.table = MagicMock(side_effect=lambda name: tables[name])
+    return db
+
+
+def _mark(keyword: str, synced_minutes_ago: int, covered_days: int = 30) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "keyword": keyword,
+        "last_notice_at": now.isoformat(),
+        "covered_from": (now - timedelta(days=covered_days)).isoformat(),
+        "synced_at": (now - timedelta(minutes=synced_minutes_ago)).isoformat(),
+    }
+
+
+def _stored(bid_no: str, title: str, budget: int = 300_000_000) -> dict:
+    deadline = datetime.now(timezone.utc) + timedelta(days=10)
+    bid = BidAnnouncement(
+        bid_no=bid_no, bid_title=title, agency="행정안전부", bid_type="용역",
+        budget_amount=budget, deadline_date=deadline,
+    )
+    return {**bid.model_dump(mode="json"), "content_hash": "h"}
+
+
+def test_수집_계획은_키워드_합집합_최장_기간_느슨한_필터():
+    presets = [
+        _preset("a", ["AI", "플랫폼"], min_budget=200_000_000, announce_date_range_days=14),
+        _preset("b", ["AI", "LLM"], min_budget=50_000_000, bid_types=["용역", "물품"], announce_date_range_days=30),
+    ]
+    keywords, range_days, flt = bid_ingestion.ingestion_plan(presets)
+    assert keywords == ["AI", "플랫폼", "LLM"]
+    assert range_days == 30
+    assert flt == BidFilter(frozenset({"용역", "물품"}), 50_000_000, 5)
+
+
+async def test_최근_동기화된_키워드는_G2B_없이_로컬_조회():
+    db = _db(
+        marks=[_mark("AI", 10)],
+        stored=[_stored("001", "AI 행정 시스템"), _stored("002", "AI 소규모", budget=1_000_000)],
+    )
+    g2b = MagicMock()
+    g2b.search_bid_announcements = AsyncMock()
+    preset = _preset("a", ["AI"])
+
+    result = await BidFetcher(g2b, db).fetch_bids_by_preset(preset, incremental=True, prefer_local=True)
+
+    assert [b.bid_no for b in result] == ["001"]
+    g2b.search_bid_announcements.assert_not_awaited()
+
+
+async def test_로컬_조회는_저장_공고를_페이지_단위로_모두_읽음():
+    pages = [
+        [_stored(f"F{i:04d}", f"AI 공고 {i}") for i in range(1000)],
+        [_stored("LAST", "AI 마지막 공고")],
+    ]
+    db = _db(marks=[_mark("AI", 10)])
+    stored = db.table("bid_announcements")
+    stored.execute = AsyncMock(side_effect=lambda: MagicMock(data=pages.pop(0)))
+
+    result = await BidFetcher(MagicMock(), db).load_local_bids(_preset("a", ["AI"]))
+
+    assert len(result) == 1001 and "LAST" in {b.bid_no for b in result}
+    assert [args for name, args in stored.calls if name == "range"] == [(0, 999), (1000, 1999)]
+
+
+async def test_동기화가_오래되었거나_없는_키워드가_있으면_G2B_조회():
+    preset = _preset("a", ["AI", "LLM"])
+    stale = BidFetcher(MagicMock(), _db(marks=[_mark("AI", 10), _mark("LLM", 600)]))
+    missing = BidFetcher(MagicMock(), _db(marks=[_mark("AI", 10)]))
+    assert await stale.load_local_bids(preset) is None
+    assert await missing.load_local_bids(preset) is None
+
+    short = BidFetcher(MagicMock(), _db(marks=[_mark("AI", 10, covered_days=3)]))
+    assert await short.load_local_bids(_preset("b", ["AI"])) is None
+
+
+async def test_워커는_활성_프리셋_키워드를_한_번에_동기화():
+    presets = _Query([
+        _preset("a", ["AI", "플랫폼"]).model_dump(mode="json"),
+        _preset("b", ["AI"], announce_date_range_days=30).model_dump(mode="json"),
+    ])
+    client = MagicMock()
+    client.table = MagicMock(return_value=presets)
+    fetcher = MagicMock()
+    fetcher.sync_keywords = AsyncMock(return_value=[MagicMock(), MagicMock()])
+    g2b = MagicMock()
+    g2b.__aenter__ = AsyncMock(return_value=g2b)
+    g2b.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.services.bid_ingestion.get_async_client", AsyncMock(return_value=client)),
+        patch("app.services.bid_ingestion.G2BService", return_value=g2b),
+        patch("app.services.bid_ingestion.BidFetcher", return_value=fetcher),
+    ):
+        count = await bid_ingestion.BidIngestionWorker().run_once()
+
+    assert count == 2
+    assert ("eq", ("is_active", True)) in presets.calls
+    fetcher.sync_keywords.assert_awaited_once()
+    args, kwargs = fetcher.sync_keywords.call_args
+    assert args[:2] == (["AI", "플랫폼"], 30)
+    assert kwargs == {"incremental": True}
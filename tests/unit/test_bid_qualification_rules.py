@@ -0,0 +1,116 @@
+"""입찰 참가자격 규칙 판정 유닛 테스트 — 명확한 pass/fail만 확정, 나머지는 Claude로"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.bid_schemas import BidAnnouncement, TeamBidProfile
+from app.services.bid_qualification_rules import QualificationRules
+from app.services.bid_recommender import BidRecommender
+
+PROFILE = TeamBidProfile(
+    team_id="t1",
+    company_size="중기업",
+    certifications=["GS인증", "소프트웨어사업자 신고"],
+    business_registration_type="중소기업",
+    employee_count=80,
+)
+
+
+def _bid(content: str, bid_no: str = "001") -> BidAnnouncement:
+    return BidAnnouncement(bid_no=bid_no, bid_title="시스템 구축", agency="행정안전부", content_text=content)
+
+
+def _evaluate(content: str, profile: TeamBidProfile = PROFILE):
+    return QualificationRules(profile).evaluate(_bid(content))
+
+
+def test_인원_요건_미달은_fail():
+    result = _evaluate("참가자격: 상시 근로자 100명 이상인 업체")
+    assert result.qualification_status == "fail"
+    assert "100명" in result.disqualification_reason
+
+
+def test_과업_투입_인력은_자격_요건으로_보지_않음():
+    assert _evaluate("투입 인력 100명 이상 확보 계획을 제출") is None
+
+
+def test_중소기업_제한_충족과_대기업_불충족():
+    text = "본 사업은 중소기업자간 경쟁제품으로 중소기업만 참여 가능"
+    assert _evaluate(text).qualification_status == "pass"
+
+    big = PROFILE.model_copy(update={"company_size": "대기업", "business_registration_type": None})
+    result = _evaluate(text, big)
+    assert result.qualification_status == "fail"
+    assert "대기업" in result.disqualification_reason
+
+
+def test_필수_인증_보유_여부():
+    assert _evaluate("소프트웨어사업자로 등록한 업체, GS인증 보유").qualification_status == "pass"
+    result = _evaluate("ISO 27001 인증을 보유한 자")
+    assert result.qualification_status == "fail"
+    assert "ISO 27001" in result.disqualification_reason
+
+
+def test_인증_목록이_비어_있으면_인증_조항은_판단하지_않음():
+    empty = PROFILE.model_copy(update={"certifications": []})
+    assert _evaluate("ISO 27001 인증을 보유한 자", empty) is None
+
+
+def test_가점_우대_대기업_배제_조항은_fail로_단정하지_않음():
+    no_gs = PROFILE.model_copy(update={"certifications": ["ISO 9001"]})
+    assert _evaluate("GS인증 보유 업체는 기술평가 시 가점 부여", no_gs) is None
+    assert _evaluate("ISMS 인증을 취득한 업체 우대") is None
+    assert _evaluate("상시 근로자 수 300인 이상 기업은 참여를 제한함") is None
+
+
+def test_사업자_유형_가점_우대_조항은_fail로_단정하지_않음():
+    general = PROFILE.model_copy(update={"company_size": "중견기업", "business_registration_type": "일반법인"})
+    assert _evaluate("여성기업으로 확인받은 업체는 기술평가 시 가점을 부여", general) is None
+    assert _evaluate("사회적기업으로 인증받은 경우 우대", general) is None
+    assert _evaluate("협동조합으로 구성된 컨소시엄 가점", general) is None
+    assert _evaluate("사회적기업으로 참가를 한정함", general).qualification_status == "fail"
+
+
+def test_기업규모_제한_없음_가점_조항은_fail로_단정하지_않음():
+    midsize = PROFILE.model_copy(update={"company_size": "중견기업", "business_registration_type": "일반법인"})
+    assert _evaluate("중소기업 참가자격 제한 없음", midsize) is None
+    assert _evaluate("중소기업으로 참가 제한 업체 가점 부여", midsize) is None
+    assert _evaluate("중소기업으로 참가자격 제한", midsize).qualification_status == "fail"
+
+
+def test_필수_조항_위반은_다른_문장의_우대_조항과_무관하게_fail():
+    result = _evaluate("ISO 27001 인증을 보유한 자. GS인증 보유 업체 우대")
+    assert result.qualification_status == "fail"
+    assert "ISO 27001" in result.disqualification_reason
+
+
+def test_지역_실적_제한이_있으면_pass_확정하지_않음():
+    assert _evaluate("GS인증 보유 업체, 서울특별시 소재 업체로 지역제한") is None
+    assert _evaluate("GS인증 보유, 최근 3년 용역 실적 2건 이상") is None
+
+
+def test_조항이_없으면_Claude_판정():
+    assert _evaluate("공고 내용 요약") is None
+    assert _evaluate("") is None
+
+
+async def test_check_qualifications는_미확정_공고만_Claude로():
+    bids = [
+        _bid("상시 근로자 200명 이상", "001"),
+        _bid("사업 개요만 기재", "002"),
+        _bid("GS인증 보유 업체", "003"),
+    ]
+    with patch("app.services.bid_recommender.AsyncAnthropic"):
+        rec = BidRecommender()
+    response = MagicMock()
+    response.content = [MagicMock(text=json.dumps([{"bid_no": "002", "qualification_status": "ambiguous"}]))]
+    rec.client.messages.create = AsyncMock(return_value=response)
+
+    results = await rec.check_qualifications(PROFILE, bids)
+
+    assert rec.client.messages.create.await_count == 1
+    user = rec.client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert "bid_no: 002" in user and "bid_no: 001" not in user
+    assert [(r.bid_no, r.qualification_status) for r in results] == [
+        ("001", "fail"), ("002", "ambiguous"), ("003", "pass"),
+    ]
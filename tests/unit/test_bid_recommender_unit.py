@@ -463,3 +463,72 @@ class TestAnalyzeBidsMocked:
         user_content = scoring_call_args.kwargs["messages"][0]["content"]
         # 2건만 포함 (bid 000, 001)
         assert user_content.count("bid_no:") == 2
+
+
+# ─────────────────────────────────────────────────────────────
+# 배치 동시 실행
+# ─────────────────────────────────────────────────────────────
+
+class TestConcurrentBatches:
+    """check_qualifications / score_bids 배치 동시 실행 — 순서 유지, 동시 실행 상한, 배치별 폴백"""
+
+    def _make_rec(self, monkeypatch, concurrency=2):
+        monkeypatch.setattr("app.services.bid_recommender.settings.bid_analysis_concurrency", concurrency)
+        rec = make_recommender()
+        rec.BATCH_SIZE = 2
+        return rec
+
+    def _client(self, rec, fail_bid=None, delays=None):
+        import asyncio
+        state = {"active": 0, "peak": 0}
+
+        async def create(**kwargs):
+            content = kwargs["messages"][0]["content"]
+            nos = [line.split(": ")[1] for line in content.splitlines() if line.startswith("bid_no: ")]
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            try:
+                # 앞 배치일수록 늦게 끝나도록 지연
+                await asyncio.sleep((delays or {}).get(nos[0], 0))
+                if fail_bid in nos:
+                    raise RuntimeError("API 오류")
+                if "자격 판정" in content:
+                    payload = [{"bid_no": n, "qualification_status": "pass"} for n in nos]
+                else:
+                    payload = [{"bid_no": n, "match_score": 70} for n in nos]
+                return _make_claude_response(json.dumps(payload))
+            finally:
+                state["active"] -= 1
+
+        rec.client.messages.create = AsyncMock(side_effect=create)
+        return state
+
+    async def test_자격_판정_결과는_입력_순서대로_병합(self, monkeypatch):
+        rec = self._make_rec(monkeypatch)
+        bids = [make_bid(f"00{i}") for i in range(6)]
+        state = self._client(rec, delays={"000": 0.03, "002": 0.01})
+
+        results = await rec.check_qualifications(SAMPLE_PROFILE, bids)
+
+        assert [r.bid_no for r in results] == [b.bid_no for b in bids]
+        assert state["peak"] == 2
+
+    async def test_실패_배치만_ambiguous_나머지는_정상(self, monkeypatch):
+        rec = self._make_rec(monkeypatch, concurrency=4)
+        bids = [make_bid(f"00{i}") for i in range(6)]
+        self._client(rec, fail_bid="003")
+
+        results = await rec.check_qualifications(SAMPLE_PROFILE, bids)
+
+        status = {r.bid_no: r.qualification_status for r in results}
+        assert status["002"] == status["003"] == "ambiguous"
+        assert all(status[n] == "pass" for n in ("000", "001", "004", "005"))
+
+    async def test_점수_실패_배치는_건너뛰고_순서_유지(self, monkeypatch):
+        rec = self._make_rec(monkeypatch, concurrency=3)
+        bids = [make_bid(f"00{i}") for i in range(6)]
+        self._client(rec, fail_bid="001", delays={"002": 0.02})
+
+        results = await rec.score_bids(SAMPLE_PROFILE, bids)
+
+        assert [r.bid_no for r in results] == ["002", "003", "004", "005"]
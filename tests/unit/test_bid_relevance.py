@@ -0,0 +1,72 @@
+"""입찰 공고 로컬 관련도(BM25) 유닛 테스트 — n-gram, 순위, analyze_bids 사전 필터"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.config import settings
+from app.models.bid_schemas import BidAnnouncement, TeamBidProfile
+from app.services import bid_relevance as br
+from app.services.bid_recommender import BidRecommender
+
+PROFILE = TeamBidProfile(team_id="t1", expertise_areas=["인공지능"], tech_keywords=["챗봇", "LLM"])
+
+
+def _bid(bid_no: str, title: str, content: str = "") -> BidAnnouncement:
+    return BidAnnouncement(bid_no=bid_no, bid_title=title, agency="행정안전부", content_text=content)
+
+
+def test_어절_내부_문자_ngram():
+    assert br.char_ngrams("AI 챗봇구축") == ["ai", "챗봇", "봇구", "구축", "챗봇구", "봇구축"]
+
+
+def test_관련_공고가_먼저_정렬():
+    bids = [
+        _bid("1", "청사 시설물 유지보수 용역", "건물 설비 점검"),
+        _bid("2", "민원 상담 인공지능 챗봇 구축", "LLM 기반 상담 자동화"),
+        _bid("3", "도로 포장 공사", "아스팔트 포장"),
+        _bid("4", "홈페이지 운영", "게시판에 챗봇 안내 배너 추가"),
+    ]
+    ranked = [b.bid_no for b in br.rank_bids(PROFILE, bids)]
+    assert ranked[0] == "2"
+    assert ranked[1] == "4"
+    scores = br.score_bids(PROFILE, bids)
+    assert scores["1"] == scores["3"] == 0
+
+
+def test_질의어_없으면_수집_순서_유지():
+    bids = [_bid(str(i), f"공고 {i}") for i in range(5)]
+    empty = TeamBidProfile(team_id="t1")
+    assert [b.bid_no for b in br.rank_bids(empty, bids)] == ["0", "1", "2", "3", "4"]
+
+
+async def test_analyze_bids는_관련도_상위_후보만_분석(monkeypatch):
+    monkeypatch.setattr(settings, "bid_prefilter_max_candidates", 2)
+    bids = [
+        _bid("1", "청사 청소 용역"),
+        _bid("2", "인공지능 챗봇 구축"),
+        _bid("3", "도로 포장 공사"),
+        _bid("4", "LLM 기반 민원 챗봇 고도화"),
+    ]
+    calls = []
+
+    async def create(**kwargs):
+        content = kwargs["messages"][0]["content"]
+        nos = [line.split(": ")[1] for line in content.splitlines() if line.startswith("bid_no: ")]
+        calls.append(nos)
+        if "자격 판정" in content:
+            payload = [{"bid_no": n, "qualification_status": "pass"} for n in nos]
+        else:
+            payload = [{"bid_no": n, "match_score": 80} for n in nos]
+        resp = MagicMock()
+        resp.content = [MagicMock(text=json.dumps(payload))]
+        return resp
+
+    with patch("app.services.bid_recommender.AsyncAnthropic"):
+        rec = BidRecommender()
+    rec.client.messages.create = AsyncMock(side_effect=create)
+
+    recommendations, quals = await rec.analyze_bids(PROFILE, bids, top_n=1)
+
+    assert sorted(calls[0]) == ["2", "4"]
+    assert {q.bid_no for q in quals} == {"2", "4"}
+    assert len(recommendations) == 1 and recommendations[0].bid_no in {"2", "4"}
@@ -0,0 +1,61 @@
+"""입찰 공고 전문 검색 유닛 테스트 — keyset 커서, 하이라이트, RPC 페이지 처리"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import bid_search
+
+
+def _row(bid_no: str, rank: float, snippet: str = "") -> dict:
+    return {
+        "bid_no": bid_no, "bid_title": f"AI 챗봇 구축 {bid_no}", "agency": "행정안전부",
+        "rank": rank, "snippet": snippet,
+    }
+
+
+def _client(rows: list[dict]):
+    client = MagicMock()
+    rpc = MagicMock()
+    rpc.execute = AsyncMock(return_value=MagicMock(data=rows))
+    client.rpc = MagicMock(return_value=rpc)
+    return client
+
+
+def test_커서_왕복과_손상_커서():
+    cursor = bid_search.encode_cursor(1.234567, "20260001-00")
+    assert bid_search.decode_cursor(cursor) == (1.234567, "20260001-00")
+    with pytest.raises(bid_search.InvalidCursorError):
+        bid_search.decode_cursor("not-a-cursor")
+
+
+def test_하이라이트는_이스케이프_후_대소문자_무시_강조():
+    text = "<b>ai</b> 챗봇구축 및 AI 고도화"
+    result = bid_search.highlight(text, bid_search.query_terms("AI 챗봇"))
+    assert result == "&lt;b&gt;<mark>ai</mark>&lt;/b&gt; <mark>챗봇</mark>구축 및 <mark>AI</mark> 고도화"
+    assert bid_search.highlight("가" * 300, ["가"], max_chars=10).endswith("…")
+
+
+async def test_다음_페이지가_있으면_마지막_행_커서_반환():
+    client = _client([_row("001", 2.5, "상세 챗봇 도입"), _row("002", 1.5), _row("003", 1.0)])
+
+    result = await bid_search.search_announcements(client, "챗봇", limit=2)
+
+    params = client.rpc.call_args.args[1]
+    assert params["p_limit"] == 3 and params["p_after_rank"] is None
+    assert [r["bid_no"] for r in result["data"]] == ["001", "002"]
+    assert result["data"][0]["highlight"]["content"] == "상세 <mark>챗봇</mark> 도입"
+    assert "snippet" not in result["data"][0]
+    assert bid_search.decode_cursor(result["meta"]["next_cursor"]) == (1.5, "002")
+
+
+async def test_커서로_이어서_조회하고_마지막_페이지는_커서_없음():
+    client = _client([_row("003", 1.0)])
+    cursor = bid_search.encode_cursor(1.5, "002")
+
+    result = await bid_search.search_announcements(client, "챗봇", limit=2, cursor=cursor, bid_type="용역")
+
+    params = client.rpc.call_args.args[1]
+    assert (params["p_after_rank"], params["p_after_bid_no"]) == (1.5, "002")
+    assert params["p_bid_type"] == "용역"
+    assert result["meta"]["next_cursor"] is None
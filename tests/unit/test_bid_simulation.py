@@ -0,0 +1,79 @@
+"""입찰가 몬테카를로 시뮬레이션 유닛 테스트 — 이력 투찰률 추정, 낙찰 확률 곡선, 추천 투찰가"""
+
+import numpy as np
+import pytest
+
+from app.services.bid_calculator import BidCalculator, PersonnelInput, ProcurementMethod
+from app.services.bid_simulation import (
+    BidSimulator,
+    RatioDistribution,
+    fit_ratio_distribution,
+    history_ratio,
+    win_probability_curve,
+)
+
+
+def test_낙찰결과_행에서_낙찰률_추출():
+    assert history_ratio({"sucsfbidRate": "88.123"}) == pytest.approx(0.88123)
+    assert history_ratio({"sucsfBidAmt": "88,000,000", "presmptPrce": "100,000,000"}) == pytest.approx(0.88)
+    assert history_ratio({"sucsfBidAmt": "88,000,000"}) is None
+
+
+def test_이력이_부족하면_기본_분포_충분하면_이력으로_추정():
+    assert fit_ratio_distribution([{"sucsfbidRate": "90"}]) == RatioDistribution(samples=1)
+
+    rows = [{"sucsfbidRate": str(r)} for r in (89.0, 89.5, 90.0, 90.5, 91.0, 250.0)]
+    dist = fit_ratio_distribution(rows)
+    assert dist.samples == 5  # 250%는 이상치로 제외
+    assert dist.mean == pytest.approx(0.90, abs=0.002) and dist.std >= 0.003
+
+
+def test_하한_미만과_예정가격_초과_투찰은_낙찰_불가():
+    grid = np.array([0.80, 0.90, 0.95, 1.05])
+    probs = win_probability_curve(
+        grid, competitor_count=0, distribution=RatioDistribution(),
+        floor_rate=0.87745, reserve_range=0.02, scenarios=2000, seed=7,
+    )
+    assert probs.tolist() == [0.0, 1.0, 1.0, 0.0]
+
+
+def test_경쟁사가_많을수록_낙찰_확률_감소():
+    grid = np.array([0.885])
+    kwargs = dict(distribution=RatioDistribution(0.89, 0.01), floor_rate=0.87745,
+                  reserve_range=0.02, scenarios=5000, seed=1)
+    few = win_probability_curve(grid, competitor_count=2, **kwargs)[0]
+    many = win_probability_curve(grid, competitor_count=10, **kwargs)[0]
+    assert 0 < many < few < 1
+
+
+def test_추천_투찰가는_원가_이상에서_기대이익_최대():
+    calc = BidCalculator()
+    cost = calc.calculate_cost([PersonnelInput(role="PM", grade="특급", person_months=6)])
+    result = BidSimulator(calc).simulate(
+        cost, ProcurementMethod.ADEQUATE_REVIEW, budget=int(cost.total_cost * 1.3),
+        competitor_count=5, scenarios=3000, seed=3,
+    )
+    best = result.ratios.index(result.recommended_ratio)
+    margins = [m for m in result.expected_margin if m is not None]
+    assert result.recommended_bid >= cost.total_cost
+    assert result.expected_margin[best] == max(margins)
+    assert len(result.ratios) == len(result.win_probability)
+    assert BidSimulator.to_dict(result)["curve"][best]["ratio"] == result.recommended_ratio
+
+
+def test_종합평가는_시뮬레이션_대상이_아님():
+    calc = BidCalculator()
+    cost = calc.calculate_cost([PersonnelInput(role="PM", grade="특급", person_months=1)])
+    with pytest.raises(ValueError):
+        BidSimulator(calc).simulate(cost, ProcurementMethod.COMPREHENSIVE)
+
+
+def test_요청_경쟁사_수는_상한_이내만_허용():
+    from pydantic import ValidationError
+
+    from app.api.routes_v31 import BidCalculateRequest
+
+    assert BidCalculateRequest(personnel=[], competitor_count=100).competitor_count == 100
+    for bad in (-1, 50_000):
+        with pytest.raises(ValidationError):
+            BidCalculateRequest(personnel=[], competitor_count=bad)
@@ -0,0 +1,75 @@
+"""프롬프트 컨텍스트 패킹 유닛 테스트 — 토큰 추정, JSON 축소, 우선순위 예산 배분"""
+
+import json
+
+from app.config import settings
+from app.utils.context_packer import (
+    ContextField,
+    compact_json,
+    estimate_tokens,
+    fit_text,
+    pack_fields,
+    step_budget,
+)
+
+
+def test_한국어는_문자당_1토큰_영문은_더_적게_추정():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("제안서작성") == 5
+    assert estimate_tokens("a" * 35) == 10
+    assert estimate_tokens("가" * 100) > estimate_tokens("a" * 100)
+
+
+def test_fit_text는_예산_이내로_자르고_표시를_남김():
+    text = "\n".join(f"{i}번째 요구사항 항목입니다" for i in range(200))
+    out = fit_text(text, 300)
+    assert estimate_tokens(out) <= 300
+    assert out.endswith("…")
+    assert fit_text("짧은 글", 300) == "짧은 글"
+    assert fit_text(text, 0) == ""
+
+
+def test_compact_json은_축소해도_유효한_JSON():
+    value = {
+        "requirements": [f"요구사항 {i} " + "상세 설명 " * 50 for i in range(100)],
+        "meta": {"title": "시스템 구축", "budget": 1_000_000},
+    }
+    raw = compact_json(value, 1500)
+    assert estimate_tokens(raw) <= 1500
+    parsed = json.loads(raw)
+    assert parsed["meta"]["title"] == "시스템 구축"
+    assert parsed["requirements"][-1].startswith("…(+")
+
+
+def test_예산_이내면_원본_그대로():
+    fields = [ContextField("a", "본문"), ContextField("b", {"k": [1, 2]})]
+    assert pack_fields(fields, 1000) == {"a": "본문", "b": '{"k":[1,2]}'}
+
+
+def test_예산_초과_시_높은_우선순위부터_배분():
+    big = "가" * 5000
+    fields = [
+        ContextField("low", big, priority=3, min_tokens=100),
+        ContextField("high", big, priority=1, min_tokens=100),
+    ]
+    out = pack_fields(fields, 3000)
+    assert estimate_tokens(out["high"]) > estimate_tokens(out["low"])
+    assert estimate_tokens(out["low"]) <= 100
+    assert sum(estimate_tokens(v) for v in out.values()) <= 3000
+
+
+def test_단계_예산은_오버헤드와_전역_상한_반영(monkeypatch):
+    monkeypatch.setattr(settings, "context_budget_tokens", {"phase2": 16_000})
+    monkeypatch.setattr(settings, "max_input_tokens", 10_000)
+    assert step_budget("phase2") == 10_000
+    assert step_budget("phase2", "가" * 1000) == 9_000
+    assert step_budget("unknown") == 10_000
+
+
+def test_Phase5_평가_입력은_섹션마다_상한_이내():
+    from app.services.phase_executor import _section_previews
+
+    sections = {f"섹션{i}": "가" * 3000 for i in range(3)} | {"표": ["행"]}
+    previews = _section_previews(sections, settings.phase5_section_preview_tokens)
+    assert all(estimate_tokens(previews[f"섹션{i}"]) <= settings.phase5_section_preview_tokens for i in range(3))
+    assert previews["표"] == ["행"]
@@ -0,0 +1,61 @@
+"""file_utils 유닛 테스트 — HWPX(ZIP+XML) 추출 및 확장자 분기"""
+
+import zipfile
+
+import pytest
+
+from app.config import settings
+from app.exceptions import FileProcessingError
+from app.utils.file_utils import extract_text_from_file, extract_text_from_hwpx
+
+_SECTION_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+    "{paras}</hs:sec>"
+)
+
+
+def _para(text: str) -> str:
+    return f"<hp:p><hp:run><hp:t>{text}</hp:t></hp:run></hp:p>"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "text_cache_dir", str(tmp_path / "text_cache"))
+
+
+@pytest.fixture
+def hwpx_path(tmp_path):
+    path = tmp_path / "rfp.hwpx"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("mimetype", "application/hwp+zip")
+        for i in range(11):
+            z.writestr(f"Contents/section{i}.xml", _SECTION_XML.format(paras=_para(f"섹션{i} 첫문단") + _para(f"섹션{i} 둘째")))
+    return path
+
+
+def test_hwpx_문단_단위_추출_및_섹션_순서(hwpx_path):
+    text = extract_text_from_hwpx(hwpx_path)
+    lines = text.split("\n")
+    assert lines[:2] == ["섹션0 첫문단", "섹션0 둘째"]
+    # section10이 section2보다 뒤에 와야 함 (숫자 정렬)
+    assert lines.index("섹션2 첫문단") < lines.index("섹션10 첫문단")
+
+
+def test_hwpx_섹션_수_제한(hwpx_path):
+    text = extract_text_from_hwpx(hwpx_path, max_sections=2)
+    assert "섹션1 둘째" in text
+    assert "섹션2" not in text
+
+
+def test_extract_text_from_file_hwpx_분기(hwpx_path):
+    assert extract_text_from_file(hwpx_path).startswith("섹션0 첫문단")
+
+
+def test_바이너리_hwp_명확한_오류(tmp_path):
+    path = tmp_path / "legacy.hwp"
+    path.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 64)  # OLE 시그니처
+    with pytest.raises(FileProcessingError) as exc:
+        extract_text_from_file(path)
+    assert "HWPX" in exc.value.message
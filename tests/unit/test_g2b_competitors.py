@@ -0,0 +1,66 @@
+"""경쟁사 분석 API 경로 유닛 테스트 — 단계별 동시 호출, 호출별 타임아웃·부분 결과 (G2B 호출 Mock)"""
+
+import asyncio
+from unittest.mock import patch
+
+from app.config import settings
+from app.services.g2b_service import G2BService
+
+WINNERS = ["가나", "가나", "다라", "마바", "사아", "자차", "카타"]
+
+
+class _FakeG2B(G2BService):
+    """API 메서드마다 지연을 두고 동시 실행 수를 기록"""
+
+    def __init__(self, slow: frozenset = frozenset()):
+        super().__init__()
+        self.slow = slow
+        self.in_flight = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    async def _delay(self, name: str, seconds: float = 0.05):
+        self.calls.append(name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.in_flight -= 1
+
+    async def search_bid_announcements(self, keyword, **kwargs):
+        await self._delay("announcements")
+        return [{}] * 3
+
+    async def get_bid_results(self, keyword, **kwargs):
+        await self._delay("results")
+        return [{"sucsfBidderNm": w, "sucsfBidAmt": "100000000"} for w in WINNERS]
+
+    async def get_company_bid_history(self, company, **kwargs):
+        await self._delay(company, 5 if company in self.slow else 0.05)
+        if company == "사아":
+            raise RuntimeError("G2B API 오류")
+        return [{}] * 4
+
+
+async def test_1_2단계와_업체_이력을_각각_동시에_조회():
+    g2b = _FakeG2B()
+    with patch.object(settings, "award_history_enabled", False):
+        result = await g2b.search_competitors("AI 챗봇 구축", max_competitors=10)
+
+    assert g2b.calls[:2] == ["announcements", "results"] and len(g2b.calls) == 7
+    assert g2b.peak == 5
+    assert result["source"] == "api" and result["bid_announcements_found"] == 3
+    assert [c["company_name"] for c in result["competitors"]][:2] == ["가나", "다라"]
+
+
+async def test_시간_초과나_실패한_업체_이력은_빈_결과로_두고_진행():
+    g2b = _FakeG2B(slow=frozenset({"다라"}))
+    with (
+        patch.object(settings, "award_history_enabled", False),
+        patch.object(settings, "g2b_call_timeout_seconds", 0.2),
+    ):
+        result = await asyncio.wait_for(g2b.search_competitors("AI 챗봇 구축"), 2)
+
+    history = {c["company_name"]: c["bid_history_count"] for c in result["competitors"]}
+    assert history == {"가나": 4, "다라": 0, "마바": 4, "사아": 0, "자차": 4, "카타": 0}
@@ -0,0 +1,102 @@
+"""모델 라우팅 유닛 테스트 — 단계별 모델 선택, 검증 실패 시 상위 모델 승격, 사용량 집계"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config import settings
+from app.utils import model_router as mr
+
+SMALL = "claude-haiku-4-5-20251001"
+MID = "claude-sonnet-4-5-20250929"
+
+
+def _response(text: str, in_tok: int = 10, out_tok: int = 5) -> MagicMock:
+    resp = MagicMock()
+    resp.content = [MagicMock(text=text)]
+    resp.usage.input_tokens = in_tok
+    resp.usage.output_tokens = out_tok
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def routes(monkeypatch):
+    monkeypatch.setattr(settings, "claude_model", "claude-opus-4-6")
+    monkeypatch.setattr(settings, "model_routes", {"toc_extract": SMALL, "bid_scoring": MID})
+    monkeypatch.setattr(settings, "model_escalation", {SMALL: MID})
+    mr.reset_route_usage()
+    yield
+    mr.reset_route_usage()
+
+
+def test_단계별_모델_선택_미지정은_기본_모델():
+    assert mr.model_for("toc_extract") == SMALL
+    assert mr.model_for("phase4") == "claude-opus-4-6"
+    assert mr.escalation_for(SMALL) == MID
+    assert mr.escalation_for(MID) == "claude-opus-4-6"
+    assert mr.escalation_for("claude-opus-4-6") is None
+
+
+async def test_검증_통과시_소형_모델_1회_호출():
+    client = MagicMock()
+    client.messages.create = AsyncMock(return_value=_response('{"toc": ["개요"]}'))
+
+    result = await mr.routed_call(client, "toc_extract", validate=json.loads, max_tokens=100)
+
+    assert result.value == {"toc": ["개요"]}
+    assert result.model == SMALL and not result.escalated
+    assert client.messages.create.call_args.kwargs["model"] == SMALL
+
+
+async def test_검증_실패시_상위_모델로_재시도():
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=[_response("목차 없음"), _response('{"toc": []}')])
+
+    result = await mr.routed_call(client, "toc_extract", validate=json.loads, max_tokens=100)
+
+    assert result.escalated and result.model == MID
+    models = [c.kwargs["model"] for c in client.messages.create.call_args_list]
+    assert models == [SMALL, MID]
+    usage = mr.route_usage()["toc_extract"]
+    assert usage["calls"] == 2 and usage["escalations"] == 1
+    assert usage["models"] == {SMALL: 1, MID: 1}
+    assert usage["input_tokens"] == 20
+
+
+async def test_승격_후에도_실패하면_예외():
+    client = MagicMock()
+    client.messages.create = AsyncMock(return_value=_response("잘못된 응답"))
+
+    with pytest.raises(json.JSONDecodeError):
+        await mr.routed_call(client, "toc_extract", validate=json.loads)
+
+    assert client.messages.create.await_count == 2
+    assert mr.route_usage()["toc_extract"]["failures"] == 1
+
+
+async def test_기본_모델은_재시도하지_않음():
+    client = MagicMock()
+    client.messages.create = AsyncMock(return_value=_response("잘못된 응답"))
+
+    with pytest.raises(json.JSONDecodeError):
+        await mr.routed_call(client, "phase4", validate=json.loads)
+
+    assert client.messages.create.await_count == 1
+
+
+async def test_피드백_보강_호출도_라우팅과_공용_제한을_거침():
+    from app.services.phase_executor import PhaseExecutor
+
+    executor = PhaseExecutor("p-1", MagicMock())
+    executor.client = MagicMock()
+    executor.client.messages.create = AsyncMock(return_value=_response("  개선된 요약  "))
+    slot = MagicMock(wraps=mr.claude_limiter.slot)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mr.claude_limiter, "slot", slot)
+        assert await executor._enhance_with_feedback("기존 분석", "RFP 분석 개선") == "개선된 요약"
+
+    slot.assert_called_once()
+    assert executor.client.messages.create.call_args.kwargs["model"] == "claude-opus-4-6"
+    assert mr.route_usage()["phase1_feedback"]["calls"] == 1
@@ -0,0 +1,176 @@
+"""근접 중복 탐지 유닛 테스트 — MinHash/LSH, 재공고 연결·분석 생략, 섹션 연결·검색 제외"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.api import routes_bids
+from app.models.bid_schemas import BidAnnouncement, QualificationResult, SearchPreset, TeamBidProfile
+from app.services import section_search
+from app.services.bid_fetcher import BidFetcher
+from app.services.bid_recommender import BidRecommender
+from app.services.section_search import SectionSearchIndex
+from app.utils.minhash import LSHIndex, minhash, similarity
+
+BASE = (
+    "본 사업은 공공기관 민원 상담 업무에 생성형 AI 챗봇을 도입하여 상담 품질을 높이는 것을 목표로 한다. "
+    "입찰 참가자격은 소프트웨어사업자로 신고된 업체로서 최근 3년간 유사 사업 수행 실적이 있어야 하며, "
+    "공동수급은 허용하지 않는다. 제안서 평가는 기술 90점, 가격 10점으로 한다."
+)
+REWORDED = BASE.replace("최근 3년간", "최근 5년간")
+OTHER = "도로 포장 보수 공사. 아스팔트 재포장 구간 12km, 시공능력평가액 기준 이상 업체 참가 가능."
+
+
+class _Query:
+    """Supabase 쿼리 체인 Mock — 메서드 호출을 기록하고 execute()에서 data 반환"""
+
+    def __init__(self, data=None):
+        self.data = data or []
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    async def execute(self):
+        return MagicMock(data=self.data)
+
+
+def test_문구만_바뀐_본문은_유사도가_높고_무관한_본문은_낮음():
+    assert minhash(BASE) == minhash(BASE.replace(" ", "  ") + "!")
+    assert similarity(minhash(BASE), minhash(REWORDED)) >= 0.8
+    assert similarity(minhash(BASE), minhash(OTHER)) < 0.2
+    assert minhash("  ... ") is None
+
+
+def test_LSH는_근접_중복만_후보로_반환하고_삭제를_반영():
+    index = LSHIndex()
+    index.add("a", minhash(BASE))
+    index.add("b", minhash(OTHER))
+    assert index.best_match(minhash(REWORDED), 0.8) == ("a", similarity(minhash(BASE), minhash(REWORDED)))
+    assert index.best_match(minhash(REWORDED), 0.8, accept=lambda key: key != "a") is None
+
+    index.remove("a")
+    assert index.best_match(minhash(REWORDED), 0.8) is None
+    assert "a" not in index and len(index) == 1
+
+
+async def test_재공고는_같은_기관의_원_공고에_연결되어_저장():
+    stored = _Query([
+        {"bid_no": "OLD", "agency": "행정안전부", "minhash": minhash(f"챗봇 구축\n{BASE}"), "duplicate_of": None},
+        {"bid_no": "ELSE", "agency": "다른 기관", "minhash": minhash(f"챗봇 구축\n{BASE}"), "duplicate_of": None},
+    ])
+    upsert = _Query()
+    db = MagicMock()
+    db.table = MagicMock(side_effect=lambda name: stored if not stored.calls else upsert)
+
+    again = BidAnnouncement(bid_no="NEW", bid_title="[재공고] 챗봇 구축", agency="행정안전부", content_text=REWORDED)
+    road = BidAnnouncement(bid_no="ROAD", bid_title="도로 보수", agency="행정안전부", content_text=OTHER)
+    await BidFetcher(MagicMock(), db)._upsert_announcements([again, road])
+
+    rows = {r["bid_no"]: r for r in next(args[0] for name, args in upsert.calls if name == "upsert")}
+    assert rows["NEW"]["duplicate_of"] == "OLD" and again.duplicate_of == "OLD"
+    assert rows["ROAD"]["duplicate_of"] is None
+    assert len(rows["NEW"]["minhash"]) == 128
+
+
+async def test_재공고는_AI_분석을_생략하고_원_공고_결과를_복사():
+    root = BidAnnouncement(bid_no="001", bid_title="챗봇", agency="기관", content_text=BASE)
+    again = BidAnnouncement(
+        bid_no="002", bid_title="[재공고] 챗봇", agency="기관", content_text=REWORDED, duplicate_of="001"
+    )
+    orphan = BidAnnouncement(
+        bid_no="003", bid_title="[재공고] 행정", agency="기관", content_text="내용", duplicate_of="OLD"
+    )
+    profile = TeamBidProfile(team_id="team-1", expertise_areas=["AI"])
+    preset = SearchPreset(id="preset-1", team_id="team-1", name="AI", keywords=["AI"])
+
+    queries = [_Query(), _Query(), _Query()]  # 메모 조회, 원 공고(OLD) 분석 조회, upsert
+    client = MagicMock()
+    client.table = MagicMock(side_effect=queries)
+
+    analyzed = []
+
+    async def analyze(profile, bids, top_n=20):
+        analyzed.extend(b.bid_no for b in bids)
+        return [], [QualificationResult(bid_no=b.bid_no, qualification_status="pass") for b in bids]
+
+    fetcher = MagicMock()
+    fetcher.fetch_bids_by_preset = AsyncMock(return_value=[root, again, orphan])
+    g2b = MagicMock()
+    g2b.__aenter__ = AsyncMock(return_value=g2b)
+    g2b.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.api.routes_bids.get_async_client", AsyncMock(return_value=client)),
+        patch("app.api.routes_bids.G2BService", return_value=g2b),
+        patch("app.api.routes_bids.BidFetcher", return_value=fetcher),
+        patch("app.services.bid_recommender.AsyncAnthropic"),
+        patch.object(BidRecommender, "analyze_bids", side_effect=analyze),
+    ):
+        await routes_bids._run_fetch_and_analyze("team-1", preset, profile)
+
+    # 원 공고 OLD의 이전 분석이 없으면 재공고 003은 직접 분석
+    assert sorted(analyzed) == ["001", "003"]
+    assert ("in_", ("bid_no", ["OLD"])) in queries[1].calls
+    rows = next(args[0] for name, args in queries[2].calls if name == "upsert")
+    assert {r["bid_no"]: r["qualification_status"] for r in rows} == {"001": "pass", "002": "pass", "003": "pass"}
+
+
+def _section(sid: str, content: str, owner: str = "u1", **kwargs) -> dict:
+    return {"id": sid, "title": "회사 소개", "category": "company_intro", "content": content, "owner_id": owner, **kwargs}
+
+
+async def test_재업로드_섹션은_같은_라이브러리_원본에_연결():
+    index = SectionSearchIndex()
+    index.add(_section("s1", BASE))
+    index.add(_section("s2", BASE, owner="u2"))
+    index._loaded_at = time.monotonic()
+    rows = [
+        _section("n1", REWORDED),
+        _section("n2", OTHER),
+        _section("n3", OTHER + " 끝."),
+        _section("n4", REWORDED, owner="u3"),
+    ]
+    with patch.object(section_search, "section_index", index):
+        linked = await section_search.link_duplicate_sections(MagicMock(), rows)
+
+    assert linked == 2
+    assert [r.get("duplicate_of") for r in rows] == ["s1", None, "n2", None]
+
+
+async def test_연결된_섹션은_검색과_벡터_인덱스에서_제외():
+    index = SectionSearchIndex()
+    index._loaded_at = time.monotonic()
+    vectors = MagicMock(index_section=AsyncMock(), remove_section=AsyncMock(), search=AsyncMock(return_value=[]))
+    with (
+        patch.object(section_search, "section_index", index),
+        patch.object(section_search, "library_vectors", vectors),
+    ):
+        await section_search.index_section(_section("s1", BASE))
+        await section_search.index_section(_section("s2", REWORDED, duplicate_of="s1"))
+        matches = await section_search.hybrid_search(
+            MagicMock(), "챗봇 상담", owner_id="u1", team_ids=[], allow=lambda meta: True
+        )
+
+    assert [m.section_id for m in matches] == ["s1"]
+    vectors.index_section.assert_awaited_once()
+    vectors.remove_section.assert_awaited_once_with("s2")
+
+
+async def test_재공고_비교_대상은_배치_기관만_페이지_단위로_조회():
+    filler = [{"bid_no": f"F{i:04d}", "agency": "행정안전부", "minhash": None, "duplicate_of": None} for i in range(1000)]
+    original = {"bid_no": "OLD", "agency": "행정안전부", "minhash": minhash(f"챗봇 구축\n{BASE}"), "duplicate_of": None}
+    pages = [filler, [original]]
+    stored = _Query()
+    stored.execute = AsyncMock(side_effect=lambda: MagicMock(data=pages.pop(0)))
+    db = MagicMock()
+    db.table = MagicMock(return_value=stored)
+
+    again = BidAnnouncement(bid_no="NEW", bid_title="[재공고] 챗봇 구축", agency="행정안전부", content_text=REWORDED)
+    await BidFetcher(MagicMock(), db)._link_duplicates([again])
+
+    assert again.duplicate_of == "OLD"
+    assert [args for name, args in stored.calls if name == "range"] == [(0, 999), (1000, 1999)]
+    assert ("in_", ("agency", ["행정안전부"])) in stored.calls
@@ -0,0 +1,78 @@
+"""pdf_extractor 유닛 테스트 — 페이지 순서 보존, 병렬/직렬 경로 일치"""
+
+import pytest
+
+from app.config import settings
+from app.utils import pdf_extractor
+from app.utils.pdf_extractor import aiter_pdf_pages, extract_pdf_text, iter_pdf_pages
+
+
+def make_pdf(page_texts: list[str]) -> bytes:
+    """페이지별 텍스트를 가진 최소 PDF 바이트 생성"""
+    objects: list[bytes] = []
+    n = len(page_texts)
+    font_id = 3 + 2 * n
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(n))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {n} >>".encode())
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for idx, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{idx} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def pdf_bytes():
+    return make_pdf([f"Page{i:03d}" for i in range(12)])
+
+
+@pytest.fixture
+def force_parallel(monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "PARALLEL_MIN_PAGES", 1)
+    monkeypatch.setattr(settings, "pdf_pages_per_chunk", 5)
+    monkeypatch.setattr(settings, "pdf_extract_workers", 2)
+    yield
+    pdf_extractor.shutdown_pool()
+
+
+def test_직렬_추출_페이지_순서(pdf_bytes):
+    pages = list(iter_pdf_pages(pdf_bytes))
+    assert len(pages) == 12
+    assert [p.strip() for p in pages] == [f"Page{i:03d}" for i in range(12)]
+
+
+def test_max_pages_제한(pdf_bytes):
+    pages = list(iter_pdf_pages(pdf_bytes, max_pages=3))
+    assert [p.strip() for p in pages] == ["Page000", "Page001", "Page002"]
+
+
+def test_병렬_추출_결과가_직렬과_동일(pdf_bytes, force_parallel):
+    text = extract_pdf_text(pdf_bytes)
+    assert text.split("\n") == [f"Page{i:03d}" for i in range(12)]
+
+
+async def test_비동기_스트리밍_순서_보존(pdf_bytes, force_parallel):
+    pages = [p.strip() async for p in aiter_pdf_pages(pdf_bytes)]
+    assert pages == [f"Page{i:03d}" for i in range(12)]
+
+
+def test_경로_입력(tmp_path, pdf_bytes):
+    path = tmp_path / "rfp.pdf"
+    path.write_bytes(pdf_bytes)
+    assert extract_pdf_text(path).startswith("Page000")
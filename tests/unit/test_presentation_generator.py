@@ -0,0 +1,168 @@
+"""발표 자료 스토리보드 유닛 테스트 — 슬라이드 그룹 병렬 생성 및 재조립 (Claude 호출 Mock)"""
+
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.exceptions import ClaudeAPIError
+from app.models.phase_schemas import Phase2Artifact, Phase3Artifact, Phase4Artifact
+from app.services import presentation_generator as pg
+
+
+TOC = [
+    {"slide_num": i, "layout": "cover" if i == 1 else "eval_section",
+     "title": f"슬라이드 {i}", "eval_badge": "" if i == 1 else "기술능력 | 40점",
+     "target_section": "", "score_weight": 40}
+    for i in range(1, 8)
+]
+
+
+def _text_response(payload: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.content = [MagicMock(text=json.dumps(payload, ensure_ascii=False))]
+    return resp
+
+
+def _make_client(fail_nums: set[int] = frozenset(), drop_nums: set[int] = frozenset()):
+    """TOC → Visual Brief → 그룹별 스토리보드 순으로 응답하는 Mock 클라이언트"""
+    calls: list[dict] = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        content = kwargs["messages"][0]["content"]
+        if "목차를 설계" in content:
+            return _text_response({"toc": TOC, "total_slides": len(TOC)})
+        if "시각 설계 전략" in content and "작성 대상" not in content:
+            return _text_response({"visual_briefs": [{"slide_num": s["slide_num"]} for s in TOC]})
+        nums = [int(n) for n in re.search(r"slide_num\n\[(.*?)\]", content).group(1).split(",")]
+        if fail_nums & set(nums):
+            raise RuntimeError("API 오류")
+        return _text_response({
+            "slides": [
+                {"slide_num": n, "layout": "eval_section", "title": f"슬라이드 {n}", "bullets": ["근거"]}
+                for n in reversed(nums) if n not in drop_nums
+            ],
+            "eval_coverage": {"기술능력": ", ".join(f"slide_{n}" for n in nums if n > 1)},
+        })
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    return client, calls
+
+
+def _artifacts():
+    phase2 = Phase2Artifact(summary="분석")
+    phase3 = Phase3Artifact(summary="전략", win_theme={"primary_message": "승리"})
+    phase4 = Phase4Artifact(summary="본문", sections={"개요": "본문"})
+    return phase2, phase3, phase4
+
+
+@pytest.fixture
+def small_groups(monkeypatch):
+    monkeypatch.setattr(settings, "presentation_storyboard_group_size", 3)
+    monkeypatch.setattr(settings, "presentation_storyboard_concurrency", 2)
+
+
+async def test_그룹별_병렬_생성_후_슬라이드_순서대로_재조립(small_groups):
+    client, calls = _make_client()
+    with patch("anthropic.AsyncAnthropic", return_value=client):
+        result = await pg.generate_presentation_slides(*_artifacts())
+
+    assert [s["slide_num"] for s in result["slides"]] == list(range(1, 8))
+    assert result["total_slides"] == 7
+    assert result["eval_coverage"] == {"기술능력": ", ".join(f"slide_{n}" for n in range(2, 8))}
+    # TOC + Visual Brief + 스토리보드 3그룹 (3+3+1장)
+    assert len(calls) == 5
+
+
+async def test_그룹_공통_prefix에_캐시_지정(small_groups):
+    client, calls = _make_client()
+    with patch("anthropic.AsyncAnthropic", return_value=client):
+        await pg.generate_presentation_slides(*_artifacts())
+
+    storyboard_calls = calls[2:]
+    systems = [c["system"] for c in storyboard_calls]
+    assert all(s == systems[0] for s in systems)
+    assert systems[0][-1]["cache_control"] == {"type": "ephemeral"}
+
+
+async def test_실패_그룹과_누락_슬라이드는_TOC로_대체(small_groups):
+    client, _ = _make_client(fail_nums={4}, drop_nums={7})
+    with patch("anthropic.AsyncAnthropic", return_value=client):
+        result = await pg.generate_presentation_slides(*_artifacts())
+
+    slides = {s["slide_num"]: s for s in result["slides"]}
+    assert sorted(slides) == list(range(1, 8))
+    assert slides[4]["title"] == "슬라이드 4" and slides[4]["bullets"] == []
+    assert slides[7]["bullets"] == []
+    assert slides[1]["bullets"] == ["근거"]
+
+
+async def test_모든_그룹_실패_시_예외(small_groups):
+    client, _ = _make_client(fail_nums=set(range(1, 8)))
+    with patch("anthropic.AsyncAnthropic", return_value=client):
+        with pytest.raises(ClaudeAPIError):
+            await pg.generate_presentation_slides(*_artifacts())
+
+
+def test_eval_coverage_병합은_참조_중복_제거():
+    merged = pg._merge_coverage([
+        {"기술능력": "slide_3", "관리": "slide_9"},
+        {"기술능력": "slide_4, slide_3"},
+    ])
+    assert merged == {"기술능력": "slide_3, slide_4", "관리": "slide_9"}
+
+
+async def test_선택_슬라이드만_재생성(small_groups):
+    client, calls = _make_client()
+    with patch("anthropic.AsyncAnthropic", return_value=client):
+        original = await pg.generate_presentation_slides(*_artifacts())
+    original["slides"] = [{**s, "bullets": ["이전"]} for s in original["slides"]]
+    calls.clear()
+
+    client2, calls2 = _make_client()
+    with patch("anthropic.AsyncAnthropic", return_value=client2):
+        result = await pg.regenerate_slides(original, [3, 6], *_artifacts(), instructions="수치 보강")
+
+    assert len(calls2) == 1
+    assert "수치 보강" in calls2[0]["messages"][0]["content"]
+    by_num = {s["slide_num"]: s for s in result["slides"]}
+    assert by_num[3]["bullets"] == ["근거"] and by_num[6]["bullets"] == ["근거"]
+    assert all(by_num[n]["bullets"] == ["이전"] for n in (1, 2, 4, 5, 7))
+
+    old_hashes, new_hashes = pg.slide_hashes(original), pg.slide_hashes(result)
+    assert {n for n in new_hashes if new_hashes[n] != old_hashes[n]} == {"3", "6"}
+
+
+async def test_슬라이드_재생성은_RFP_제목을_프로젝트명으로_사용(tmp_path):
+    from app.api import routes_presentation as rp
+
+    phase2, phase3, phase4 = _artifacts()
+    old = {"slides": [{"slide_num": 1, "title": "표지"}, {"slide_num": 2, "title": "개요"}]}
+    new = {"slides": [{"slide_num": 1, "title": "표지"}, {"slide_num": 2, "title": "개요 (보강)"}]}
+    session = {
+        "phase_artifact_1": {"rfp_data": {"title": "AI 챗봇 구축", "raw_text": "원문"}},
+        "phase_artifact_2": phase2.model_dump(),
+        "phase_artifact_3": phase3.model_dump(),
+        "phase_artifact_4": phase4.model_dump(),
+        "presentation_slides": old,
+        "presentation_pptx_path": str(tmp_path / "presentation.pptx"),
+    }
+    states: list[dict] = []
+    build = MagicMock()
+
+    with (
+        patch.object(rp.session_manager, "aget_session", AsyncMock(return_value=session)),
+        patch.object(rp, "regenerate_slides", AsyncMock(return_value=new)),
+        patch.object(rp, "_save_slides_json", side_effect=lambda pid, js: pg.slide_hashes(js)),
+        patch.object(rp, "patch_presentation_pptx", build),
+        patch.object(rp, "_upload_presentation", AsyncMock(return_value="url")),
+        patch.object(rp, "_set_presentation_state", side_effect=lambda pid, u: states.append(u)),
+    ):
+        await rp._run_slide_regeneration("p-1", [2])
+
+    assert states[-1]["presentation_status"] == "done"
+    assert build.call_args.args[4] == "AI 챗봇 구축"
@@ -0,0 +1,75 @@
+"""발표 자료 PPTX 부분 갱신 테스트 — 변경 슬라이드만 재렌더링 (API 키 불필요)"""
+
+from pptx import Presentation
+
+from app.services.presentation_pptx_builder import build_presentation_pptx, patch_presentation_pptx
+
+
+def _slides(titles: dict[int, str]) -> dict:
+    return {
+        "slides": [
+            {"slide_num": n, "layout": "cover" if n == 1 else "eval_section",
+             "title": t, "bullets": [f"근거 {n}"]}
+            for n, t in titles.items()
+        ]
+    }
+
+
+def _titles(path) -> list[str]:
+    prs = Presentation(str(path))
+    out = []
+    for slide in prs.slides:
+        texts = [sh.text_frame.text for sh in slide.shapes if sh.has_text_frame]
+        out.append(" / ".join(texts))
+    return out
+
+
+def test_변경_슬라이드만_교체하고_나머지_XML_재사용(tmp_path):
+    path = tmp_path / "presentation.pptx"
+    build_presentation_pptx(_slides({1: "표지", 2: "둘째", 3: "셋째", 4: "넷째"}), path)
+    before = Presentation(str(path))
+    untouched_xml = {i: before.slides[i]._element.xml for i in (0, 1, 3)}
+
+    updated = _slides({1: "표지", 2: "둘째", 3: "셋째 수정본", 4: "넷째"})
+    patch_presentation_pptx(path, updated, {3}, path)
+
+    after = Presentation(str(path))
+    assert len(after.slides) == 4
+    assert "셋째 수정본" in _titles(path)[2]
+    for i, xml in untouched_xml.items():
+        assert after.slides[i]._element.xml == xml
+
+
+def test_슬라이드_수_불일치_시_전체_빌드(tmp_path):
+    path = tmp_path / "presentation.pptx"
+    build_presentation_pptx(_slides({1: "표지", 2: "둘째"}), path)
+
+    patch_presentation_pptx(path, _slides({1: "표지", 2: "둘째", 3: "추가"}), {3}, path)
+
+    assert len(Presentation(str(path)).slides) == 3
+    assert "추가" in _titles(path)[2]
+
+
+def test_기존_파일_없으면_전체_빌드(tmp_path):
+    path = tmp_path / "missing.pptx"
+    patch_presentation_pptx(path, _slides({1: "표지", 2: "둘째"}), {2}, path)
+    assert len(Presentation(str(path)).slides) == 2
+
+
+def test_떨어진_여러_슬라이드를_한_번에_교체해도_파트명이_겹치지_않음(tmp_path):
+    import zipfile
+
+    path = tmp_path / "presentation.pptx"
+    build_presentation_pptx(_slides({1: "표지", 2: "둘째", 3: "셋째", 4: "넷째", 5: "다섯째"}), path)
+
+    updated = _slides({1: "표지", 2: "둘째 수정본", 3: "셋째", 4: "넷째 수정본", 5: "다섯째"})
+    patch_presentation_pptx(path, updated, {2, 4}, path)
+
+    names = [n for n in zipfile.ZipFile(path).namelist() if n.startswith("ppt/slides/slide")]
+    assert len(names) == len(set(names)) == 5
+    titles = _titles(path)
+    assert "둘째 수정본" in titles[1] and "넷째 수정본" in titles[3]
+    assert "셋째" in titles[2] and "수정본" not in titles[2] + titles[4]
+    assert [s.part.partname for s in Presentation(str(path)).slides] == [
+        f"/ppt/slides/slide{i}.xml" for i in range(1, 6)
+    ]
@@ -0,0 +1,86 @@
+"""진행 이벤트 pub/sub 유닛 테스트 — 재전송/실시간/resync/keepalive"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from app.services.phase_executor import PhaseExecutor
+from app.services.progress_bus import ProgressBus
+
+
+async def _take(agen, n: int, timeout: float = 1.0) -> list:
+    out = []
+    async def run():
+        async for ev in agen:
+            out.append(ev)
+            if len(out) == n:
+                return
+    await asyncio.wait_for(run(), timeout)
+    return out
+
+
+async def test_버퍼_재전송_후_실시간_이벤트():
+    bus = ProgressBus(buffer_size=10)
+    bus.publish("p1", "phase", {"current_phase": "phase_1_research"})
+    bus.publish("p1", "artifact", {"phase": 1})
+
+    agen = bus.subscribe("p1", 0, keepalive=1.0)
+    first = await _take(agen, 2)
+    assert [e.id for e in first] == [1, 2]
+
+    async def later():
+        await asyncio.sleep(0.01)
+        bus.publish("p1", "status", {"status": "completed"})
+    asyncio.create_task(later())
+    live = await _take(agen, 1)
+    assert live[0].event == "status" and live[0].id == 3
+    await agen.aclose()
+
+
+async def test_Last_Event_ID_이후만_재전송():
+    bus = ProgressBus(buffer_size=10)
+    for i in range(5):
+        bus.publish("p1", "section", {"i": i})
+    agen = bus.subscribe("p1", 3, keepalive=1.0)
+    events = await _take(agen, 2)
+    assert [e.id for e in events] == [4, 5]
+    await agen.aclose()
+
+
+async def test_버퍼_밖으로_밀려나면_resync():
+    bus = ProgressBus(buffer_size=3)
+    for i in range(6):
+        bus.publish("p1", "section", {"i": i})
+    agen = bus.subscribe("p1", 1, keepalive=1.0)
+    events = await _take(agen, 4)
+    assert events[0].event == "resync"
+    assert [e.id for e in events[1:]] == [4, 5, 6]
+    await agen.aclose()
+
+
+async def test_이벤트_없으면_keepalive():
+    bus = ProgressBus(buffer_size=3)
+    agen = bus.subscribe("p1", 0, keepalive=0.01)
+    assert await _take(agen, 1) == [None]
+    await agen.aclose()
+
+
+def test_SSE_포맷():
+    ev = ProgressBus(buffer_size=3).publish("p1", "phase", {"current_phase": "phase_2_analysis"})
+    lines = ev.to_sse().split("\n")
+    assert lines[0] == "id: 1" and lines[1] == "event: phase"
+    assert json.loads(lines[2].removeprefix("data: ")) == {"current_phase": "phase_2_analysis"}
+
+
+async def test_PhaseExecutor_상태_변경_발행(monkeypatch):
+    bus = ProgressBus(buffer_size=10)
+    monkeypatch.setattr("app.services.phase_executor.progress_bus", bus)
+    executor = PhaseExecutor("p-evt", MagicMock())
+    monkeypatch.setattr(executor, "_bg_task", lambda coro: coro.close())
+
+    executor._update_status("phase_3_plan")
+
+    agen = bus.subscribe("p-evt", 0, keepalive=1.0)
+    (ev,) = await _take(agen, 1)
+    assert ev.event == "phase" and ev.data["current_phase"] == "phase_3_plan"
+    await agen.aclose()
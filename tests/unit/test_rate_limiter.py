@@ -0,0 +1,31 @@
+"""Claude 공용 호출 제한기 유닛 테스트 — 동시 실행 상한, 분당 요청 간격"""
+
+import asyncio
+import time
+
+from app.utils.rate_limiter import AsyncRateLimiter
+
+
+async def test_동시_실행_수_제한():
+    limiter = AsyncRateLimiter(max_concurrency=2)
+    state = {"active": 0, "peak": 0}
+
+    async def job():
+        async with limiter.slot():
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+    await asyncio.gather(*(job() for _ in range(6)))
+    assert state["peak"] == 2
+
+
+async def test_분당_요청_수_간격_적용():
+    limiter = AsyncRateLimiter(max_concurrency=10, rate_per_minute=1200)  # 50ms 간격
+
+    started = time.monotonic()
+    for _ in range(3):
+        async with limiter.slot():
+            pass
+    assert time.monotonic() - started >= 0.09
@@ -0,0 +1,122 @@
+"""장문 RFP 청크 분석 유닛 테스트 — 분할/병합 규칙 및 map-reduce 흐름 (Claude 호출 Mock)"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.services import rfp_parser
+from app.services.rfp_chunker import dedup_items, merge_chunk_results, split_rfp_text
+
+
+LONG_RFP = "\n".join(
+    [f"제{i}장 과업 내용 {i}\n" + ("세부 과업 설명 문장입니다. " * 40) for i in range(1, 9)]
+    + ["제9장 평가 기준\n1. 기술능력 평가 (40점)\n2. 사업수행계획 (30점)\n3. 가격 (30점)"]
+)
+
+
+# ─────────────────────────────────────────────────────────────
+# split_rfp_text
+# ─────────────────────────────────────────────────────────────
+
+class TestSplitRfpText:
+
+    def test_청크_크기_제한과_원문_보존(self):
+        chunks = split_rfp_text(LONG_RFP, 2000)
+        assert len(chunks) > 1
+        assert all(len(c) <= 2000 for c in chunks)
+        assert "".join(chunks) == LONG_RFP
+
+    def test_장_제목_경계에서_분할(self):
+        chunks = split_rfp_text(LONG_RFP, 1500)
+        assert all(c.lstrip().startswith("제") for c in chunks)
+
+    def test_경계_없는_긴_텍스트는_고정_길이_분할(self):
+        text = "가" * 5000
+        chunks = split_rfp_text(text, 1000)
+        assert [len(c) for c in chunks] == [1000] * 5
+
+
+# ─────────────────────────────────────────────────────────────
+# merge_chunk_results
+# ─────────────────────────────────────────────────────────────
+
+class TestMergeChunkResults:
+
+    def test_요구사항_중복_제거_및_순서_유지(self):
+        items = ["SFR-001 통합 로그인 기능", "SFR-001  통합 로그인 기능.", "보안", "SFR-002 대시보드"]
+        assert dedup_items(items) == ["SFR-001 통합 로그인 기능", "보안", "SFR-002 대시보드"]
+
+    def test_포함_관계는_긴_항목_유지(self):
+        items = ["클라우드 전환 설계 지원", "클라우드 전환 설계 지원 및 이행 컨설팅"]
+        assert dedup_items(items) == ["클라우드 전환 설계 지원 및 이행 컨설팅"]
+
+    def test_단일값_최빈값_및_충돌_기록(self):
+        results = [
+            {"title": "AI 플랫폼 구축", "client_name": "행정안전부"},
+            {"title": "AI 플랫폼 구축 사업", "client_name": ""},
+            {"title": "AI 플랫폼 구축", "budget": "5억원"},
+        ]
+        merged, conflicts = merge_chunk_results(results)
+        assert merged["title"] == "AI 플랫폼 구축"
+        assert merged["client_name"] == "행정안전부"
+        assert merged["budget"] == "5억원"
+        assert conflicts == {"title": ["AI 플랫폼 구축", "AI 플랫폼 구축 사업"]}
+
+    def test_목차는_가장_긴_청크_목차_사용(self):
+        results = [
+            {"table_of_contents": ["사업 개요"]},
+            {"table_of_contents": ["사업 개요", "수행 방법론", "투입 인력"]},
+        ]
+        merged, _ = merge_chunk_results(results)
+        assert merged["table_of_contents"] == ["사업 개요", "수행 방법론", "투입 인력"]
+        assert merged["budget"] is None
+
+
+# ─────────────────────────────────────────────────────────────
+# analyze_rfp_text (청크 모드)
+# ─────────────────────────────────────────────────────────────
+
+def _response(payload: dict) -> MagicMock:
+    r = MagicMock()
+    r.content = [MagicMock(text=json.dumps(payload, ensure_ascii=False))]
+    return r
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    rfp_parser._parse_cache.clear()
+    yield
+    rfp_parser._parse_cache.clear()
+
+
+async def test_장문_RFP_청크_병렬_분석_후_병합(monkeypatch):
+    monkeypatch.setattr(settings, "rfp_chunk_threshold_chars", 1000)
+    monkeypatch.setattr(settings, "rfp_chunk_chars", 1500)
+    n_chunks = len(split_rfp_text(LONG_RFP, 1500))
+
+    async def fake_create(**kwargs):
+        content = kwargs["messages"][0]["content"]
+        if "충돌 항목별 후보값" in content:
+            return _response({"title": "AI 플랫폼 구축 사업"})
+        if "제9장 평가 기준" in content:
+            return _response({"title": "AI 플랫폼 구축 사업", "evaluation_criteria": ["기술능력 40점", "가격 30점"]})
+        return _response({"title": "AI 플랫폼 구축", "requirements": ["SFR-001 통합 로그인 기능"]})
+
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=fake_create)
+    with patch("app.utils.create_anthropic_client", return_value=client):
+        rfp = await rfp_parser.parse_rfp_text(LONG_RFP)
+
+    # 청크 n회 + 충돌 조정 1회
+    assert client.messages.create.await_count == n_chunks + 1
+    assert rfp.title == "AI 플랫폼 구축 사업"
+    assert rfp.requirements == ["SFR-001 통합 로그인 기능"]
+    assert rfp.evaluation_criteria == ["기술능력 40점", "가격 30점"]
+    assert rfp.raw_text == LONG_RFP
+
+    # 같은 텍스트 재요청은 파싱 캐시 HIT
+    with patch("app.utils.create_anthropic_client", return_value=client):
+        await rfp_parser.parse_rfp_text(LONG_RFP)
+    assert client.messages.create.await_count == n_chunks + 1
@@ -0,0 +1,144 @@
+"""Phase 4 섹션 단위 재생성 유닛 테스트 — 선택 섹션만 재작성/재평가, DOCX 패치 (Claude 호출 Mock)"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from docx import Document
+
+from app.models.phase_schemas import (
+    Phase1Artifact, Phase2Artifact, Phase3Artifact, Phase4Artifact, Phase5Artifact,
+)
+from app.services.docx_builder import build_docx, patch_docx_sections
+from app.services.phase_executor import PhaseExecutor
+
+
+SECTIONS = {"사업 이해도": "기존 이해도 본문", "수행 방법론": "기존 방법론 본문\n둘째 줄", "투입 인력": "기존 인력 본문"}
+
+
+def _body_by_heading(path) -> dict[str, list[str]]:
+    out: dict[str, list[str]] = {}
+    current = None
+    for p in Document(str(path)).paragraphs:
+        if p.style.name == "Heading 1":
+            current = p.text.split(". ", 1)[1]
+            out[current] = []
+        elif current:
+            out[current].append(p.text)
+    return out
+
+
+# ─────────────────────────────────────────────────────────────
+# patch_docx_sections
+# ─────────────────────────────────────────────────────────────
+
+def test_DOCX_변경_섹션만_교체(tmp_path):
+    path = tmp_path / "p.docx"
+    build_docx(SECTIONS, path, "테스트 사업")
+
+    updated = {**SECTIONS, "수행 방법론": "새 방법론 1\n새 방법론 2\n새 방법론 3"}
+    patch_docx_sections(updated, {"수행 방법론"}, path, "테스트 사업")
+
+    body = _body_by_heading(path)
+    assert list(body) == list(SECTIONS)
+    assert body["수행 방법론"] == ["새 방법론 1", "새 방법론 2", "새 방법론 3"]
+    assert body["사업 이해도"] == ["기존 이해도 본문"]
+    assert body["투입 인력"] == ["기존 인력 본문"]
+
+
+def test_DOCX_구조_불일치_시_전체_재생성(tmp_path):
+    path = tmp_path / "p.docx"
+    build_docx({"다른 섹션": "본문"}, path)
+
+    patch_docx_sections(SECTIONS, {"투입 인력"}, path)
+
+    assert list(_body_by_heading(path)) == list(SECTIONS)
+
+
+# ─────────────────────────────────────────────────────────────
+# PhaseExecutor.regenerate_sections
+# ─────────────────────────────────────────────────────────────
+
+def _response(payload: dict) -> MagicMock:
+    r = MagicMock()
+    r.content = [MagicMock(text=json.dumps(payload, ensure_ascii=False))]
+    r.usage = MagicMock(input_tokens=100, output_tokens=50)
+    return r
+
+
+def _session(tmp_path) -> dict:
+    docx_path = tmp_path / "p.docx"
+    build_docx(SECTIONS, docx_path, "테스트 사업")
+    a5 = Phase5Artifact(
+        summary="검토", quality_score=70.0, docx_path=str(docx_path),
+        issues=[
+            {"section": "수행 방법론", "severity": "high", "description": "근거 부족"},
+            {"section": "투입 인력", "severity": "low", "description": "경력 보강"},
+        ],
+    )
+    return {
+        "phase_artifact_1": Phase1Artifact(summary="조사").model_dump(),
+        "phase_artifact_2": Phase2Artifact(summary="분석").model_dump(),
+        "phase_artifact_3": Phase3Artifact(summary="전략").model_dump(),
+        "phase_artifact_4": Phase4Artifact(
+            summary="본문", sections=dict(SECTIONS), structured_data={"_project_name": "테스트 사업"},
+        ).model_dump(),
+        "phase_artifact_5": a5.model_dump(),
+    }
+
+
+async def test_선택_섹션만_재작성하고_재평가(tmp_path):
+    session = _session(tmp_path)
+    sm = MagicMock()
+    sm.get_session.return_value = session
+    sm.update_session.side_effect = lambda pid, upd: session.update(upd)
+
+    calls: list[dict] = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        content = kwargs["messages"][0]["content"]
+        if "재작성된 섹션" in content:
+            return _response({
+                "summary": "개선됨",
+                "section_scores": {"수행 방법론": 85},
+                "issues": [{"section": "수행 방법론", "severity": "low", "description": "사소함"}],
+            })
+        return _response({"section_name": "수행 방법론", "content": "재작성된 방법론"})
+
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(side_effect=RuntimeError("no db"))), \
+         patch("app.services.phase_executor.get_template_toc", AsyncMock(return_value=[])):
+        executor = PhaseExecutor("p-1", sm)
+        executor.client = MagicMock()
+        executor.client.messages.create = AsyncMock(side_effect=create)
+        a5 = await executor.regenerate_sections(["수행 방법론"], "정량 근거 보강")
+
+    # 재작성 1회 + 재평가 1회
+    assert len(calls) == 2
+    assert "정량 근거 보강" in calls[0]["messages"][0]["content"]
+    assert calls[0]["system"][-1].get("cache_control") == {"type": "ephemeral"}
+
+    sections = session["phase_artifact_4"]["sections"]
+    assert sections["수행 방법론"] == "재작성된 방법론"
+    assert sections["사업 이해도"] == "기존 이해도 본문"
+
+    # 다른 섹션 issue 유지, 재작성 섹션 issue 교체, 점수는 (85-70)/3 만큼 상승
+    assert {i["description"] for i in a5.issues} == {"경력 보강", "사소함"}
+    assert a5.quality_score == 75.0
+    assert _body_by_heading(a5.docx_path)["수행 방법론"] == ["재작성된 방법론"]
+    assert session["status"] == "completed"
+
+
+async def test_아티팩트_로드_실패도_실패_상태로_종료(tmp_path):
+    session = _session(tmp_path)
+    session["phase_artifact_4"]["sections"] = "손상된 값"
+    sm = MagicMock()
+    sm.get_session.return_value = session
+    sm.update_session.side_effect = lambda pid, upd: session.update(upd)
+
+    executor = PhaseExecutor("p-1", sm)
+    with patch.object(executor, "_finish") as finish, pytest.raises(Exception):
+        await executor.regenerate_sections(["수행 방법론"])
+
+    assert session["status"] == "failed"
+    assert finish.call_args.args == ("failed",)
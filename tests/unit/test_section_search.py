@@ -0,0 +1,101 @@
+"""섹션 라이브러리 하이브리드 검색 유닛 테스트 — BM25 역색인, 증분 갱신, RRF 융합"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services import section_search
+from app.services.section_search import SectionSearchIndex
+from app.services.vector_store import VectorHit
+
+
+def _section(sid: str, title: str, content: str, owner: str = "u1", **kwargs) -> dict:
+    return {"id": sid, "title": title, "category": "methodology", "content": content, "owner_id": owner, **kwargs}
+
+
+def _allow_all(meta: dict) -> bool:
+    return True
+
+
+def _index(*sections) -> SectionSearchIndex:
+    index = SectionSearchIndex()
+    for s in sections:
+        index.add(s)
+    index._loaded_at = time.monotonic()
+    return index
+
+
+def test_BM25는_제목_일치를_우선하고_무관_섹션은_제외():
+    index = _index(
+        _section("s1", "회사 소개", "당사는 클라우드 전환 사업을 수행"),
+        _section("s2", "클라우드 전환 방법론", "단계별 수행 절차"),
+        _section("s3", "투입 인력", "조직도와 역할"),
+    )
+    assert [sid for sid, _ in index.search("클라우드 전환", _allow_all, 10)] == ["s2", "s1"]
+
+
+def test_수정_삭제는_역색인에_즉시_반영():
+    index = _index(_section("s1", "클라우드 방법론", "전환 절차"))
+    index.add(_section("s1", "보안 관리", "개인정보 보호 대책"))
+    assert index.search("클라우드", _allow_all, 10) == []
+    assert [sid for sid, _ in index.search("보안", _allow_all, 10)] == ["s1"]
+
+    index.remove("s1")
+    assert index.search("보안", _allow_all, 10) == [] and len(index) == 0
+    assert index._postings == {} and index._total_len == 0
+
+
+def test_접근_범위_필터():
+    index = _index(
+        _section("mine", "클라우드 방법론", "절차"),
+        _section("other", "클라우드 사례", "사례", owner="u2"),
+    )
+    results = index.search("클라우드", lambda m: m["owner_id"] == "u1", 10)
+    assert [sid for sid, _ in results] == ["mine"]
+
+
+async def test_하이브리드_검색은_두_순위를_RRF로_융합():
+    index = _index(
+        _section("s1", "클라우드 전환 방법론", "단계별 절차"),
+        _section("s2", "클라우드 사례", "사례 소개"),
+        _section("s3", "이관 전략", "레거시 시스템을 새 인프라로 옮기는 계획"),
+        _section("private", "클라우드 전환", "타인 자료", owner="u2"),
+    )
+    search = AsyncMock(return_value=[
+        VectorHit(text="옮기는 계획", score=0.62, title="이관 전략", category="methodology", section_id="s3"),
+        VectorHit(text="단계별 절차", score=0.55, title="클라우드 전환 방법론", category="methodology", section_id="s1"),
+        VectorHit(text="타인 자료", score=0.9, title="클라우드 전환", category="methodology", section_id="private"),
+        VectorHit(text="자료 원문", score=0.7, title="a.pdf", category="other", asset_id="a1"),
+    ])
+
+    with patch.object(section_search, "section_index", index), \
+         patch("app.services.section_search.library_vectors.search", search):
+        matches = await section_search.hybrid_search(
+            MagicMock(), "클라우드 전환", owner_id="u1", team_ids=[],
+            allow=lambda m: m["owner_id"] == "u1", limit=10,
+        )
+
+    assert [m.section_id for m in matches] == ["s1", "s3", "s2"]
+    top = matches[0]
+    assert top.bm25 is not None and top.vector == 0.55
+    assert matches[1].bm25 is None and matches[2].vector is None
+
+
+async def test_첫_검색에서_sections_테이블로_역색인_구축():
+    rows = [_section("s1", "클라우드 방법론", "절차")]
+    query = MagicMock()
+    query.select.return_value.order.return_value.range.return_value.execute = AsyncMock(
+        return_value=MagicMock(data=rows)
+    )
+    client = MagicMock()
+    client.table.return_value = query
+    index = SectionSearchIndex()
+    backfill = AsyncMock(return_value=1)
+
+    with patch("app.services.section_search.library_vectors.backfill_sections", backfill):
+        await index.ensure_loaded(client)
+        await index.ensure_loaded(client)
+        await index._backfill_task
+
+    assert len(index) == 1
+    assert query.select.call_count == 1
+    backfill.assert_awaited_once_with(rows)
@@ -0,0 +1,90 @@
+"""text_cache 유닛 테스트 — SHA-256 키 캐시, 페이지 오프셋, 부분 추출"""
+
+import pytest
+
+from app.config import settings
+from app.utils.text_cache import content_hash, get_or_extract, join_pages, load_cached_text
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "text_cache_dir", str(tmp_path / "text_cache"))
+    monkeypatch.setattr(settings, "text_cache_enabled", True)
+    return tmp_path / "text_cache"
+
+
+def test_join_pages_오프셋():
+    cached = join_pages(["가나다", "", "라마"])
+    assert cached.text == "가나다\n라마"
+    assert cached.page_offsets == [0, 3, 4]
+    assert cached.head(1) == "가나다"
+    assert cached.head(2) == "가나다"
+    assert cached.head(None) == cached.text
+
+
+def test_재추출_없이_캐시_HIT():
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return ["1페이지", "2페이지"]
+
+    data = b"%PDF-fake-bytes"
+    assert get_or_extract(data, extract) == "1페이지\n2페이지"
+    assert get_or_extract(data, extract) == "1페이지\n2페이지"
+    assert len(calls) == 1
+
+    cached = load_cached_text(content_hash(data))
+    assert cached.page_offsets == [0, 5]
+
+
+def test_전체_캐시에서_앞페이지만_잘라_사용():
+    data = b"doc"
+    get_or_extract(data, lambda: ["A", "B", "C"])
+    # 전체 캐시가 있으면 부분 추출 함수는 호출되지 않음
+    assert get_or_extract(data, lambda: pytest.fail("호출되면 안 됨"), max_pages=2, variant="p2") == "A\nB"
+
+
+def test_빈_텍스트는_캐시하지_않음():
+    data = b"empty"
+    get_or_extract(data, lambda: "")
+    assert load_cached_text(content_hash(data)) is None
+
+
+def test_손상된_캐시는_무시(cache_dir):
+    data = b"corrupt"
+    get_or_extract(data, lambda: "본문")
+    path = next(cache_dir.rglob("*.json.z"))
+    path.write_bytes(b"not-zlib")
+    assert get_or_extract(data, lambda: "재추출") == "재추출"
+
+
+def test_페이지_기준이_아닌_부분_추출은_전체_캐시를_쓰지_않음():
+    data = b"hwpx"
+    get_or_extract(data, lambda: "전체 본문 " * 100)
+    assert get_or_extract(data, lambda: "앞부분", variant="toc") == "앞부분"
+    assert get_or_extract(data, lambda: pytest.fail("호출되면 안 됨"), variant="toc") == "앞부분"
+
+
+def test_저장_실패_시_임시_파일을_남기지_않음(cache_dir, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("app.utils.text_cache.os.replace", fail)
+    assert get_or_extract(b"data", lambda: "본문") == "본문"
+    assert not list(cache_dir.rglob("*.tmp"))
+
+
+def test_용량_초과_시_오래된_캐시부터_삭제(cache_dir, monkeypatch):
+    import base64
+    import os
+
+    monkeypatch.setattr(settings, "text_cache_max_mb", 1)
+    blobs = [base64.b64encode(os.urandom(450 * 1024)).decode() for _ in range(3)]
+    for i, blob in enumerate(blobs):
+        get_or_extract(f"doc{i}".encode(), lambda b=blob: b)
+        path = next(p for p in cache_dir.rglob("*.json.z") if p.name.startswith(content_hash(f"doc{i}".encode())))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert load_cached_text(content_hash(b"doc0")) is None
+    assert load_cached_text(content_hash(b"doc2")) is not None
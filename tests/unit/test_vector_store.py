@@ -0,0 +1,126 @@
+"""섹션 라이브러리 벡터 인덱스 유닛 테스트 — 청크, 임베딩, 접근 범위, Phase 4 목차별 검색"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from app.services.phase_executor import PhaseExecutor
+from app.services.vector_store import LibraryVectorStore, VectorHit, chunk_text, embed_text
+
+
+def _section(sid: str, title: str, content: str, owner: str = "u1", **kwargs) -> dict:
+    return {"id": sid, "title": title, "category": "methodology", "content": content, "owner_id": owner, **kwargs}
+
+
+def test_청크는_문단_경계와_최대_길이를_지킴():
+    text = "첫 문단\n\n둘째 문단\n\n" + "가" * 25
+    chunks = chunk_text(text, max_chars=12)
+    assert chunks == ["첫 문단\n\n둘째 문단", "가" * 12, "가" * 12, "가"]
+
+
+def test_관련_텍스트의_임베딩_유사도가_더_높음():
+    query = np.array(embed_text("클라우드 전환 방법론"))
+    related = np.array(embed_text("공공기관 클라우드 전환 수행 방법론과 절차"))
+    unrelated = np.array(embed_text("청사 시설물 청소 용역 인력 배치"))
+    assert float(query @ related) > float(query @ unrelated)
+    assert abs(float(np.linalg.norm(related)) - 1.0) < 1e-5
+
+
+async def test_접근_가능한_청크만_검색하고_재인덱싱은_교체(tmp_path):
+    store = LibraryVectorStore(path=str(tmp_path / "vectors"))
+    await store.index_section(_section("s1", "클라우드 전환 방법론", "클라우드 전환 단계별 수행 절차"))
+    await store.index_section(_section("s2", "클라우드 사례", "타사 클라우드 전환 사례", owner="u2"))
+    await store.index_section(_section("s3", "클라우드 공개 자료", "클라우드 전환 공개 가이드", owner="u2", is_public=True))
+    await store.index_section(_section("s4", "팀 클라우드 자료", "클라우드 전환 팀 노하우", owner="u3", team_id="t1"))
+
+    hits = await store.search("클라우드 전환", owner_id="u1", team_ids=["t1"], k=10)
+    assert {h.section_id for h in hits} == {"s1", "s3", "s4"}
+
+    await store.index_section(_section("s1", "조직 구성", "투입 인력 조직도"))
+    hits = await store.search("클라우드 전환", owner_id="u1", k=10, section_ids=["s1"], min_score=-1)
+    assert [h.text for h in hits] == ["투입 인력 조직도"]
+
+    await store.remove_section("s1")
+    assert await store.search("조직", owner_id="u1", section_ids=["s1"], min_score=-1) == []
+
+
+def test_목차별_결과를_라운드_로빈으로_예산까지_채움():
+    def hit(sid, text):
+        return VectorHit(text=text, score=0.5, title=f"제목 {sid}", category="methodology", section_id=sid)
+
+    hits = {
+        "사업 이해": [hit("a", "가" * 100), hit("b", "나" * 100)],
+        "수행 방법론": [hit("a", "가" * 100), hit("c", "다" * 100)],
+    }
+    text = PhaseExecutor._format_library_hits(hits, budget=10_000)
+    assert text.count("가" * 100) == 1 and "나" * 100 in text and "다" * 100 in text
+
+    small = PhaseExecutor._format_library_hits(hits, budget=150)
+    assert "### 목차: 사업 이해" in small and "나" * 100 not in small
+
+
+async def test_Phase4는_목차_항목별로_선택_섹션_안에서_검색():
+    proposal = MagicMock()
+    proposal.eq.return_value.maybe_single.return_value.execute = AsyncMock(return_value=MagicMock(
+        data={"owner_id": "u1", "team_id": "t1", "section_ids": ["s1"]}
+    ))
+    client = MagicMock()
+    client.table.return_value.select.return_value = proposal
+    search = AsyncMock(return_value=[
+        VectorHit(text="단계별 절차", score=0.4, title="방법론", category="methodology", section_id="s1"),
+    ])
+
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(return_value=client)), \
+         patch("app.services.phase_executor.library_vectors.search", search):
+        executor = PhaseExecutor("p-1", MagicMock())
+        ctx = await executor._load_section_context(["사업 이해", "수행 방법론"], budget=1000)
+
+    assert [c.args[0] for c in search.await_args_list] == ["사업 이해", "수행 방법론"]
+    assert search.await_args_list[0].kwargs == {"owner_id": "u1", "team_ids": ["t1"], "section_ids": ["s1"]}
+    assert "### 목차: 사업 이해" in ctx and "단계별 절차" in ctx
+
+
+async def test_백필은_인덱스에_없는_섹션만_인덱싱(tmp_path):
+    store = LibraryVectorStore(path=str(tmp_path / "vectors"))
+    await store.index_section(_section("s1", "방법론", "클라우드 전환 절차"))
+    sections = [
+        _section("s1", "방법론", "클라우드 전환 절차"),
+        _section("s2", "조직", "투입 인력 조직도"),
+        _section("s3", "빈 섹션", "  "),
+    ]
+
+    assert await store.backfill_sections(sections) == 1
+    assert await store.backfill_sections(sections) == 0
+    hits = await store.search("조직도", owner_id="u1", section_ids=["s2"], min_score=-1)
+    assert [h.section_id for h in hits] == ["s2"]
+
+
+async def test_검색_결과가_없는_선택_섹션은_전문으로_보충():
+    proposal = MagicMock()
+    proposal.eq.return_value.maybe_single.return_value.execute = AsyncMock(return_value=MagicMock(
+        data={"owner_id": "u1", "team_id": None, "section_ids": ["s1", "s2"]}
+    ))
+    sections = MagicMock()
+    sections.in_.return_value.execute = AsyncMock(return_value=MagicMock(
+        data=[{"title": "조직 구성", "category": "organization", "content": "투입 인력 조직도 전문"}]
+    ))
+    client = MagicMock()
+    client.table.side_effect = lambda name: MagicMock(
+        select=MagicMock(return_value=proposal if name == "proposals" else sections)
+    )
+    search = AsyncMock(return_value=[
+        VectorHit(text="단계별 절차", score=0.4, title="방법론", category="methodology", section_id="s1"),
+    ])
+
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(return_value=client)), \
+         patch("app.services.phase_executor.library_vectors.search", search):
+        executor = PhaseExecutor("p-1", MagicMock())
+        ctx = await executor._load_section_context(["수행 방법론"], budget=1000)
+
+        search.return_value = []
+        empty = await executor._load_section_context(["수행 방법론"], budget=1000)
+
+    assert "단계별 절차" in ctx and "투입 인력 조직도 전문" in ctx
+    assert sections.in_.call_args_list[0].args == ("id", ["s2"])
+    assert sections.in_.call_args_list[1].args == ("id", ["s1", "s2"])
+    assert "투입 인력 조직도 전문" in empty
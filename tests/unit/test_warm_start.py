@@ -0,0 +1,176 @@
+"""제안서 웜 스타트 유닛 테스트 — 이전 실행 검색, RFP 변경분, Phase 2/3 재사용 (Claude 호출 Mock)"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.phase_schemas import Phase1Artifact
+from app.models.schemas import RFPData
+from app.services.phase_executor import PhaseExecutor
+from app.services.warm_start import WarmStartMatch, find_prior_run, rfp_delta, rfp_signature
+
+RFP = {
+    "title": "2026년 민원 상담 AI 챗봇 고도화",
+    "client_name": "행정안전부",
+    "project_scope": "민원 상담 챗봇의 답변 정확도 개선 및 상담 이력 분석 기능 구축",
+    "duration": "8개월",
+    "budget": "5억원",
+    "requirements": ["생성형 AI 답변", "상담 이력 분석", "개인정보 비식별화"],
+    "evaluation_criteria": ["기술능력 80", "가격 20"],
+    "table_of_contents": ["사업 이해", "수행 방법론", "투입 인력"],
+}
+NEXT_YEAR = {
+    **RFP,
+    "title": "2027년 민원 상담 AI 챗봇 고도화",
+    "requirements": ["생성형 AI 답변", "상담 이력 분석", "개인정보 비식별화", "음성 상담 연계"],
+}
+
+
+class _Query:
+    """Supabase 쿼리 체인 Mock — 메서드 호출을 기록하고 execute()에서 data 반환"""
+
+    def __init__(self, data=None):
+        self.data = data or []
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return method
+
+    async def execute(self):
+        return MagicMock(data=self.data)
+
+
+def test_RFP_변경분은_바뀐_필드만_기록():
+    assert rfp_delta(RFP, dict(RFP)) == {}
+    assert rfp_delta(RFP, NEXT_YEAR) == {
+        "title": {"before": RFP["title"], "after": NEXT_YEAR["title"]},
+        "requirements": {"added": ["음성 상담 연계"], "removed": []},
+    }
+
+
+async def test_가장_비슷한_완료_제안서의_Phase_1_3_아티팩트를_찾음():
+    unrelated = {**RFP, "title": "도로 포장 공사", "project_scope": "아스팔트 재포장", "requirements": ["시공"],
+                 "table_of_contents": ["공사 개요"], "client_name": "국토부", "evaluation_criteria": []}
+    proposals = _Query([
+        {"id": "old-other", "title": "도로", "rfp_minhash": rfp_signature(unrelated)},
+        {"id": "old-chatbot", "title": "2026 챗봇", "rfp_minhash": rfp_signature(RFP)},
+        {"id": "no-signature", "title": "서명 없음", "rfp_minhash": None},
+    ])
+    phases = _Query([
+        {"phase_num": 1, "artifact_json": {"rfp_data": RFP}},
+        {"phase_num": 2, "artifact_json": {"structured_data": {"summary": "분석"}}},
+        {"phase_num": 3, "artifact_json": {"structured_data": {"summary": "전략"}}},
+    ])
+    client = MagicMock()
+    client.table = MagicMock(side_effect=lambda name: proposals if name == "proposals" else phases)
+
+    match = await find_prior_run(client, proposal_id="new", owner_id="u1", team_id="t1", rfp=NEXT_YEAR)
+
+    assert match.proposal_id == "old-chatbot" and match.similarity >= 0.7
+    assert set(match.artifacts) == {1, 2, 3}
+    assert sorted(match.delta) == ["requirements", "title"]
+    assert ("or_", ("owner_id.eq.u1,team_id.eq.t1",)) in proposals.calls
+    assert ("neq", ("id", "new")) in proposals.calls
+
+
+async def test_아티팩트가_빠진_후보는_사용하지_않음():
+    proposals = _Query([{"id": "old", "title": "챗봇", "rfp_minhash": rfp_signature(RFP)}])
+    phases = _Query([{"phase_num": 1, "artifact_json": {"rfp_data": RFP}}])
+    client = MagicMock()
+    client.table = MagicMock(side_effect=lambda name: proposals if name == "proposals" else phases)
+
+    assert await find_prior_run(client, proposal_id="new", owner_id="u1", team_id=None, rfp=RFP) is None
+    assert ("eq", ("owner_id", "u1")) in proposals.calls
+
+
+def _executor(seed: WarmStartMatch) -> tuple[PhaseExecutor, list[dict]]:
+    session = {"owner_id": "u1", "proposal_state": {"warm_start": True}}
+    sm = MagicMock()
+    sm.get_session.return_value = session
+    executor = PhaseExecutor("p-1", sm)
+    executor._seed = seed
+    executor._seed_changes = dict(seed.delta)
+
+    calls: list[dict] = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        r = MagicMock()
+        payload = {"updated": {"key_requirements": ["음성 상담 연계"]}, "summary": "갱신된 분석"}
+        r.content = [MagicMock(text=json.dumps(payload, ensure_ascii=False))]
+        r.usage = MagicMock(input_tokens=100, output_tokens=20)
+        return r
+
+    executor.client = MagicMock()
+    executor.client.messages.create = AsyncMock(side_effect=create)
+    return executor, calls
+
+
+def _seed(delta: dict) -> WarmStartMatch:
+    return WarmStartMatch(
+        proposal_id="old", title="2026 챗봇", similarity=0.9, delta=delta,
+        artifacts={
+            1: {"rfp_data": RFP},
+            2: {"structured_data": {"summary": "이전 분석", "key_requirements": ["생성형 AI 답변"],
+                                    "hidden_intent": "상담 인력 부담 완화"}},
+            3: {"structured_data": {"summary": "이전 전략", "win_strategy": "정확도 우위"}},
+        },
+    )
+
+
+async def test_RFP_변경이_없으면_Claude_호출_없이_Phase_2_3_재사용():
+    executor, calls = _executor(_seed({}))
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(side_effect=RuntimeError("no db"))):
+        a2 = await executor.phase2_analysis(Phase1Artifact(summary="조사"))
+        a3 = await executor.phase3_plan(a2)
+        await asyncio.gather(*executor._bg_tasks)
+
+    assert calls == []
+    assert a2.hidden_intent == "상담 인력 부담 완화" and a2.token_count == 0
+    assert a3.win_strategy == "정확도 우위"
+
+
+async def test_RFP_변경분만_재분석하고_갱신_항목을_다음_단계로_전달():
+    executor, calls = _executor(_seed(rfp_delta(RFP, NEXT_YEAR)))
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(side_effect=RuntimeError("no db"))):
+        a2 = await executor.phase2_analysis(Phase1Artifact(summary="조사"))
+        await executor.phase3_plan(a2)
+        await asyncio.gather(*executor._bg_tasks)
+
+    assert len(calls) == 2
+    assert "음성 상담 연계" in calls[0]["messages"][0]["content"]
+    assert a2.key_requirements == ["음성 상담 연계"]
+    assert a2.hidden_intent == "상담 인력 부담 완화" and a2.summary == "갱신된 분석"
+    assert "phase2_updated" in calls[1]["messages"][0]["content"]
+
+
+async def test_개선_지침이_있으면_웜_스타트_없이_새로_분석():
+    executor, calls = _executor(_seed({}))
+    instructions = [{"phase": 2, "feedback": {"description": "경쟁 분석 보강"}}]
+    with patch("app.services.phase_executor.get_async_client", AsyncMock(side_effect=RuntimeError("no db"))):
+        await executor.phase2_analysis(Phase1Artifact(summary="조사"), instructions)
+        await asyncio.gather(*executor._bg_tasks)
+
+    assert len(calls) == 1 and executor._seed is None
+    assert "경쟁 분석 보강" in calls[0]["messages"][0]["content"]
+
+
+async def test_수락하지_않으면_후보만_안내하고_적용하지_않음():
+    sm = MagicMock()
+    sm.get_session.return_value = {"owner_id": "u1", "proposal_state": {}}
+    executor = PhaseExecutor("p-1", sm)
+    match = _seed({})
+
+    with (
+        patch("app.services.phase_executor.get_async_client", AsyncMock(return_value=MagicMock())),
+        patch("app.services.phase_executor.save_rfp_signature", AsyncMock()),
+        patch("app.services.phase_executor.find_prior_run", AsyncMock(return_value=match)),
+    ):
+        info = await executor._find_warm_start(RFPData(**RFP, raw_text="원문"))
+        await asyncio.gather(*executor._bg_tasks)
+
+    assert info["applied"] is False and info["proposal_id"] == "old"
+    assert executor._seed is None and executor._seed_changes == {}